@@ -4,7 +4,9 @@ Enterprise-grade role and permission management for production environments.
 """
 
 import logging
-from collections.abc import Awaitable, Callable
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -190,9 +192,169 @@ class PermissionCheck:
     ttl: int = 300  # Cache TTL in seconds
 
 
+def _permission_key(resource: Any, action: Any) -> str:
+    """Build the canonical ``resource:action`` name, unwrapping enum members."""
+    resource_name = resource.value if isinstance(resource, Enum) else str(resource)
+    action_name = action.value if isinstance(action, Enum) else str(action)
+    return f"{resource_name}:{action_name}"
+
+
+class CompiledPermissionModel:
+    """
+    Process-wide compiled authorization model.
+
+    Every distinct ``resource:action`` permission is assigned one bit. Role
+    permissions, including those inherited through the parent-role chain, are
+    folded into integer masks, and each user's effective mask is memoized
+    against the model version so that a permission check is a dictionary
+    lookup plus a bitwise AND. Any role change bumps the version, which
+    invalidates every memoized user mask at once.
+    """
+
+    def __init__(self, max_cached_users: int = 10000) -> None:
+        """Initialize an empty model."""
+        self._lock = threading.RLock()
+        self._bits: dict[str, int] = {}
+        self._names: list[str] = []
+        self._role_masks: dict[int, int] = {}
+        self._query_masks: dict[tuple[str, str], int] = {}
+        # user_id -> (version, role signature, mask, is_super_admin)
+        self._user_masks: OrderedDict[int, tuple[int, tuple[int, ...], int, bool]] = (
+            OrderedDict()
+        )
+        self._max_cached_users = max_cached_users
+        self.version = 0
+
+    def bit_for(self, permission_name: str) -> int:
+        """Return the bit assigned to a permission name, allocating it if new."""
+        bit = self._bits.get(permission_name)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(permission_name)
+                if bit is None:
+                    bit = 1 << len(self._names)
+                    self._names.append(permission_name)
+                    self._bits[permission_name] = bit
+        return bit
+
+    def query_mask(self, resource: Any, action: Any) -> int:
+        """Return the mask satisfying ``resource:action`` (exact or ``resource:*``)."""
+        key = (str(resource), str(action))
+        mask = self._query_masks.get(key)
+        if mask is None:
+            permission_name = _permission_key(resource, action)
+            wildcard_name = permission_name.split(":", 1)[0] + ":*"
+            mask = self.bit_for(permission_name) | self.bit_for(wildcard_name)
+            self._query_masks[key] = mask
+        return mask
+
+    def role_mask(self, role: Any) -> int:
+        """
+        Return the transitive permission mask for a role.
+
+        The parent chain is walked iteratively, stopping at the first ancestor
+        that is already compiled, so deep or cyclic hierarchies are safe.
+        """
+        cached = self._role_masks.get(role.id)
+        if cached is not None:
+            return cached
+
+        chain: list[Any] = []
+        seen: set[int] = set()
+        inherited = 0
+        current = role
+        while current is not None and current.id not in seen:
+            compiled = self._role_masks.get(current.id)
+            if compiled is not None:
+                inherited = compiled
+                break
+            seen.add(current.id)
+            chain.append(current)
+            current = getattr(current, "parent_role", None)
+
+        with self._lock:
+            # Fold from the oldest ancestor down so every role on the chain
+            # gets its own transitive mask cached along the way.
+            mask = inherited
+            for chain_role in reversed(chain):
+                for permission in chain_role.permissions:
+                    mask |= self.bit_for(
+                        _permission_key(permission.resource, permission.action)
+                    )
+                self._role_masks[chain_role.id] = mask
+        return self._role_masks[role.id]
+
+    def compile_roles(self, roles: Iterable[Any]) -> None:
+        """Recompile the masks for all given roles and invalidate user masks."""
+        with self._lock:
+            self._role_masks.clear()
+            self.version += 1
+            for role in roles:
+                self.role_mask(role)
+        logger.info(
+            f"Compiled RBAC permission model v{self.version}: "
+            f"{len(self._role_masks)} roles, {len(self._names)} permissions"
+        )
+
+    def invalidate(self) -> None:
+        """Drop all compiled role masks after a role definition change."""
+        with self._lock:
+            self._role_masks.clear()
+            self.version += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop the memoized mask for a single user."""
+        with self._lock:
+            self._user_masks.pop(user_id, None)
+
+    def user_mask(self, user: Any, use_cache: bool = True) -> tuple[int, bool, bool]:
+        """
+        Resolve a user's effective permission mask.
+
+        Returns:
+            Tuple of (mask, is_super_admin, served_from_cache)
+        """
+        roles = list(user.roles)
+        signature = tuple(role.id for role in roles)
+
+        if use_cache:
+            entry = self._user_masks.get(user.id)
+            if entry is not None and entry[0] == self.version and entry[1] == signature:
+                return entry[2], entry[3], True
+
+        version = self.version
+        mask = 0
+        is_super_admin = False
+        for role in roles:
+            mask |= self.role_mask(role)
+            if role.name == SystemRoles.SUPER_ADMIN:
+                is_super_admin = True
+
+        if use_cache:
+            with self._lock:
+                self._user_masks[user.id] = (version, signature, mask, is_super_admin)
+                self._user_masks.move_to_end(user.id)
+                while len(self._user_masks) > self._max_cached_users:
+                    self._user_masks.popitem(last=False)
+
+        return mask, is_super_admin, False
+
+    def permission_names(self, mask: int) -> set[str]:
+        """Expand a mask back into permission names."""
+        return {name for index, name in enumerate(self._names) if mask >> index & 1}
+
+
+_permission_model = CompiledPermissionModel()
+
+
+def get_permission_model() -> CompiledPermissionModel:
+    """Get the process-wide compiled permission model."""
+    return _permission_model
+
+
 class RBACService:
     """
-    Role-Based Access Control service with caching and audit logging.
+    Role-Based Access Control service backed by the compiled permission model.
     Implements hierarchical roles, dynamic permissions, and resource policies.
     """
 
@@ -200,8 +362,7 @@ class RBACService:
         """Initialize RBAC service."""
         self.db = db
         self.cache_enabled = cache_enabled
-        self._permission_cache: dict[str, tuple[PermissionCheck, datetime]] = {}
-        self._role_hierarchy_cache: dict[int, set[int]] = {}
+        self.permission_model = get_permission_model()
 
     def check_permission(
         self,
@@ -214,6 +375,9 @@ class RBACService:
         """
         Check if user has permission to perform action on resource.
 
+        Role and wildcard permissions are answered from the user's compiled
+        mask; resource policies are only queried for resource-scoped checks.
+
         Args:
             user: Current user
             resource: Resource type
@@ -224,66 +388,53 @@ class RBACService:
         Returns:
             PermissionCheck result
         """
-        # Build cache key
-        cache_key = f"{user.id}:{resource}:{action}:{resource_id}"
-
-        # Check cache
-        if self.cache_enabled and cache_key in self._permission_cache:
-            cached_result, cached_time = self._permission_cache[cache_key]
-            if (datetime.utcnow() - cached_time).seconds < cached_result.ttl:
-                cached_result.cached = True
-                return cached_result
+        mask, is_super_admin, cached = self.permission_model.user_mask(
+            user, use_cache=self.cache_enabled
+        )
 
         # Super admin bypass
-        if self._is_super_admin(user):
-            result = PermissionCheck(
+        if is_super_admin:
+            return PermissionCheck(
                 allowed=True,
                 reason="Super admin has all permissions",
                 context={"role": SystemRoles.SUPER_ADMIN},
+                cached=cached,
             )
-            self._cache_permission(cache_key, result)
-            return result
 
         # Check role-based permissions
-        if self._has_role_permission(user, resource, action):
-            result = PermissionCheck(
+        if mask & self.permission_model.query_mask(resource, action):
+            return PermissionCheck(
                 allowed=True,
                 reason="Permission granted through role",
                 context={"method": "role"},
+                cached=cached,
             )
-            self._cache_permission(cache_key, result)
-            return result
 
         # Check direct user permissions
         if self._has_direct_permission(user, resource, action):
-            result = PermissionCheck(
+            return PermissionCheck(
                 allowed=True,
                 reason="Direct permission grant",
                 context={"method": "direct"},
             )
-            self._cache_permission(cache_key, result)
-            return result
 
         # Check resource-level policies
         if resource_id and self._check_resource_policy(
             user, resource, action, resource_id, context
         ):
-            result = PermissionCheck(
+            return PermissionCheck(
                 allowed=True,
                 reason="Resource policy allows access",
                 context={"method": "policy", "resource_id": resource_id},
             )
-            self._cache_permission(cache_key, result)
-            return result
 
         # Permission denied
-        result = PermissionCheck(
+        return PermissionCheck(
             allowed=False,
             reason=f"No permission for {action} on {resource}",
             context={"user_id": user.id, "roles": [r.name for r in user.roles]},
+            cached=cached,
         )
-        self._cache_permission(cache_key, result)
-        return result
 
     def assign_role(
         self,
@@ -445,12 +596,9 @@ class RBACService:
         Returns:
             List of permission names
         """
-        permissions = set[str]()
-
         # Get permissions from roles (including inherited)
-        for role in user.roles:
-            role_permissions = self._get_role_permissions_recursive(role)
-            permissions.update(role_permissions)
+        mask, _, _ = self.permission_model.user_mask(user, use_cache=self.cache_enabled)
+        permissions = self.permission_model.permission_names(mask)
 
         # Get direct permissions
         # This would need to be implemented with proper SQLAlchemy query
@@ -512,6 +660,9 @@ class RBACService:
         self.db.add(role)
         self.db.commit()
 
+        # Role definitions changed; recompile masks on next use
+        self.permission_model.invalidate()
+
         logger.info(f"Custom role {name} created by {created_by.email}")
 
         return role
@@ -520,24 +671,6 @@ class RBACService:
     # Private Methods
     # ========================================================================
 
-    def _is_super_admin(self, user: User) -> bool:
-        """Check if user has super admin role."""
-        return any(role.name == SystemRoles.SUPER_ADMIN for role in user.roles)
-
-    def _has_role_permission(self, user: User, resource: str, action: str) -> bool:
-        """Check if user has permission through their roles."""
-        permission_name = f"{resource}:{action}"
-
-        for role in user.roles:
-            role_permissions = self._get_role_permissions_recursive(role)
-            if (
-                permission_name in role_permissions
-                or f"{resource}:*" in role_permissions
-            ):
-                return True
-
-        return False
-
     def _has_direct_permission(self, user: User, resource: str, action: str) -> bool:
         """Check if user has direct permission grant."""
         # This would need to be implemented with proper SQLAlchemy query
@@ -579,39 +712,9 @@ class RBACService:
 
         return False
 
-    def _get_role_permissions_recursive(self, role: Role) -> set[str]:
-        """Get all permissions for a role including inherited permissions."""
-        if role.id in self._role_hierarchy_cache:
-            return self._role_hierarchy_cache[role.id]
-
-        permissions = set[str]()
-
-        # Get direct permissions
-        for permission in role.permissions:
-            permissions.add(f"{permission.resource}:{permission.action}")
-
-        # Get inherited permissions from parent role
-        if role.parent_role:
-            parent_permissions = self._get_role_permissions_recursive(role.parent_role)
-            permissions.update(parent_permissions)
-
-        # Cache the result
-        self._role_hierarchy_cache[role.id] = permissions
-
-        return permissions
-
-    def _cache_permission(self, key: str, result: PermissionCheck) -> None:
-        """Cache a permission check result."""
-        if self.cache_enabled:
-            self._permission_cache[key] = (result, datetime.utcnow())
-
     def _clear_user_cache(self, user_id: int) -> None:
-        """Clear all cached permissions for a user."""
-        keys_to_remove = [
-            k for k in self._permission_cache if k.startswith(f"{user_id}:")
-        ]
-        for key in keys_to_remove:
-            del self._permission_cache[key]
+        """Clear the compiled permission mask for a user."""
+        self.permission_model.invalidate_user(user_id)
 
 
 # ============================================================================
@@ -911,6 +1014,9 @@ def initialize_rbac_system(db: Session) -> None:
             db.add(role)
 
     db.commit()
+
+    # Compile every role's transitive permissions up front
+    get_permission_model().compile_roles(db.query(Role).all())
     logger.info("RBAC system initialized with default roles and permissions")
 
 
@@ -26,6 +26,7 @@ from src.interfaces.rag_service_interfaces import (
 from src.interfaces.repository_interfaces import IDocumentRepository
 from src.interfaces.service_interfaces import IDocumentLibraryService
 from src.prompt_management.manager import PromptManager
+from src.repositories.async_repository import AsyncDocumentRepository
 from src.repositories.document_repository import DocumentRepository
 from src.repositories.vector_repository import VectorIndexRepository
 from src.services.content_hash_service import ContentHashService
@@ -250,6 +251,13 @@ def get_document_repository(
     return _document_repository
 
 
+def get_async_document_repository(
+    repo: IDocumentRepository = Depends(get_document_repository),
+) -> AsyncDocumentRepository:
+    """Provide the document repository with awaitable, off-loop methods."""
+    return AsyncDocumentRepository(repo)
+
+
 def get_document_preview_service(
     doc_repo: IDocumentRepository = Depends(get_document_repository),
 ) -> DocumentPreviewService:
@@ -271,11 +279,25 @@ def get_document_preview_service(
             thumbnail_width=preview_config.thumbnail_width,
             max_page_number=preview_config.max_page_number,
             cache_ttl_seconds=preview_config.cache_ttl_seconds,
+            render_workers=preview_config.render_workers,
+            open_documents_per_worker=preview_config.open_documents_per_worker,
+            prerender_first_pages=preview_config.prerender_first_pages,
+            prerender_ahead=preview_config.prerender_ahead,
+            thumbnail_format=preview_config.thumbnail_format,
+            thumbnail_quality=preview_config.thumbnail_quality,
         )
         _document_preview_service = DocumentPreviewService(doc_repo, settings)
     return _document_preview_service
 
 
+def shutdown_document_preview_service() -> None:
+    """Stop the preview service's render workers, if it was created."""
+    global _document_preview_service
+    if _document_preview_service is not None:
+        _document_preview_service.close()
+        _document_preview_service = None
+
+
 def get_document_library_service(
     repo: IDocumentRepository = Depends(get_document_repository),
 ) -> IDocumentLibraryService:
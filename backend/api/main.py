@@ -190,6 +190,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Shutdown
     logger.info("Shutting down AI Enhanced PDF Scholar API...")
 
+    # Stop preview render workers
+    try:
+        from backend.api.dependencies import shutdown_document_preview_service
+
+        shutdown_document_preview_service()
+    except Exception as preview_error:
+        logger.warning(f"Preview renderer shutdown error: {preview_error}")
+
     # Shutdown cache system
     try:
         logger.info("Cache system shutdown completed")
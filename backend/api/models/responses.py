@@ -67,6 +67,21 @@ class PaginationMeta(Meta):
     total_pages: int = Field(..., ge=0, description="Total number of pages")
     has_next: bool = Field(..., description="Whether there is a next page")
     has_prev: bool = Field(..., description="Whether there is a previous page")
+    next_cursor: str | None = Field(
+        None, description="Opaque cursor for the next page, where supported"
+    )
+
+
+class CursorPaginationMeta(Meta):
+    """
+    Metadata for keyset (cursor) paginated responses.
+    """
+
+    per_page: int = Field(..., ge=1, description="Items per page")
+    has_next: bool = Field(..., description="Whether there is a next page")
+    next_cursor: str | None = Field(
+        None, description="Opaque cursor for the next page (null on the last page)"
+    )
 
 
 class ErrorDetail(BaseModel):
@@ -159,6 +174,34 @@ class PaginatedResponse(BaseModel, Generic[T]):
     errors: list[ErrorDetail] | None = Field(None, description="Error details (if any)")
 
 
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """
+    Cursor-paginated API response.
+
+    Used for list endpoints that page with an opaque cursor instead of
+    page numbers, so deep pages cost the same as the first one.
+
+    Example:
+        {
+            "success": true,
+            "data": [{"id": 42, "title": "Paper"}],
+            "meta": {
+                "timestamp": "2025-01-11T10:00:00Z",
+                "version": "v2",
+                "per_page": 50,
+                "has_next": true,
+                "next_cursor": "WzIwMjMsIDQyLCAiOWYxYyJd"
+            },
+            "errors": null
+        }
+    """
+
+    success: bool = Field(True, description="Whether the request succeeded")
+    data: list[T] = Field(..., description="Array of data items")
+    meta: CursorPaginationMeta = Field(..., description="Cursor pagination metadata")
+    errors: list[ErrorDetail] | None = Field(None, description="Error details (if any)")
+
+
 # ============================================================================
 # Domain-Specific Response Models
 # ============================================================================
@@ -6,6 +6,7 @@ Async WebSocket-enabled RAG endpoints for real-time streaming processing.
 import asyncio
 import logging
 import time
+from contextlib import aclosing
 from typing import Any
 
 from fastapi import (
@@ -34,6 +35,7 @@ from backend.api.models import (
     RAGQueryResponse,
 )
 from backend.api.websocket_manager import RAGProgressType, WebSocketManager
+from backend.services.rag_token_stream import stream_tokens
 from src.controllers.library_controller import LibraryController
 from src.services.enhanced_rag_service import EnhancedRAGService
 
@@ -84,7 +86,9 @@ class RAGStreamingProcessor:
         enable_progress_updates: bool = True,
         **kwargs,
     ) -> str:
-        """Process RAG query with streaming updates."""
+        """Process RAG query, sending answer tokens to the client as the LLM
+        generates them. chunk_size is accepted for request compatibility;
+        chunks are no longer cut from a finished answer."""
         try:
             # Stage 1: Validation and Setup
             if enable_progress_updates:
@@ -135,42 +139,36 @@ class RAGStreamingProcessor:
             if cancellation_token.is_set():
                 return ""
 
-            # Execute RAG query (simulate async processing)
-            await asyncio.sleep(0.1)  # Allow for cancellation checks
-            response = self.controller.query_document(document_id, query)
-
-            if response is None:
-                raise SystemException(
-                    message="RAG query processing failed", error_type="external_service"
+            # Forward tokens from streaming synthesis as they are generated
+            parts: list[str] = []
+            async with aclosing(
+                stream_tokens(
+                    lambda: self.controller.stream_query_document(document_id, query),
+                    cancellation_token,
                 )
-
-            # Stage 4: Response Streaming (if enabled)
-            if enable_progress_updates and len(response) > chunk_size:
-                await self.ws_manager.send_rag_progress_update(
-                    client_id,
-                    task_id,
-                    RAGProgressType.STREAMING_RESPONSE,
-                    80.0,
-                    "Streaming response to client",
-                )
-
-                # Stream response in chunks
-                chunks = [
-                    response[i : i + chunk_size]
-                    for i in range(0, len(response), chunk_size)
-                ]
-                total_chunks = len(chunks)
-
-                for i, chunk in enumerate(chunks):
-                    if cancellation_token.is_set():
-                        return ""
-
+            ) as tokens:
+                async for token in tokens:
+                    if not parts and enable_progress_updates:
+                        await self.ws_manager.send_rag_progress_update(
+                            client_id,
+                            task_id,
+                            RAGProgressType.STREAMING_RESPONSE,
+                            80.0,
+                            "Streaming response to client",
+                        )
                     await self.ws_manager.send_rag_response_chunk(
-                        client_id, task_id, chunk, i, total_chunks
+                        client_id, task_id, token, len(parts)
                     )
+                    parts.append(token)
+
+            if cancellation_token.is_set():
+                return ""
 
-                    # Small delay between chunks to prevent overwhelming
-                    await asyncio.sleep(0.05)
+            response = "".join(parts)
+            if not response:
+                raise SystemException(
+                    message="RAG query processing failed", error_type="external_service"
+                )
 
             # Final stage
             if enable_progress_updates:
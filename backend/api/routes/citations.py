@@ -7,7 +7,7 @@ Implements:
 - Citation CRUD operations
 - Citation search and filtering
 - Citation network analysis
-- Export functionality (BibTeX, JSON, CSV)
+- Streaming export (BibTeX, EndNote, JSON, CSV)
 
 References:
 - ADR-001: V2.0 Architecture Principles
@@ -18,7 +18,10 @@ from __future__ import annotations
 
 import csv
 import io
+import json
 import logging
+import zlib
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Any
 
@@ -27,9 +30,10 @@ from fastapi import (
     Depends,
     HTTPException,
     Query,
+    Request,
     status,
 )
-from fastapi.responses import PlainTextResponse, Response
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 
 from backend.api.dependencies import (
     get_db,
@@ -37,10 +41,16 @@ from backend.api.dependencies import (
 )
 from backend.api.models.responses import (
     APIResponse,
+    CursorPaginatedResponse,
+    CursorPaginationMeta,
     ErrorDetail,
     Meta,
     PaginatedResponse,
 )
+from backend.api.utils.keyset_cursor import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
 from src.database.connection import DatabaseConnection
 from src.database.models import CitationModel
 from src.exceptions import DatabaseError, ValidationError
@@ -225,10 +235,12 @@ class CitationSearchParams(BaseModel):
     year_to: int | None = Field(None, description="End year")
     citation_type: str | None = Field(None, description="Citation type")
     doi: str | None = Field(None, description="DOI exact match")
+    document_id: int | None = Field(None, description="Source document")
     min_confidence: float = Field(
         0.0, ge=0, le=1, description="Minimum confidence score"
     )
     limit: int = Field(50, ge=1, le=200, description="Result limit")
+    cursor: str | None = Field(None, description="Cursor from the previous page")
 
 
 class CitationStatisticsData(BaseModel):
@@ -243,24 +255,16 @@ class CitationStatisticsData(BaseModel):
     documents_with_citations: int
 
 
-class ExportResponseData(BaseModel):
-    """Export response data."""
-
-    format: str
-    total_exported: int
-    content: str
-
-
 # ============================================================================
 # Typed Response Aliases
 # ============================================================================
 
 CitationResponse = APIResponse[CitationData]
 CitationListResponse = PaginatedResponse[CitationData]
+CitationSearchResponse = CursorPaginatedResponse[CitationData]
 CitationExtractResponse = APIResponse[CitationExtractResponseData]
 CitationNetworkResponse = APIResponse[CitationNetworkResponseData]
 CitationStatisticsResponse = APIResponse[CitationStatisticsData]
-CitationExportResponse = APIResponse[ExportResponseData]
 
 
 # ============================================================================
@@ -300,6 +304,25 @@ def validate_document_exists(
         )
 
 
+def encode_citation_cursor(sort_key: tuple[int, int], filters: dict[str, Any]) -> str:
+    """Encode a (year, id) keyset sort key as an opaque, URL-safe cursor."""
+    return encode_keyset_cursor(sort_key, filters)
+
+
+def decode_citation_cursor(cursor: str, filters: dict[str, Any]) -> tuple[int, int]:
+    """
+    Decode a cursor produced by encode_citation_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for other filters
+    """
+    year_key, citation_id = decode_keyset_cursor(cursor, filters, key_length=2)
+    try:
+        return int(year_key), int(citation_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
 def format_bibtex(citation: CitationModel) -> str:
     """Format citation as BibTeX entry."""
     cite_key = f"cite{citation.id}"
@@ -322,53 +345,142 @@ def format_bibtex(citation: CitationModel) -> str:
     return "\n".join(lines)
 
 
-def format_csv(citations: list[CitationModel]) -> str:
-    """Format citations as CSV."""
+def format_endnote(citation: CitationModel) -> str:
+    """Format citation as an EndNote tagged (.enw) record."""
+    lines = ["%0 Journal Article"]
+
+    if citation.authors:
+        lines.append(f"%A {citation.authors}")
+    if citation.title:
+        lines.append(f"%T {citation.title}")
+    if citation.journal_or_venue:
+        lines.append(f"%J {citation.journal_or_venue}")
+    if citation.publication_year:
+        lines.append(f"%D {citation.publication_year}")
+    if citation.page_range:
+        lines.append(f"%P {citation.page_range}")
+    if citation.doi:
+        lines.append(f"%R {citation.doi}")
+
+    return "\n".join(lines)
+
+
+CSV_EXPORT_COLUMNS = [
+    "id",
+    "document_id",
+    "authors",
+    "title",
+    "publication_year",
+    "journal_or_venue",
+    "doi",
+    "page_range",
+    "citation_type",
+    "confidence_score",
+]
+
+EXPORT_FORMATS = {
+    # format: (media type, file extension)
+    "bibtex": ("application/x-bibtex", "bib"),
+    "endnote": ("application/x-endnote-refer", "enw"),
+    "json": ("application/json", "json"),
+    "csv": ("text/csv", "csv"),
+}
+
+EXPORT_BATCH_SIZE = 1000
+
+
+def format_csv_rows(citations: list[CitationModel], header: bool = False) -> str:
+    """Format a batch of citations as CSV rows."""
     output = io.StringIO()
     writer = csv.writer(output)
 
-    # Header
-    writer.writerow(
-        [
-            "id",
-            "document_id",
-            "authors",
-            "title",
-            "publication_year",
-            "journal_or_venue",
-            "doi",
-            "page_range",
-            "citation_type",
-            "confidence_score",
-        ]
+    if header:
+        writer.writerow(CSV_EXPORT_COLUMNS)
+    writer.writerows(
+        [getattr(c, column) for column in CSV_EXPORT_COLUMNS] for c in citations
     )
 
-    # Data rows
-    for c in citations:
-        writer.writerow(
-            [
-                c.id,
-                c.document_id,
-                c.authors,
-                c.title,
-                c.publication_year,
-                c.journal_or_venue,
-                c.doi,
-                c.page_range,
-                c.citation_type,
-                c.confidence_score,
-            ]
-        )
-
     return output.getvalue()
 
 
-def format_json_export(citations: list[CitationModel]) -> str:
-    """Format citations as JSON string."""
-    import json
+def iter_export_chunks(
+    format: str, batches: Iterable[list[CitationModel]]
+) -> Iterator[str]:
+    """
+    Format citation batches incrementally, one chunk per batch.
+
+    Args:
+        format: Export format (bibtex, endnote, json, csv)
+        batches: Citation batches in export order
 
-    data = [c.to_api_dict() for c in citations]
-    return json.dumps(data, indent=2, default=str)
+    Yields:
+        Text chunks that concatenate to the complete export document
+    """
+    if format == "csv":
+        yield format_csv_rows([], header=True)
+        for batch in batches:
+            yield format_csv_rows(batch)
+        return
+
+    if format == "json":
+        yield "["
+        separator = "\n"
+        for batch in batches:
+            parts = []
+            for citation in batch:
+                parts.append(separator)
+                parts.append(json.dumps(citation.to_api_dict(), default=str))
+                separator = ",\n"
+            yield "".join(parts)
+        yield "\n]\n"
+        return
+
+    formatter = format_bibtex if format == "bibtex" else format_endnote
+    for batch in batches:
+        yield "".join(f"{formatter(c)}\n\n" for c in batch)
+
+
+def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Gzip-compress text chunks on the fly."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Check whether an Accept-Encoding header allows a gzip response body.
+
+    An explicit gzip coding decides by its q-value, otherwise a ``*``
+    wildcard does; ``q=0`` marks a coding as not acceptable.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        True if gzip has a non-zero quality
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
 
 
 # ============================================================================
@@ -564,7 +676,7 @@ async def get_document_citations(
 
 
 @router.get(
-    "/{citation_id}",
+    "/{citation_id:int}",
     response_model=CitationResponse,
     summary="Get citation by ID",
     description="Get detailed information about a specific citation",
@@ -624,7 +736,7 @@ async def get_citation(
 
 
 @router.put(
-    "/{citation_id}",
+    "/{citation_id:int}",
     response_model=CitationResponse,
     summary="Update citation",
     description="Update citation information (manual correction)",
@@ -716,7 +828,7 @@ async def update_citation(
 
 
 @router.delete(
-    "/{citation_id}",
+    "/{citation_id:int}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete citation",
     description="Delete a specific citation",
@@ -766,12 +878,12 @@ async def delete_citation(
 
 @router.get(
     "/search",
-    response_model=CitationListResponse,
+    response_model=CitationSearchResponse,
     summary="Search citations",
-    description="Search citations by various criteria",
+    description="Search citations by various criteria with cursor pagination",
     responses={
         200: {"description": "Search completed successfully"},
-        400: {"description": "Invalid search parameters"},
+        400: {"description": "Invalid search parameters or cursor"},
         500: {"description": "Internal server error"},
     },
 )
@@ -782,14 +894,19 @@ async def search_citations(
     year_to: int | None = Query(None, description="End year"),
     citation_type: str | None = Query(None, description="Citation type filter"),
     doi: str | None = Query(None, description="DOI exact match"),
+    document_id: int | None = Query(None, description="Source document filter"),
     min_confidence: float = Query(0.0, ge=0, le=1, description="Minimum confidence"),
     limit: int = Query(50, ge=1, le=200, description="Result limit"),
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
     citation_repo: ICitationRepository = Depends(get_citation_repository),
-) -> CitationListResponse:
+) -> CitationSearchResponse:
     """
     Search citations by various criteria.
 
+    Results are ordered by publication year then ID, newest first. Pass the
+    returned ``next_cursor`` back to fetch the following page; cursors are
+    only valid for the filters they were issued with.
+
     Args:
         author: Author name for fuzzy matching
         title: Title keywords
@@ -797,66 +914,44 @@ async def search_citations(
         year_to: End year for year range
         citation_type: Citation type filter
         doi: DOI for exact matching
+        document_id: Source document filter
         min_confidence: Minimum confidence score
         limit: Maximum results to return
-        page: Page number for pagination
+        cursor: Opaque cursor from the previous page
         citation_repo: Citation repository (injected)
 
     Returns:
-        CitationListResponse with matching citations
+        CitationSearchResponse with matching citations
 
     Raises:
-        HTTPException: 400 on invalid search parameters
+        HTTPException: 400 on invalid search parameters or cursor
     """
     try:
-        citations: list[CitationModel] = []
-
-        # Search by specific criteria
-        if doi:
-            citation = citation_repo.find_by_doi(doi)
-            if citation:
-                citations = [citation]
-        elif author:
-            citations = citation_repo.search_by_author(author, limit)
-        elif title:
-            citations = citation_repo.search_by_title(title, limit)
-        elif year_from is not None and year_to is not None:
-            citations = citation_repo.find_by_year_range(year_from, year_to)
-        elif citation_type:
-            citations = citation_repo.get_by_type(citation_type)
-        else:
-            # No specific filter - this would need a get_all method
-            # For now, return empty or use statistics to get all
-            citations = []
-
-        # Filter by confidence
-        if min_confidence > 0:
-            citations = [
-                c
-                for c in citations
-                if c.confidence_score and c.confidence_score >= min_confidence
-            ]
-
-        # Pagination
-        total = len(citations)
-        total_pages = (total + limit - 1) // limit
-        offset = (page - 1) * limit
-        paginated_citations = citations[offset : offset + limit]
-
-        citation_data = [model_to_citation_data(c) for c in paginated_citations]
+        filters = {
+            "author": author,
+            "title": title,
+            "year_from": year_from,
+            "year_to": year_to,
+            "document_id": document_id,
+            "citation_type": citation_type,
+            "doi": doi,
+            "min_confidence": min_confidence,
+        }
+        after = decode_citation_cursor(cursor, filters) if cursor else None
 
-        from backend.api.models.responses import PaginationMeta
+        citations, next_key = citation_repo.search_page(
+            **filters, after=after, limit=limit
+        )
 
-        return CitationListResponse(
+        return CitationSearchResponse(
             success=True,
-            data=citation_data,
-            meta=PaginationMeta(
-                page=page,
+            data=[model_to_citation_data(c) for c in citations],
+            meta=CursorPaginationMeta(
                 per_page=limit,
-                total=total,
-                total_pages=total_pages,
-                has_next=page < total_pages,
-                has_prev=page > 1,
+                has_next=next_key is not None,
+                next_cursor=(
+                    encode_citation_cursor(next_key, filters) if next_key else None
+                ),
             ),
             errors=None,
         )
@@ -922,7 +1017,9 @@ async def get_citation_network(
         validate_document_exists(document_id, doc_repo)
 
         # Build network via service
-        network_data = citation_service.build_citation_network(document_id, depth)
+        network_data = citation_service.build_citation_network(
+            document_id, depth, min_confidence
+        )
 
         # Convert nodes
         nodes = [
@@ -952,7 +1049,7 @@ async def get_citation_network(
         metrics = CitationNetworkMetrics(
             total_nodes=len(nodes),
             total_edges=len(edges),
-            max_depth_reached=network_data.get("depth", depth),
+            max_depth_reached=network_data.get("depth_reached", depth),
             average_confidence=edge_metrics.get("avg_confidence", 0.0),
         )
 
@@ -989,29 +1086,39 @@ async def get_citation_network(
 
 @router.post(
     "/export/{format}",
-    response_model=CitationExportResponse,
+    response_class=StreamingResponse,
     summary="Export citations",
-    description="Export citations in various formats (BibTeX, JSON, CSV)",
+    description=(
+        "Stream citations as BibTeX, EndNote, JSON or CSV. The response is "
+        "gzip-encoded when the client accepts it."
+    ),
     responses={
-        200: {"description": "Export completed successfully"},
+        200: {"description": "Export stream started"},
         400: {"description": "Invalid format or parameters"},
+        404: {"description": "Document not found"},
         500: {"description": "Internal server error"},
     },
 )
 async def export_citations(
     format: str,
+    request: Request,
     document_id: int | None = Query(None, description="Filter by document ID"),
     author: str | None = Query(None, description="Filter by author"),
     year_from: int | None = Query(None, description="Start year"),
     year_to: int | None = Query(None, description="End year"),
     citation_repo: ICitationRepository = Depends(get_citation_repository),
     doc_repo: IDocumentRepository = Depends(get_document_repository),
-) -> CitationExportResponse:
+) -> StreamingResponse:
     """
-    Export citations in specified format.
+    Stream citations in the specified format.
+
+    Citations are read in id-ordered batches and each batch is formatted and
+    sent before the next is fetched, so memory use does not grow with the
+    size of the export and the first bytes are sent after one query.
 
     Args:
-        format: Export format (bibtex, json, csv)
+        format: Export format (bibtex, endnote, json, csv)
+        request: Incoming request, used for Accept-Encoding negotiation
         document_id: Optional document ID filter
         author: Optional author filter
         year_from: Optional start year filter
@@ -1020,55 +1127,57 @@ async def export_citations(
         doc_repo: Document repository (injected)
 
     Returns:
-        CitationExportResponse with exported content
+        StreamingResponse with the export as an attachment
 
     Raises:
-        HTTPException: 400 for invalid format
+        HTTPException: 400 for invalid format, 404 if document not found
     """
     try:
         # Validate format
         format_lower = format.lower()
-        if format_lower not in ("bibtex", "json", "csv"):
+        if format_lower not in EXPORT_FORMATS:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported format: {format}. Use bibtex, json, or csv.",
+                detail=(
+                    f"Unsupported format: {format}. Use {', '.join(EXPORT_FORMATS)}."
+                ),
             )
 
-        # Get citations to export
-        citations: list[CitationModel] = []
-
         if document_id:
-            # Validate document exists
             validate_document_exists(document_id, doc_repo)
-            citations = citation_repo.find_by_document_id(document_id)
-        elif author:
-            citations = citation_repo.search_by_author(author, limit=1000)
-        elif year_from is not None and year_to is not None:
-            citations = citation_repo.find_by_year_range(year_from, year_to)
-        else:
-            # Get all citations - would need a get_all method
-            # For now, get by document IDs
-            all_docs = doc_repo.get_all(limit=1000, offset=0)
-            for doc in all_docs:
-                citations.extend(citation_repo.find_by_document_id(doc.id))
-
-        # Format export content
-        if format_lower == "bibtex":
-            content = "\n\n".join(format_bibtex(c) for c in citations)
-        elif format_lower == "csv":
-            content = format_csv(citations)
-        else:  # json
-            content = format_json_export(citations)
-
-        return CitationExportResponse(
-            success=True,
-            data=ExportResponseData(
-                format=format_lower,
-                total_exported=len(citations),
-                content=content,
+
+        batches = citation_repo.iter_batches(
+            document_id=document_id,
+            author=author,
+            year_from=year_from,
+            year_to=year_to,
+            batch_size=EXPORT_BATCH_SIZE,
+        )
+
+        def stream() -> Iterator[str]:
+            try:
+                yield from iter_export_chunks(format_lower, batches)
+            except Exception as e:
+                # Headers are already sent; the truncated body is all we can do
+                logger.error(f"Citation export aborted mid-stream: {e}", exc_info=True)
+                raise
+
+        media_type, extension = EXPORT_FORMATS[format_lower]
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        headers = {
+            "Content-Disposition": (
+                f'attachment; filename="citations_{timestamp}.{extension}"'
             ),
-            meta=Meta(),
-            errors=None,
+            "Vary": "Accept-Encoding",
+        }
+
+        body: Iterator[str] | Iterator[bytes] = stream()
+        if accepts_gzip(request.headers.get("accept-encoding", "")):
+            body = gzip_chunks(body)
+            headers["Content-Encoding"] = "gzip"
+
+        return StreamingResponse(
+            body, media_type=f"{media_type}; charset=utf-8", headers=headers
         )
 
     except HTTPException:
@@ -14,7 +14,9 @@ References:
 - ADR-003: API Versioning Strategy
 """
 
+import asyncio
 import logging
+import os
 import time
 from pathlib import Path
 
@@ -22,6 +24,7 @@ from fastapi import (
     APIRouter,
     Depends,
     File,
+    Header,
     HTTPException,
     Query,
     Response,
@@ -31,9 +34,9 @@ from fastapi import (
 from fastapi.responses import FileResponse
 
 from backend.api.dependencies import (
+    get_async_document_repository,
     get_document_library_service,
     get_document_preview_service,
-    get_document_repository,
     get_documents_dir,
 )
 from backend.api.models.responses import (
@@ -43,7 +46,9 @@ from backend.api.models.responses import (
     Links,
     PaginationMeta,
 )
+from backend.api.utils.keyset_cursor import decode_keyset_cursor, encode_keyset_cursor
 from backend.api.utils.path_safety import build_safe_temp_path, is_within_allowed_roots
+from backend.api.utils.ranged_file_response import RangedFileResponse
 from backend.config.application_config import get_application_config
 from backend.services.metrics_collector import get_metrics_collector
 from src.database.models import DocumentModel
@@ -52,8 +57,9 @@ from src.exceptions import (
     DocumentValidationError,
     DuplicateDocumentError,
 )
-from src.interfaces.repository_interfaces import IDocumentRepository
 from src.interfaces.service_interfaces import IDocumentLibraryService
+from src.repositories.async_repository import AsyncDocumentRepository
+from src.repositories.document_repository import SUMMARY_COLUMNS
 from src.services.document_preview_service import (
     DocumentPreviewService,
     PreviewContent,
@@ -61,7 +67,9 @@ from src.services.document_preview_service import (
     PreviewError,
     PreviewNotFoundError,
     PreviewUnsupportedError,
+    ThumbnailSprite,
 )
+from src.services.file_status_resolver import get_file_status_resolver
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +109,23 @@ def _build_preview_headers(
     }
 
 
+def _etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """Evaluate If-None-Match against a strong ETag (weak comparison)."""
+    if not if_none_match or not etag:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+def _thumbnail_cache_control(version: str | None, ttl_seconds: int) -> str:
+    # Versioned URLs change with the file hash, so they can be cached for good
+    if version:
+        return "private, max-age=31536000, immutable"
+    return f"private, max-age={ttl_seconds}, must-revalidate"
+
+
 def _handle_preview_exception(operation: str, exc: Exception) -> None:
     if isinstance(exc, PreviewDisabledError):
         _record_preview_metric(operation, "disabled", None)
@@ -139,7 +164,9 @@ def _handle_preview_exception(operation: str, exc: Exception) -> None:
 
 
 def model_to_response_data(
-    document: DocumentModel, base_url: str = "/api"
+    document: DocumentModel,
+    base_url: str = "/api",
+    file_exists: bool | None = None,
 ) -> DocumentData:
     """
     Convert DocumentModel to DocumentData response.
@@ -147,12 +174,15 @@ def model_to_response_data(
     Args:
         document: Database document model
         base_url: Base URL for generating links
+        file_exists: Pre-resolved file availability from a batched listing;
+            a single stat() is done here when omitted
 
     Returns:
         DocumentData with HATEOAS links
     """
-    # Check if file exists
-    file_exists = Path(document.file_path).exists() if document.file_path else False
+    if file_exists is None:
+        # One stat() instead of a directory scan for single-document responses
+        file_exists = bool(document.file_path) and os.path.exists(document.file_path)
 
     # Generate HATEOAS links
     links = Links(
@@ -174,6 +204,8 @@ def model_to_response_data(
         if preview_config and preview_config.enabled:
             preview_url = f"{base_url}/documents/{document.id}/preview"
             thumbnail_url = f"{base_url}/documents/{document.id}/thumbnail"
+            if document.file_hash:
+                thumbnail_url += f"?v={document.file_hash[:16]}"
     except Exception:
         logger.debug("Preview configuration unavailable", exc_info=True)
 
@@ -223,57 +255,96 @@ async def list_documents(
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     sort_by: str = Query("created_at", description="Sort field"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
+    cursor: str | None = Query(
+        None, description="Cursor from the previous page (overrides page)"
+    ),
     # Dependencies
-    doc_repo: IDocumentRepository = Depends(get_document_repository),
+    doc_repo: AsyncDocumentRepository = Depends(get_async_document_repository),
 ) -> DocumentListResponse:
     """
     List all documents with pagination and optional search.
 
     This endpoint demonstrates:
     - Proper dependency injection (doc_repo injected)
-    - Database-level pagination (LIMIT/OFFSET)
-    - Batch file existence check (no N+1 queries)
+    - Queries run on database threads, concurrently with the total count
+    - Only the columns the listing shows are loaded (no metadata JSON)
+    - Keyset pagination: pass ``meta.next_cursor`` back as ``cursor`` to
+      fetch the next page with an index seek; ``page`` falls back to OFFSET
+    - Cached totals (trigger-maintained count, per-query search totals)
+    - Batch file existence check (one directory scan per page, off the loop)
     - HATEOAS links on each document
     - Standardized response envelope
     """
     try:
-        # Calculate offset for pagination
-        offset = (page - 1) * per_page
+        # Cursors are only valid for the listing they were issued for
+        filters = (
+            {"query": query}
+            if query
+            else {"sort_by": sort_by.lower(), "sort_order": sort_order.lower()}
+        )
+        after = None
+        if cursor:
+            sort_value, document_id = decode_keyset_cursor(
+                cursor, filters, key_length=2
+            )
+            if not isinstance(sort_value, str | int | float) or not isinstance(
+                document_id, int
+            ):
+                raise ValueError("Invalid cursor")
+            after = (sort_value, document_id)
+        offset = 0 if after else (page - 1) * per_page
 
         # Get documents from repository
         if query:
-            # Search mode with proper pagination + total count
-            documents, total = doc_repo.search(
-                query=query,
-                limit=per_page,
-                offset=offset,
+            # Search mode with keyset pagination + cached total count
+            (documents, next_key), total = await asyncio.gather(
+                doc_repo.search_page(
+                    query,
+                    after=after,
+                    offset=offset,
+                    limit=per_page,
+                    columns=SUMMARY_COLUMNS,
+                ),
+                doc_repo.count_search(query),
             )
         else:
             # List all mode
-            documents = doc_repo.get_all(
-                limit=per_page,
-                offset=offset,
-                sort_by=sort_by,
-                sort_order=sort_order,
+            (documents, next_key), total = await asyncio.gather(
+                doc_repo.get_page(
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    after=after,
+                    offset=offset,
+                    limit=per_page,
+                    columns=SUMMARY_COLUMNS,
+                ),
+                doc_repo.count(),
             )
-            total = doc_repo.count()
+
+        # Resolve file availability for the whole page in a worker thread
+        file_status = await get_file_status_resolver().resolve_async(
+            doc.file_path for doc in documents
+        )
 
         # Convert to response format with HATEOAS links
-        # Note: File availability is checked inside model_to_response_data
-        document_data = [model_to_response_data(doc) for doc in documents]
+        document_data = [
+            model_to_response_data(
+                doc, file_exists=file_status.get(doc.file_path, False)
+            )
+            for doc in documents
+        ]
 
         # Calculate pagination metadata
         total_pages = (total + per_page - 1) // per_page
-        has_next = page < total_pages
-        has_prev = page > 1
 
         meta = PaginationMeta(
             page=page,
             per_page=per_page,
             total=total,
             total_pages=total_pages,
-            has_next=has_next,
-            has_prev=has_prev,
+            has_next=next_key is not None,
+            has_prev=page > 1 or after is not None,
+            next_cursor=encode_keyset_cursor(next_key, filters) if next_key else None,
         )
 
         return DocumentListResponse(
@@ -315,7 +386,7 @@ async def list_documents(
 )
 async def get_document(
     document_id: int,
-    doc_repo: IDocumentRepository = Depends(get_document_repository),
+    doc_repo: AsyncDocumentRepository = Depends(get_async_document_repository),
 ) -> DocumentResponse:
     """
     Get a specific document by ID.
@@ -332,7 +403,7 @@ async def get_document(
     """
     try:
         # Get document from repository
-        document = doc_repo.get_by_id(document_id)
+        document = await doc_repo.get_by_id(document_id)
 
         if document is None:
             raise HTTPException(
@@ -413,6 +484,8 @@ async def get_document_preview(
 )
 async def get_document_thumbnail(
     document_id: int,
+    v: str | None = Query(None, description="Thumbnail version from thumbnail_url"),
+    if_none_match: str | None = Header(None),
     preview_service: DocumentPreviewService = Depends(get_document_preview_service),
 ) -> Response:
     """Return the cached thumbnail (first page) for a document."""
@@ -424,6 +497,13 @@ async def get_document_thumbnail(
         headers = _build_preview_headers(
             document_id, preview, preview_service.settings.cache_ttl_seconds
         )
+        if preview.etag:
+            headers["ETag"] = preview.etag
+            headers["Cache-Control"] = _thumbnail_cache_control(
+                v, preview_service.settings.cache_ttl_seconds
+            )
+        if _etag_matches(if_none_match, preview.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
         return Response(
             content=preview.content, media_type=preview.content_type, headers=headers
         )
@@ -431,6 +511,62 @@ async def get_document_thumbnail(
         _handle_preview_exception("thumbnail", exc)
 
 
+@router.get(
+    "/thumbnails/sprite",
+    summary="Get thumbnails of several documents as one sprite sheet",
+    responses={
+        200: {
+            "content": {
+                "image/webp": {"schema": {"type": "string", "format": "binary"}}
+            }
+        },
+        304: {"description": "Sprite unchanged"},
+        400: {"description": "Invalid document list"},
+        503: {"description": "Previews disabled"},
+    },
+)
+async def get_thumbnail_sprite(
+    ids: str = Query(..., description="Comma-separated document IDs, in grid order"),
+    columns: int = Query(10, ge=1, le=50, description="Cells per sprite row"),
+    if_none_match: str | None = Header(None),
+    preview_service: DocumentPreviewService = Depends(get_document_preview_service),
+) -> Response:
+    """
+    Return one image holding the thumbnails of a document grid.
+
+    Cells are laid out row-major in the order of ``ids``; the X-Sprite-*
+    headers give the cell size and any documents left blank.
+    """
+    start = time.perf_counter()
+    try:
+        try:
+            document_ids = [int(part) for part in ids.split(",") if part.strip()]
+        except ValueError as exc:
+            raise PreviewError("ids must be comma-separated integers") from exc
+        # Rendering and encoding the sheet blocks; keep it off the event loop
+        sprite: ThumbnailSprite = await asyncio.to_thread(
+            preview_service.get_thumbnail_sprite, document_ids, columns
+        )
+        _record_preview_metric("sprite", "success", time.perf_counter() - start)
+        headers = {
+            "ETag": sprite.etag,
+            "Cache-Control": _thumbnail_cache_control(
+                None, preview_service.settings.cache_ttl_seconds
+            ),
+            "X-Sprite-Columns": str(sprite.columns),
+            "X-Sprite-Cell-Width": str(sprite.cell_width),
+            "X-Sprite-Cell-Height": str(sprite.cell_height),
+            "X-Sprite-Missing": ",".join(map(str, sprite.missing_ids)),
+        }
+        if _etag_matches(if_none_match, sprite.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(
+            content=sprite.content, media_type=sprite.content_type, headers=headers
+        )
+    except Exception as exc:  # noqa: BLE001
+        _handle_preview_exception("sprite", exc)
+
+
 # ============================================================================
 # Upload Document
 # ============================================================================
@@ -643,16 +779,23 @@ async def upload_document(
     "/{document_id}/download",
     response_class=FileResponse,
     summary="Download document",
-    description="Download the PDF file for a document",
+    description=(
+        "Download the PDF file for a document. Supports Range (including "
+        "multiple ranges), If-Range and If-None-Match against an ETag derived "
+        "from the stored file hash."
+    ),
     responses={
         200: {"description": "File download"},
+        206: {"description": "Requested byte range(s)"},
+        304: {"description": "File unchanged"},
         404: {"description": "Document or file not found"},
+        416: {"description": "Range not satisfiable"},
         500: {"description": "Internal server error"},
     },
 )
 async def download_document(
     document_id: int,
-    doc_repo: IDocumentRepository = Depends(get_document_repository),
+    doc_repo: AsyncDocumentRepository = Depends(get_async_document_repository),
     documents_dir: Path = Depends(get_documents_dir),
 ) -> FileResponse:
     """
@@ -662,6 +805,7 @@ async def download_document(
     - Path traversal prevention (validate_file_path)
     - Secure file serving
     - Proper content-type headers
+    - Byte ranges and conditional requests for PDF viewers and resumes
 
     Args:
         document_id: Document ID
@@ -676,7 +820,7 @@ async def download_document(
     """
     try:
         # Get document from repository
-        document = doc_repo.get_by_id(document_id)
+        document = await doc_repo.get_by_id(document_id)
 
         if document is None:
             raise HTTPException(
@@ -709,15 +853,32 @@ async def download_document(
             )
 
         # Check if file exists
-        if not file_path.exists():
+        try:
+            stat_result = os.stat(file_path)
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Document file not found on disk",
-            )
+            ) from None
+
+        # The stored hash identifies the bytes only while the file is still
+        # the one that was hashed: same size and not modified since the row
+        # was written. A file rewritten behind the library's back gets a
+        # stat-based ETag instead
+        etag = None
+        if (
+            document.file_hash
+            and document.updated_at is not None
+            and stat_result.st_size == document.file_size
+            and stat_result.st_mtime <= document.updated_at.timestamp()
+        ):
+            etag = f'"{document.file_hash}"'
 
         # Return file
-        return FileResponse(
+        return RangedFileResponse(
             path=file_path,
+            etag=etag,
+            stat_result=stat_result,
             filename=f"{document.title}.pdf",
             media_type="application/pdf",
         )
@@ -21,6 +21,7 @@ from backend.api.models import (
     LibraryStatsResponse,
 )
 from src.controllers.library_controller import LibraryController
+from src.database.executor import get_database_executor
 from src.database.models import DocumentModel
 
 logger = logging.getLogger(__name__)
@@ -33,7 +34,9 @@ async def get_library_statistics(
 ) -> LibraryStatsResponse:
     """Get comprehensive library statistics."""
     try:
-        stats: dict[str, Any] = controller.get_library_statistics()
+        stats: dict[str, Any] = await get_database_executor().run(
+            controller.get_library_statistics
+        )
         if "error" in stats:
             raise SystemException(
                 message=f"Failed to get library statistics: {stats['error']}",
@@ -70,8 +73,9 @@ async def find_duplicate_documents(
 ) -> DuplicatesResponse:
     """Find duplicate documents in the library."""
     try:
-        duplicates: list[tuple[str, list[DocumentModel]]] = (
-            controller.find_duplicate_documents()
+        executor = get_database_executor()
+        duplicates: list[tuple[str, list[DocumentModel]]] = await executor.run(
+            controller.find_duplicate_documents
         )
         duplicate_groups: list[DuplicateGroup] = []
         total_duplicates: int = 0
@@ -103,7 +107,9 @@ async def cleanup_library(
 ) -> CleanupResponse:
     """Perform library cleanup operations."""
     try:
-        results: dict[str, Any] = controller.cleanup_library()
+        results: dict[str, Any] = await get_database_executor().run(
+            controller.cleanup_library
+        )
         if "error" in results:
             raise SystemException(
                 message=f"Library cleanup failed: {results['error']}",
@@ -131,7 +137,9 @@ async def check_library_health(
 ) -> BaseResponse:
     """Check library health status."""
     try:
-        stats: dict[str, Any] = controller.get_library_statistics()
+        stats: dict[str, Any] = await get_database_executor().run(
+            controller.get_library_statistics
+        )
         health: dict[str, Any] = stats.get("health", {})
         # Determine overall health
         issues: list[str] = []
@@ -160,7 +168,9 @@ async def optimize_library(
     """Optimize library storage and performance."""
     try:
         # This could include various optimization operations
-        results: dict[str, Any] = controller.cleanup_library()
+        results: dict[str, Any] = await get_database_executor().run(
+            controller.cleanup_library
+        )
         if "error" in results:
             raise SystemException(
                 message=f"Library optimization failed: {results['error']}",
@@ -205,8 +215,8 @@ async def search_documents(
 ) -> DocumentListResponse:
     """Search documents by title and content."""
     try:
-        documents: list[DocumentModel] = controller.get_documents(
-            search_query=q, limit=limit
+        documents: list[DocumentModel] = await get_database_executor().run(
+            controller.get_documents, search_query=q, limit=limit
         )
         # Convert to response models
         doc_responses: list[DocumentResponse] = []
@@ -231,8 +241,8 @@ async def get_recent_documents(
     """Get recently accessed documents."""
     try:
         # Use the library service directly for recent documents
-        recent_docs: list[DocumentModel] = (
-            controller.library_service.get_recent_documents(limit)
+        recent_docs: list[DocumentModel] = await get_database_executor().run(
+            controller.library_service.get_recent_documents, limit
         )
         # Convert to response models
         doc_responses: list[DocumentResponse] = []
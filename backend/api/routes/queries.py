@@ -13,23 +13,28 @@ References:
 - ADR-003: API Versioning Strategy
 """
 
+import json
 import logging
 import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from backend.api.dependencies import (
-    get_document_repository,
+    get_async_document_repository,
     get_rag_cache_manager,
     require_rag_service,
 )
 from backend.api.models.requests import MultiDocumentQueryRequest, QueryRequest
 from backend.api.models.responses import APIResponse, Links
+from backend.services.rag_token_stream import stream_tokens
 from config import Config
 from src.interfaces.rag_service_interfaces import IRAGCacheManager
-from src.interfaces.repository_interfaces import IDocumentRepository
+from src.repositories.async_repository import AsyncDocumentRepository
 from src.services.enhanced_rag_service import (
     EnhancedRAGService,
     RAGQueryError,
@@ -114,9 +119,14 @@ class QueryResponse(APIResponse[QueryResultData]):
     response_model=QueryResponse,
     status_code=status.HTTP_200_OK,
     summary="Query a document",
-    description="Execute RAG query against a single document",
+    description="Execute RAG query against a single document. With "
+    '"streaming": true the answer is sent as Server-Sent Events while it is '
+    "generated.",
     responses={
-        200: {"description": "Query executed successfully"},
+        200: {
+            "description": "Query executed successfully",
+            "content": {"text/event-stream": {}},
+        },
         400: {"description": "Invalid query parameters"},
         404: {"description": "Document not found or index not built"},
         503: {"description": "RAG service not available"},
@@ -126,10 +136,10 @@ class QueryResponse(APIResponse[QueryResultData]):
 async def query_document(
     document_id: int,
     request: QueryRequest,
-    doc_repo: IDocumentRepository = Depends(get_document_repository),
+    doc_repo: AsyncDocumentRepository = Depends(get_async_document_repository),
     cache_manager: IRAGCacheManager = Depends(get_rag_cache_manager),
     rag_service: EnhancedRAGService = Depends(require_rag_service),
-) -> QueryResponse:
+) -> QueryResponse | StreamingResponse:
     """
     Execute RAG query against a single document.
 
@@ -140,6 +150,9 @@ async def query_document(
     4. Cache result for future queries
     5. Return response with sources
 
+    When request.streaming is set, steps 3-5 stream the answer as
+    Server-Sent Events instead (see _stream_query_events).
+
     Args:
         document_id: Document to query
         request: Query request with parameters
@@ -148,7 +161,7 @@ async def query_document(
         rag_service: Enhanced RAG service (injected)
 
     Returns:
-        QueryResponse with generated answer and sources
+        QueryResponse with generated answer and sources, or an event stream
 
     Raises:
         HTTPException: 404 if document/index not found, 503 if RAG unavailable, 500 if query fails
@@ -157,7 +170,7 @@ async def query_document(
 
     try:
         # 1. Validate document exists
-        document = doc_repo.get_by_id(document_id)
+        document = await doc_repo.get_by_id(document_id)
         if document is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -170,6 +183,11 @@ async def query_document(
             document_id=document_id,
         )
 
+        if request.streaming:
+            return await _stream_query_events(
+                document_id, request, cache_manager, rag_service, cached_result
+            )
+
         if cached_result is not None:
             # Return cached result
             processing_time_ms = int((time.time() - start_time) * 1000)
@@ -270,6 +288,114 @@ async def query_document(
         ) from e
 
 
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format one Server-Sent Event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _stream_query_events(
+    document_id: int,
+    request: QueryRequest,
+    cache_manager: IRAGCacheManager,
+    rag_service: EnhancedRAGService,
+    cached_result: str | None,
+) -> StreamingResponse:
+    """
+    Stream a single-document answer as Server-Sent Events.
+
+    Events:
+    - token: {"text": delta} for each generated token
+    - done: {"response", "cached", "processing_time_ms"} once the answer is complete
+    - error: {"detail"} if generation fails after the stream has started
+
+    The first token is awaited before the response starts, so index and
+    query failures still map to 404/500 status codes. A client disconnect
+    closes the token stream, which stops generation.
+
+    Args:
+        document_id: Document to query
+        request: Query request with parameters
+        cache_manager: Cache manager
+        rag_service: Enhanced RAG service
+        cached_result: Cached answer, replayed as a single token if present
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+
+    Raises:
+        HTTPException: 404 if the index is missing, 500 if the query fails
+    """
+    start_time = time.time()
+    if cached_result is not None:
+        tokens: AsyncIterator[str] = _replay(cached_result)
+    else:
+        tokens = stream_tokens(
+            lambda: rag_service.stream_query_document(
+                query=request.query, document_id=document_id
+            )
+        )
+
+    try:
+        first_token = await anext(tokens, "")
+    except VectorIndexNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Vector index not found for document {document_id}. "
+            "Please build the index first.",
+        ) from e
+    except RAGQueryError as e:
+        logger.error(f"RAG query failed for document {document_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Query execution failed: {str(e)}",
+        ) from e
+
+    async def events() -> AsyncIterator[str]:
+        parts = [first_token]
+        async with aclosing(tokens):
+            yield _sse_event("token", {"text": first_token})
+            try:
+                async for token in tokens:
+                    parts.append(token)
+                    yield _sse_event("token", {"text": token})
+            except Exception as e:
+                logger.error(f"Streaming query failed for document {document_id}: {e}")
+                yield _sse_event("error", {"detail": f"Query execution failed: {e}"})
+                return
+
+        response_text = "".join(parts)
+        if cached_result is None:
+            cache_manager.cache_query_result(
+                query=request.query,
+                document_id=document_id,
+                result=response_text,
+                ttl_seconds=3600,  # 1 hour TTL
+            )
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"RAG query streamed on document {document_id} "
+            f"(time: {processing_time_ms}ms)"
+        )
+        yield _sse_event(
+            "done",
+            {
+                "response": response_text,
+                "cached": cached_result is not None,
+                "processing_time_ms": processing_time_ms,
+            },
+        )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _replay(text: str) -> AsyncIterator[str]:
+    yield text
+
+
 # ============================================================================
 # Multi-Document Query
 # ============================================================================
@@ -291,7 +417,7 @@ async def query_document(
 )
 async def query_multiple_documents(
     request: MultiDocumentQueryRequest,
-    doc_repo: IDocumentRepository = Depends(get_document_repository),
+    doc_repo: AsyncDocumentRepository = Depends(get_async_document_repository),
     rag_service: EnhancedRAGService = Depends(require_rag_service),
 ) -> QueryResponse:
     """
@@ -318,7 +444,7 @@ async def query_multiple_documents(
 
     try:
         # 1. Validate documents exist
-        documents = doc_repo.get_by_ids(request.document_ids)
+        documents = await doc_repo.get_by_ids(request.document_ids)
 
         if len(documents) != len(request.document_ids):
             found_ids = {doc.id for doc in documents}
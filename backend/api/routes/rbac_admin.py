@@ -21,6 +21,7 @@ from backend.api.auth.rbac import (
     ResourceTypes,
     Role,
     SystemRoles,
+    get_permission_model,
     get_rbac_service,
     require_permission,
     require_role,
@@ -240,6 +241,7 @@ async def delete_role(
 
     db.delete(role)
     db.commit()
+    get_permission_model().invalidate()
 
     logger.info(f"Role {role_name} deleted by {current_user.email}")
 
@@ -0,0 +1,43 @@
+"""Opaque cursors for keyset-paginated list endpoints."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from collections.abc import Sequence
+from typing import Any
+
+
+def _filter_digest(filters: dict[str, Any]) -> str:
+    """Short digest binding a cursor to the filters it was issued for."""
+    canonical = json.dumps(filters, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_keyset_cursor(sort_key: Sequence[Any], filters: dict[str, Any]) -> str:
+    """Encode a keyset sort key as an opaque, URL-safe cursor."""
+    payload = json.dumps([*sort_key, _filter_digest(filters)])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_keyset_cursor(
+    cursor: str, filters: dict[str, Any], key_length: int
+) -> list[Any]:
+    """
+    Decode a cursor produced by encode_keyset_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for other filters
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        *sort_key, digest = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if len(sort_key) != key_length:
+        raise ValueError("Invalid cursor")
+    if digest != _filter_digest(filters):
+        raise ValueError("Cursor does not match the current search filters")
+    return sort_key
@@ -1,12 +1,15 @@
 """
 WebSocket Manager
 Manages WebSocket connections for real-time communication.
+Each connection has a bounded outbound queue drained by its own writer task,
+so a slow client only ever delays itself.
 """
 
 import asyncio
 import contextlib
 import json
 import logging
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -72,14 +75,180 @@ class RAGStreamConfig:
     task_timeout_seconds: int = 300  # 5 minutes
 
 
+class OverflowPolicy(Enum):
+    """What to do when a client's outbound queue is full."""
+
+    COALESCE = "coalesce"  # Replace pending progress for the same task
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+
+@dataclass
+class SendQueueConfig:
+    """Configuration for per-client outbound queues."""
+
+    max_queue_size: int = 256  # messages waiting per client
+    overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE
+    send_timeout_seconds: float | None = 30.0  # a stuck send disconnects
+
+
+# Message types that only carry the latest state of something, and the field
+# identifying that something; a newer message supersedes a queued older one
+PROGRESS_MESSAGE_KEYS = {
+    "rag_progress": "document_id",
+    "rag_progress_update": "task_id",
+    "index_progress": "document_id",
+    "upload_progress": "session_id",
+    "chunk_progress": "session_id",
+}
+
+
+def progress_key(data: dict[str, Any]) -> str | None:
+    """Coalescing key for a progress message, or None for other messages."""
+    field_name = PROGRESS_MESSAGE_KEYS.get(data.get("type", ""))
+    if field_name is None:
+        return None
+    value = data.get(field_name)
+    if value is None and isinstance(data.get("data"), dict):
+        value = data["data"].get(field_name)
+    return None if value is None else f"{data['type']}:{value}"
+
+
+class ClientConnection:
+    """
+    Outbound side of one WebSocket connection.
+
+    Messages are queued as already-serialized text and sent in order by a
+    dedicated writer task. Queued entries are ``[key, text]`` lists so a
+    coalesced progress update can replace its payload in place, keeping
+    its position in the queue.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        websocket: WebSocket,
+        config: SendQueueConfig,
+        on_failure: Callable[[str], None],
+    ) -> None:
+        self.client_id = client_id
+        self.websocket = websocket
+        self.config = config
+        self._on_failure = on_failure
+        self._queue: deque[list[Any]] = deque()
+        self._pending: dict[str, list[Any]] = {}
+        self._ready = asyncio.Event()
+        self._writer: asyncio.Task[None] | None = None
+        self._timed_out = False
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def start(self) -> None:
+        """Start the writer task."""
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def stop(self) -> None:
+        """Cancel the writer task and discard queued messages."""
+        if self._writer and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        self._queue.clear()
+        self._pending.clear()
+
+    def enqueue(self, text: str, key: str | None = None) -> bool:
+        """
+        Queue a message without waiting for the socket.
+
+        Args:
+            text: Serialized message
+            key: Progress key; under COALESCE a queued message with the same
+                key is replaced instead of queueing another
+        Returns:
+            False if the overflow policy requires disconnecting the client
+        """
+        policy = self.config.overflow_policy
+        if key is not None and policy is OverflowPolicy.COALESCE:
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry[1] = text
+                self.coalesced += 1
+                return True
+
+        if len(self._queue) >= self.config.max_queue_size:
+            if policy is OverflowPolicy.DISCONNECT:
+                return False
+            oldest_key, _ = self._queue.popleft()
+            if oldest_key is not None:
+                self._pending.pop(oldest_key, None)
+            self.dropped += 1
+
+        entry = [key, text]
+        self._queue.append(entry)
+        if key is not None and policy is OverflowPolicy.COALESCE:
+            self._pending[key] = entry
+        self._ready.set()
+        return True
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                while not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                key, text = self._queue.popleft()
+                if key is not None:
+                    self._pending.pop(key, None)
+                await self._send(text)
+                self.sent += 1
+        except asyncio.CancelledError:
+            if not self._timed_out:
+                raise
+            logger.error(f"Send to {self.client_id} timed out")
+            self._on_failure(self.client_id)
+        except Exception as e:
+            logger.error(f"Failed to send message to {self.client_id}: {e}")
+            self._on_failure(self.client_id)
+
+    async def _send(self, text: str) -> None:
+        # A timer cancels the writer rather than using asyncio.wait_for,
+        # which can swallow an outside cancellation on Python < 3.12
+        timeout = self.config.send_timeout_seconds
+        handle = (
+            asyncio.get_running_loop().call_later(timeout, self._send_timed_out)
+            if timeout is not None
+            else None
+        )
+        try:
+            await self.websocket.send_text(text)
+        finally:
+            if handle is not None:
+                handle.cancel()
+
+    def _send_timed_out(self) -> None:
+        self._timed_out = True
+        if self._writer is not None:
+            self._writer.cancel()
+
+
 class WebSocketManager:
     """Manages WebSocket connections for real-time features with RAG streaming support."""
 
-    def __init__(self) -> None:
+    def __init__(self, send_config: SendQueueConfig | None = None) -> None:
         # Store active connections
         self.active_connections: dict[str, WebSocket] = {}
         # Group connections by rooms/channels
-        self.rooms: dict[str, list[str]] = {}
+        self.rooms: dict[str, set[str]] = {}
+        self._client_rooms: dict[str, set[str]] = {}
+
+        # Outbound queues
+        self.send_config = send_config or SendQueueConfig()
+        self._connections: dict[str, ClientConnection] = {}
+        self._overflow_disconnects = 0
+        self._closing: set[asyncio.Task[None]] = set()
 
         # RAG streaming capabilities
         self.rag_tasks: dict[str, RAGTask] = {}
@@ -94,7 +263,14 @@ class WebSocketManager:
     async def connect(self, websocket: WebSocket, client_id: str) -> None:
         """Accept a new WebSocket connection."""
         await websocket.accept()
+        if client_id in self.active_connections:
+            self.disconnect(client_id)  # Reconnect replaces the old socket
         self.active_connections[client_id] = websocket
+        connection = ClientConnection(
+            client_id, websocket, self.send_config, self.disconnect
+        )
+        self._connections[client_id] = connection
+        connection.start()
 
         # Start cleanup task if not already started
         self._start_cleanup_task()
@@ -118,10 +294,16 @@ class WebSocketManager:
         """Remove a WebSocket connection and cleanup associated RAG tasks."""
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+            connection = self._connections.pop(client_id, None)
+            if connection is not None:
+                connection.stop()
             # Remove from all rooms
-            for _room_name, members in self.rooms.values():
-                if client_id in members:
-                    members.remove(client_id)
+            for room_name in self._client_rooms.pop(client_id, set()):
+                members = self.rooms.get(room_name)
+                if members is not None:
+                    members.discard(client_id)
+                    if not members:
+                        del self.rooms[room_name]
 
             # Cancel and cleanup RAG tasks for this client
             self._cleanup_client_rag_tasks(client_id)
@@ -130,78 +312,82 @@ class WebSocketManager:
                 f"WebSocket client {client_id} disconnected. Total: {len(self.active_connections)}"
             )
 
-    async def send_personal_message(self, message: str, client_id: str) -> None:
-        """Send a message to a specific client."""
-        if client_id in self.active_connections:
-            try:
-                websocket = self.active_connections[client_id]
-                await websocket.send_text(message)
-            except Exception as e:
-                logger.error(f"Failed to send message to {client_id}: {e}")
-                # Clean up broken connection
-                self.disconnect(client_id)
+    async def send_personal_message(
+        self, message: str, client_id: str, coalesce_key: str | None = None
+    ) -> None:
+        """Queue a message for a specific client."""
+        self._enqueue([client_id], message, coalesce_key)
 
     async def send_personal_json(self, data: dict[str, Any], client_id: str) -> None:
         """Send JSON data to a specific client."""
-        await self.send_personal_message(json.dumps(data), client_id)
+        await self.send_personal_message(
+            json.dumps(data), client_id, progress_key(data)
+        )
 
-    async def broadcast(self, message: str) -> None:
-        """Send a message to all connected clients."""
-        disconnected = []
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(message)
-            except Exception as e:
-                logger.error(f"Failed to broadcast to {client_id}: {e}")
-                disconnected.append(client_id)
-        # Clean up broken connections
-        for client_id in disconnected:
-            self.disconnect(client_id)
+    async def broadcast(self, message: str, coalesce_key: str | None = None) -> None:
+        """Queue a message for all connected clients."""
+        self._enqueue(list(self._connections), message, coalesce_key)
 
     async def broadcast_json(self, data: dict[str, Any]) -> None:
-        """Broadcast JSON data to all connected clients."""
-        await self.broadcast(json.dumps(data))
+        """Broadcast JSON data to all connected clients (serialized once)."""
+        await self.broadcast(json.dumps(data), progress_key(data))
 
     async def join_room(self, client_id: str, room_name: str) -> None:
         """Add a client to a room."""
-        if room_name not in self.rooms:
-            self.rooms[room_name] = []
-        if client_id not in self.rooms[room_name]:
-            self.rooms[room_name].append(client_id)
+        self.rooms.setdefault(room_name, set()).add(client_id)
+        self._client_rooms.setdefault(client_id, set()).add(room_name)
         logger.info(f"Client {client_id} joined room {room_name}")
 
     async def leave_room(self, client_id: str, room_name: str) -> None:
         """Remove a client from a room."""
-        if room_name in self.rooms and client_id in self.rooms[room_name]:
-            self.rooms[room_name].remove(client_id)
+        members = self.rooms.get(room_name)
+        if members is not None and client_id in members:
+            members.discard(client_id)
+            if not members:
+                del self.rooms[room_name]
+            self._client_rooms.get(client_id, set()).discard(room_name)
             logger.info(f"Client {client_id} left room {room_name}")
 
-    async def send_to_room(self, message: str, room_name: str) -> None:
-        """Send a message to all clients in a room."""
-        if room_name not in self.rooms:
-            return
-        disconnected = []
-        for client_id in self.rooms[room_name]:
-            if client_id in self.active_connections:
-                try:
-                    websocket = self.active_connections[client_id]
-                    await websocket.send_text(message)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send to room {room_name}, client {client_id}: {e}"
-                    )
-                    disconnected.append(client_id)
-        # Clean up broken connections
-        for client_id in disconnected:
-            self.disconnect(client_id)
+    async def send_to_room(
+        self, message: str, room_name: str, coalesce_key: str | None = None
+    ) -> None:
+        """Queue a message for all clients in a room."""
+        members = self.rooms.get(room_name)
+        if members:
+            self._enqueue(list(members), message, coalesce_key)
 
     async def send_json_to_room(self, data: dict[str, Any], room_name: str) -> None:
-        """Send JSON data to all clients in a room."""
-        await self.send_to_room(json.dumps(data), room_name)
+        """Send JSON data to all clients in a room (serialized once)."""
+        await self.send_to_room(json.dumps(data), room_name, progress_key(data))
+
+    def _enqueue(
+        self, client_ids: list[str], message: str, coalesce_key: str | None
+    ) -> None:
+        """Queue one serialized message for each client, applying overflow policy."""
+        overflowed = []
+        for client_id in client_ids:
+            connection = self._connections.get(client_id)
+            if connection is not None and not connection.enqueue(message, coalesce_key):
+                overflowed.append(client_id)
+        for client_id in overflowed:
+            logger.warning(f"Disconnecting {client_id}: outbound queue full")
+            self._overflow_disconnects += 1
+            websocket = self.active_connections.get(client_id)
+            self.disconnect(client_id)
+            if websocket is not None:
+                task = asyncio.create_task(self._close_quietly(websocket))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket) -> None:
+        # 1013: try again later
+        with contextlib.suppress(Exception):
+            await websocket.close(code=1013)
 
     def get_room_members(self, room_name: str) -> list[str]:
         """Get list[Any] of clients in a room."""
-        return self.rooms.get(room_name, [])
+        return list(self.rooms.get(room_name, ()))
 
     def get_connection_count(self) -> int:
         """Get total number of active connections."""
@@ -402,7 +588,7 @@ class WebSocketManager:
 
                 # Set cancellation token
                 if task.cancellation_token:
-                    task.cancellation_token.set[str]()
+                    task.cancellation_token.set()
 
                 # Update status
                 task.status = RAGTaskStatus.CANCELLED
@@ -524,6 +710,16 @@ class WebSocketManager:
             "rooms": {
                 room_name: len(members) for room_name, members in self.rooms.items()
             },
+            "send_queues": {
+                "overflow_policy": self.send_config.overflow_policy.value,
+                "max_queue_size": self.send_config.max_queue_size,
+                "queued_messages": sum(c.queued for c in self._connections.values()),
+                "dropped_messages": sum(c.dropped for c in self._connections.values()),
+                "coalesced_messages": sum(
+                    c.coalesced for c in self._connections.values()
+                ),
+                "overflow_disconnects": self._overflow_disconnects,
+            },
             "rag_streaming": rag_stats,
             "rag_config": {
                 "max_concurrent_tasks": self.rag_config.max_concurrent_tasks,
@@ -654,7 +850,7 @@ class WebSocketManager:
         ]:
             return False
         if task.cancellation_token:
-            task.cancellation_token.set[str]()
+            task.cancellation_token.set()
         if task.background_task and not task.background_task.done():
             task.background_task.cancel()
         task.status = RAGTaskStatus.CANCELLED
@@ -808,11 +1004,17 @@ class WebSocketManager:
             if task.background_task and not task.background_task.done():
                 task.background_task.cancel()
             if task.cancellation_token:
-                task.cancellation_token.set[str]()
+                task.cancellation_token.set()
+
+        # Stop writer tasks
+        for connection in self._connections.values():
+            connection.stop()
 
         # Clear all data
         self.active_connections.clear()
+        self._connections.clear()
         self.rooms.clear()
+        self._client_rooms.clear()
         self.client_tasks.clear()
         self.rag_tasks.clear()
         self._is_started = False
@@ -234,6 +234,12 @@ class PreviewConfig:
     thumbnail_width: int = 256
     max_page_number: int = 500
     cache_ttl_seconds: int = 3600
+    render_workers: int = 2
+    open_documents_per_worker: int = 8
+    prerender_first_pages: int = 3
+    prerender_ahead: int = 2
+    thumbnail_format: str = "webp"
+    thumbnail_quality: str = "standard"
 
     def validate(self, environment: Environment) -> list[str]:
         """Validate preview configuration."""
@@ -249,6 +255,14 @@ class PreviewConfig:
             issues.append("preview: max_page_number must be positive")
         if self.cache_ttl_seconds <= 0:
             issues.append("preview: cache_ttl_seconds must be positive")
+        if self.render_workers < 0 or self.open_documents_per_worker < 0:
+            issues.append("preview: render pool sizes cannot be negative")
+        if self.prerender_first_pages < 0 or self.prerender_ahead < 0:
+            issues.append("preview: pre-render page counts cannot be negative")
+        if self.thumbnail_format not in {"webp", "jpeg", "png"}:
+            issues.append("preview: thumbnail_format must be webp, jpeg or png")
+        if self.thumbnail_quality not in {"low", "standard", "high"}:
+            issues.append("preview: thumbnail_quality must be low, standard or high")
 
         cache_path = Path(self.cache_dir)
         if cache_path.is_absolute() and environment.is_development():
@@ -455,6 +469,16 @@ class ApplicationConfig:
             thumbnail_width=int(os.getenv("PREVIEW_THUMBNAIL_WIDTH", "256")),
             max_page_number=int(os.getenv("PREVIEW_MAX_PAGE_NUMBER", "500")),
             cache_ttl_seconds=int(os.getenv("PREVIEW_CACHE_TTL_SECONDS", "3600")),
+            render_workers=int(os.getenv("PREVIEW_RENDER_WORKERS", "2")),
+            open_documents_per_worker=int(
+                os.getenv("PREVIEW_OPEN_DOCUMENTS_PER_WORKER", "8")
+            ),
+            prerender_first_pages=int(os.getenv("PREVIEW_PRERENDER_FIRST_PAGES", "3")),
+            prerender_ahead=int(os.getenv("PREVIEW_PRERENDER_AHEAD", "2")),
+            thumbnail_format=os.getenv("PREVIEW_THUMBNAIL_FORMAT", "webp").lower(),
+            thumbnail_quality=os.getenv(
+                "PREVIEW_THUMBNAIL_QUALITY", "standard"
+            ).lower(),
         )
 
     def _load_logging_config(self) -> None:
@@ -572,6 +596,8 @@ class ApplicationConfig:
                 "max_width": self.preview.max_width,
                 "thumbnail_width": self.preview.thumbnail_width,
                 "cache_ttl_seconds": self.preview.cache_ttl_seconds,
+                "render_workers": self.preview.render_workers,
+                "thumbnail_format": self.preview.thumbnail_format,
             },
             "caching": self.caching.to_dict() if self.caching else {"enabled": False},
             "app": {
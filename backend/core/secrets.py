@@ -110,7 +110,8 @@ class SecretConfig(BaseModel):
     retry_delay_seconds: int = Field(default=1)
 
     @field_validator("environment")
-    def validate_environment(self, v) -> Any:
+    @classmethod
+    def validate_environment(cls, v) -> Any:
         allowed = ["development", "staging", "production", "test"]
         if v not in allowed:
             raise ValueError(f"Environment must be one of {allowed}")
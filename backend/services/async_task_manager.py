@@ -1,13 +1,18 @@
 """
 Async Task Manager
 Background task management for concurrent RAG query processing with memory optimization.
+Tasks wait in per-category lanes and are dispatched when a slot frees up or a
+task is submitted; CPU-bound callables run in a process pool lane.
 """
 
 import asyncio
+import functools
+import heapq
 import logging
+import multiprocessing
 import time
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -37,6 +42,20 @@ class TaskCategory(Enum):
     SYSTEM_MAINTENANCE = "system_maintenance"
 
 
+# Concurrent tasks per category lane (all event-loop lanes together are also
+# capped by AsyncTaskManager.max_concurrent_tasks)
+DEFAULT_LANE_LIMITS = {
+    TaskCategory.RAG_QUERY: 5,
+    TaskCategory.INDEX_BUILD: 2,
+    TaskCategory.DOCUMENT_PROCESSING: 2,
+    TaskCategory.CACHE_CLEANUP: 1,
+    TaskCategory.SYSTEM_MAINTENANCE: 1,
+}
+
+# Lane for callables submitted with submit_cpu_task
+CPU_LANE = "cpu"
+
+
 @dataclass
 class MemoryStats:
     """Memory usage statistics."""
@@ -85,6 +104,7 @@ class AsyncTask:
     metrics: TaskMetrics = field(default_factory=lambda: TaskMetrics(datetime.now()))
     memory_limit_mb: float | None = None
     timeout_seconds: float | None = None
+    cpu_bound: bool = False  # Runs in the process pool lane
 
     # Async task tracking
     asyncio_task: asyncio.Task[None] | None = None
@@ -109,8 +129,9 @@ class MemoryMonitor:
     ) -> None:
         self.critical_threshold = critical_threshold
         self.warning_threshold = warning_threshold
-        self._last_check = datetime.now()
+        self._last_check: datetime | None = None
         self._check_interval = timedelta(seconds=5)
+        self._limited = False
 
     def get_memory_stats(self) -> MemoryStats:
         """Get current system memory statistics."""
@@ -136,14 +157,24 @@ class MemoryMonitor:
             logger.error(f"Failed to get memory stats: {e}")
             return MemoryStats(0, 0, 0, 0, False)
 
+    @property
+    def check_interval_seconds(self) -> float:
+        return self._check_interval.total_seconds()
+
     def should_limit_tasks(self) -> bool:
-        """Check if new tasks should be limited due to memory pressure."""
-        if datetime.now() - self._last_check < self._check_interval:
-            return False
+        """Check if new tasks should be limited due to memory pressure.
+
+        The system is sampled at most once per check interval; in between,
+        the last answer is returned.
+        """
+        now = datetime.now()
+        if self._last_check and now - self._last_check < self._check_interval:
+            return self._limited
 
-        self._last_check = datetime.now()
+        self._last_check = now
         stats = self.get_memory_stats()
-        return stats.percentage >= self.warning_threshold
+        self._limited = stats.percentage >= self.warning_threshold
+        return self._limited
 
     def is_memory_critical(self) -> bool:
         """Check if memory usage is at critical levels."""
@@ -151,6 +182,22 @@ class MemoryMonitor:
         return stats.is_critical
 
 
+class TaskLane:
+    """Pending tasks of one lane, ordered by priority then submission."""
+
+    def __init__(self, name: str, limit: int) -> None:
+        self.name = name
+        self.limit = limit
+        self.running = 0
+        self.pending: list[tuple[int, int, AsyncTask]] = []
+
+    def push(self, task: AsyncTask, sequence: int) -> None:
+        heapq.heappush(self.pending, (-task.priority.value, sequence, task))
+
+    def pop(self) -> AsyncTask:
+        return heapq.heappop(self.pending)[2]
+
+
 class AsyncTaskManager:
     """Manages background tasks with memory optimization and concurrency control."""
 
@@ -160,6 +207,8 @@ class AsyncTaskManager:
         max_queue_size: int = 100,
         memory_limit_mb: float | None = None,
         enable_memory_monitoring: bool = True,
+        lane_limits: dict[TaskCategory, int] | None = None,
+        cpu_workers: int = 2,
     ) -> None:
         self.max_concurrent_tasks = max_concurrent_tasks
         self.max_queue_size = max_queue_size
@@ -167,20 +216,29 @@ class AsyncTaskManager:
 
         # Task tracking
         self.active_tasks: dict[str, AsyncTask] = {}
-        self.task_queue: asyncio.PriorityQueue[Any] = asyncio.PriorityQueue[Any](
-            maxsize=max_queue_size
-        )
+        self.queued_tasks: dict[str, AsyncTask] = {}
         self.completed_tasks: dict[str, AsyncTask] = {}
         self.task_counter = 0
 
+        # One lane per category plus the process pool lane
+        limits = {**DEFAULT_LANE_LIMITS, **(lane_limits or {})}
+        self.lanes: dict[str, TaskLane] = {
+            category.value: TaskLane(category.value, limits[category])
+            for category in TaskCategory
+        }
+        self.lanes[CPU_LANE] = TaskLane(CPU_LANE, cpu_workers)
+        self._loop_running = 0  # Tasks running on the event loop
+        self.cpu_workers = cpu_workers
+        self._process_pool: ProcessPoolExecutor | None = None
+
         # Memory management
         self.memory_monitor = MemoryMonitor() if enable_memory_monitoring else None
+        self._memory_recheck: asyncio.TimerHandle | None = None
         self.thread_pool = ThreadPoolExecutor(
             max_workers=3, thread_name_prefix="async_task_"
         )
 
         # Background processing
-        self._processor_task: asyncio.Task[None] | None = None
         self._cleanup_task: asyncio.Task[None] | None = None
         self._running = False
 
@@ -195,8 +253,8 @@ class AsyncTaskManager:
             return
 
         self._running = True
-        self._processor_task = asyncio.create_task(self._process_tasks())
         self._cleanup_task = asyncio.create_task(self._cleanup_completed_tasks())
+        self._dispatch()  # Tasks submitted before start
         logger.info("AsyncTaskManager started")
 
     async def stop(self) -> None:
@@ -207,16 +265,20 @@ class AsyncTaskManager:
         for task in self.active_tasks.values():
             if task.asyncio_task and not task.asyncio_task.done():
                 task.asyncio_task.cancel()
-                task.cancellation_event.set[str]()
+                task.cancellation_event.set()
 
-        # Wait for processor tasks to complete
-        if self._processor_task:
-            self._processor_task.cancel()
+        # Stop background tasks
+        if self._memory_recheck:
+            self._memory_recheck.cancel()
+            self._memory_recheck = None
         if self._cleanup_task:
             self._cleanup_task.cancel()
 
-        # Shutdown thread pool
+        # Shutdown pools
         self.thread_pool.shutdown(wait=True)
+        if self._process_pool:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
 
         logger.info("AsyncTaskManager stopped")
 
@@ -231,12 +293,64 @@ class AsyncTaskManager:
         **kwargs,
     ) -> str:
         """Submit a new background task."""
+        return self._enqueue(
+            handler,
+            category,
+            priority,
+            memory_limit_mb,
+            timeout_seconds,
+            False,
+            args,
+            kwargs,
+        )
 
+    async def submit_cpu_task(
+        self,
+        func: Callable[..., Any],
+        *args,
+        category: TaskCategory = TaskCategory.DOCUMENT_PROCESSING,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        timeout_seconds: float | None = None,
+        **kwargs,
+    ) -> str:
+        """
+        Submit a CPU-bound callable to run in the process pool lane.
+
+        Args:
+            func: Picklable module-level function; called as func(*args, **kwargs)
+            *args: Positional arguments (must be picklable)
+            category: Category reported in task status
+            priority: Dispatch priority within the CPU lane
+            timeout_seconds: Give up waiting after this long (the worker
+                process finishes the call regardless)
+            **kwargs: Keyword arguments (must be picklable)
+        Returns:
+            Task ID
+        Raises:
+            RuntimeError: If memory is critical or the queue is full
+        """
+        return self._enqueue(
+            func, category, priority, None, timeout_seconds, True, args, kwargs
+        )
+
+    def _enqueue(
+        self,
+        handler: Callable[..., Any],
+        category: TaskCategory,
+        priority: TaskPriority,
+        memory_limit_mb: float | None,
+        timeout_seconds: float | None,
+        cpu_bound: bool,
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> str:
         # Check memory pressure
         if self.memory_monitor and self.memory_monitor.is_memory_critical():
             raise RuntimeError(
                 "Cannot submit task: System memory is at critical levels"
             )
+        if len(self.queued_tasks) >= self.max_queue_size:
+            raise RuntimeError(f"Task queue is full ({self.max_queue_size} tasks)")
 
         # Generate task ID
         self.task_counter += 1
@@ -252,21 +366,15 @@ class AsyncTaskManager:
             kwargs=kwargs,
             memory_limit_mb=memory_limit_mb or self.memory_limit_mb,
             timeout_seconds=timeout_seconds,
+            cpu_bound=cpu_bound,
         )
 
-        # Add to queue with priority (lower number = higher priority)
-        try:
-            priority_value = (
-                4 - priority.value,
-                time.time(),
-            )  # Higher priority = lower number
-            await self.task_queue.put((priority_value, task))
-            logger.debug(f"Submitted task {task_id} with priority {priority.name}")
-            return task_id
-        except asyncio.QueueFull as e:
-            raise RuntimeError(
-                f"Task queue is full ({self.max_queue_size} tasks)"
-            ) from e
+        lane = self.lanes[CPU_LANE if cpu_bound else category.value]
+        lane.push(task, self.task_counter)
+        self.queued_tasks[task_id] = task
+        logger.debug(f"Submitted task {task_id} with priority {priority.name}")
+        self._dispatch()
+        return task_id
 
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel a running or queued task."""
@@ -274,12 +382,19 @@ class AsyncTaskManager:
             task = self.active_tasks[task_id]
             if task.asyncio_task and not task.asyncio_task.done():
                 task.asyncio_task.cancel()
-                task.cancellation_event.set[str]()
+                task.cancellation_event.set()
                 logger.info(f"Cancelled active task {task_id}")
                 return True
 
-        # Note: Cancelling queued tasks would require scanning the queue
-        # For now, we only cancel active tasks
+        # Queued tasks are dropped from their lane when they reach its head
+        task = self.queued_tasks.pop(task_id, None)
+        if task is not None:
+            task.error = Exception("Task was cancelled")
+            task.completed_at = datetime.now()
+            task.metrics.end_time = task.completed_at
+            self.completed_tasks[task_id] = task
+            logger.info(f"Cancelled queued task {task_id}")
+            return True
         return False
 
     async def get_task_status(self, task_id: str) -> dict[str, Any] | None:
@@ -297,6 +412,16 @@ class AsyncTaskManager:
                 "memory_peak_mb": task.metrics.memory_peak_mb,
             }
 
+        if task_id in self.queued_tasks:
+            task = self.queued_tasks[task_id]
+            return {
+                "task_id": task_id,
+                "status": "queued",
+                "category": task.category.value,
+                "priority": task.priority.name,
+                "queued_seconds": task.age_seconds,
+            }
+
         # Check completed tasks
         if task_id in self.completed_tasks:
             task = self.completed_tasks[task_id]
@@ -327,12 +452,20 @@ class AsyncTaskManager:
         return {
             "uptime_seconds": uptime_seconds,
             "active_tasks": len(self.active_tasks),
-            "queue_size": self.task_queue.qsize(),
+            "queue_size": len(self.queued_tasks),
             "completed_tasks": len(self.completed_tasks),
             "total_processed": self._total_tasks_processed,
             "total_errors": self._total_errors,
             "max_concurrent": self.max_concurrent_tasks,
             "max_queue_size": self.max_queue_size,
+            "lanes": {
+                name: {
+                    "running": lane.running,
+                    "queued": len(lane.pending),
+                    "limit": lane.limit,
+                }
+                for name, lane in self.lanes.items()
+            },
             "memory_stats": (
                 {
                     "used_mb": memory_stats.used_mb,
@@ -354,45 +487,81 @@ class AsyncTaskManager:
             ],
         }
 
-    async def _process_tasks(self) -> None:
-        """Background task processor."""
-        while self._running:
-            try:
-                # Check if we can process more tasks
-                if len(self.active_tasks) >= self.max_concurrent_tasks:
-                    await asyncio.sleep(0.1)
-                    continue
-
-                # Check memory pressure
-                if self.memory_monitor and self.memory_monitor.should_limit_tasks():
-                    await asyncio.sleep(0.5)
-                    continue
-
-                try:
-                    # Get next task from queue with timeout
-                    priority_tuple, task = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=1.0
-                    )
-
-                    # Start task execution
-                    task.started_at = datetime.now()
-                    task.metrics.start_time = task.started_at
-
-                    # Create asyncio task
-                    task.asyncio_task = asyncio.create_task(self._execute_task(task))
-
-                    # Track active task
-                    self.active_tasks[task.task_id] = task
+    def _dispatch(self) -> None:
+        """Start queued tasks while their lanes have free slots.
 
-                    logger.debug(f"Started task {task.task_id}")
-
-                except asyncio.TimeoutError:
-                    # No tasks in queue, continue loop
-                    continue
-
-            except Exception as e:
-                logger.error(f"Error in task processor: {e}")
-                await asyncio.sleep(1.0)
+        Called on submit, when a task finishes and when memory pressure is
+        re-checked, so nothing polls while tasks wait.
+        """
+        if not self._running or self._memory_limited():
+            return
+        while (lane := self._next_lane()) is not None:
+            self._start_task(lane.pop(), lane)
+
+    def _next_lane(self) -> TaskLane | None:
+        """Lane whose head task goes next: highest priority, then oldest."""
+        loop_slots = self._loop_running < self.max_concurrent_tasks
+        best: TaskLane | None = None
+        for lane in self.lanes.values():
+            while lane.pending and lane.pending[0][2].task_id not in self.queued_tasks:
+                heapq.heappop(lane.pending)  # Cancelled while queued
+            if not lane.pending or lane.running >= lane.limit:
+                continue
+            if lane.name != CPU_LANE and not loop_slots:
+                continue
+            if best is None or lane.pending[0][:2] < best.pending[0][:2]:
+                best = lane
+        return best
+
+    def _memory_limited(self) -> bool:
+        """Hold dispatch under memory pressure and schedule one re-check."""
+        if not self.memory_monitor or not self.memory_monitor.should_limit_tasks():
+            return False
+        if self._memory_recheck is None:
+            self._memory_recheck = asyncio.get_running_loop().call_later(
+                self.memory_monitor.check_interval_seconds, self._recheck_memory
+            )
+        return True
+
+    def _recheck_memory(self) -> None:
+        self._memory_recheck = None
+        self._dispatch()
+
+    def _start_task(self, task: AsyncTask, lane: TaskLane) -> None:
+        del self.queued_tasks[task.task_id]
+        lane.running += 1
+        if lane.name != CPU_LANE:
+            self._loop_running += 1
+
+        task.started_at = datetime.now()
+        task.metrics.start_time = task.started_at
+        self.active_tasks[task.task_id] = task
+        task.asyncio_task = asyncio.create_task(self._execute_task(task))
+        task.asyncio_task.add_done_callback(
+            functools.partial(self._task_finished, lane)
+        )
+        logger.debug(f"Started task {task.task_id}")
+
+    def _task_finished(self, lane: TaskLane, _: asyncio.Task[None]) -> None:
+        lane.running -= 1
+        if lane.name != CPU_LANE:
+            self._loop_running -= 1
+        self._dispatch()
+
+    def _run_handler(self, task: AsyncTask) -> Any:
+        """Awaitable running the task's handler on the loop or in the pool."""
+        if not task.cpu_bound:
+            return task.handler(*task.args, **task.kwargs)
+        if self._process_pool is None:
+            # Spawned workers do not inherit the event loop or open handles
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.cpu_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return asyncio.get_running_loop().run_in_executor(
+            self._process_pool,
+            functools.partial(task.handler, *task.args, **task.kwargs),
+        )
 
     async def _execute_task(self, task: AsyncTask) -> None:
         """Execute a single task with monitoring."""
@@ -404,7 +573,7 @@ class AsyncTaskManager:
 
                 done, pending = await asyncio.wait(
                     [
-                        asyncio.create_task(task.handler(*task.args, **task.kwargs)),
+                        asyncio.ensure_future(self._run_handler(task)),
                         timeout_task,
                         cancel_task,
                     ],
@@ -427,7 +596,7 @@ class AsyncTaskManager:
                     task.result = completed_task.result()
             else:
                 # Execute without timeout
-                task.result = await task.handler(*task.args, **task.kwargs)
+                task.result = await self._run_handler(task)
 
             # Mark as completed
             task.completed_at = datetime.now()
@@ -4,25 +4,52 @@ Comprehensive encryption for data at rest and in transit.
 """
 
 import base64
+import bisect
 import hashlib
 import json
 import logging
 import os
 import secrets
+import tempfile
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, MultiFernet
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    String,
+    Text,
+    func,
+    insert,
+    update,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
 
+from backend.services.key_rotation import (
+    DEFAULT_REWRAP_BATCH_SIZE,
+    KeyCache,
+    ReEncryptionJob,
+    master_key_wrapper,
+    rewrap_data_keys,
+)
 from backend.services.secrets_manager import SecretsManagerService
+from backend.services.segmented_encryption import (
+    DEFAULT_SEGMENT_SIZE,
+    FORMAT_NAME,
+    SegmentedFileCipher,
+    SegmentHeader,
+    is_segmented_file,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +76,8 @@ class EncryptionKey(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     rotated_at = Column(DateTime, nullable=True)
     expires_at = Column(DateTime, nullable=True)
-    metadata = Column(Text, nullable=True)  # JSON metadata
+    # "metadata" is reserved on declarative models; the column keeps its name
+    key_metadata = Column("metadata", Text, nullable=True)  # JSON metadata
 
 
 class EncryptedField(Base):
@@ -82,13 +110,19 @@ class EncryptionService:
         db: Session,
         secrets_manager: SecretsManagerService | None = None,
         key_rotation_days: int = 90,
+        key_cache_size: int = 1024,
+        key_cache_ttl: float = 300.0,
     ) -> None:
         """Initialize encryption service."""
         self.db = db
         self.secrets_manager = secrets_manager or SecretsManagerService()
         self.key_rotation_days = key_rotation_days
-        self._key_cache: dict[str, bytes] = {}
+        self._key_cache = KeyCache(key_cache_size, key_cache_ttl)
+        # Retired data key id -> key id that replaced it
+        self._key_successors: dict[str, str] = {}
         self._master_key: bytes | None = None
+        # Master key replaced by the last rotation, kept for unwrapping
+        self._previous_master_key: bytes | None = None
 
         # Initialize master key
         self._initialize_master_key()
@@ -100,6 +134,11 @@ class EncryptionService:
             master_key_b64 = self.secrets_manager.get_secret("encryption/master_key")
             if master_key_b64:
                 self._master_key = base64.b64decode(master_key_b64)
+                previous_b64 = self.secrets_manager.get_secret(
+                    "encryption/master_key_previous"
+                )
+                if previous_b64:
+                    self._previous_master_key = base64.b64decode(previous_b64)
             else:
                 # Generate new master key
                 self._master_key = Fernet.generate_key()
@@ -117,6 +156,11 @@ class EncryptionService:
             else:
                 raise RuntimeError("No master encryption key available") from e
 
+    @property
+    def _key_wrapper(self) -> MultiFernet:
+        """Wraps data keys with the master key; unwraps under either version."""
+        return master_key_wrapper(self._master_key, self._previous_master_key)
+
     # ========================================================================
     # Symmetric Encryption (AES-256-GCM)
     # ========================================================================
@@ -141,13 +185,14 @@ class EncryptionService:
         # Convert data to bytes
         if isinstance(data, str):
             plaintext = data.encode("utf-8")
-        elif isinstance(data, dict[str, Any]):
+        elif isinstance(data, dict):
             plaintext = json.dumps(data).encode("utf-8")
         else:
             plaintext = data
 
-        # Get or generate encryption key
+        # Get or generate encryption key (new data always uses the active version)
         if key_id:
+            key_id = self._active_key_id(key_id)
             key = self._get_encryption_key(key_id)
         else:
             key = self._generate_data_key()
@@ -204,6 +249,26 @@ class EncryptionService:
         Returns:
             Decrypted data
         """
+        plaintext = self._decrypt_bytes(encrypted_data, metadata, additional_data)
+
+        # Try to decode as string or JSON
+        try:
+            text = plaintext.decode("utf-8")
+            # Try to parse as JSON
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                return text
+        except UnicodeDecodeError:
+            return plaintext
+
+    def _decrypt_bytes(
+        self,
+        encrypted_data: bytes,
+        metadata: dict[str, Any],
+        additional_data: bytes | None = None,
+    ) -> bytes:
+        """Decrypt AES-256-GCM data to raw bytes."""
         # Extract components
         nonce_size = metadata.get("nonce_size", 12)
         tag_size = metadata.get("tag_size", 16)
@@ -227,18 +292,34 @@ class EncryptionService:
             decryptor.authenticate_additional_data(additional_data)
 
         # Decrypt data
-        plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+        return decryptor.update(ciphertext) + decryptor.finalize()
 
-        # Try to decode as string or JSON
-        try:
-            text = plaintext.decode("utf-8")
-            # Try to parse as JSON
-            try:
-                return json.loads(text)
-            except json.JSONDecodeError:
-                return text
-        except UnicodeDecodeError:
-            return plaintext
+    def reencrypt_data(
+        self,
+        encrypted_data: bytes,
+        metadata: dict[str, Any],
+        additional_data: bytes | None = None,
+    ) -> tuple[bytes, dict[str, Any]]:
+        """
+        Re-encrypt data under the active version of its key.
+
+        Args:
+            encrypted_data: Encrypted data
+            metadata: Encryption metadata
+            additional_data: Additional authenticated data (AAD)
+
+        Returns:
+            Tuple of (encrypted_data, metadata), unchanged if the key is active
+        """
+        key_id = metadata["key_id"]
+        if self._active_key_id(key_id) == key_id:
+            return encrypted_data, metadata
+        plaintext = self._decrypt_bytes(encrypted_data, metadata, additional_data)
+        return self.encrypt_data(
+            plaintext,
+            key_id,
+            additional_data if metadata.get("has_aad") else None,
+        )
 
     # ========================================================================
     # Field-Level Encryption
@@ -270,7 +351,7 @@ class EncryptionService:
             table_name=table_name,
             column_name=column_name,
             record_id=record_id,
-            encryption_key_id=key_id,
+            encryption_key_id=metadata["key_id"],
             encryption_metadata=json.dumps(metadata),
         )
         self.db.add(field_record)
@@ -324,15 +405,21 @@ class EncryptionService:
         self,
         input_path: Path,
         output_path: Path | None = None,
-        chunk_size: int = 64 * 1024,  # 64KB chunks
+        chunk_size: int = 64 * 1024,  # 64KB segments
+        max_workers: int | None = None,
     ) -> tuple[Path, dict[str, Any]]:
         """
-        Encrypt a file using streaming encryption.
+        Encrypt a file into a segmented AES-256-GCM container.
+
+        Each chunk_size segment is sealed with its own nonce and tag, so the
+        file is encrypted in parallel and can later be decrypted in parallel
+        or read by byte range (see read_file_range).
 
         Args:
             input_path: Path to input file
             output_path: Optional output path (defaults to input_path.enc)
-            chunk_size: Size of chunks for streaming
+            chunk_size: Plaintext bytes per segment
+            max_workers: Worker threads (defaults to the CPU count)
 
         Returns:
             Tuple of (output_path, metadata)
@@ -344,51 +431,19 @@ class EncryptionService:
         key = self._generate_data_key()
         key_id = self._store_data_key(key, key_type="file")
 
-        # Generate nonce
-        nonce = os.urandom(12)
-
-        # Create cipher
-        cipher = Cipher(
-            algorithms.AES(key), modes.GCM(nonce), backend=default_backend()
+        # Encrypt file; per-segment tags replace a whole-file hash
+        header = SegmentedFileCipher(key, max_workers).encrypt_file(
+            input_path, output_path, key_id, segment_size=chunk_size
         )
-        encryptor = cipher.encryptor()
-
-        # Calculate file hash for integrity
-        file_hash = hashlib.sha256()
-
-        # Encrypt file
-        with open(input_path, "rb") as infile, open(output_path, "wb") as outfile:
-            # Write nonce at the beginning
-            outfile.write(nonce)
-
-            # Reserve space for tag (will write later)
-            tag_position = outfile.tell()
-            outfile.write(b"\x00" * 16)
-
-            # Encrypt file contents
-            while True:
-                chunk = infile.read(chunk_size)
-                if not chunk:
-                    break
-
-                file_hash.update(chunk)
-                encrypted_chunk = encryptor.update(chunk)
-                outfile.write(encrypted_chunk)
-
-            # Finalize encryption
-            encryptor.finalize()
-
-            # Write authentication tag
-            outfile.seek(tag_position)
-            outfile.write(encryptor.tag)
 
         # Create metadata
         metadata = {
             "key_id": key_id,
             "algorithm": "AES-256-GCM",
-            "file_size": input_path.stat().st_size,
-            "encrypted_size": output_path.stat().st_size,
-            "file_hash": file_hash.hexdigest(),
+            "format": FORMAT_NAME,
+            "segment_size": header.segment_size,
+            "file_size": header.plaintext_size,
+            "encrypted_size": header.encrypted_size,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
@@ -406,14 +461,19 @@ class EncryptionService:
         input_path: Path,
         output_path: Path | None = None,
         chunk_size: int = 64 * 1024,
+        max_workers: int | None = None,
     ) -> Path:
         """
         Decrypt a file encrypted with encrypt_file.
 
+        Segmented containers are decrypted in parallel; files written by the
+        earlier single-stream format are still decrypted sequentially.
+
         Args:
             input_path: Path to encrypted file
             output_path: Optional output path
-            chunk_size: Size of chunks for streaming
+            chunk_size: Size of chunks for streaming (single-stream format)
+            max_workers: Worker threads (defaults to the CPU count)
 
         Returns:
             Path to decrypted file
@@ -424,6 +484,13 @@ class EncryptionService:
             else:
                 output_path = Path(str(input_path) + ".dec")
 
+        if is_segmented_file(input_path):
+            header = SegmentHeader.read_from(input_path)
+            key = self._get_encryption_key(header.key_id)
+            SegmentedFileCipher(key, max_workers).decrypt_file(input_path, output_path)
+            logger.info(f"Decrypted file: {input_path} -> {output_path}")
+            return output_path
+
         # Load metadata
         metadata_path = Path(str(input_path) + ".meta")
         if not metadata_path.exists():
@@ -474,6 +541,94 @@ class EncryptionService:
 
         return output_path
 
+    def read_file_range(
+        self,
+        input_path: Path,
+        offset: int,
+        length: int,
+        max_workers: int | None = None,
+    ) -> bytes:
+        """
+        Read a verified plaintext byte range of a file from encrypt_file.
+
+        Only the segments covering the range are read and authenticated.
+
+        Args:
+            input_path: Path to encrypted file (segmented format)
+            offset: First plaintext byte
+            length: Number of bytes (clamped to the end of the file)
+            max_workers: Worker threads (defaults to the CPU count)
+
+        Returns:
+            Plaintext bytes of the range
+
+        Raises:
+            ValueError: If the file is not segmented or fails authentication
+        """
+        header = SegmentHeader.read_from(input_path)
+        key = self._get_encryption_key(header.key_id)
+        return SegmentedFileCipher(key, max_workers).read_range(
+            input_path, offset, length
+        )
+
+    def reencrypt_file(self, path: Path, max_workers: int | None = None) -> bool:
+        """
+        Re-encrypt a file under the active version of its key, in place.
+
+        Files in the single-stream format are converted to the segmented
+        format. The new container is written next to the file and swapped
+        in atomically.
+
+        Args:
+            path: Encrypted file
+            max_workers: Worker threads (defaults to the CPU count)
+
+        Returns:
+            True if the file was rewritten, False if it was already current
+        """
+        path = Path(path)
+        metadata_path = Path(str(path) + ".meta")
+        segmented = is_segmented_file(path)
+        if segmented:
+            header = SegmentHeader.read_from(path)
+            key_id, segment_size = header.key_id, header.segment_size
+        else:
+            with open(metadata_path) as f:
+                key_id = json.load(f)["key_id"]
+            segment_size = DEFAULT_SEGMENT_SIZE
+
+        active_key_id = self._active_key_id(key_id)
+        if segmented and active_key_id == key_id:
+            return False
+
+        with tempfile.TemporaryDirectory(dir=path.parent) as workdir:
+            plaintext_path = Path(workdir) / "plaintext"
+            self.decrypt_file(path, plaintext_path, max_workers=max_workers)
+            staged_path = Path(workdir) / "sealed"
+            header = SegmentedFileCipher(
+                self._get_encryption_key(active_key_id), max_workers
+            ).encrypt_file(plaintext_path, staged_path, active_key_id, segment_size)
+            os.replace(staged_path, path)
+
+        if metadata_path.exists():
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+            metadata.pop("file_hash", None)
+            metadata.update(
+                {
+                    "key_id": active_key_id,
+                    "format": FORMAT_NAME,
+                    "segment_size": header.segment_size,
+                    "encrypted_size": header.encrypted_size,
+                    "timestamp": datetime.utcnow().isoformat(),
+                }
+            )
+            with open(metadata_path, "w") as f:
+                json.dump(metadata, f, indent=2)
+
+        logger.info(f"Re-encrypted file {path} under key {active_key_id}")
+        return True
+
     # ========================================================================
     # Asymmetric Encryption (RSA)
     # ========================================================================
@@ -567,8 +722,8 @@ class EncryptionService:
     # ========================================================================
 
     def _generate_data_key(self, key_type: str = "field") -> bytes:
-        """Generate a new data encryption key."""
-        return Fernet.generate_key()
+        """Generate a new 256-bit data encryption key."""
+        return os.urandom(32)
 
     def _store_data_key(self, key: bytes, key_type: str = "field") -> str:
         """Store a data key encrypted with master key."""
@@ -576,8 +731,7 @@ class EncryptionService:
         key_id = f"{key_type}_{secrets.token_urlsafe(16)}"
 
         # Encrypt key with master key
-        fernet = Fernet(self._master_key)
-        encrypted_key = fernet.encrypt(key)
+        encrypted_key = self._key_wrapper.encrypt(key)
 
         # Store in database
         key_record = EncryptionKey(
@@ -592,42 +746,101 @@ class EncryptionService:
         self.db.commit()
 
         # Cache the key
-        self._key_cache[key_id] = key
+        self._key_cache.put(key_id, key)
 
         return key_id
 
+    def _unwrap_key_record(
+        self, key_record: EncryptionKey, wrapper: MultiFernet | None = None
+    ) -> bytes:
+        """Decrypt a stored data key and note its successor if retired."""
+        if not key_record.is_active and key_record.key_metadata:
+            successor = json.loads(key_record.key_metadata).get("rotated_to")
+            if successor:
+                self._key_successors[key_record.key_id] = successor
+        wrapper = wrapper or self._key_wrapper
+        return wrapper.decrypt(base64.b64decode(key_record.encrypted_key))
+
     def _get_encryption_key(self, key_id: str) -> bytes:
         """Retrieve and decrypt an encryption key."""
         # Check cache
-        if key_id in self._key_cache:
-            return self._key_cache[key_id]
+        key = self._key_cache.get(key_id)
+        if key is not None:
+            return key
 
-        # Get from database
-        key_record = (
-            self.db.query(EncryptionKey)
-            .filter_by(key_id=key_id, is_active=True)
-            .first()
-        )
+        # Get from database; retired keys stay readable for decryption
+        key_record = self.db.query(EncryptionKey).filter_by(key_id=key_id).first()
 
         if not key_record:
             raise ValueError(f"Encryption key not found: {key_id}")
 
         # Decrypt key with master key
-        fernet = Fernet(self._master_key)
-        encrypted_key = base64.b64decode(key_record.encrypted_key)
-        key = fernet.decrypt(encrypted_key)
+        key = self._unwrap_key_record(key_record)
 
         # Cache the key
-        self._key_cache[key_id] = key
+        self._key_cache.put(key_id, key)
 
         return key
 
-    def rotate_keys(self, force: bool = False) -> dict[str, int]:
+    def prefetch_keys(self, key_ids: Iterable[str], chunk_size: int = 500) -> int:
+        """
+        Load many data keys into the key cache with batched queries.
+
+        Args:
+            key_ids: Keys about to be used (cached ones are skipped)
+            chunk_size: Key ids per IN query
+
+        Returns:
+            Number of keys loaded from the database
+        """
+        missing = self._key_cache.missing(key_ids)
+        wrapper = self._key_wrapper
+        loaded = 0
+        for i in range(0, len(missing), chunk_size):
+            key_records = (
+                self.db.query(EncryptionKey)
+                .filter(EncryptionKey.key_id.in_(missing[i : i + chunk_size]))
+                .all()
+            )
+            self._key_cache.put_many(
+                {
+                    key_record.key_id: self._unwrap_key_record(key_record, wrapper)
+                    for key_record in key_records
+                }
+            )
+            loaded += len(key_records)
+        return loaded
+
+    def _active_key_id(self, key_id: str) -> str:
+        """
+        Follow rotations of a data key to its active version.
+
+        Rotations made by another process are seen once the cached key
+        expires and its record is reloaded.
+        """
+        if key_id not in self._key_successors:
+            self._get_encryption_key(key_id)
+        seen = set()
+        while key_id in self._key_successors and key_id not in seen:
+            seen.add(key_id)
+            key_id = self._key_successors[key_id]
+            self._get_encryption_key(key_id)
+        return key_id
+
+    def rotate_keys(
+        self, force: bool = False, batch_size: int = 1000
+    ) -> dict[str, int]:
         """
         Rotate encryption keys based on age.
 
+        New key versions are inserted and the old records retired in bulk
+        statements, all in one transaction. Retired keys remain available for
+        decryption; data is moved to the new versions lazily (see
+        reencrypt_data and the re-encryption jobs).
+
         Args:
             force: Force rotation regardless of age
+            batch_size: Keys inserted and retired per statement
 
         Returns:
             Dictionary with rotation statistics
@@ -641,44 +854,260 @@ class EncryptionService:
 
         if not force:
             query = query.filter(
-                (EncryptionKey.rotated_at is None)
+                EncryptionKey.rotated_at.is_(None)
                 | (EncryptionKey.rotated_at < cutoff_date)
             )
 
-        keys_to_rotate = query.all()
+        keys_to_rotate = query.order_by(EncryptionKey.id).all()
+        wrapper = self._key_wrapper
+        now = datetime.utcnow()
+        successors = {}
 
-        for key_record in keys_to_rotate:
-            try:
-                # Generate new key
-                new_key = self._generate_data_key(key_record.key_type)
-
-                # Create new key record
-                new_key_record = EncryptionKey(
-                    key_id=f"{key_record.key_id}_v{key_record.key_version + 1}",
-                    key_type=key_record.key_type,
-                    algorithm=key_record.algorithm,
-                    encrypted_key=base64.b64encode(
-                        Fernet(self._master_key).encrypt(new_key)
-                    ).decode("utf-8"),
-                    key_version=key_record.key_version + 1,
-                    is_active=True,
-                )
-                self.db.add(new_key_record)
+        try:
+            for i in range(0, len(keys_to_rotate), batch_size):
+                batch = keys_to_rotate[i : i + batch_size]
+                new_records = []
+                retired_records = []
+                for key_record in batch:
+                    # Generate new key
+                    new_key_id = f"{key_record.key_id}_v{key_record.key_version + 1}"
+                    new_records.append(
+                        {
+                            "key_id": new_key_id,
+                            "key_type": key_record.key_type,
+                            "algorithm": key_record.algorithm,
+                            "encrypted_key": base64.b64encode(
+                                wrapper.encrypt(
+                                    self._generate_data_key(key_record.key_type)
+                                )
+                            ).decode("utf-8"),
+                            "key_version": key_record.key_version + 1,
+                            "is_active": True,
+                            "created_at": now,
+                        }
+                    )
+
+                    # Retire old key, recording its successor
+                    key_metadata = json.loads(key_record.key_metadata or "{}")
+                    key_metadata["rotated_to"] = new_key_id
+                    successors[key_record.key_id] = new_key_id
+                    retired_records.append(
+                        {
+                            "id": key_record.id,
+                            "is_active": False,
+                            "rotated_at": now,
+                            "key_metadata": json.dumps(key_metadata),
+                        }
+                    )
+
+                self.db.execute(insert(EncryptionKey), new_records)
+                self.db.execute(update(EncryptionKey), retired_records)
+                stats["rotated"] += len(batch)
+
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to rotate keys: {e}")
+            return {"rotated": 0, "skipped": 0, "failed": len(keys_to_rotate)}
+
+        self._key_successors.update(successors)
+        logger.info(f"Rotated {stats['rotated']} keys")
+        return stats
 
-                # Deactivate old key
-                key_record.is_active = False
-                key_record.rotated_at = datetime.utcnow()
+    def rotate_master_key(
+        self, batch_size: int = DEFAULT_REWRAP_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """
+        Rotate the master key and rewrap every stored data key under it.
 
-                stats["rotated"] += 1
+        Only the wrapped keys change, in bulk and in a single transaction;
+        encrypted data is untouched. The replaced master key is kept as
+        encryption/master_key_previous only while the rotation is in
+        flight, so keys stay readable if the process stops between
+        publishing the new master key and committing; it is removed once
+        the rewrapped keys are committed.
 
-                logger.info(f"Rotated key: {key_record.key_id}")
-            except Exception as e:
-                logger.error(f"Failed to rotate key {key_record.key_id}: {e}")
-                stats["failed"] += 1
+        Args:
+            batch_size: Keys rewrapped per statement
 
-        self.db.commit()
+        Returns:
+            Dictionary with rotation statistics
+        """
+        old_master_key = self._master_key
+        old_previous_key = self._previous_master_key
+        new_master_key = Fernet.generate_key()
+        start = datetime.utcnow()
 
-        return stats
+        try:
+            self.secrets_manager.set_secret(
+                "encryption/master_key_previous",
+                base64.b64encode(old_master_key).decode("utf-8"),
+            )
+            self._previous_master_key = old_master_key
+            rewrapped = rewrap_data_keys(
+                self.db,
+                EncryptionKey.__table__,
+                old_master_key,
+                new_master_key,
+                batch_size,
+            )
+            self.secrets_manager.set_secret(
+                "encryption/master_key",
+                base64.b64encode(new_master_key).decode("utf-8"),
+            )
+            self._master_key = new_master_key
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            self._master_key = old_master_key
+            self._previous_master_key = old_previous_key
+            self.secrets_manager.set_secret(
+                "encryption/master_key",
+                base64.b64encode(old_master_key).decode("utf-8"),
+            )
+            self._restore_previous_master_key(old_previous_key)
+            logger.error("Master key rotation failed; kept the current master key")
+            raise
+
+        # Every committed data key is now wrapped under the new master key
+        self._previous_master_key = None
+        if not self.secrets_manager.delete_secret("encryption/master_key_previous"):
+            logger.warning("Could not remove the previous master key after rotation")
+
+        logger.info(f"Rotated master key and rewrapped {rewrapped} data keys")
+        return {
+            "rewrapped": rewrapped,
+            "duration_seconds": (datetime.utcnow() - start).total_seconds(),
+        }
+
+    def _restore_previous_master_key(self, previous_key: bytes | None) -> None:
+        """Put back the previous master key secret a failed rotation replaced."""
+        if previous_key is None:
+            self.secrets_manager.delete_secret("encryption/master_key_previous")
+        else:
+            self.secrets_manager.set_secret(
+                "encryption/master_key_previous",
+                base64.b64encode(previous_key).decode("utf-8"),
+            )
+
+    # ========================================================================
+    # Lazy Re-encryption
+    # ========================================================================
+
+    def create_field_reencryption_job(
+        self,
+        load_value: Callable[[EncryptedField], str],
+        store_value: Callable[[EncryptedField, str], None],
+        checkpoint_path: Path,
+        batch_size: int = 500,
+        max_records_per_second: float | None = None,
+    ) -> ReEncryptionJob:
+        """
+        Build a job re-encrypting field values still under retired keys.
+
+        Tracked fields are visited in id order; each batch prefetches its
+        keys, re-encrypts the values and commits. The job uses this service's
+        session, so a job started in the background needs a service (and
+        session) of its own.
+
+        Args:
+            load_value: Returns the stored base64 value of a tracked field
+            store_value: Saves the re-encrypted base64 value of a field
+            checkpoint_path: JSON file recording progress
+            batch_size: Fields per batch and transaction
+            max_records_per_second: Throughput cap, unlimited when None
+
+        Returns:
+            Re-encryption job (call run() or start())
+        """
+        retired_key_ids = self.db.query(EncryptionKey.key_id).filter(
+            EncryptionKey.is_active.is_(False)
+        )
+
+        def fetch_batch(cursor: int | None, limit: int) -> list[tuple[int, Any]]:
+            query = self.db.query(EncryptedField).filter(
+                EncryptedField.encryption_key_id.in_(retired_key_ids)
+            )
+            if cursor is not None:
+                query = query.filter(EncryptedField.id > cursor)
+            records = query.order_by(EncryptedField.id).limit(limit).all()
+            return [(record.id, record) for record in records]
+
+        def process_batch(records: list[EncryptedField]) -> None:
+            key_ids = [record.encryption_key_id for record in records]
+            self.prefetch_keys(key_ids)
+            self.prefetch_keys(
+                self._key_successors[key_id]
+                for key_id in key_ids
+                if key_id in self._key_successors
+            )
+            for record in records:
+                metadata = json.loads(record.encryption_metadata)
+                encrypted_data, metadata = self.reencrypt_data(
+                    base64.b64decode(load_value(record)), metadata
+                )
+                store_value(record, base64.b64encode(encrypted_data).decode("utf-8"))
+                record.encryption_key_id = metadata["key_id"]
+                record.encryption_metadata = json.dumps(metadata)
+                record.encrypted_at = datetime.utcnow()
+            self.db.commit()
+
+        return ReEncryptionJob(
+            fetch_batch,
+            process_batch,
+            checkpoint_path,
+            batch_size=batch_size,
+            max_items_per_second=max_records_per_second,
+            target=self._rotation_target(),
+        )
+
+    def create_file_reencryption_job(
+        self,
+        paths: Iterable[Path],
+        checkpoint_path: Path,
+        batch_size: int = 16,
+        max_files_per_second: float | None = None,
+        max_workers: int | None = None,
+    ) -> ReEncryptionJob:
+        """
+        Build a job re-encrypting files still under retired keys.
+
+        Args:
+            paths: Encrypted files to check
+            checkpoint_path: JSON file recording progress
+            batch_size: Files per batch
+            max_files_per_second: Throughput cap, unlimited when None
+            max_workers: Worker threads per file
+
+        Returns:
+            Re-encryption job (call run() or start())
+        """
+        ordered = sorted(str(path) for path in paths)
+
+        def fetch_batch(cursor: str | None, limit: int) -> list[tuple[str, Path]]:
+            start = 0 if cursor is None else bisect.bisect_right(ordered, cursor)
+            return [(path, Path(path)) for path in ordered[start : start + limit]]
+
+        def process_batch(batch: list[Path]) -> None:
+            for path in batch:
+                self.reencrypt_file(path, max_workers)
+
+        return ReEncryptionJob(
+            fetch_batch,
+            process_batch,
+            checkpoint_path,
+            batch_size=batch_size,
+            max_items_per_second=max_files_per_second,
+            target=self._rotation_target(),
+        )
+
+    def _rotation_target(self) -> str | None:
+        """
+        Identify the latest key rotation, so a re-encryption checkpoint from
+        before a later rotation is not resumed as already completed.
+        """
+        latest = self.db.query(func.max(EncryptionKey.rotated_at)).scalar()
+        return latest.isoformat() if latest else None
 
     # ========================================================================
     # Database Encryption
@@ -8,12 +8,15 @@ import asyncio
 import hashlib
 import json
 import logging
+import os
 import re
+import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import Any
 
 import aiofiles
@@ -66,19 +69,39 @@ class IncrementalSnapshot:
     files_tracked: int
     total_size: int
     checksum_map: dict[str, str] = field(default_factory=dict)
+    # relative path -> (inode, mtime_ns, size) for filesystem snapshots
+    stat_map: dict[str, tuple[int, int, int]] = field(default_factory=dict)
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
 class FileSystemTracker:
-    """Tracks file system changes for incremental backup."""
+    """
+    Tracks file system changes for incremental backup.
+
+    Each snapshot records ``(inode, mtime_ns, size)`` per file alongside its
+    checksum in a compact SQLite manifest. Later scans trust unchanged stat
+    triples and only re-hash candidate files, using a thread pool for the
+    hashing itself.
+    """
+
+    # Files above this size are fingerprinted from stat data instead of hashed
+    FULL_HASH_MAX_SIZE = 1024 * 1024
+    HASH_CHUNK_SIZE = 1024 * 1024
 
     def __init__(
-        self, base_path: str, exclude_patterns: list[str] | None = None
+        self,
+        base_path: str,
+        exclude_patterns: list[str] | None = None,
+        max_hash_workers: int | None = None,
     ) -> None:
         """Initialize file system tracker."""
         self.base_path = Path(base_path)
         self.exclude_patterns = exclude_patterns or []
+        self.max_hash_workers = max_hash_workers or min(8, (os.cpu_count() or 1) + 4)
         self.snapshot_file = (
+            self.base_path.parent / f".{self.base_path.name}_snapshot.db"
+        )
+        self.legacy_snapshot_file = (
             self.base_path.parent / f".{self.base_path.name}_snapshot.json"
         )
         self.last_snapshot: IncrementalSnapshot | None = None
@@ -86,47 +109,30 @@ class FileSystemTracker:
     async def create_snapshot(self, snapshot_id: str) -> IncrementalSnapshot:
         """Create a snapshot of the current file system state."""
         start_time = time.time()
-        files_tracked = 0
-        total_size = 0
-        checksum_map = {}
 
         if not self.base_path.exists():
             raise FileNotFoundError(f"Base path does not exist: {self.base_path}")
 
-        for file_path in self._scan_files():
-            try:
-                stat_info = file_path.stat()
-                file_size = stat_info.st_size
-                files_tracked += 1
-                total_size += file_size
-
-                # Calculate checksum for small files only for performance
-                if file_size < 1024 * 1024:  # 1MB threshold
-                    checksum = await self._calculate_checksum(file_path)
-                else:
-                    # For large files, use mtime + size as quick hash
-                    checksum = hashlib.sha256(
-                        f"{stat_info.st_mtime}:{file_size}".encode()
-                    ).hexdigest()[:16]
-
-                relative_path = str(file_path.relative_to(self.base_path))
-                checksum_map[relative_path] = checksum
-
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Cannot access file {file_path}: {e}")
-                continue
+        if not self.last_snapshot:
+            await self._load_snapshot()
+
+        stat_map = await asyncio.to_thread(self._scan_entries)
+        checksum_map, hashed = await self._resolve_checksums(stat_map)
+        total_size = sum(entry[2] for entry in stat_map.values())
 
         snapshot = IncrementalSnapshot(
             snapshot_id=snapshot_id,
             source_id=str(self.base_path),
             backup_level=BackupLevel.FULL,
             created_at=datetime.utcnow(),
-            files_tracked=files_tracked,
+            files_tracked=len(checksum_map),
             total_size=total_size,
             checksum_map=checksum_map,
+            stat_map={path: stat_map[path] for path in checksum_map},
             metadata={
                 "scan_duration": time.time() - start_time,
                 "exclude_patterns": self.exclude_patterns,
+                "files_hashed": hashed,
             },
         )
 
@@ -135,7 +141,8 @@ class FileSystemTracker:
         self.last_snapshot = snapshot
 
         logger.info(
-            f"Created filesystem snapshot: {files_tracked} files, {total_size} bytes"
+            f"Created filesystem snapshot: {snapshot.files_tracked} files, "
+            f"{total_size} bytes ({hashed} hashed)"
         )
         return snapshot
 
@@ -143,65 +150,56 @@ class FileSystemTracker:
         self, since_snapshot_id: str | None = None
     ) -> list[ChangeRecord]:
         """Detect changes since the specified snapshot."""
-        if not self.last_snapshot and self.snapshot_file.exists():
+        if not self.last_snapshot:
             await self._load_snapshot()
 
         if not self.last_snapshot:
             logger.warning("No previous snapshot found, performing full scan")
             return []
 
-        changes = []
-        current_files = {}
+        previous = self.last_snapshot
+        stat_map = await asyncio.to_thread(self._scan_entries)
+        checksum_map, _ = await self._resolve_checksums(stat_map)
 
-        # Scan current state
-        for file_path in self._scan_files():
-            try:
-                stat_info = file_path.stat()
-                relative_path = str(file_path.relative_to(self.base_path))
-
-                # Calculate checksum
-                if stat_info.st_size < 1024 * 1024:
-                    checksum = await self._calculate_checksum(file_path)
-                else:
-                    checksum = hashlib.sha256(
-                        f"{stat_info.st_mtime}:{stat_info.st_size}".encode()
-                    ).hexdigest()[:16]
-
-                current_files[relative_path] = {
-                    "checksum": checksum,
-                    "size": stat_info.st_size,
-                    "mtime": stat_info.st_mtime,
-                }
-
-                # Check for changes
-                if relative_path not in self.last_snapshot.checksum_map:
-                    # New file
-                    changes.append(
-                        ChangeRecord(
-                            path=relative_path,
-                            change_type=ChangeType.CREATED,
-                            timestamp=datetime.fromtimestamp(stat_info.st_mtime),
-                            size=stat_info.st_size,
-                            checksum=checksum,
-                        )
-                    )
-                elif self.last_snapshot.checksum_map[relative_path] != checksum:
-                    # Modified file
-                    changes.append(
-                        ChangeRecord(
-                            path=relative_path,
-                            change_type=ChangeType.MODIFIED,
-                            timestamp=datetime.fromtimestamp(stat_info.st_mtime),
-                            size=stat_info.st_size,
-                            checksum=checksum,
-                        )
+        created: list[str] = []
+        changes = []
+        for relative_path, checksum in checksum_map.items():
+            previous_checksum = previous.checksum_map.get(relative_path)
+            if previous_checksum is None:
+                created.append(relative_path)
+            elif previous_checksum != checksum:
+                changes.append(
+                    self._change_record(
+                        relative_path,
+                        ChangeType.MODIFIED,
+                        stat_map[relative_path],
+                        checksum,
                     )
+                )
 
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Cannot access file {file_path}: {e}")
-                continue
+        deleted = [path for path in previous.checksum_map if path not in checksum_map]
+
+        # Pair deletions and creations sharing an identical stat triple as moves
+        moved_from = {
+            previous.stat_map[path]: path
+            for path in deleted
+            if path in previous.stat_map
+        }
+        moved_sources: set[str] = set()
+        for relative_path in created:
+            stat_entry = stat_map[relative_path]
+            source_path = moved_from.pop(stat_entry, None)
+            change_type = (
+                ChangeType.CREATED if source_path is None else ChangeType.MOVED
+            )
+            record = self._change_record(
+                relative_path, change_type, stat_entry, checksum_map[relative_path]
+            )
+            if source_path is not None:
+                record.metadata["previous_path"] = source_path
+                moved_sources.add(source_path)
+            changes.append(record)
 
-        # Check for deleted files
         changes.extend(
             ChangeRecord(
                 path=relative_path,
@@ -210,42 +208,159 @@ class FileSystemTracker:
                 size=0,
                 checksum="",
             )
-            for relative_path in self.last_snapshot.checksum_map
-            if relative_path not in current_files
+            for relative_path in deleted
+            if relative_path not in moved_sources
         )
 
         logger.info(f"Detected {len(changes)} changes since last snapshot")
         return changes
 
-    def _scan_files(self) -> list[Path]:
-        """Scan files in base path, excluding patterns."""
-        files = []
+    @staticmethod
+    def _change_record(
+        relative_path: str,
+        change_type: ChangeType,
+        stat_entry: tuple[int, int, int],
+        checksum: str,
+    ) -> ChangeRecord:
+        """Build a change record from a scanned stat triple."""
+        _, mtime_ns, size = stat_entry
+        return ChangeRecord(
+            path=relative_path,
+            change_type=change_type,
+            timestamp=datetime.fromtimestamp(mtime_ns / 1_000_000_000),
+            size=size,
+            checksum=checksum,
+        )
+
+    def _scan_entries(self) -> dict[str, tuple[int, int, int]]:
+        """
+        Walk the base path with ``os.scandir``, excluding patterns.
+
+        Returns:
+            Mapping of relative path to ``(inode, mtime_ns, size)``
+        """
+        entries: dict[str, tuple[int, int, int]] = {}
+        pending = [(str(self.base_path), "")]
+
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                iterator = os.scandir(directory)
+            except OSError as e:
+                logger.warning(f"Cannot access directory {directory}: {e}")
+                continue
+
+            with iterator:
+                for entry in iterator:
+                    relative_path = f"{prefix}{entry.name}"
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, f"{relative_path}/"))
+                            continue
+                        if not entry.is_file() or self._is_excluded(relative_path):
+                            continue
+                        stat_info = entry.stat()
+                    except OSError as e:
+                        logger.warning(f"Cannot access file {entry.path}: {e}")
+                        continue
+
+                    entries[str(PurePath(relative_path))] = (
+                        stat_info.st_ino,
+                        stat_info.st_mtime_ns,
+                        stat_info.st_size,
+                    )
 
-        for item in self.base_path.rglob("*"):
-            if item.is_file():
-                relative_path = str(item.relative_to(self.base_path))
+        return entries
 
-                # Check exclude patterns
-                excluded = False
-                for pattern in self.exclude_patterns:
-                    if pattern in relative_path or item.match(pattern):
-                        excluded = True
-                        break
+    def _is_excluded(self, relative_path: str) -> bool:
+        """Check a relative path against the exclude patterns."""
+        for pattern in self.exclude_patterns:
+            if pattern in relative_path or PurePath(relative_path).match(pattern):
+                return True
+        return False
 
-                if not excluded:
-                    files.append(item)
+    async def _resolve_checksums(
+        self, stat_map: dict[str, tuple[int, int, int]]
+    ) -> tuple[dict[str, str], int]:
+        """
+        Resolve checksums for scanned files.
 
-        return files
+        Checksums from the previous snapshot are reused when the stat triple is
+        unchanged; only the remaining candidates are hashed in a thread pool.
 
-    async def _calculate_checksum(self, file_path: Path) -> str:
+        Returns:
+            Tuple of (checksum map, number of files hashed)
+        """
+        previous = self.last_snapshot
+        checksum_map: dict[str, str] = {}
+        candidates: list[str] = []
+
+        for relative_path, stat_entry in stat_map.items():
+            if (
+                previous is not None
+                and previous.stat_map.get(relative_path) == stat_entry
+                and relative_path in previous.checksum_map
+            ):
+                checksum_map[relative_path] = previous.checksum_map[relative_path]
+            elif stat_entry[2] >= self.FULL_HASH_MAX_SIZE:
+                # For large files, use mtime + size as quick hash
+                checksum_map[relative_path] = self._stat_fingerprint(
+                    stat_entry, previous, relative_path
+                )
+            else:
+                candidates.append(relative_path)
+
+        if candidates:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=self.max_hash_workers) as executor:
+                digests = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            executor,
+                            self._calculate_checksum,
+                            self.base_path / relative_path,
+                        )
+                        for relative_path in candidates
+                    )
+                )
+            checksum_map.update(zip(candidates, digests, strict=True))
+
+        return checksum_map, len(candidates)
+
+    @staticmethod
+    def _stat_fingerprint(
+        stat_entry: tuple[int, int, int],
+        previous: IncrementalSnapshot | None,
+        relative_path: str,
+    ) -> str:
+        """
+        Quick hash of a large file from its mtime and size.
+
+        Legacy JSON snapshots fingerprinted the float ``st_mtime``; when the
+        previous snapshot has no stat data for the path, that form is
+        recomputed so unchanged large files are not reported as modified.
+        """
+        _, mtime_ns, size = stat_entry
+        fingerprint = hashlib.sha256(f"{mtime_ns}:{size}".encode()).hexdigest()[:16]
+        if previous is None or relative_path in previous.stat_map:
+            return fingerprint
+
+        seconds, nanoseconds = divmod(mtime_ns, 1_000_000_000)
+        legacy_mtime = seconds + nanoseconds * 1e-9  # as os.stat builds st_mtime
+        legacy = hashlib.sha256(f"{legacy_mtime}:{size}".encode()).hexdigest()[:16]
+        if previous.checksum_map.get(relative_path) == legacy:
+            return legacy
+        return fingerprint
+
+    def _calculate_checksum(self, file_path: Path) -> str:
         """Calculate SHA-256 checksum of a file."""
         hash_sha256 = hashlib.sha256()
 
         try:
-            async with aiofiles.open(file_path, "rb") as f:
-                while chunk := await f.read(8192):
+            with open(file_path, "rb") as f:
+                while chunk := f.read(self.HASH_CHUNK_SIZE):
                     hash_sha256.update(chunk)
-        except Exception as e:
+        except OSError as e:
             logger.warning(f"Failed to calculate checksum for {file_path}: {e}")
             return ""
 
@@ -253,45 +368,123 @@ class FileSystemTracker:
 
     async def _save_snapshot(self, snapshot: IncrementalSnapshot) -> None:
         """Save snapshot to disk."""
-        snapshot_data = {
-            "snapshot_id": snapshot.snapshot_id,
-            "source_id": snapshot.source_id,
-            "backup_level": snapshot.backup_level.value,
-            "created_at": snapshot.created_at.isoformat(),
-            "files_tracked": snapshot.files_tracked,
-            "total_size": snapshot.total_size,
-            "checksum_map": snapshot.checksum_map,
-            "metadata": snapshot.metadata,
-        }
+        await asyncio.to_thread(self._write_manifest, snapshot)
 
-        async with aiofiles.open(self.snapshot_file, "w") as f:
-            await f.write(json.dumps(snapshot_data, indent=2))
-
-    async def _load_snapshot(self) -> None:
-        """Load snapshot from disk."""
-        if not self.snapshot_file.exists():
-            return
+    def _write_manifest(self, snapshot: IncrementalSnapshot) -> None:
+        """Write the snapshot manifest to a temporary SQLite file and swap it in."""
+        temp_file = self.snapshot_file.with_suffix(".db.tmp")
+        temp_file.unlink(missing_ok=True)
 
+        conn = sqlite3.connect(temp_file)
         try:
-            async with aiofiles.open(self.snapshot_file) as f:
-                content = await f.read()
-                data = json.loads(content)
-
-            self.last_snapshot = IncrementalSnapshot(
-                snapshot_id=data["snapshot_id"],
-                source_id=data["source_id"],
-                backup_level=BackupLevel(data["backup_level"]),
-                created_at=datetime.fromisoformat(data["created_at"]),
-                files_tracked=data["files_tracked"],
-                total_size=data["total_size"],
-                checksum_map=data["checksum_map"],
-                metadata=data.get("metadata", {}),
+            conn.executescript("""
+                PRAGMA journal_mode = OFF;
+                PRAGMA synchronous = OFF;
+                CREATE TABLE snapshot (
+                    snapshot_id TEXT NOT NULL,
+                    source_id TEXT NOT NULL,
+                    backup_level TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    files_tracked INTEGER NOT NULL,
+                    total_size INTEGER NOT NULL,
+                    metadata TEXT NOT NULL
+                );
+                CREATE TABLE files (
+                    path TEXT PRIMARY KEY,
+                    inode INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    checksum BLOB NOT NULL
+                ) WITHOUT ROWID;
+                """)
+            conn.execute(
+                "INSERT INTO snapshot VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    snapshot.snapshot_id,
+                    snapshot.source_id,
+                    snapshot.backup_level.value,
+                    snapshot.created_at.isoformat(),
+                    snapshot.files_tracked,
+                    snapshot.total_size,
+                    json.dumps(snapshot.metadata),
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        path,
+                        *snapshot.stat_map.get(path, (0, 0, 0)),
+                        bytes.fromhex(checksum),
+                    )
+                    for path, checksum in snapshot.checksum_map.items()
+                ),
             )
+            conn.commit()
+        finally:
+            conn.close()
+
+        os.replace(temp_file, self.snapshot_file)
 
+    async def _load_snapshot(self) -> None:
+        """Load snapshot from disk."""
+        try:
+            if self.snapshot_file.exists():
+                self.last_snapshot = await asyncio.to_thread(self._read_manifest)
+            elif self.legacy_snapshot_file.exists():
+                self.last_snapshot = await self._load_legacy_snapshot()
         except Exception as e:
             logger.error(f"Failed to load snapshot: {e}")
             self.last_snapshot = None
 
+    def _read_manifest(self) -> IncrementalSnapshot | None:
+        """Read a snapshot from the SQLite manifest."""
+        conn = sqlite3.connect(f"file:{self.snapshot_file}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT * FROM snapshot").fetchone()
+            if row is None:
+                return None
+
+            checksum_map: dict[str, str] = {}
+            stat_map: dict[str, tuple[int, int, int]] = {}
+            for path, inode, mtime_ns, size, checksum in conn.execute(
+                "SELECT path, inode, mtime_ns, size, checksum FROM files"
+            ):
+                checksum_map[path] = checksum.hex()
+                stat_map[path] = (inode, mtime_ns, size)
+        finally:
+            conn.close()
+
+        return IncrementalSnapshot(
+            snapshot_id=row[0],
+            source_id=row[1],
+            backup_level=BackupLevel(row[2]),
+            created_at=datetime.fromisoformat(row[3]),
+            files_tracked=row[4],
+            total_size=row[5],
+            checksum_map=checksum_map,
+            stat_map=stat_map,
+            metadata=json.loads(row[6]),
+        )
+
+    async def _load_legacy_snapshot(self) -> IncrementalSnapshot:
+        """Load a snapshot written in the previous JSON format."""
+        async with aiofiles.open(self.legacy_snapshot_file) as f:
+            content = await f.read()
+            data = json.loads(content)
+
+        # Legacy snapshots carry no stat data, so every file is re-hashed once
+        return IncrementalSnapshot(
+            snapshot_id=data["snapshot_id"],
+            source_id=data["source_id"],
+            backup_level=BackupLevel(data["backup_level"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            files_tracked=data["files_tracked"],
+            total_size=data["total_size"],
+            checksum_map=data["checksum_map"],
+            metadata=data.get("metadata", {}),
+        )
+
 
 class DatabaseTracker:
     """Tracks database changes for incremental backup."""
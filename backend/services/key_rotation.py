@@ -0,0 +1,315 @@
+"""
+Key Rotation
+Envelope-key rotation support for the encryption service.
+
+Data keys are stored wrapped (Fernet-encrypted) under the master key, so a
+master key rotation only has to rewrap those records - the data they protect
+is untouched. Rewrapping streams the key table in id order and writes each
+batch back with one executemany UPDATE, all inside the caller's transaction.
+Data still encrypted under retired data keys is re-encrypted lazily: new
+writes use the active key version, and a throttled background job with a
+checkpoint file works through the backlog.
+"""
+
+import base64
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from cryptography.fernet import Fernet, MultiFernet
+from sqlalchemy import Table, bindparam, select, update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REWRAP_BATCH_SIZE = 5000
+
+
+# ============================================================================
+# Data Key Cache
+# ============================================================================
+
+
+class KeyCache:
+    """
+    Bounded LRU cache of unwrapped data keys with a time-to-live, so
+    plaintext keys neither accumulate nor stay in memory indefinitely.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0) -> None:
+        """
+        Initialize key cache.
+
+        Args:
+            max_size: Maximum number of keys held
+            ttl_seconds: Seconds a key stays cached after it was loaded
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key_id: str) -> bytes | None:
+        """Cached key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key_id)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key_id: str, key: bytes) -> None:
+        """Cache a key, evicting the least recently used beyond max_size."""
+        self.put_many({key_id: key})
+
+    def put_many(self, keys: dict[str, bytes]) -> None:
+        """Cache several keys at once."""
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for key_id, key in keys.items():
+                self._entries[key_id] = (key, expires_at)
+                self._entries.move_to_end(key_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def missing(self, key_ids: Iterable[str]) -> list[str]:
+        """Key ids that are not cached (or have expired), deduplicated."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                key_id
+                for key_id in dict.fromkeys(key_ids)
+                if key_id not in self._entries or self._entries[key_id][1] <= now
+            ]
+
+    def invalidate(self, key_id: str | None = None) -> None:
+        """Drop one key, or every key when key_id is None."""
+        with self._lock:
+            if key_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Size and hit statistics."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# ============================================================================
+# Master Key Rewrapping
+# ============================================================================
+
+
+def master_key_wrapper(master_key: bytes, *previous_keys: bytes | None) -> MultiFernet:
+    """
+    Fernet wrapper for data keys: wraps with master_key and unwraps tokens
+    made under it or any of the previous master keys.
+    """
+    return MultiFernet(
+        [Fernet(key) for key in (master_key, *previous_keys) if key is not None]
+    )
+
+
+def rewrap_data_keys(
+    session: Session,
+    table: Table,
+    old_master_key: bytes,
+    new_master_key: bytes,
+    batch_size: int = DEFAULT_REWRAP_BATCH_SIZE,
+) -> int:
+    """
+    Rewrap every stored data key from the old master key to the new one.
+
+    Rows are read in id order with keyset pagination and updated with one
+    executemany statement per batch. Nothing is committed: the caller owns
+    the transaction, so the rewrap is all-or-nothing. Rows already wrapped
+    under the new key are rewrapped again harmlessly, which makes a retried
+    rotation safe.
+
+    Args:
+        session: Database session (transaction left open)
+        table: Key table with id and encrypted_key columns
+        old_master_key: Master key the keys are currently wrapped with
+        new_master_key: Master key to wrap them with
+        batch_size: Rows read and updated per statement
+
+    Returns:
+        Number of keys rewrapped
+    """
+    wrapper = master_key_wrapper(new_master_key, old_master_key)
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values(encrypted_key=bindparam("wrapped_key"))
+    )
+    last_id = None
+    rewrapped = 0
+    while True:
+        query = select(table.c.id, table.c.encrypted_key).order_by(table.c.id)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        rows = session.execute(query.limit(batch_size)).all()
+        if not rows:
+            break
+        params = [
+            {
+                "row_id": row_id,
+                "wrapped_key": base64.b64encode(
+                    wrapper.rotate(base64.b64decode(encrypted_key))
+                ).decode("utf-8"),
+            }
+            for row_id, encrypted_key in rows
+        ]
+        session.execute(statement, params)
+        rewrapped += len(rows)
+        last_id = rows[-1][0]
+    logger.info(f"Rewrapped {rewrapped} data keys under the new master key")
+    return rewrapped
+
+
+# ============================================================================
+# Background Re-encryption
+# ============================================================================
+
+
+class ReEncryptionJob:
+    """
+    Throttled, resumable batch job for re-encrypting data under new keys.
+
+    fetch_batch(cursor, limit) returns up to limit (cursor, item) pairs that
+    come after cursor (None for the start), in cursor order;
+    process_batch(items) re-encrypts them. The cursor of the last processed
+    item is saved to a checkpoint file after every batch, so a restarted job
+    resumes where it stopped. A checkpoint saved for a different target (for
+    example, before a later key rotation) is discarded and the job starts
+    over.
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[Any, int], list[tuple[Any, Any]]],
+        process_batch: Callable[[list[Any]], None],
+        checkpoint_path: Path,
+        batch_size: int = 500,
+        max_items_per_second: float | None = None,
+        target: str | None = None,
+    ) -> None:
+        """
+        Initialize re-encryption job.
+
+        Args:
+            fetch_batch: Loads the next batch of (cursor, item) pairs
+            process_batch: Re-encrypts a batch of items
+            checkpoint_path: JSON file recording progress
+            batch_size: Items per batch
+            max_items_per_second: Throughput cap, unlimited when None
+            target: Key state the job re-encrypts towards; progress saved
+                for another target is not resumed
+        """
+        self.fetch_batch = fetch_batch
+        self.process_batch = process_batch
+        self.checkpoint_path = Path(checkpoint_path)
+        self.batch_size = batch_size
+        self.max_items_per_second = max_items_per_second
+        self.target = target
+        self._stop = threading.Event()
+
+    def load_checkpoint(self) -> dict[str, Any]:
+        """Saved progress for this target, or a fresh state if there is none."""
+        fresh = {
+            "cursor": None,
+            "processed": 0,
+            "completed": False,
+            "target": self.target,
+        }
+        try:
+            with open(self.checkpoint_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return fresh
+        if state.get("target") != self.target:
+            logger.info(
+                f"Ignoring re-encryption checkpoint for target "
+                f"{state.get('target')!r}; starting over for {self.target!r}"
+            )
+            return fresh
+        return state
+
+    def _save_checkpoint(self, state: dict[str, Any]) -> None:
+        state["updated_at"] = datetime.utcnow().isoformat()
+        temp_path = self.checkpoint_path.with_name(f".{self.checkpoint_path.name}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def run(self) -> dict[str, Any]:
+        """
+        Process batches until the backlog is empty or stop() is called.
+
+        Returns:
+            Final checkpoint state
+        """
+        state = self.load_checkpoint()
+        if state.get("completed"):
+            return state
+        start = time.monotonic()
+        processed = 0
+        while not self._stop.is_set():
+            batch = self.fetch_batch(state["cursor"], self.batch_size)
+            if not batch:
+                state["completed"] = True
+                self._save_checkpoint(state)
+                break
+            self.process_batch([item for _, item in batch])
+            state["cursor"] = batch[-1][0]
+            state["processed"] += len(batch)
+            self._save_checkpoint(state)
+
+            processed += len(batch)
+            if self.max_items_per_second:
+                ahead = processed / self.max_items_per_second - (
+                    time.monotonic() - start
+                )
+                if ahead > 0:
+                    self._stop.wait(ahead)
+        logger.info(
+            f"Re-encryption job processed {processed} items "
+            f"({state['processed']} total, completed={state['completed']})"
+        )
+        return state
+
+    def start(self) -> threading.Thread:
+        """Run the job in a daemon thread."""
+        thread = threading.Thread(target=self.run, name="reencryption-job", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        """Ask a running job to stop after its current batch."""
+        self._stop.set()
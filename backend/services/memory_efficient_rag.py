@@ -8,6 +8,7 @@ import gc
 import logging
 import weakref
 from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any
 
@@ -15,6 +16,7 @@ from backend.api.websocket_manager import RAGProgressType, WebSocketManager
 from backend.services.async_task_manager import (
     MemoryMonitor,
 )
+from backend.services.rag_token_stream import stream_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -145,7 +147,7 @@ class MemoryOptimizedRAGProcessor:
             if cancellation_token.is_set():
                 return ""
 
-            # Stage 4: Query processing with memory monitoring
+            # Stage 4: Query processing, forwarding tokens as they are generated
             await self._progress_update(
                 client_id,
                 task_id,
@@ -154,30 +156,21 @@ class MemoryOptimizedRAGProcessor:
                 "Executing RAG query with memory optimization",
             )
 
-            # Process query in chunks to manage memory
-            response = await self._process_query_with_chunking(
-                controller, document_id, query, processor, cancellation_token
+            response = await self._stream_query(
+                controller,
+                document_id,
+                query,
+                processor,
+                client_id,
+                task_id,
+                cancellation_token,
             )
 
-            if not response:
-                raise ValueError("RAG query returned empty response")
-
             if cancellation_token.is_set():
                 return ""
 
-            # Stage 5: Response streaming (if enabled)
-            if self.enable_streaming and len(response) > self.chunk_size:
-                await self._progress_update(
-                    client_id,
-                    task_id,
-                    RAGProgressType.STREAMING_RESPONSE,
-                    80.0,
-                    f"Streaming response ({len(response)} characters)",
-                )
-
-                await self._stream_response(
-                    response, client_id, task_id, cancellation_token
-                )
+            if not response:
+                raise ValueError("RAG query returned empty response")
 
             await processor.check_memory_pressure()
 
@@ -211,29 +204,43 @@ class MemoryOptimizedRAGProcessor:
             )
             raise
 
-    async def _process_query_with_chunking(
+    async def _stream_query(
         self,
         controller: Any,
         document_id: int,
         query: str,
         processor: "RAGMemoryContext",
+        client_id: str,
+        task_id: str,
         cancellation_token: asyncio.Event,
     ) -> str:
-        """Process query with memory-efficient chunking."""
-
-        # Perform the actual RAG query
-        # Note: This is where we'd implement advanced chunking if the controller supported it
-        # For now, we use the existing controller method with memory monitoring
+        """Run the query with streaming synthesis, sending each token to the
+        client as it arrives. Returns the full answer."""
 
-        # Monitor memory before query
         await processor.check_memory_pressure()
 
-        # Execute query (this might be memory intensive)
-        response = await asyncio.to_thread(
-            controller.query_document, document_id, query
-        )
+        parts: list[str] = []
+        async with aclosing(
+            stream_tokens(
+                lambda: controller.stream_query_document(document_id, query),
+                cancellation_token,
+            )
+        ) as tokens:
+            async for token in tokens:
+                if self.enable_streaming:
+                    if not parts:
+                        await self._progress_update(
+                            client_id,
+                            task_id,
+                            RAGProgressType.STREAMING_RESPONSE,
+                            80.0,
+                            "Streaming response",
+                        )
+                    await self.ws_manager.send_rag_response_chunk(
+                        client_id, task_id, token, len(parts)
+                    )
+                parts.append(token)
 
-        # Monitor memory after query
         await processor.check_memory_pressure()
 
         # Force garbage collection if memory usage is high
@@ -241,39 +248,7 @@ class MemoryOptimizedRAGProcessor:
             gc.collect()
             await asyncio.sleep(0.1)  # Allow GC to complete
 
-        return response
-
-    async def _stream_response(
-        self,
-        response: str,
-        client_id: str,
-        task_id: str,
-        cancellation_token: asyncio.Event,
-    ) -> None:
-        """Stream response in chunks to the client."""
-
-        if not self.enable_streaming:
-            return
-
-        # Split response into chunks
-        chunks = [
-            response[i : i + self.chunk_size]
-            for i in range(0, len(response), self.chunk_size)
-        ]
-
-        total_chunks = len(chunks)
-
-        for i, chunk in enumerate(chunks):
-            if cancellation_token.is_set():
-                break
-
-            await self.ws_manager.send_rag_response_chunk(
-                client_id, task_id, chunk, i, total_chunks
-            )
-
-            # Small delay to prevent overwhelming the client
-            if i < len(chunks) - 1:  # Don't delay after the last chunk
-                await asyncio.sleep(0.02)
+        return "".join(parts)
 
     async def _progress_update(
         self,
@@ -0,0 +1,91 @@
+"""
+RAG Token Streaming
+Bridges a blocking token iterator (LlamaIndex streaming synthesis running in a
+worker thread) to an async iterator, so tokens reach WebSocket and SSE clients
+as the LLM produces them and a disconnect stops generation.
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+async def stream_tokens(
+    produce: Callable[[], Iterable[str]],
+    cancellation_token: asyncio.Event | None = None,
+) -> AsyncIterator[str]:
+    """
+    Iterate ``produce()`` in a worker thread, yielding each token on the loop.
+
+    Generation stops at the next token boundary when the consumer stops
+    iterating (client disconnect, task cancellation, ``aclose()``) or when
+    ``cancellation_token`` is set; the underlying iterator is then closed in
+    the worker thread so the LLM stream is released. Use
+    ``contextlib.aclosing`` when breaking out of the loop early.
+
+    Args:
+        produce: Callable returning the blocking token iterable
+        cancellation_token: Optional event that ends the stream when set
+
+    Returns:
+        Async iterator over tokens
+
+    Raises:
+        Exception: Whatever ``produce`` or its iterator raised
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    stop = threading.Event()
+
+    def publish(item: Any) -> None:
+        # The loop may already be closed if the consumer went away at shutdown
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    def run() -> None:
+        try:
+            tokens = iter(produce())
+            try:
+                for token in tokens:
+                    if stop.is_set():
+                        break
+                    publish(token)
+            finally:
+                close = getattr(tokens, "close", None)
+                if close is not None:
+                    close()
+        except BaseException as e:  # Re-raised on the loop
+            publish((_END, e))
+        else:
+            publish((_END, None))
+
+    def end_on_cancel(future: asyncio.Future[Any]) -> None:
+        if not future.cancelled():
+            queue.put_nowait((_END, None))
+
+    watcher: asyncio.Future[Any] | None = None
+    if cancellation_token is not None:
+        watcher = asyncio.ensure_future(cancellation_token.wait())
+        watcher.add_done_callback(end_on_cancel)
+
+    worker = threading.Thread(target=run, name="rag-token-stream", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, tuple) and item and item[0] is _END:
+                if item[1] is not None:
+                    raise item[1]
+                return
+            yield item
+    finally:
+        stop.set()
+        if watcher is not None:
+            watcher.cancel()
@@ -0,0 +1,397 @@
+"""
+Segmented File Encryption
+Random-access AES-256-GCM container for files at rest.
+
+The plaintext is split into fixed-size segments and each segment is sealed
+on its own, so segments can be encrypted and decrypted in parallel and any
+byte range can be read (and authenticated) without touching the rest of the
+file. The construction follows the STREAM/online-AEAD layout:
+
+    header | segment 0 ciphertext + tag | segment 1 ... | last segment + tag
+
+- A per-file AES key is derived with HKDF-SHA256 from the data key and a
+  random salt, so files sharing a data key never share a (key, nonce) pair.
+- Segment nonces are ``nonce_prefix (7) || segment index (4) || last (1)``:
+  reordering, dropping or truncating segments fails authentication.
+- The header (format, segment size, plaintext size, salt, nonce prefix,
+  key id) is the associated data of every segment.
+"""
+
+import logging
+import os
+import struct
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeVar
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+MAGIC = b"AISEG\x00\x00\x01"
+FORMAT_NAME = "segmented-aes-256-gcm-v1"
+TAG_SIZE = 16
+SALT_SIZE = 16
+NONCE_PREFIX_SIZE = 7
+DEFAULT_SEGMENT_SIZE = 64 * 1024
+# Segments handled per worker task: large enough to amortize scheduling
+SEGMENTS_PER_TASK = 64
+
+# magic, segment size, plaintext size, salt, nonce prefix, key id length
+_HEADER = struct.Struct(f">8sIQ{SALT_SIZE}s{NONCE_PREFIX_SIZE}sH")
+
+
+class SegmentAuthenticationError(ValueError):
+    """Raised when a segment fails authentication (tampered or truncated)."""
+
+    pass
+
+
+# ============================================================================
+# Container Header
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class SegmentHeader:
+    """Header of a segmented container; also the AAD of every segment."""
+
+    segment_size: int
+    plaintext_size: int
+    salt: bytes
+    nonce_prefix: bytes
+    key_id: str
+
+    def to_bytes(self) -> bytes:
+        """Serialize the header."""
+        key_id = self.key_id.encode("utf-8")
+        return (
+            _HEADER.pack(
+                MAGIC,
+                self.segment_size,
+                self.plaintext_size,
+                self.salt,
+                self.nonce_prefix,
+                len(key_id),
+            )
+            + key_id
+        )
+
+    @classmethod
+    def read_from(cls, path: Path) -> "SegmentHeader":
+        """
+        Read the header of a segmented file.
+
+        Args:
+            path: Encrypted file
+
+        Returns:
+            Parsed header
+
+        Raises:
+            ValueError: If the file is not a segmented container
+        """
+        with open(path, "rb") as f:
+            fixed = f.read(_HEADER.size)
+            if len(fixed) < _HEADER.size or not fixed.startswith(MAGIC):
+                raise ValueError(f"Not a segmented encrypted file: {path}")
+            fields = _HEADER.unpack(fixed)
+            _, segment_size, plaintext_size, salt, prefix, key_id_size = fields
+            key_id = f.read(key_id_size).decode("utf-8")
+        if segment_size <= 0:
+            raise ValueError(f"Invalid segment size in {path}")
+        return cls(segment_size, plaintext_size, salt, prefix, key_id)
+
+    @property
+    def size(self) -> int:
+        """Header length in bytes."""
+        return _HEADER.size + len(self.key_id.encode("utf-8"))
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segments (an empty file still has one, empty, segment)."""
+        return max(1, -(-self.plaintext_size // self.segment_size))
+
+    @property
+    def encrypted_size(self) -> int:
+        """Total size of the container file."""
+        return self.size + self.plaintext_size + self.segment_count * TAG_SIZE
+
+    def segment_offset(self, index: int) -> int:
+        """File offset of a segment's ciphertext."""
+        return self.size + index * (self.segment_size + TAG_SIZE)
+
+    def nonce(self, index: int) -> bytes:
+        """Nonce of a segment: prefix, big-endian index, last-segment flag."""
+        last = index == self.segment_count - 1
+        return self.nonce_prefix + struct.pack(">IB", index, last)
+
+
+def is_segmented_file(path: Path) -> bool:
+    """Whether a file starts with the segmented container magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+# ============================================================================
+# Segmented Cipher
+# ============================================================================
+
+
+class SegmentedFileCipher:
+    """
+    Encrypts, decrypts and range-reads segmented containers with one data key.
+    Work is spread over a thread pool in batches of segments using
+    positional reads and writes, so workers never share a file position.
+    """
+
+    def __init__(self, key: bytes, max_workers: int | None = None) -> None:
+        """
+        Initialize segmented cipher.
+
+        Args:
+            key: Data key material (any length; the AES key is derived)
+            max_workers: Worker threads (defaults to the CPU count)
+        """
+        self.key = key
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def _aead(self, header: SegmentHeader) -> AESGCM:
+        """AES-256-GCM instance keyed for one file."""
+        file_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=header.salt,
+            info=FORMAT_NAME.encode("ascii"),
+        ).derive(self.key)
+        return AESGCM(file_key)
+
+    def encrypt_file(
+        self,
+        input_path: Path,
+        output_path: Path,
+        key_id: str,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+    ) -> SegmentHeader:
+        """
+        Encrypt a file into a segmented container.
+
+        Args:
+            input_path: Plaintext file
+            output_path: Container to write
+            key_id: Identifier of the data key, stored in the header
+            segment_size: Plaintext bytes per segment
+
+        Returns:
+            Header of the written container
+        """
+        if segment_size <= 0:
+            raise ValueError("segment_size must be positive")
+        header = SegmentHeader(
+            segment_size=segment_size,
+            plaintext_size=Path(input_path).stat().st_size,
+            salt=os.urandom(SALT_SIZE),
+            nonce_prefix=os.urandom(NONCE_PREFIX_SIZE),
+            key_id=key_id,
+        )
+        aead = self._aead(header)
+        aad = header.to_bytes()
+
+        with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+            dst.write(aad)
+            dst.truncate(header.encrypted_size)
+            dst.flush()
+
+            def encrypt_batch(first: int, stop: int) -> None:
+                start = first * segment_size
+                size = min(stop * segment_size, header.plaintext_size) - start
+                data = memoryview(os.pread(src.fileno(), size, start))
+                sealed = bytearray()
+                for index in range(first, stop):
+                    position = (index - first) * segment_size
+                    plaintext = data[position : position + segment_size]
+                    sealed += aead.encrypt(header.nonce(index), plaintext, aad)
+                os.pwrite(dst.fileno(), sealed, header.segment_offset(first))
+
+            self._run_batches(header, encrypt_batch)
+        return header
+
+    def decrypt_file(self, input_path: Path, output_path: Path) -> SegmentHeader:
+        """
+        Decrypt a whole segmented container.
+
+        Args:
+            input_path: Container file
+            output_path: Plaintext file to write
+
+        Returns:
+            Header of the container
+
+        Raises:
+            SegmentAuthenticationError: If any segment fails authentication
+        """
+        header = SegmentHeader.read_from(input_path)
+        self._check_size(input_path, header)
+        aead = self._aead(header)
+
+        try:
+            with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+                dst.truncate(header.plaintext_size)
+
+                def decrypt_batch(first: int, stop: int) -> None:
+                    plaintext = self._open_batch(
+                        aead, header, src.fileno(), first, stop
+                    )
+                    os.pwrite(dst.fileno(), plaintext, first * header.segment_size)
+
+                self._run_batches(header, decrypt_batch)
+        except Exception:
+            Path(output_path).unlink(missing_ok=True)
+            raise
+        return header
+
+    def iter_range(
+        self, path: Path, offset: int = 0, length: int | None = None
+    ) -> Iterator[bytes]:
+        """
+        Stream authenticated plaintext of a byte range, segment by segment.
+
+        Each piece is yielded as soon as its segment has been verified, so a
+        response can start before the rest of the range is read.
+
+        Args:
+            path: Container file
+            offset: First plaintext byte
+            length: Number of bytes (to the end of the file when None)
+
+        Yields:
+            Verified plaintext pieces in order
+
+        Raises:
+            SegmentAuthenticationError: If a segment fails authentication
+        """
+        header = SegmentHeader.read_from(path)
+        self._check_size(path, header)
+        first, stop, offset, end = self._span(header, offset, length)
+        aead = self._aead(header)
+        with open(path, "rb") as f:
+            for index in range(first, stop):
+                plaintext = self._open_batch(aead, header, f.fileno(), index, index + 1)
+                base = index * header.segment_size
+                yield plaintext[max(offset - base, 0) : end - base]
+
+    def read_range(self, path: Path, offset: int, length: int) -> bytes:
+        """
+        Read an authenticated plaintext byte range, decrypting in parallel.
+
+        Args:
+            path: Container file
+            offset: First plaintext byte
+            length: Number of bytes (clamped to the end of the file)
+
+        Returns:
+            Plaintext bytes of the range
+
+        Raises:
+            SegmentAuthenticationError: If a segment fails authentication
+        """
+        header = SegmentHeader.read_from(path)
+        self._check_size(path, header)
+        first, stop, offset, end = self._span(header, offset, length)
+        if stop - first <= SEGMENTS_PER_TASK:
+            return b"".join(self.iter_range(path, offset, end - offset))
+
+        aead = self._aead(header)
+        with open(path, "rb") as f:
+            pieces = self._run_batches(
+                header,
+                lambda start, end: self._open_batch(
+                    aead, header, f.fileno(), start, end
+                ),
+                first,
+                stop,
+            )
+        base = first * header.segment_size
+        return b"".join(pieces)[offset - base : end - base]
+
+    # ========================================================================
+    # Helpers
+    # ========================================================================
+
+    def _run_batches(
+        self,
+        header: SegmentHeader,
+        work: Callable[[int, int], R],
+        first: int = 0,
+        stop: int | None = None,
+    ) -> list[R]:
+        """Run work(first, stop) over batches of segments, results in order."""
+        stop = header.segment_count if stop is None else stop
+        batches = [
+            (start, min(start + SEGMENTS_PER_TASK, stop))
+            for start in range(first, stop, SEGMENTS_PER_TASK)
+        ]
+        if self.max_workers == 1 or len(batches) == 1:
+            return [work(*batch) for batch in batches]
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="segment-crypto"
+        ) as pool:
+            return list(pool.map(lambda batch: work(*batch), batches))
+
+    @staticmethod
+    def _open_batch(
+        aead: AESGCM, header: SegmentHeader, fd: int, first: int, stop: int
+    ) -> bytes:
+        """Read and authenticate segments [first, stop) from a container."""
+        aad = header.to_bytes()
+        sealed_size = header.segment_size + TAG_SIZE
+        data = memoryview(
+            os.pread(fd, (stop - first) * sealed_size, header.segment_offset(first))
+        )
+        plaintext = bytearray()
+        for index in range(first, stop):
+            start = (index - first) * sealed_size
+            try:
+                plaintext += aead.decrypt(
+                    header.nonce(index), data[start : start + sealed_size], aad
+                )
+            except InvalidTag as e:
+                raise SegmentAuthenticationError(
+                    f"Segment {index} failed authentication"
+                ) from e
+        return bytes(plaintext)
+
+    @staticmethod
+    def _check_size(path: Path, header: SegmentHeader) -> None:
+        size = Path(path).stat().st_size
+        if size != header.encrypted_size:
+            raise SegmentAuthenticationError(
+                f"Encrypted file size {size} does not match header "
+                f"({header.encrypted_size}); file is truncated or extended"
+            )
+
+    @staticmethod
+    def _span(
+        header: SegmentHeader, offset: int, length: int | None
+    ) -> tuple[int, int, int, int]:
+        """Segments [first, stop) covering a range, and the clamped range."""
+        if offset < 0 or (length is not None and length < 0):
+            raise ValueError("offset and length must not be negative")
+        offset = min(offset, header.plaintext_size)
+        end = header.plaintext_size if length is None else offset + length
+        end = min(end, header.plaintext_size)
+        if end <= offset:
+            return 0, 0, offset, offset
+        first = offset // header.segment_size
+        stop = (end - 1) // header.segment_size + 1
+        return first, stop, offset, end
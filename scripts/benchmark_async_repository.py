@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Async Repository Load Benchmark
+Simulates API traffic on one event loop: "requests" arrive at a fixed rate,
+each a point lookup through a repository, with and without a long analytical
+query running at the same time. Compares calling the synchronous repository
+on the loop (how routes used to work) with the async repository layer.
+Latency is measured from each request's scheduled arrival, so time spent
+waiting for a blocked loop counts against it.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Add project root to path
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.database.connection import DatabaseConnection
+from src.database.executor import DatabaseExecutor
+from src.repositories.async_repository import AsyncBaseRepository
+from src.repositories.base_repository import BaseRepository
+
+# Aggregates every row several times over: seconds of CPU inside SQLite
+ANALYTICAL_QUERY = """
+    WITH RECURSIVE passes(n) AS (
+        SELECT 1 UNION ALL SELECT n + 1 FROM passes WHERE n < 20
+    )
+    SELECT category, COUNT(*) AS samples, AVG(score * n) AS weighted
+    FROM items, passes
+    GROUP BY category
+"""
+
+
+class ItemRepository(BaseRepository[dict[str, Any]]):
+    """Minimal repository over the benchmark table."""
+
+    def get_table_name(self) -> str:
+        return "items"
+
+    def to_model(self, row: dict[str, Any]) -> dict[str, Any]:
+        return row
+
+    def to_database_dict(self, model: dict[str, Any]) -> dict[str, Any]:
+        return dict(model)
+
+
+def populate(db: DatabaseConnection, rows: int) -> None:
+    db.execute(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, category INTEGER, score REAL)"
+    )
+    db.execute_many(
+        "INSERT INTO items (category, score) VALUES (?, ?)",
+        [(i % 20, (i * 7919) % 1000 / 10) for i in range(rows)],
+    )
+
+
+async def run(
+    repo: ItemRepository,
+    executor: DatabaseExecutor,
+    mode: str,
+    analytical: bool,
+    requests: int,
+    rate: float,
+    rows: int,
+) -> dict[str, Any]:
+    """Issue requests at a fixed arrival rate and record their latencies."""
+    async_repo = AsyncBaseRepository(repo, executor)
+    latencies: list[float] = []
+
+    async def request(i: int, arrival: float) -> None:
+        if mode == "sync":
+            repo.find_by_id(i % rows + 1)
+        else:
+            await async_repo.find_by_id(i % rows + 1)
+        latencies.append(time.perf_counter() - arrival)
+
+    async def analytical_query() -> float:
+        await asyncio.sleep(0.05)  # Arrives once traffic is flowing
+        start = time.perf_counter()
+        if mode == "sync":
+            repo.db.fetch_all(ANALYTICAL_QUERY)
+        else:
+            await executor.run(repo.db.fetch_all, ANALYTICAL_QUERY)
+        return time.perf_counter() - start
+
+    background = asyncio.create_task(analytical_query()) if analytical else None
+    start = time.perf_counter()
+    tasks = []
+    for i in range(requests):
+        arrival = start + i / rate
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(request(i, arrival)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    analytical_seconds = await background if background else None
+
+    latencies.sort()
+    result = {
+        "seconds": round(elapsed, 3),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+    }
+    if analytical_seconds is not None:
+        result["analytical_query_seconds"] = round(analytical_seconds, 3)
+    return result
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rate", type=float, default=1000, help="Requests/s")
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "rows": args.rows,
+        "requests": args.requests,
+        "rate": args.rate,
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        db = DatabaseConnection(str(Path(workdir) / "bench.db"))
+        populate(db, args.rows)
+        repo = ItemRepository(db)
+        executor = DatabaseExecutor()
+        for mode in ("sync", "async"):
+            for analytical in (False, True):
+                label = f"{mode} repository" + (
+                    " + analytical query" if analytical else ""
+                )
+                results[label] = asyncio.run(
+                    run(
+                        repo,
+                        executor,
+                        mode,
+                        analytical,
+                        args.requests,
+                        args.rate,
+                        args.rows,
+                    )
+                )
+        executor.shutdown()
+        db.close_all_connections()
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Citation Ingestion Benchmark
+Compares per-row CitationRepository.create() against the transactional
+bulk_upsert() path on a synthetic batch of parsed citations, then re-ingests
+the same batch to measure the UPSERT (update-in-place) path.
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.connection import DatabaseConnection
+from src.database.models import CitationModel
+from src.repositories.citation_repository import CitationRepository
+
+MIGRATION_PATH = (
+    Path(__file__).parent.parent
+    / "src/database/migrations/versions/011_add_citation_natural_keys.py"
+)
+
+
+def load_natural_key_indexes() -> dict[str, str]:
+    """Reuse the index definitions from the natural-key migration."""
+    spec = importlib.util.spec_from_file_location("natural_keys", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.AddCitationNaturalKeysMigration.NATURAL_KEY_INDEXES
+
+
+def create_schema(db: DatabaseConnection) -> None:
+    """Create the citations table with its natural-key index."""
+    db.execute("""
+        CREATE TABLE citations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER NOT NULL,
+            raw_text TEXT NOT NULL,
+            authors TEXT,
+            title TEXT,
+            publication_year INTEGER,
+            journal_or_venue TEXT,
+            doi TEXT,
+            page_range TEXT,
+            citation_type TEXT,
+            confidence_score REAL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+    db.execute(load_natural_key_indexes()["idx_citations_natural_key"])
+
+
+def make_citations(rows: int, documents: int) -> list[CitationModel]:
+    """Citations spread over documents, as produced by the parser."""
+    return [
+        CitationModel(
+            document_id=1 + i % documents,
+            raw_text=f"Author {i}, A. (2020). Paper number {i}. Journal {i % 97}.",
+            authors=f"Author {i}, A.",
+            title=f"Paper number {i}",
+            publication_year=1990 + i % 35,
+            journal_or_venue=f"Journal {i % 97}",
+            citation_type="journal",
+            confidence_score=0.8,
+        )
+        for i in range(rows)
+    ]
+
+
+def timed(label: str, fn: Any, rows: int) -> dict[str, float]:
+    """Run fn once and report wall time and throughput."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<18} {elapsed:>8.2f} s  {rows / elapsed:>10,.0f} rows/s")
+    return {"seconds": round(elapsed, 3), "rows_per_second": round(rows / elapsed)}
+
+
+def run_benchmark(rows: int, per_row_rows: int, documents: int) -> dict[str, Any]:
+    """Benchmark per-row inserts, bulk inserts and bulk re-ingestion."""
+    results: dict[str, Any] = {"rows": rows, "per_row_rows": per_row_rows}
+    with tempfile.TemporaryDirectory() as workdir:
+        # The pool's leak detector would reclaim the long-running writer
+        per_row_db = DatabaseConnection(
+            str(Path(workdir) / "per_row.db"), enable_monitoring=False
+        )
+        bulk_db = DatabaseConnection(
+            str(Path(workdir) / "bulk.db"), enable_monitoring=False
+        )
+        for db in (per_row_db, bulk_db):
+            create_schema(db)
+
+        per_row_repo = CitationRepository(per_row_db)
+        bulk_repo = CitationRepository(bulk_db)
+
+        print(f"\nIngesting citations across {documents:,} documents")
+        sample = make_citations(per_row_rows, documents)
+        results["per_row_create"] = timed(
+            f"create() x{per_row_rows:,}",
+            lambda: [per_row_repo.create(c) for c in sample],
+            per_row_rows,
+        )
+
+        batch = make_citations(rows, documents)
+        results["bulk_insert"] = timed(
+            f"bulk x{rows:,}", lambda: bulk_repo.bulk_upsert(batch), rows
+        )
+        results["bulk_reingest"] = timed(
+            f"re-ingest x{rows:,}",
+            lambda: bulk_repo.bulk_upsert(make_citations(rows, documents)),
+            rows,
+        )
+
+        count = bulk_db.fetch_one("SELECT COUNT(*) AS n FROM citations")["n"]
+        assert count == rows, f"expected {rows} rows after re-ingest, found {count}"
+
+        results["speedup"] = round(
+            results["bulk_insert"]["rows_per_second"]
+            / results["per_row_create"]["rows_per_second"],
+            1,
+        )
+        for db in (per_row_db, bulk_db):
+            db.close_all_connections()
+    return results
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument(
+        "--per-row-rows",
+        type=int,
+        default=10_000,
+        help="Rows for the per-row baseline (it is slow; throughput is compared)",
+    )
+    parser.add_argument("--documents", type=int, default=1_000)
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, args.per_row_rows, args.documents)
+    print(f"\nBulk ingestion speedup: {results['speedup']}x")
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
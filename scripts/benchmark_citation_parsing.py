@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Citation Parsing Benchmark
+Parses a synthetic bibliography corpus with CitationParsingService, serially
+and across worker processes. An alternative implementation of the service
+module (for example a copy from an earlier revision) can be passed with
+--baseline to compare throughput and check that both produce the same output.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.citation_parsing_service import CitationParsingService
+
+SURNAMES = [
+    "Smith",
+    "Chen",
+    "Garcia",
+    "Kumar",
+    "Novak",
+    "Okafor",
+    "Silva",
+    "Johnson",
+    "Taylor",
+    "Anderson",
+    "Lee",
+    "Martin",
+    "Clark",
+    "Walker",
+]
+WORDS = [
+    "deep",
+    "learning",
+    "graph",
+    "neural",
+    "networks",
+    "attention",
+    "transformer",
+    "robust",
+    "efficient",
+    "scalable",
+    "analysis",
+    "of",
+    "data",
+    "citation",
+    "retrieval",
+    "language",
+    "models",
+    "survey",
+    "benchmark",
+    "optimization",
+    "sparse",
+    "representation",
+    "inference",
+    "reasoning",
+]
+VENUES = [
+    "Journal of Machine Learning Research",
+    "Proceedings of the Conference on Neural Information Processing",
+    "Nature",
+    "IEEE Transactions on Pattern Analysis",
+    "Cambridge University Press",
+    "PhD thesis, MIT",
+]
+
+
+def make_reference(rng: random.Random) -> str:
+    """One APA-style reference."""
+    authors = [
+        f"{rng.choice(SURNAMES)}, {chr(65 + rng.randrange(26))}."
+        for _ in range(rng.randint(1, 4))
+    ]
+    if len(authors) == 1:
+        author_text = authors[0]
+    elif rng.random() < 0.3:
+        author_text = f"{authors[0]} et al."
+    else:
+        joiner = " & " if rng.random() < 0.5 else ", and "
+        author_text = ", ".join(authors[:-1]) + joiner + authors[-1]
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 10)))
+    reference = (
+        f"{author_text} ({rng.randint(1975, 2024)}). {title.capitalize()}. "
+        f"{rng.choice(VENUES)}, {rng.randint(1, 40)}({rng.randint(1, 12)}), "
+        f"{rng.randint(1, 300)}-{rng.randint(301, 600)}."
+    )
+    if rng.random() < 0.3:
+        reference += (
+            f" https://doi.org/10.{rng.randint(1000, 9999)}/{rng.randint(10000, 99999)}"
+        )
+    return reference
+
+
+def make_document(seed: int) -> str:
+    """Body text with in-text citations followed by a wrapped reference list."""
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(rng.randint(20, 40)):
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20)))
+        if rng.random() < 0.4:
+            sentence += f" as shown by {rng.choice(SURNAMES)} et al. ({rng.randint(1990, 2024)})"
+        sentences.append(sentence.capitalize() + ".")
+
+    references = [make_reference(rng) for _ in range(rng.randint(30, 60))]
+    # Near-duplicate entries, as produced by PDF extraction
+    references += [ref.replace(". ", ".  ", 1) for ref in rng.sample(references, 5)]
+    lines = []
+    for reference in references:
+        if len(reference) > 110 and rng.random() < 0.5:
+            wrap = reference.rfind(" ", 0, 90)
+            lines += [reference[:wrap], reference[wrap + 1 :]]
+        else:
+            lines.append(reference)
+
+    body = "\n".join(
+        " ".join(sentences[i : i + 5]) for i in range(0, len(sentences), 5)
+    )
+    return f"Abstract: synthetic\n{body}\nTable 1 results\nReferences:\n" + "\n".join(
+        lines
+    )
+
+
+def load_baseline(path: Path) -> Any:
+    """Load CitationParsingService from another copy of the module."""
+    spec = importlib.util.spec_from_file_location("baseline_citation_parsing", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.CitationParsingService()
+
+
+def run_benchmark(
+    documents: int, workers: int, baseline: Path | None
+) -> dict[str, Any]:
+    """Time serial, parallel and optional baseline parsing of the corpus."""
+    corpus = [make_document(seed) for seed in range(documents)]
+    service = CitationParsingService()
+    results: dict[str, Any] = {
+        "documents": documents,
+        "corpus_mb": round(sum(map(len, corpus)) / 1e6, 2),
+        "workers": workers,
+    }
+
+    start = time.perf_counter()
+    serial = service.parse_documents(corpus, use_third_party=False, max_workers=1)
+    results["serial_seconds"] = round(time.perf_counter() - start, 3)
+    results["citations"] = sum(map(len, serial))
+
+    if workers > 1:
+        start = time.perf_counter()
+        parallel = service.parse_documents(
+            corpus, use_third_party=False, max_workers=workers
+        )
+        results["parallel_seconds"] = round(time.perf_counter() - start, 3)
+        results["parallel_matches_serial"] = parallel == serial
+
+    if baseline:
+        baseline_service = load_baseline(baseline)
+        start = time.perf_counter()
+        expected = [
+            baseline_service.parse_citations_from_text(text, use_third_party=False)
+            for text in corpus
+        ]
+        results["baseline_seconds"] = round(time.perf_counter() - start, 3)
+        results["baseline_matches"] = expected == serial
+        results["serial_speedup"] = round(
+            results["baseline_seconds"] / results["serial_seconds"], 1
+        )
+        if "parallel_seconds" in results:
+            results["parallel_speedup"] = round(
+                results["baseline_seconds"] / results["parallel_seconds"], 1
+            )
+
+    return results
+
+
+def print_report(results: dict[str, Any]) -> None:
+    """Print a summary table."""
+    print(
+        f"\n{results['documents']} documents ({results['corpus_mb']} MB), "
+        f"{results['citations']} citations"
+    )
+    for key, value in results.items():
+        if key not in ("documents", "corpus_mb", "citations"):
+            print(f"  {key:<24} {value}")
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--baseline", type=Path, help="Path to another citation_parsing_service.py"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.documents, args.workers, args.baseline)
+    print_report(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
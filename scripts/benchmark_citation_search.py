@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Citation Search Pagination Benchmark
+Measures p50/p99 latency of keyset-paginated citation search for the first
+and a deep page on a large synthetic citations table, alongside the
+equivalent LIMIT/OFFSET query for comparison.
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.connection import DatabaseConnection
+from src.repositories.citation_repository import CitationRepository
+
+MIGRATION_PATH = (
+    Path(__file__).parent.parent
+    / "src/database/migrations/versions/010_add_citation_keyset_indexes.py"
+)
+
+
+def load_keyset_indexes() -> dict[str, str]:
+    """Reuse the index definitions from the keyset migration."""
+    spec = importlib.util.spec_from_file_location("keyset_migration", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.AddCitationKeysetIndexesMigration.KEYSET_INDEXES
+
+
+def create_fixture(db: DatabaseConnection, rows: int) -> None:
+    """Create and fill a citations table with realistic value spreads."""
+    db.execute("""
+        CREATE TABLE citations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER NOT NULL,
+            raw_text TEXT NOT NULL,
+            authors TEXT,
+            title TEXT,
+            publication_year INTEGER,
+            journal_or_venue TEXT,
+            doi TEXT,
+            page_range TEXT,
+            citation_type TEXT,
+            confidence_score REAL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+    rng = random.Random(42)
+    surnames = ["Smith", "Chen", "Garcia", "Kumar", "Novak", "Okafor", "Silva"]
+    types = ["journal", "conference", "book", "website"]
+    batch = []
+    for i in range(rows):
+        batch.append(
+            (
+                rng.randint(1, 5000),
+                f"Reference {i}",
+                f"{rng.choice(surnames)}, {chr(65 + i % 26)}.",
+                f"Title {i}",
+                None if rng.random() < 0.05 else rng.randint(1970, 2024),
+                rng.choice(types),
+                round(rng.random(), 2),
+            )
+        )
+        if len(batch) == 50_000:
+            _insert(db, batch)
+            batch = []
+    if batch:
+        _insert(db, batch)
+
+    for index_sql in load_keyset_indexes().values():
+        db.execute(index_sql)
+    db.execute("ANALYZE citations")
+
+
+def _insert(db: DatabaseConnection, batch: list[tuple]) -> None:
+    db.execute_many(
+        "INSERT INTO citations (document_id, raw_text, authors, title, "
+        "publication_year, citation_type, confidence_score) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        batch,
+    )
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """p50/p99 in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1] * 1000, 3),
+    }
+
+
+def time_call(fn: Any, repeats: int) -> dict[str, float]:
+    """Time repeated calls of fn."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def run_benchmark(
+    rows: int, page_size: int, deep_page: int, repeats: int
+) -> dict[str, Any]:
+    """Benchmark first vs deep page for several filter combinations."""
+    results: dict[str, Any] = {"rows": rows, "page_size": page_size}
+    with tempfile.TemporaryDirectory() as workdir:
+        db = DatabaseConnection(str(Path(workdir) / "citations.db"))
+        start = time.perf_counter()
+        create_fixture(db, rows)
+        results["fixture_seconds"] = round(time.perf_counter() - start, 1)
+        repo = CitationRepository(db)
+
+        scenarios = {
+            "unfiltered": {},
+            "type": {"citation_type": "journal"},
+            "year_range": {"year_from": 1990, "year_to": 2010},
+            "author_confidence": {"author": "Chen", "min_confidence": 0.5},
+        }
+        for name, filters in scenarios.items():
+            # Walk to the deep page to obtain its cursor
+            after = None
+            for _ in range(deep_page - 1):
+                _, after = repo.search_page(**filters, after=after, limit=page_size)
+                if after is None:
+                    break
+            deep_after = after
+
+            offset_sql, offset_params = offset_query(filters, page_size, deep_page)
+            results[name] = {
+                "keyset_page_1": time_call(
+                    lambda f=filters: repo.search_page(**f, limit=page_size),
+                    repeats,
+                ),
+                f"keyset_page_{deep_page}": time_call(
+                    lambda f=filters, a=deep_after: repo.search_page(
+                        **f, after=a, limit=page_size
+                    ),
+                    repeats,
+                ),
+                f"offset_page_{deep_page}": time_call(
+                    lambda: db.fetch_all(offset_sql, offset_params),
+                    max(5, repeats // 10),
+                ),
+            }
+        db.close_all_connections()
+    return results
+
+
+def offset_query(
+    filters: dict[str, Any], page_size: int, page: int
+) -> tuple[str, tuple]:
+    """Equivalent LIMIT/OFFSET query for comparison."""
+    conditions, params = [], []
+    if "citation_type" in filters:
+        conditions.append("citation_type = ?")
+        params.append(filters["citation_type"])
+    if "year_from" in filters:
+        conditions.append("COALESCE(publication_year, 0) BETWEEN ? AND ?")
+        params.extend([filters["year_from"], filters["year_to"]])
+    if "author" in filters:
+        conditions.append("authors LIKE ? AND confidence_score >= ?")
+        params.extend([f"%{filters['author']}%", filters["min_confidence"]])
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    sql = (
+        f"SELECT * FROM citations {where} "  # noqa: S608 - benchmark SQL
+        "ORDER BY COALESCE(publication_year, 0) DESC, id DESC LIMIT ? OFFSET ?"
+    )
+    return sql, tuple(params + [page_size, (page - 1) * page_size])
+
+
+def print_report(results: dict[str, Any]) -> None:
+    """Print a latency table."""
+    print(
+        f"\n{results['rows']:,} citations, {results['page_size']} per page "
+        f"(fixture built in {results['fixture_seconds']}s)"
+    )
+    for name, timings in results.items():
+        if not isinstance(timings, dict):
+            continue
+        print(f"\n{name}")
+        for label, stats in timings.items():
+            print(
+                f"  {label:<20} p50 {stats['p50_ms']:>9.3f} ms   p99 {stats['p99_ms']:>9.3f} ms"
+            )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--deep-page", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, args.page_size, args.deep_page, args.repeats)
+    print_report(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
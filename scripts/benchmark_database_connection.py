@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Database Connection Read/Write Benchmark
+Runs a mixed workload (95% point reads, 5% single-row writes by default) from
+many threads against one DatabaseConnection on a WAL file database and reports
+throughput and latency percentiles. Pass --baseline-ref to run the same
+workload against DatabaseConnection from another git revision.
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Add project root to path
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.database import connection
+
+MODULE_PATH = "src/database/connection.py"
+
+
+def load_revision(ref: str, workdir: str) -> Any:
+    """Import connection.py as it was at a git revision."""
+    source = subprocess.run(  # noqa: S603
+        ["git", "show", f"{ref}:{MODULE_PATH}"],  # noqa: S607
+        cwd=PROJECT_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    path = Path(workdir) / "baseline_connection.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location("baseline_connection", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run(
+    module: Any,
+    db_path: Path,
+    workers: int,
+    operations: int,
+    write_ratio: float,
+    rows: int,
+) -> dict[str, Any]:
+    """Run operations per worker and collect per-operation latencies."""
+    db = module.DatabaseConnection(str(db_path), max_connections=workers)
+    db.execute("CREATE TABLE bench (id INTEGER PRIMARY KEY, title TEXT, hits INTEGER)")
+    db.execute_many(
+        "INSERT INTO bench (title, hits) VALUES (?, 0)",
+        [(f"document {i}",) for i in range(rows)],
+    )
+
+    read_latencies: list[float] = []
+    write_latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    barrier = threading.Barrier(workers + 1)
+
+    def worker(seed: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed)
+        reads: list[float] = []
+        writes: list[float] = []
+        failed = 0
+        barrier.wait()
+        for _ in range(operations):
+            row_id = rng.randint(1, rows)
+            is_write = rng.random() < write_ratio
+            start = time.perf_counter()
+            try:
+                if is_write:
+                    db.execute(
+                        "UPDATE bench SET hits = hits + 1 WHERE id = ?", (row_id,)
+                    )
+                else:
+                    db.fetch_one("SELECT * FROM bench WHERE id = ?", (row_id,))
+            except Exception:
+                failed += 1
+                continue
+            (writes if is_write else reads).append(time.perf_counter() - start)
+        db.close_connection()
+        with lock:
+            read_latencies.extend(reads)
+            write_latencies.extend(writes)
+            errors += failed
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    db.close_all_connections()
+
+    def percentiles(samples: list[float]) -> dict[str, float]:
+        if not samples:
+            return {}
+        samples.sort()
+        return {
+            "p50_ms": round(samples[len(samples) // 2] * 1000, 3),
+            "p95_ms": round(samples[int(len(samples) * 0.95) - 1] * 1000, 3),
+            "p99_ms": round(samples[int(len(samples) * 0.99) - 1] * 1000, 3),
+        }
+
+    completed = len(read_latencies) + len(write_latencies)
+    return {
+        "seconds": round(elapsed, 3),
+        "operations_per_second": round(completed / elapsed),
+        "errors": errors,
+        "reads": percentiles(read_latencies),
+        "writes": percentiles(write_latencies),
+    }
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--operations", type=int, default=500, help="Per worker")
+    parser.add_argument("--write-ratio", type=float, default=0.05)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--baseline-ref", help="Git revision to compare against")
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "workers": args.workers,
+        "operations_per_worker": args.operations,
+        "write_ratio": args.write_ratio,
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        workload = (args.workers, args.operations, args.write_ratio, args.rows)
+        if args.baseline_ref:
+            baseline = load_revision(args.baseline_ref, workdir)
+            results[f"baseline ({args.baseline_ref})"] = run(
+                baseline, Path(workdir) / "baseline.db", *workload
+            )
+        results["current"] = run(connection, Path(workdir) / "current.db", *workload)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
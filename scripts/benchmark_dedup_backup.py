@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Deduplicated Backup Benchmark
+Compares whole-directory copies with the chunk-deduplicating backup store for
+a full run followed by incremental runs after small index/metadata changes.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.dedup_backup_store import ZSTD_AVAILABLE, DedupBackupRepository
+
+
+def create_fixture(root: Path, index_count: int, index_size_mb: int) -> None:
+    """Create vector-index-like directories plus a PDF-sized binary per index."""
+    rng = random.Random(42)
+    for i in range(index_count):
+        index_dir = root / f"doc_{i}"
+        index_dir.mkdir(parents=True)
+        # Embeddings are effectively incompressible; docstores compress well
+        (index_dir / "default__vector_store.json").write_bytes(
+            os.urandom(index_size_mb * 1024 * 1024)
+        )
+        words = [f"token{rng.randint(0, 5000)}" for _ in range(index_size_mb * 50_000)]
+        (index_dir / "docstore.json").write_text(json.dumps({"text": words}))
+        (index_dir / "index_metadata.json").write_text(
+            json.dumps({"document_id": i, "chunk_count": 100})
+        )
+
+
+def mutate_fixture(root: Path, run: int) -> None:
+    """Apply a small rebuild: rewrite metadata and splice bytes into one store."""
+    for index_dir in sorted(root.iterdir()):
+        metadata_path = index_dir / "index_metadata.json"
+        metadata = json.loads(metadata_path.read_text())
+        metadata["rebuild"] = run
+        metadata_path.write_text(json.dumps(metadata))
+
+    target = sorted(root.iterdir())[run % len(list(root.iterdir()))]
+    store = target / "default__vector_store.json"
+    data = store.read_bytes()
+    middle = len(data) // 2
+    store.write_bytes(data[:middle] + os.urandom(4096) + data[middle:])
+
+
+def directory_size(path: Path) -> int:
+    """Total size of all files below a path."""
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def run_benchmark(index_count: int, index_size_mb: int, runs: int) -> dict[str, Any]:
+    """Run full + incremental backups with both strategies."""
+    results: dict[str, Any] = {"copy": [], "dedup": []}
+    with tempfile.TemporaryDirectory() as workdir:
+        work = Path(workdir)
+        source = work / "indexes"
+        create_fixture(source, index_count, index_size_mb)
+        repo = DedupBackupRepository(work / "repo")
+        copies = work / "copies"
+
+        for run in range(runs):
+            if run:
+                mutate_fixture(source, run)
+            source_bytes = directory_size(source)
+
+            start = time.perf_counter()
+            shutil.copytree(source, copies / f"run_{run}")
+            copy_seconds = time.perf_counter() - start
+            results["copy"].append(
+                {
+                    "run": run,
+                    "seconds": round(copy_seconds, 3),
+                    "throughput_mb_s": round(source_bytes / 2**20 / copy_seconds, 1),
+                    "bytes_stored": directory_size(copies / f"run_{run}"),
+                }
+            )
+
+            start = time.perf_counter()
+            snapshot = repo.backup(source, snapshot_id=f"run_{run}")
+            dedup_seconds = time.perf_counter() - start
+            results["dedup"].append(
+                {
+                    "run": run,
+                    "seconds": round(dedup_seconds, 3),
+                    "throughput_mb_s": round(source_bytes / 2**20 / dedup_seconds, 1),
+                    "bytes_stored": snapshot.stats["bytes_stored"],
+                    "chunks_new": snapshot.stats["chunks_new"],
+                    "chunks_total": snapshot.stats["chunks_total"],
+                }
+            )
+
+        start = time.perf_counter()
+        repo.restore(f"run_{runs - 1}", work / "restored")
+        results["restore_seconds"] = round(time.perf_counter() - start, 3)
+        results["repository"] = repo.get_storage_stats()
+        results["copy_total_bytes"] = directory_size(copies)
+
+    results["compression"] = "zstd" if ZSTD_AVAILABLE else "zlib"
+    return results
+
+
+def print_report(results: dict[str, Any]) -> None:
+    """Print a side-by-side summary."""
+    print(f"\nCompression codec: {results['compression']}")
+    print(f"{'run':>4} {'copy s':>8} {'copy MB':>9} {'dedup s':>8} {'dedup MB':>9}")
+    for copy_run, dedup_run in zip(results["copy"], results["dedup"], strict=True):
+        print(
+            f"{copy_run['run']:>4} {copy_run['seconds']:>8.2f} "
+            f"{copy_run['bytes_stored'] / 2**20:>9.1f} "
+            f"{dedup_run['seconds']:>8.2f} {dedup_run['bytes_stored'] / 2**20:>9.2f}"
+        )
+    print(
+        f"\nTotal stored: copy {results['copy_total_bytes'] / 2**20:.1f} MB, "
+        f"dedup {results['repository']['stored_bytes'] / 2**20:.1f} MB; "
+        f"restore {results['restore_seconds']:.2f}s"
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--indexes", type=int, default=10)
+    parser.add_argument("--index-size-mb", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=4)
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.indexes, args.index_size_mb, args.runs)
+    print_report(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection Benchmark
+Measures the MinHash/LSH document similarity index on a large synthetic
+library: signing, reloading persisted signatures, library-wide title groups
+and import-time lookups, against the pairwise title comparison. Precision
+and recall are measured against exhaustive comparisons: titles on a sample
+of the library, and content similarity on a smaller corpus of extracted
+text.
+"""
+
+import argparse
+import importlib.util
+import itertools
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.connection import DatabaseConnection
+from src.repositories.document_similarity_index import (
+    DocumentSimilarityIndex,
+    text_shingles,
+    title_similarity,
+)
+
+MIGRATIONS = Path(__file__).parent.parent / "src/database/migrations/versions"
+VOCABULARY = [f"term{i}" for i in range(5000)]
+
+
+def make_titles(rows: int, duplicate_rate: float, seed: int = 42) -> list[str]:
+    """Random titles where a share are one-word edits of earlier titles."""
+    rng = random.Random(seed)
+    titles: list[str] = []
+    for _ in range(rows):
+        if titles and rng.random() < duplicate_rate:
+            words = rng.choice(titles).split()
+            if len(words) > 8 and rng.random() < 0.5:
+                words.pop(rng.randrange(len(words)))
+            else:
+                words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+            titles.append(" ".join(words))
+        else:
+            titles.append(" ".join(rng.sample(VOCABULARY, rng.randint(8, 14))))
+    return titles
+
+
+def create_fixture(db: DatabaseConnection, titles: list[str]) -> None:
+    """Create a documents table and apply the signature migrations."""
+    db.execute("""
+        CREATE TABLE documents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            file_path TEXT,
+            file_hash TEXT UNIQUE NOT NULL,
+            content_hash TEXT,
+            file_size INTEGER NOT NULL,
+            file_type TEXT,
+            page_count INTEGER,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            last_accessed DATETIME,
+            metadata TEXT DEFAULT '{}',
+            tags TEXT
+        )
+        """)
+    db.execute_many(
+        "INSERT INTO documents (title, file_hash, file_size) VALUES (?, ?, ?)",
+        [(title, f"hash-{i}", i) for i, title in enumerate(titles)],
+    )
+    for filename, class_name in (
+        ("012_add_document_keyset_indexes.py", "AddDocumentKeysetIndexesMigration"),
+        ("013_add_document_signatures.py", "AddDocumentSignaturesMigration"),
+    ):
+        spec = importlib.util.spec_from_file_location(class_name, MIGRATIONS / filename)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        getattr(module, class_name)(db).up()
+
+
+def exact_pairs(items: dict[int, Any], similarity: Any, threshold: float) -> set:
+    """All ID pairs at or above the threshold, by exhaustive comparison."""
+    return {
+        (first, second)
+        for (first, a), (second, b) in itertools.combinations(sorted(items.items()), 2)
+        if similarity(a, b) >= threshold
+    }
+
+
+def precision_recall(found: set, expected: set) -> dict[str, float]:
+    """Precision and recall of found pairs against the exact pair set."""
+    true_positives = len(found & expected)
+    return {
+        "found": len(found),
+        "expected": len(expected),
+        "precision": round(true_positives / len(found), 4) if found else 1.0,
+        "recall": round(true_positives / len(expected), 4) if expected else 1.0,
+    }
+
+
+def title_benchmark(
+    rows: int, sample: int, threshold: float, lookups: int
+) -> dict[str, Any]:
+    """Title signing, scanning and lookup on a rows-sized library."""
+    titles = make_titles(rows, duplicate_rate=0.1)
+    results: dict[str, Any] = {"rows": rows, "threshold": threshold}
+    with tempfile.TemporaryDirectory() as workdir:
+        db = DatabaseConnection(
+            str(Path(workdir) / "library.db"), enable_monitoring=False
+        )
+        create_fixture(db, titles)
+
+        start = time.perf_counter()
+        index = DocumentSimilarityIndex()
+        index.ensure_loaded(db)
+        results["sign_and_index_seconds"] = round(time.perf_counter() - start, 2)
+
+        start = time.perf_counter()
+        DocumentSimilarityIndex().ensure_loaded(db)
+        results["reload_persisted_seconds"] = round(time.perf_counter() - start, 2)
+
+        start = time.perf_counter()
+        groups = index.similar_title_groups(db, threshold)
+        results["library_scan_seconds"] = round(time.perf_counter() - start, 2)
+        results["groups"] = len(groups)
+
+        rng = random.Random(7)
+        samples = []
+        for title in rng.sample(titles, lookups):
+            start = time.perf_counter()
+            index.find_similar(db, title=title, threshold=threshold)
+            samples.append(time.perf_counter() - start)
+        ordered = sorted(samples)
+        results["import_lookup"] = {
+            "p50_ms": round(statistics.median(ordered) * 1000, 3),
+            "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1] * 1000, 3),
+        }
+
+        # Exhaustive comparison on a sample versus lookups in the full index
+        subset = {i: titles[i - 1] for i in range(1, sample + 1)}
+        start = time.perf_counter()
+        truth = exact_pairs(subset, title_similarity, threshold)
+        elapsed = time.perf_counter() - start
+        results["pairwise"] = {
+            "sample_rows": sample,
+            "sample_seconds": round(elapsed, 2),
+            "extrapolated_seconds": round(elapsed * (rows / sample) ** 2),
+        }
+        found = set()
+        for document_id, title in subset.items():
+            for other, _ in index.find_similar(db, title=title, threshold=threshold):
+                if document_id < other <= sample:
+                    found.add((document_id, other))
+        results["sample_pairs"] = precision_recall(found, truth)
+        db.close_all_connections()
+    return results
+
+
+def content_benchmark(documents: int, words: int, threshold: float) -> dict[str, Any]:
+    """Precision/recall of content signatures against exact shingle Jaccard."""
+    rng = random.Random(11)
+    texts: list[str] = []
+    for _ in range(documents):
+        if texts and rng.random() < 0.2:
+            tokens = rng.choice(texts).split()
+            for _ in range(rng.randint(1, words // 20)):
+                tokens[rng.randrange(len(tokens))] = rng.choice(VOCABULARY)
+            texts.append(" ".join(tokens))
+        else:
+            texts.append(" ".join(rng.choices(VOCABULARY, k=words)))
+
+    shingles = {i + 1: frozenset(text_shingles(t)) for i, t in enumerate(texts)}
+    truth = exact_pairs(
+        shingles, lambda a, b: len(a & b) / len(a | b) if a | b else 0.0, threshold
+    )
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = DatabaseConnection(
+            str(Path(workdir) / "content.db"), enable_monitoring=False
+        )
+        create_fixture(db, [f"document {i}" for i in range(documents)])
+        index = DocumentSimilarityIndex()
+        start = time.perf_counter()
+        for document_id, text in enumerate(texts, start=1):
+            index.index_document(db, document_id, f"document {document_id}", text)
+        signing = time.perf_counter() - start
+
+        found = set()
+        for document_id in shingles:
+            for other, _ in index.find_similar(
+                db, content_of=document_id, threshold=threshold
+            ):
+                if other > document_id:
+                    found.add((document_id, other))
+        db.close_all_connections()
+
+    return {
+        "documents": documents,
+        "words_per_document": words,
+        "threshold": threshold,
+        "signing_ms_per_document": round(signing / documents * 1000, 3),
+        **precision_recall(found, truth),
+    }
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--sample", type=int, default=5_000)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--content-documents", type=int, default=1_000)
+    parser.add_argument("--content-words", type=int, default=400)
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results = {
+        "titles": title_benchmark(args.rows, args.sample, args.threshold, args.lookups),
+        "content": content_benchmark(
+            args.content_documents, args.content_words, args.threshold
+        ),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
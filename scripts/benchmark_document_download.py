@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Document Download Benchmark
+Serves a large generated PDF from a local uvicorn server and measures
+concurrent byte-range reads (as pdf.js issues them) and full downloads,
+comparing Starlette's FileResponse with the range-aware download route.
+Client and server share the machine, so server CPU time per request is
+reported alongside throughput.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+import psutil
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import FileResponse
+
+from backend.api.routes import documents
+from src.database.models import DocumentModel
+
+
+def build_app(file_path: Path) -> FastAPI:
+    """App exposing the plain FileResponse and the document download route."""
+    document = DocumentModel(
+        id=1,
+        title="Large",
+        file_path=str(file_path),
+        file_hash="benchmark-hash",
+        file_size=file_path.stat().st_size,
+        file_type=".pdf",
+    )
+    app = FastAPI()
+    app.include_router(documents.router, prefix="/api/documents")
+    app.dependency_overrides[documents.get_document_repository] = lambda: (
+        type("Repo", (), {"get_by_id": staticmethod(lambda _: document)})
+    )
+    app.dependency_overrides[documents.get_documents_dir] = lambda: file_path.parent
+
+    @app.get("/baseline")
+    async def baseline() -> FileResponse:
+        return FileResponse(file_path, media_type="application/pdf")
+
+    return app
+
+
+def serve(file_path: Path, port: int) -> None:
+    """Server process entry point."""
+    uvicorn.run(build_app(file_path), host="127.0.0.1", port=port, log_level="warning")
+
+
+def start_server(file_path: Path) -> tuple[multiprocessing.Process, int]:
+    """Run uvicorn on a free port in its own process, so clients and server
+    do not share an interpreter."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    process = multiprocessing.Process(target=serve, args=(file_path, port))
+    process.start()
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    return process, port
+
+
+async def range_reads(
+    url: str, file_size: int, clients: int, requests: int, range_size: int
+) -> dict[str, Any]:
+    """Concurrent random range reads; returns throughput and latency."""
+    rng = random.Random(5)
+    offsets = [rng.randrange(0, file_size - range_size) for _ in range(requests)]
+    latencies: list[float] = []
+    received = 0
+    limits = httpx.Limits(max_connections=clients)
+
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for offset in offsets:
+            queue.put_nowait(offset)
+
+        async def worker() -> None:
+            nonlocal received
+            while not queue.empty():
+                offset = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(
+                    url, headers={"Range": f"bytes={offset}-{offset + range_size - 1}"}
+                )
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 206, response.status_code
+                received += len(response.content)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "mb_per_second": round(received / elapsed / 1e6, 1),
+        "requests_per_second": round(requests / elapsed),
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1] * 1000, 2),
+    }
+
+
+async def full_downloads(url: str, clients: int) -> dict[str, Any]:
+    """Concurrent whole-file downloads."""
+    async with httpx.AsyncClient(timeout=120) as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(client.get(url) for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+    received = sum(len(response.content) for response in responses)
+    return {"mb_per_second": round(received / elapsed / 1e6, 1)}
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--range-kb", type=int, default=256)
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "file_mb": args.size_mb,
+        "clients": args.clients,
+        "range_kb": args.range_kb,
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        file_path = Path(workdir) / "large.pdf"
+        with open(file_path, "wb") as handle:
+            handle.write(b"%PDF-1.7\n")
+            for _ in range(args.size_mb):
+                handle.write(os.urandom(1024 * 1024))
+        file_size = file_path.stat().st_size
+
+        server, port = start_server(file_path)
+        server_process = psutil.Process(server.pid)
+
+        def server_cpu() -> float:
+            times = server_process.cpu_times()
+            return times.user + times.system
+
+        base = f"http://127.0.0.1:{port}"
+        for name, path in (
+            ("file_response", "/baseline"),
+            ("ranged_route", "/api/documents/1/download"),
+        ):
+            url = base + path
+            cpu = server_cpu()
+            reads = asyncio.run(
+                range_reads(
+                    url, file_size, args.clients, args.requests, args.range_kb * 1024
+                )
+            )
+            reads["server_cpu_ms_per_request"] = round(
+                (server_cpu() - cpu) / args.requests * 1000, 3
+            )
+            cpu = server_cpu()
+            full = asyncio.run(full_downloads(url, 4))
+            full["server_cpu_ms_per_mb"] = round(
+                (server_cpu() - cpu) / (4 * file_size / 1e6) * 1000, 3
+            )
+            results[name] = {"range_reads": reads, "full_downloads": full}
+        server.terminate()
+        server.join()
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Document Listing Benchmark
+Fills a documents table with rows carrying realistic metadata and lists all
+of them through DocumentRepository: find_all() in one call, and a keyset walk
+with get_page() as the list route does, with and without the summary column
+projection. Reports CPU time and peak traced allocations for each. Pass
+--baseline-ref to run the same listing against src/ from another git revision.
+"""
+
+import argparse
+import inspect
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+DOCUMENTS_TABLE = """
+    CREATE TABLE documents (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        file_path TEXT,
+        file_hash TEXT UNIQUE NOT NULL,
+        content_hash TEXT,
+        file_size INTEGER NOT NULL,
+        file_type TEXT,
+        page_count INTEGER,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        last_accessed DATETIME,
+        metadata TEXT DEFAULT '{}',
+        tags TEXT DEFAULT ''
+    )
+"""
+
+
+def populate(db: Any, rows: int) -> None:
+    """Insert documents with a few hundred bytes of metadata each."""
+    db.execute(DOCUMENTS_TABLE)
+    # Same expression index the keyset migration creates
+    db.execute(
+        "CREATE INDEX idx_documents_keyset_created "
+        "ON documents(COALESCE(created_at, ''), id)"
+    )
+    db.execute_many(
+        """
+        INSERT INTO documents (title, file_path, file_hash, content_hash,
+            file_size, file_type, page_count, created_at, updated_at,
+            metadata, tags)
+        VALUES (?, ?, ?, ?, ?, '.pdf', ?, ?, ?, ?, 'paper')
+        """,
+        [
+            (
+                f"Document {i}",
+                f"/library/document_{i}.pdf",
+                f"{i:064x}",
+                f"{i * 31:064x}",
+                100000 + i,
+                10 + i % 300,
+                f"2024-01-01T00:00:{i % 60:02d}.{i:06d}",
+                f"2024-01-01T00:00:{i % 60:02d}.{i:06d}",
+                json.dumps(
+                    {
+                        "file_extension": ".pdf",
+                        "original_filename": f"document_{i}.pdf",
+                        "authors": [f"Author {i % 97}", f"Author {i % 89}"],
+                        "keywords": ["retrieval", "language models", "pdf"],
+                        "abstract": "Lorem ipsum dolor sit amet " * 4,
+                    }
+                ),
+            )
+            for i in range(rows)
+        ],
+    )
+
+
+def measure(func: Any) -> dict[str, Any]:
+    """CPU time, wall time and traced allocations of one call."""
+    tracemalloc.start()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    count = func()
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "documents": count,
+        "cpu_seconds": round(cpu, 3),
+        "wall_seconds": round(wall, 3),
+        "peak_mb": round(peak / 2**20, 1),
+    }
+
+
+def run(rows: int, page_size: int) -> dict[str, Any]:
+    """List every document each way against a fresh database."""
+    from src.database.connection import DatabaseConnection
+    from src.repositories import document_repository
+
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        db = DatabaseConnection(str(Path(workdir) / "bench.db"))
+        populate(db, rows)
+        repo = document_repository.DocumentRepository(db)
+        repo.find_all(limit=10)  # Warm the connection and caches
+
+        def list_all() -> int:
+            return len(repo.find_all())
+
+        def walk(**kwargs: Any) -> int:
+            listed, cursor = 0, None
+            while True:
+                page, cursor = repo.get_page(after=cursor, limit=page_size, **kwargs)
+                listed += len(page)
+                if cursor is None:
+                    return listed
+
+        results["find_all"] = measure(list_all)
+        results["get_page walk"] = measure(walk)
+        summary = getattr(document_repository, "SUMMARY_COLUMNS", None)
+        if summary and "columns" in inspect.signature(repo.get_page).parameters:
+            results["get_page walk (summary columns)"] = measure(
+                lambda: walk(columns=summary)
+            )
+        db.close_all_connections()
+    return results
+
+
+def run_revision(ref: str, rows: int, page_size: int) -> dict[str, Any]:
+    """Run this benchmark in a subprocess against src/ from a git revision."""
+    with tempfile.TemporaryDirectory() as workdir:
+        archive = subprocess.run(  # noqa: S603
+            ["git", "archive", ref, "src"],  # noqa: S607
+            cwd=PROJECT_ROOT,
+            check=True,
+            capture_output=True,
+        ).stdout
+        subprocess.run(  # noqa: S603
+            ["tar", "-x", "-C", workdir],  # noqa: S607
+            input=archive,
+            check=True,
+        )
+        output = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                __file__,
+                "--rows",
+                str(rows),
+                "--page-size",
+                str(page_size),
+                "--src-root",
+                workdir,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    return json.loads(output)["current"]
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--baseline-ref", help="Git revision to compare against")
+    parser.add_argument("--src-root", help=argparse.SUPPRESS)
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    # Add project root (or an extracted revision) to path
+    sys.path.insert(0, args.src_root or str(PROJECT_ROOT))
+
+    results: dict[str, Any] = {"rows": args.rows, "page_size": args.page_size}
+    if args.baseline_ref:
+        results[f"baseline ({args.baseline_ref})"] = run_revision(
+            args.baseline_ref, args.rows, args.page_size
+        )
+    results["current"] = run(args.rows, args.page_size)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Document List Pagination Benchmark
+Measures p50/p99 latency of keyset-paginated document listing for the first
+and a deep page of every sort key on a large synthetic documents table,
+alongside the equivalent LIMIT/OFFSET query, and compares the maintained
+document counter and cached search totals with plain COUNT(*) scans.
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.connection import DatabaseConnection
+from src.repositories.document_repository import SORT_KEYS, DocumentRepository
+
+MIGRATION_PATH = (
+    Path(__file__).parent.parent
+    / "src/database/migrations/versions/012_add_document_keyset_indexes.py"
+)
+
+
+def apply_keyset_migration(db: DatabaseConnection) -> None:
+    """Run the keyset migration against the fixture database."""
+    spec = importlib.util.spec_from_file_location("keyset_migration", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.AddDocumentKeysetIndexesMigration(db).up()
+
+
+def create_fixture(db: DatabaseConnection, rows: int) -> None:
+    """Create and fill a documents table with realistic value spreads."""
+    db.execute("""
+        CREATE TABLE documents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            file_path TEXT,
+            file_hash TEXT UNIQUE NOT NULL,
+            content_hash TEXT,
+            file_size INTEGER NOT NULL,
+            file_type TEXT,
+            page_count INTEGER,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            last_accessed DATETIME,
+            metadata TEXT DEFAULT '{}',
+            tags TEXT
+        )
+        """)
+    rng = random.Random(42)
+    topics = ["Graph", "Neural", "Quantum", "Protein", "Climate", "Market", "Sensor"]
+    batch = []
+    for i in range(rows):
+        created = rng.randint(0, 5 * 365 * 86400)
+        batch.append(
+            (
+                f"{rng.choice(topics)} study {i}",
+                f"hash-{i}",
+                rng.randint(10_000, 50_000_000),
+                _timestamp(created),
+                _timestamp(created + rng.randint(0, 86400 * 30)),
+                None if rng.random() < 0.4 else _timestamp(created + 86400 * 60),
+            )
+        )
+        if len(batch) == 50_000:
+            _insert(db, batch)
+            batch = []
+    if batch:
+        _insert(db, batch)
+
+    apply_keyset_migration(db)
+
+
+def _timestamp(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(1_600_000_000 + seconds))
+
+
+def _insert(db: DatabaseConnection, batch: list[tuple]) -> None:
+    db.execute_many(
+        "INSERT INTO documents (title, file_hash, file_size, created_at, "
+        "updated_at, last_accessed) VALUES (?, ?, ?, ?, ?, ?)",
+        batch,
+    )
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """p50/p99 in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[max(int(len(ordered) * 0.99) - 1, 0)] * 1000, 3),
+    }
+
+
+def time_call(fn: Any, repeats: int) -> dict[str, float]:
+    """Time repeated calls of fn."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def deep_cursor(fetch: Any, page_size: int, deep_page: int) -> Any:
+    """Walk to the deep page to obtain its cursor."""
+    after = None
+    for _ in range(deep_page - 1):
+        _, after = fetch(after=after, limit=page_size)
+        if after is None:
+            break
+    return after
+
+
+def run_benchmark(
+    rows: int, page_size: int, deep_page: int, repeats: int
+) -> dict[str, Any]:
+    """Benchmark first vs deep page per sort key, plus counts."""
+    results: dict[str, Any] = {"rows": rows, "page_size": page_size}
+    slow_repeats = max(5, repeats // 10)
+    with tempfile.TemporaryDirectory() as workdir:
+        db = DatabaseConnection(
+            str(Path(workdir) / "documents.db"), enable_monitoring=False
+        )
+        start = time.perf_counter()
+        create_fixture(db, rows)
+        results["fixture_seconds"] = round(time.perf_counter() - start, 1)
+        repo = DocumentRepository(db)
+        deep_offset = (deep_page - 1) * page_size
+
+        for sort_by, sort_expr in SORT_KEYS.items():
+            for sort_order in ("desc", "asc"):
+
+                def fetch(sort_by=sort_by, sort_order=sort_order, **kwargs):
+                    return repo.get_page(
+                        sort_by=sort_by, sort_order=sort_order, **kwargs
+                    )
+
+                after = deep_cursor(fetch, page_size, deep_page)
+                direction = sort_order.upper()
+                offset_sql = (
+                    "SELECT * FROM documents "  # noqa: S608 - benchmark SQL
+                    f"ORDER BY {sort_expr} {direction}, id {direction} "
+                    "LIMIT ? OFFSET ?"
+                )
+                results[f"{sort_by}_{sort_order}"] = {
+                    "keyset_page_1": time_call(
+                        lambda f=fetch: f(limit=page_size), repeats
+                    ),
+                    f"keyset_page_{deep_page}": time_call(
+                        lambda f=fetch, a=after: f(after=a, limit=page_size), repeats
+                    ),
+                    f"offset_page_{deep_page}": time_call(
+                        lambda sql=offset_sql: db.fetch_all(
+                            sql, (page_size, deep_offset)
+                        ),
+                        slow_repeats,
+                    ),
+                }
+
+        query = "quantum"
+        repo.count_search(query)  # Prime the cached total
+        results["counts"] = {
+            "count_counter": time_call(repo.count, repeats),
+            "count_scan": time_call(
+                lambda: db.fetch_one("SELECT COUNT(*) FROM documents"), slow_repeats
+            ),
+            "search_total_cached": time_call(lambda: repo.count_search(query), repeats),
+            "search_total_scan": time_call(
+                lambda: db.fetch_one(
+                    "SELECT COUNT(*) FROM documents WHERE title LIKE ?",
+                    (f"%{query}%",),
+                ),
+                slow_repeats,
+            ),
+        }
+        db.close_all_connections()
+    return results
+
+
+def print_report(results: dict[str, Any]) -> None:
+    """Print a latency table."""
+    print(
+        f"\n{results['rows']:,} documents, {results['page_size']} per page "
+        f"(fixture built in {results['fixture_seconds']}s)"
+    )
+    for name, timings in results.items():
+        if not isinstance(timings, dict):
+            continue
+        print(f"\n{name}")
+        for label, stats in timings.items():
+            print(
+                f"  {label:<20} p50 {stats['p50_ms']:>9.3f} ms   p99 {stats['p99_ms']:>9.3f} ms"
+            )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--deep-page", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, args.page_size, args.deep_page, args.repeats)
+    print_report(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Index Publish Benchmark
+Publishes a synthetic LlamaIndex-style index (default 500 MB of JSON stores)
+the previous way - build in a temp directory, copy into the final path - and
+by staging plus atomic promotion, then backs it up by copy and by hard link.
+Reports wall time and bytes written to disk for each step (Linux only for the
+I/O counters, read from /proc/self/io).
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Add project root to path
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.index_version_store import fsync_tree
+from src.services.rag.file_manager import RAGFileManager
+from src.services.vector_index_manager import _link_or_copy
+
+STORE_FILES = {
+    "default__vector_store.json": 0.80,
+    "docstore.json": 0.18,
+    "index_store.json": 0.01,
+    "graph_store.json": 0.01,
+}
+
+
+def write_index(directory: Path, size_mb: int) -> None:
+    """Write index store files totalling about size_mb megabytes."""
+    directory.mkdir(parents=True, exist_ok=True)
+    block = json.dumps({"embedding": [0.125] * 1000}) + ","
+    for name, share in STORE_FILES.items():
+        target = int(size_mb * share * 2**20)
+        with open(directory / name, "w") as f:
+            f.write('{"data": [')
+            written = 0
+            while written < target:
+                f.write(block)
+                written += len(block)
+            f.write("{}]}")
+    fsync_tree(directory)
+
+
+def disk_bytes_written() -> int | None:
+    """Bytes this process caused to be written to storage so far."""
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(": ") for line in f.read().splitlines())
+        return int(fields["write_bytes"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def measure(step: Callable[[], Any]) -> dict[str, Any]:
+    """Wall time and disk writes of one step, with dirty pages flushed."""
+    before = disk_bytes_written()
+    start = time.perf_counter()
+    step()
+    os.sync()
+    elapsed = time.perf_counter() - start
+    after = disk_bytes_written()
+    result: dict[str, Any] = {"seconds": round(elapsed, 3)}
+    if before is not None and after is not None:
+        result["mb_written"] = round((after - before) / 2**20, 1)
+    return result
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=500)
+    parser.add_argument(
+        "--storage-dir", type=Path, help="Where to create the vector storage"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {"index_size_mb": args.size_mb}
+    with tempfile.TemporaryDirectory(dir=args.storage_dir) as workdir:
+        manager = RAGFileManager(str(Path(workdir) / "vector_indexes"))
+        manager.versions.background_gc = False
+
+        # Previous flow: build in the system temp dir, copy into place
+        copied_path = manager.vector_storage_dir / "doc_1_copy"
+        build_dir = Path(tempfile.mkdtemp(prefix="rag_index_1_"))
+        write_index(build_dir, args.size_mb)
+
+        def copy_publish() -> None:
+            manager.prepare_index_directory(copied_path, overwrite=True)
+            manager.copy_index_files(build_dir, copied_path)
+
+        results["copy into place"] = measure(copy_publish)
+        shutil.rmtree(build_dir)
+
+        # New flow: build in staging on the storage filesystem, promote
+        promoted_path = manager.vector_storage_dir / "doc_1_promote"
+        staging = manager.create_staging_directory(1)
+        write_index(staging, args.size_mb)
+        results["stage + atomic promote"] = measure(
+            lambda: manager.promote_index(staging, promoted_path)
+        )
+
+        backup_dir = Path(workdir) / "backup"
+        results["backup by copy"] = measure(
+            lambda: shutil.copytree(promoted_path, backup_dir / "copy")
+        )
+        results["backup by hard link"] = measure(
+            lambda: shutil.copytree(
+                promoted_path, backup_dir / "link", copy_function=_link_or_copy
+            )
+        )
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
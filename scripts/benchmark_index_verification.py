@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Index Verification Sweep Benchmark
+Creates many small LlamaIndex-style indexes and runs the health-check sweep
+(verify_index_files + get_chunk_count on every index) twice: on indexes
+without a manifest, which parses every JSON store, and with build-time
+manifests, which only stats the files. Also times one throttled deep
+verification pass over the same indexes.
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Add project root to path
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.rag.file_manager import RAGFileManager
+from src.services.rag.index_manifest import MANIFEST_FILE
+
+
+def write_index(directory: Path, size_kb: int, dimension: int) -> None:
+    """Write a vector store of about size_kb kilobytes plus the small stores."""
+    directory.mkdir(parents=True)
+    vector = [0.125] * dimension
+    per_chunk = len(json.dumps(vector)) + 16
+    chunks = max(1, size_kb * 1024 // per_chunk)
+    embedding_dict = {f"node-{i}": vector for i in range(chunks)}
+    (directory / "default__vector_store.json").write_text(
+        json.dumps({"embedding_dict": embedding_dict})
+    )
+    (directory / "graph_store.json").write_text('{"graph_dict": {}}')
+    (directory / "index_store.json").write_text('{"index_store/data": {}}')
+
+
+def sweep(manager: RAGFileManager, paths: list[str]) -> dict[str, Any]:
+    """Verify and count chunks for every index, as a health check does."""
+    start = time.perf_counter()
+    cpu = time.process_time()
+    valid = sum(manager.verify_index_files(path) for path in paths)
+    chunks = sum(manager.get_chunk_count(path) for path in paths)
+    return {
+        "seconds": round(time.perf_counter() - start, 3),
+        "cpu_seconds": round(time.process_time() - cpu, 3),
+        "valid": valid,
+        "chunks": chunks,
+    }
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--indexes", type=int, default=1000)
+    parser.add_argument("--index-kb", type=int, default=512)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument(
+        "--deep-rate-mb", type=float, default=0, help="Deep pass cap (0: none)"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "indexes": args.indexes,
+        "index_kb": args.index_kb,
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        manager = RAGFileManager(str(Path(workdir) / "vector_indexes"))
+        template = Path(workdir) / "template"
+        write_index(template, args.index_kb, args.dimension)
+        paths = []
+        for i in range(args.indexes):
+            path = manager.vector_storage_dir / f"doc_{i}_bench"
+            shutil.copytree(template, path)
+            paths.append(str(path))
+
+        results["sweep without manifest"] = sweep(manager, paths)
+
+        start = time.perf_counter()
+        for path in paths:
+            manager.write_index_manifest(Path(path))
+        results["manifest write seconds"] = round(time.perf_counter() - start, 3)
+
+        results["sweep with manifest"] = sweep(manager, paths)
+
+        rate = args.deep_rate_mb * 2**20 or None
+        start = time.perf_counter()
+        thread, verified = manager.start_deep_verification(paths, rate)
+        thread.join()
+        manifest = json.loads((Path(paths[0]) / MANIFEST_FILE).read_text())
+        results["deep verification"] = {
+            "seconds": round(time.perf_counter() - start, 3),
+            "valid": sum(verified.values()),
+            "digest": manifest["digest_algorithm"],
+        }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
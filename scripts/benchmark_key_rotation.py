@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Key Rotation Benchmark
+Fills a SQLite key table with wrapped data keys (default 1M) and rotates the
+master key over all of them with the bulk rewrap used by
+EncryptionService.rotate_master_key. For comparison it rewraps a sample the
+per-record ORM way (load object, set attribute, flush) and extrapolates.
+It then looks up a batch of uncached keys with one query per miss and with
+batched prefetch into the bounded key cache.
+"""
+
+import argparse
+import base64
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from cryptography.fernet import Fernet, MultiFernet
+from sqlalchemy import Column, Integer, String, Text, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Add project root to path
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.services.key_rotation import KeyCache, rewrap_data_keys
+
+Base = declarative_base()
+
+
+class WrappedKey(Base):
+    """Subset of the encryption_keys table used by rotation."""
+
+    __tablename__ = "encryption_keys"
+
+    id = Column(Integer, primary_key=True)
+    key_id = Column(String(100), unique=True, nullable=False)
+    encrypted_key = Column(Text, nullable=False)
+
+
+def populate(session: Session, master_key: bytes, count: int) -> None:
+    """Insert count data keys wrapped under master_key."""
+    fernet = Fernet(master_key)
+    data_key = bytes(32)
+
+    def wrapped_key() -> str:
+        return base64.b64encode(fernet.encrypt(data_key)).decode("utf-8")
+
+    for start in range(0, count, 10000):
+        session.execute(
+            WrappedKey.__table__.insert(),
+            [
+                {"key_id": f"file_{i}", "encrypted_key": wrapped_key()}
+                for i in range(start, min(start + 10000, count))
+            ],
+        )
+    session.commit()
+
+
+def orm_rewrap(session: Session, old: bytes, new: bytes, limit: int) -> float:
+    """Rewrap the first limit keys one ORM object at a time; rolled back."""
+    wrapper = MultiFernet([Fernet(new), Fernet(old)])
+    start = time.perf_counter()
+    records = session.query(WrappedKey).order_by(WrappedKey.id).limit(limit).all()
+    for record in records:
+        record.encrypted_key = base64.b64encode(
+            wrapper.rotate(base64.b64decode(record.encrypted_key))
+        ).decode("utf-8")
+        session.flush()
+    elapsed = time.perf_counter() - start
+    session.rollback()
+    return elapsed
+
+
+def lookup_per_miss(
+    session: Session, wrapper: MultiFernet, key_ids: list[str]
+) -> float:
+    """One query and unwrap per key id, as the unbatched lookup did."""
+    cache = KeyCache(max_size=len(key_ids))
+    start = time.perf_counter()
+    for key_id in key_ids:
+        if cache.get(key_id) is None:
+            encrypted_key = session.execute(
+                select(WrappedKey.encrypted_key).where(WrappedKey.key_id == key_id)
+            ).scalar_one()
+            cache.put(key_id, wrapper.decrypt(base64.b64decode(encrypted_key)))
+    return time.perf_counter() - start
+
+
+def lookup_prefetch(
+    session: Session, wrapper: MultiFernet, key_ids: list[str]
+) -> float:
+    """Batched IN queries into the key cache, then cached lookups."""
+    cache = KeyCache(max_size=len(key_ids))
+    start = time.perf_counter()
+    missing = cache.missing(key_ids)
+    for i in range(0, len(missing), 500):
+        rows = session.execute(
+            select(WrappedKey.key_id, WrappedKey.encrypted_key).where(
+                WrappedKey.key_id.in_(missing[i : i + 500])
+            )
+        )
+        cache.put_many(
+            {
+                key_id: wrapper.decrypt(base64.b64decode(encrypted_key))
+                for key_id, encrypted_key in rows
+            }
+        )
+    for key_id in key_ids:
+        cache.get(key_id)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--orm-sample", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--work-dir", type=Path, help="Where to create the database")
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    old_master, new_master = Fernet.generate_key(), Fernet.generate_key()
+    results: dict[str, Any] = {"keys": args.keys, "batch_size": args.batch_size}
+    with tempfile.TemporaryDirectory(dir=args.work_dir) as workdir:
+        engine = create_engine(f"sqlite:///{Path(workdir) / 'keys.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            start = time.perf_counter()
+            populate(session, old_master, args.keys)
+            results["populate seconds"] = round(time.perf_counter() - start, 1)
+
+            sample = min(args.orm_sample, args.keys)
+            elapsed = orm_rewrap(session, old_master, new_master, sample)
+            results["per-record ORM rewrap"] = {
+                "sample": sample,
+                "keys_per_second": round(sample / elapsed),
+                "extrapolated_seconds": round(elapsed * args.keys / sample, 1),
+            }
+
+            start = time.perf_counter()
+            rewrap_data_keys(
+                session, WrappedKey.__table__, old_master, new_master, args.batch_size
+            )
+            session.commit()
+            elapsed = time.perf_counter() - start
+            results["bulk rewrap, one transaction"] = {
+                "seconds": round(elapsed, 1),
+                "keys_per_second": round(args.keys / elapsed),
+            }
+
+            wrapper = MultiFernet([Fernet(new_master)])
+            rng = random.Random(0)
+            key_ids = [
+                f"file_{rng.randrange(args.keys)}"
+                for _ in range(min(args.lookups, args.keys))
+            ]
+            results["uncached lookups"] = {
+                "keys": len(key_ids),
+                "per-miss query seconds": round(
+                    lookup_per_miss(session, wrapper, key_ids), 3
+                ),
+                "batched prefetch seconds": round(
+                    lookup_prefetch(session, wrapper, key_ids), 3
+                ),
+            }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Preview Rendering Benchmark
+Scrolls through a generated multi-page PDF one page at a time, pausing
+between pages like a reader, and reports page-to-image latency of
+DocumentPreviewService for:
+- reopen: the document is reopened for every page, rendered inline
+- cached_handles: rendered inline with an open document kept per file
+- pool_prerender: worker processes with cached handles and pre-rendering
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import fitz  # PyMuPDF
+
+from src.database.models import DocumentModel
+from src.services.document_preview_service import (
+    DocumentPreviewService,
+    PreviewSettings,
+)
+from src.services.preview_render_pool import PreviewRenderPool
+
+PARAGRAPH = (
+    "Retrieval augmented generation combines a dense retriever with a "
+    "sequence model; the retriever selects passages that condition decoding. "
+)
+
+
+def make_pdf(path: Path, pages: int) -> None:
+    """Write a text-heavy PDF with the given number of pages."""
+    document = fitz.open()
+    for number in range(1, pages + 1):
+        page = document.new_page()
+        page.insert_text((72, 60), f"Page {number}", fontsize=18)
+        page.insert_textbox(fitz.Rect(72, 90, 540, 760), PARAGRAPH * 30, fontsize=10)
+        page.draw_rect(fitz.Rect(72, 600, 300, 740), color=(0, 0, 1), width=2)
+    document.save(path)
+    document.close()
+
+
+def scroll(
+    pdf_path: Path,
+    cache_dir: Path,
+    pool: PreviewRenderPool,
+    pages: int,
+    width: int,
+    dwell: float,
+    prerender: bool,
+) -> dict[str, Any]:
+    """Request every page in order and collect per-page latency."""
+    document = DocumentModel(
+        id=1,
+        title="Benchmark",
+        file_path=str(pdf_path),
+        file_hash="benchmark",
+        file_size=pdf_path.stat().st_size,
+        file_type=".pdf",
+        _from_database=True,
+    )
+    settings = PreviewSettings(
+        enabled=True,
+        cache_dir=cache_dir,
+        max_width=width,
+        min_width=100,
+        thumbnail_width=256,
+        max_page_number=pages,
+        cache_ttl_seconds=3600,
+        prerender_first_pages=3 if prerender else 0,
+        prerender_ahead=2 if prerender else 0,
+    )
+    repo = types.SimpleNamespace(get_by_id=lambda _: document)
+    service = DocumentPreviewService(repo, settings, render_pool=pool)
+    pool.warm_up()
+
+    samples, hits = [], 0
+    try:
+        for page in range(1, pages + 1):
+            start = time.perf_counter()
+            preview = service.get_page_preview(1, page=page, width=width)
+            samples.append(time.perf_counter() - start)
+            hits += preview.from_cache
+            time.sleep(dwell)
+    finally:
+        service.close()
+
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1] * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+        "cache_hits": hits,
+        "pool": pool.stats,
+    }
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--dwell-ms", type=float, default=150.0)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    configurations = {
+        "reopen": (lambda: PreviewRenderPool(workers=0, max_open_documents=0), False),
+        "cached_handles": (lambda: PreviewRenderPool(workers=0), False),
+        "pool_prerender": (lambda: PreviewRenderPool(workers=args.workers), True),
+    }
+    results: dict[str, Any] = {
+        "pages": args.pages,
+        "width": args.width,
+        "dwell_ms": args.dwell_ms,
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        pdf_path = Path(workdir) / "scroll.pdf"
+        make_pdf(pdf_path, args.pages)
+        results["file_mb"] = round(pdf_path.stat().st_size / 1e6, 2)
+        for name, (make_pool, prerender) in configurations.items():
+            results[name] = scroll(
+                pdf_path,
+                Path(workdir) / name,
+                make_pool(),
+                args.pages,
+                args.width,
+                args.dwell_ms / 1000,
+                prerender,
+            )
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
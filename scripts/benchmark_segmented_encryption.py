@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Segmented Encryption Benchmark
+Encrypts and decrypts a large random file (default 1 GB) with the previous
+single-stream AES-256-GCM layout and with the segmented container at several
+worker counts, then measures random range-read latency, which the
+single-stream layout can only serve by decrypting from the start of the file.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Add project root to path
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.services.segmented_encryption import (
+    DEFAULT_SEGMENT_SIZE,
+    SegmentedFileCipher,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def write_random_file(path: Path, size_mb: int) -> None:
+    """Write size_mb megabytes of random data."""
+    block = os.urandom(2**20)
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(block)
+
+
+def stream_encrypt(key: bytes, source: Path, target: Path) -> None:
+    """Previous layout: nonce | tag | ciphertext of one GCM stream."""
+    nonce = os.urandom(12)
+    encryptor = Cipher(
+        algorithms.AES(key), modes.GCM(nonce), backend=default_backend()
+    ).encryptor()
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        dst.write(nonce + b"\0" * 16)
+        while chunk := src.read(CHUNK_SIZE):
+            dst.write(encryptor.update(chunk))
+        encryptor.finalize()
+        dst.seek(12)
+        dst.write(encryptor.tag)
+
+
+def stream_decrypt(key: bytes, source: Path, target: Path) -> None:
+    """Decrypt the previous layout; the tag is only checked at the very end."""
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        nonce, tag = src.read(12), src.read(16)
+        decryptor = Cipher(
+            algorithms.AES(key), modes.GCM(nonce, tag), backend=default_backend()
+        ).decryptor()
+        while chunk := src.read(CHUNK_SIZE):
+            dst.write(decryptor.update(chunk))
+        decryptor.finalize()
+
+
+def throughput(size_mb: int, seconds: float) -> dict[str, Any]:
+    """Wall time and rate of one pass over the file."""
+    return {"seconds": round(seconds, 3), "mb_per_second": round(size_mb / seconds, 1)}
+
+
+def timed(step: Callable[[], Any]) -> float:
+    """Wall time of one step."""
+    start = time.perf_counter()
+    step()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--segment-kb", type=int, default=DEFAULT_SEGMENT_SIZE // 1024)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--range-reads", type=int, default=200)
+    parser.add_argument("--range-kb", type=int, default=256)
+    parser.add_argument("--work-dir", type=Path, help="Where to write the files")
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    key = os.urandom(32)
+    results: dict[str, Any] = {
+        "size_mb": args.size_mb,
+        "segment_kb": args.segment_kb,
+        "cpu_count": os.cpu_count(),
+    }
+    with tempfile.TemporaryDirectory(dir=args.work_dir) as workdir:
+        plain = Path(workdir) / "plain.bin"
+        encrypted = Path(workdir) / "plain.bin.enc"
+        decrypted = Path(workdir) / "plain.bin.dec"
+        write_random_file(plain, args.size_mb)
+
+        results["single stream"] = {
+            "encrypt": throughput(
+                args.size_mb, timed(lambda: stream_encrypt(key, plain, encrypted))
+            ),
+            "decrypt": throughput(
+                args.size_mb,
+                timed(lambda: stream_decrypt(key, encrypted, decrypted)),
+            ),
+        }
+
+        for workers in args.workers:
+            cipher = SegmentedFileCipher(key, max_workers=workers)
+            results[f"segmented, {workers} workers"] = {
+                "encrypt": throughput(
+                    args.size_mb,
+                    timed(
+                        lambda: cipher.encrypt_file(
+                            plain, encrypted, "bench", args.segment_kb * 1024
+                        )
+                    ),
+                ),
+                "decrypt": throughput(
+                    args.size_mb,
+                    timed(lambda: cipher.decrypt_file(encrypted, decrypted)),
+                ),
+            }
+
+        # Random range reads against the last segmented container
+        rng = random.Random(0)
+        length = args.range_kb * 1024
+        size = plain.stat().st_size
+        latencies = []
+        for _ in range(args.range_reads):
+            offset = rng.randrange(0, max(1, size - length))
+            start = time.perf_counter()
+            cipher.read_range(encrypted, offset, length)
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        results["range read"] = {
+            "range_kb": args.range_kb,
+            "reads": args.range_reads,
+            "p50_ms": round(statistics.median(latencies), 3),
+            "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 3),
+            # Single stream: a verified read needs the whole file decrypted
+            "single_stream_equivalent_ms": round(
+                results["single stream"]["decrypt"]["seconds"] * 1000, 1
+            ),
+        }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Task Manager Scheduling Benchmark
+Queues thousands of tiny tasks (a short await each) on AsyncTaskManager and
+reports total time, scheduling overhead over the ideal
+tasks * task_ms / concurrency, and queue-to-start latency. Pass --baseline-ref
+to run the same workload against AsyncTaskManager from another git revision.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Add project root to path
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.services import async_task_manager
+
+MODULE_PATH = "backend/services/async_task_manager.py"
+
+
+def load_revision(ref: str, workdir: str) -> Any:
+    """Import async_task_manager as it was at a git revision."""
+    source = subprocess.run(  # noqa: S603
+        ["git", "show", f"{ref}:{MODULE_PATH}"],  # noqa: S607
+        cwd=PROJECT_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    path = Path(workdir) / "baseline_async_task_manager.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location("baseline_async_task_manager", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def run(
+    module: Any, tasks: int, concurrency: int, task_ms: float
+) -> dict[str, Any]:
+    """Submit all tasks up front and wait for the queue to drain."""
+    manager = module.AsyncTaskManager(
+        max_concurrent_tasks=concurrency,
+        max_queue_size=tasks,
+        enable_memory_monitoring=False,
+    )
+    if hasattr(module, "DEFAULT_LANE_LIMITS"):
+        category = module.TaskCategory.RAG_QUERY
+        manager.lanes[category.value].limit = concurrency
+    done = asyncio.Event()
+    finished = 0
+
+    async def tiny() -> None:
+        nonlocal finished
+        await asyncio.sleep(task_ms / 1000)
+        finished += 1
+        if finished == tasks:
+            done.set()
+
+    await manager.start()
+    start = time.perf_counter()
+    for _ in range(tasks):
+        await manager.submit_task(tiny)
+    await done.wait()
+    elapsed = time.perf_counter() - start
+
+    waits = sorted(
+        (task.started_at - task.created_at).total_seconds() * 1000
+        for task in manager.completed_tasks.values()
+    )
+    await manager.stop()
+    ideal = tasks * task_ms / 1000 / concurrency
+    return {
+        "total_seconds": round(elapsed, 3),
+        "ideal_seconds": round(ideal, 3),
+        "overhead_us_per_task": round((elapsed - ideal) / tasks * 1e6, 1),
+        "tasks_per_second": round(tasks / elapsed),
+        "queue_to_start_p50_ms": round(statistics.median(waits), 2),
+        "queue_to_start_p95_ms": round(waits[int(len(waits) * 0.95) - 1], 2),
+    }
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--task-ms", type=float, default=1.0)
+    parser.add_argument("--baseline-ref", help="Git revision to compare against")
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "tasks": args.tasks,
+        "concurrency": args.concurrency,
+        "task_ms": args.task_ms,
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.baseline_ref:
+            baseline = load_revision(args.baseline_ref, workdir)
+            results[f"baseline ({args.baseline_ref})"] = asyncio.run(
+                run(baseline, args.tasks, args.concurrency, args.task_ms)
+            )
+    results["current"] = asyncio.run(
+        run(async_task_manager, args.tasks, args.concurrency, args.task_ms)
+    )
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
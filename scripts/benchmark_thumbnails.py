@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Thumbnail Grid Benchmark
+Serves a warm grid of document thumbnails three ways and reports time,
+bytes, HTTP requests and files opened per grid:
+- png_files: one PNG file plus .meta sidecar per thumbnail (previous layout)
+- packed: one request per thumbnail from the packed thumbnail store
+- sprite: one sprite sheet request for the whole grid
+"""
+
+import argparse
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+import types
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageDraw
+
+from src.database.models import DocumentModel
+from src.services.document_preview_service import (
+    DocumentPreviewService,
+    PreviewSettings,
+)
+from src.services.preview_render_pool import RenderResult
+
+_opened = 0
+
+
+def _count_opens(event: str, _args: tuple) -> None:
+    global _opened
+    if event == "open":
+        _opened += 1
+
+
+def render_page(seed: int, width: int) -> bytes:
+    """A page-like PNG: white background with lines of grey "text"."""
+    height = round(width * 1.294)
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    for line in range(12, height - 12, 6):
+        length = width - 24 - (seed * 7 + line) % (width // 3)
+        draw.line((12, line, 12 + length, line), fill=(90, 90, 90), width=2)
+    draw.rectangle((12, 12, width // 2, 30), fill=(40, 60, 160))
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class _PagePool:
+    """Render pool stand-in returning pre-rendered pages."""
+
+    def __init__(self, pages: dict[str, bytes], width: int):
+        self.pages = pages
+        self.width = width
+
+    def submit(self, file_path: str, page: int, width: int) -> Future:
+        future: Future = Future()
+        content = self.pages[file_path]
+        future.set_result(RenderResult(content, width, round(width * 1.294), 1))
+        return future
+
+    def render(self, file_path: str, page: int, width: int) -> RenderResult:
+        return self.submit(file_path, page, width).result()
+
+    def shutdown(self) -> None:
+        pass
+
+
+def measure(run: Any, repeats: int) -> dict[str, Any]:
+    """Time a grid load and count files opened."""
+    global _opened
+    samples = []
+    for _ in range(repeats):
+        _opened = 0
+        start = time.perf_counter()
+        payload, requests = run()
+        samples.append(time.perf_counter() - start)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 2),
+        "bytes": payload,
+        "http_requests": requests,
+        "files_opened": _opened,
+    }
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--width", type=int, default=256)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    sys.addaudithook(_count_opens)
+    results: dict[str, Any] = {"documents": args.documents, "width": args.width}
+    with tempfile.TemporaryDirectory() as workdir:
+        documents = {
+            i: DocumentModel(
+                id=i,
+                title=f"Document {i}",
+                file_path=f"{workdir}/doc{i}.pdf",
+                file_hash=f"hash-{i}",
+                file_size=1,
+                file_type=".pdf",
+                _from_database=True,
+            )
+            for i in range(1, args.documents + 1)
+        }
+        pages = {d.file_path: render_page(i, args.width) for i, d in documents.items()}
+        for document in documents.values():
+            Path(document.file_path).write_bytes(b"%PDF")
+        repo = types.SimpleNamespace(
+            get_by_id=documents.get,
+            get_by_ids=lambda ids: [documents[i] for i in ids if i in documents],
+        )
+        settings = PreviewSettings(
+            enabled=True,
+            cache_dir=Path(workdir) / "previews",
+            max_width=1024,
+            min_width=64,
+            thumbnail_width=args.width,
+            max_page_number=500,
+            cache_ttl_seconds=3600,
+            prerender_first_pages=0,
+            prerender_ahead=0,
+        )
+        service = DocumentPreviewService(
+            repo, settings, render_pool=_PagePool(pages, args.width)
+        )
+        ids = list(documents)
+
+        def png_files() -> tuple[int, int]:
+            previews = [service.get_page_preview(i, 1, args.width) for i in ids]
+            return sum(len(p.content) for p in previews), len(ids)
+
+        def packed() -> tuple[int, int]:
+            thumbnails = [service.get_thumbnail(i) for i in ids]
+            return sum(len(t.content) for t in thumbnails), len(ids)
+
+        def sprite() -> tuple[int, int]:
+            return len(service.get_thumbnail_sprite(ids, args.columns).content), 1
+
+        for run in (png_files, packed, sprite):
+            run()  # Warm caches
+        results["png_files"] = measure(png_files, args.repeats)
+        results["packed"] = measure(packed, args.repeats)
+        results["sprite"] = measure(sprite, args.repeats)
+        service._sprites.clear()
+        results["sprite_cold_compose"] = measure(
+            lambda: (service._sprites.clear(), sprite())[1], 3
+        )
+        service.close()
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+WebSocket Fan-out Benchmark
+Broadcasts progress messages to thousands of simulated clients, a few of
+which stall on every send, and reports delivery latency percentiles for the
+healthy clients:
+- sequential: serialize and await send_text per client in turn (previous
+  WebSocketManager behaviour)
+- queued: WebSocketManager with per-client queues and writer tasks
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.api.websocket_manager import (
+    OverflowPolicy,
+    SendQueueConfig,
+    WebSocketManager,
+)
+
+
+class SimulatedSocket:
+    """Records when each message arrives; stalled sockets sleep per send."""
+
+    def __init__(self, stall_seconds: float = 0.0):
+        self.stall_seconds = stall_seconds
+        self.received: list[float] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        if self.stall_seconds:
+            await asyncio.sleep(self.stall_seconds)
+        self.received.append(time.perf_counter())
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+def make_sockets(clients: int, stalled: int, stall_seconds: float) -> list[Any]:
+    rng = random.Random(7)
+    slow = set(rng.sample(range(clients), stalled))
+    return [
+        SimulatedSocket(stall_seconds if i in slow else 0.0) for i in range(clients)
+    ]
+
+
+def message(index: int) -> dict[str, Any]:
+    return {
+        "type": "rag_progress_update",
+        "task_id": "task-1",
+        "progress_type": "indexing",
+        "percentage": index,
+        "message": "Indexing document",
+    }
+
+
+def summarize(
+    sockets: list[SimulatedSocket], sent_at: list[float], elapsed: float
+) -> dict[str, Any]:
+    latencies = [
+        (arrived - sent_at[i]) * 1000
+        for socket in sockets
+        if not socket.stall_seconds
+        for i, arrived in enumerate(socket.received)
+    ]
+    ordered = sorted(latencies)
+    return {
+        "deliveries": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 2),
+        "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1], 2),
+        "max_ms": round(ordered[-1], 2),
+        "total_seconds": round(elapsed, 2),
+    }
+
+
+async def run_sequential(args: argparse.Namespace) -> dict[str, Any]:
+    sockets = make_sockets(args.clients, args.stalled, args.stall_ms / 1000)
+    sent_at = []
+    start = time.perf_counter()
+    for index in range(args.broadcasts):
+        sent_at.append(time.perf_counter())
+        for socket in sockets:
+            await socket.send_text(json.dumps(message(index)))
+        await asyncio.sleep(args.interval_ms / 1000)
+    return summarize(sockets, sent_at, time.perf_counter() - start)
+
+
+async def run_queued(args: argparse.Namespace) -> dict[str, Any]:
+    manager = WebSocketManager(
+        SendQueueConfig(
+            max_queue_size=args.queue_size,
+            overflow_policy=OverflowPolicy(args.policy),
+        )
+    )
+    sockets = make_sockets(args.clients, args.stalled, args.stall_ms / 1000)
+    for index, socket in enumerate(sockets):
+        await manager.connect(socket, f"client-{index}")
+    await asyncio.sleep(0.05)
+    for socket in sockets:
+        socket.received.clear()  # Ignore welcome messages
+
+    sent_at = []
+    start = time.perf_counter()
+    for index in range(args.broadcasts):
+        sent_at.append(time.perf_counter())
+        await manager.broadcast_json(message(index))
+        await asyncio.sleep(args.interval_ms / 1000)
+    while manager.get_stats()["send_queues"]["queued_messages"] > args.stalled * 2:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    stats = manager.get_stats()["send_queues"]
+    await manager.cleanup()
+
+    result = summarize(sockets, sent_at, elapsed)
+    result["coalesced_for_stalled"] = stats["coalesced_messages"]
+    result["overflow_disconnects"] = stats["overflow_disconnects"]
+    return result
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--stalled", type=int, default=5)
+    parser.add_argument("--stall-ms", type=float, default=200)
+    parser.add_argument("--broadcasts", type=int, default=20)
+    parser.add_argument("--interval-ms", type=float, default=50)
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument(
+        "--policy", choices=[p.value for p in OverflowPolicy], default="coalesce"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results to file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "clients": args.clients,
+        "stalled_clients": args.stalled,
+        "stall_ms": args.stall_ms,
+        "broadcasts": args.broadcasts,
+        "sequential": asyncio.run(run_sequential(args)),
+        "queued": asyncio.run(run_queued(args)),
+    }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
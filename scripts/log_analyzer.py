@@ -8,9 +8,13 @@ for AI Enhanced PDF Scholar production monitoring.
 import argparse
 import json
 import logging
+import math
+import os
+import random
 import re
 import statistics
 from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -486,6 +490,169 @@ class LogParser:
         return datetime.now()
 
 
+# ============================================================================
+# Shared Result Builders
+# ============================================================================
+
+
+def classify_trend(older_avg: float, recent_avg: float) -> str:
+    """Classify a response time trend from older and recent averages."""
+    if recent_avg > older_avg * 1.2:
+        return "increasing"
+    elif recent_avg < older_avg * 0.8:
+        return "decreasing"
+    return "stable"
+
+
+def build_performance_bottleneck(
+    endpoint: str,
+    avg_time: float,
+    max_time: float,
+    min_time: float,
+    percentile_95: float,
+    request_count: int,
+    error_rate: float,
+    trend: str,
+) -> PerformanceBottleneck:
+    """Build a bottleneck result with severity and recommendations."""
+    # Determine severity
+    if avg_time > 5000 or percentile_95 > 10000:  # 5s avg or 10s p95
+        severity = "critical"
+    elif avg_time > 2000 or percentile_95 > 5000:  # 2s avg or 5s p95
+        severity = "high"
+    elif avg_time > 1000 or percentile_95 > 2000:  # 1s avg or 2s p95
+        severity = "medium"
+    else:
+        severity = "low"
+
+    # Generate recommendations
+    recommendations = []
+    if avg_time > 2000:
+        recommendations.append("Optimize endpoint performance")
+    if error_rate > 5:
+        recommendations.append("Investigate error causes")
+    if trend == "increasing":
+        recommendations.append("Monitor for performance regression")
+    if percentile_95 > avg_time * 3:
+        recommendations.append("Check for performance outliers")
+
+    return PerformanceBottleneck(
+        endpoint=endpoint,
+        avg_response_time=avg_time,
+        max_response_time=max_time,
+        min_response_time=min_time,
+        percentile_95=percentile_95,
+        request_count=request_count,
+        error_rate=error_rate,
+        trend=trend,
+        severity=severity,
+        recommendations=recommendations,
+    )
+
+
+def sort_bottlenecks(bottlenecks: list[PerformanceBottleneck]) -> None:
+    """Sort bottlenecks by severity and response time."""
+    severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+    bottlenecks.sort(
+        key=lambda x: (severity_order.get(x.severity, 999), -x.avg_response_time)
+    )
+
+
+def build_security_event(
+    pattern_id: str,
+    ip: str,
+    endpoint_counts: Counter[str],
+    first_seen: datetime,
+    last_seen: datetime,
+) -> SecurityEvent:
+    """Build a security event with risk level, attack pattern and countermeasures."""
+    pattern_config = LogPatternLibrary.SECURITY_PATTERNS[pattern_id]
+
+    # Determine risk level based on frequency and pattern type
+    frequency = sum(endpoint_counts.values())
+
+    if frequency > 50 or pattern_config["severity"] == "critical":
+        risk_level = "high"
+    elif frequency > 10 or pattern_config["severity"] == "high":
+        risk_level = "medium"
+    else:
+        risk_level = "low"
+
+    # Generate countermeasures
+    countermeasures = []
+    if pattern_id in ["sql_injection_attempt", "xss_attempt"]:
+        countermeasures.extend(
+            [
+                "Block IP address",
+                "Review input validation",
+                "Enable WAF protection",
+            ]
+        )
+    elif pattern_id == "failed_login_burst":
+        countermeasures.extend(
+            [
+                "Implement account lockout",
+                "Enable rate limiting",
+                "Monitor for credential stuffing",
+            ]
+        )
+    elif pattern_id == "suspicious_user_agent":
+        countermeasures.extend(
+            [
+                "Block bot traffic",
+                "Implement CAPTCHA",
+                "Monitor for automated attacks",
+            ]
+        )
+
+    # Determine attack pattern
+    attack_pattern = None
+    if frequency > 20 and len(endpoint_counts) > 5:
+        attack_pattern = "reconnaissance_scan"
+    elif frequency > 50:
+        attack_pattern = "brute_force_attack"
+    elif pattern_id == "sql_injection_attempt":
+        attack_pattern = "sql_injection_attack"
+
+    return SecurityEvent(
+        event_type=pattern_config["name"],
+        source_ip=ip,
+        target_endpoint=endpoint_counts.most_common(1)[0][0],
+        frequency=frequency,
+        first_seen=first_seen,
+        last_seen=last_seen,
+        risk_level=risk_level,
+        attack_pattern=attack_pattern,
+        countermeasures=countermeasures,
+    )
+
+
+def sort_security_events(security_events: list[SecurityEvent]) -> None:
+    """Sort security events by risk level and frequency."""
+    risk_order = {"high": 0, "medium": 1, "low": 2}
+    security_events.sort(
+        key=lambda x: (risk_order.get(x.risk_level, 999), -x.frequency)
+    )
+
+
+def resolve_time_window(timeframe: str) -> tuple[datetime, datetime]:
+    """Resolve a timeframe such as 24h, 7d or 60m into a (start, end) window."""
+    end_time = datetime.now()
+    if timeframe.endswith("h"):
+        hours = int(timeframe[:-1])
+        start_time = end_time - timedelta(hours=hours)
+    elif timeframe.endswith("d"):
+        days = int(timeframe[:-1])
+        start_time = end_time - timedelta(days=days)
+    elif timeframe.endswith("m"):
+        minutes = int(timeframe[:-1])
+        start_time = end_time - timedelta(minutes=minutes)
+    else:
+        # Default to 24 hours
+        start_time = end_time - timedelta(hours=24)
+    return start_time, end_time
+
+
 # ============================================================================
 # Log Analysis Engine
 # ============================================================================
@@ -576,23 +743,94 @@ class LogAnalysisEngine:
 
         return results
 
+    def analyze_logs_streaming(
+        self,
+        log_sources: list[str | Path],
+        timeframe: str = "24h",
+        analysis_types: list[AnalysisType] | None = None,
+        workers: int | None = None,
+        chunk_size: int = 64 * 1024 * 1024,
+    ) -> dict[str, Any]:
+        """
+        Analyze logs in a single streaming pass without materializing entries.
+
+        Files are split into byte ranges that are analyzed in parallel worker
+        processes; each worker feeds every entry through all analyzers once and
+        returns a bounded partial state that is merged here. Percentiles come
+        from t-digests and error pattern examples are reservoir samples, so
+        results may differ marginally from ``analyze_logs``.
+        """
+        if analysis_types is None:
+            analysis_types = list[Any](AnalysisType)
+
+        workers = workers or os.cpu_count() or 1
+        start_time, end_time = resolve_time_window(timeframe)
+        logger.info(
+            f"Starting streaming log analysis for timeframe: {timeframe} "
+            f"with {workers} workers"
+        )
+
+        tasks = []
+        for log_source in log_sources:
+            log_path = Path(log_source)
+            if not log_path.exists():
+                logger.warning(f"Log file not found: {log_path}")
+                continue
+            for start, end in split_log_file(log_path, chunk_size):
+                tasks.append((str(log_path), start, end, start_time, end_time))
+
+        state = StreamingAnalysisState()
+        if workers == 1 or len(tasks) <= 1:
+            for task in tasks:
+                state.merge(analyze_log_range(*task))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                for partial in pool.map(analyze_log_range, *zip(*tasks, strict=True)):
+                    state.merge(partial)
+
+        results: dict[str, Any] = {}
+
+        if AnalysisType.ERROR_PATTERNS in analysis_types:
+            results["error_patterns"] = state.error_pattern_results()
+
+        if AnalysisType.PERFORMANCE_BOTTLENECKS in analysis_types:
+            results["performance_bottlenecks"] = state.bottleneck_results()
+
+        if AnalysisType.SECURITY_EVENTS in analysis_types:
+            results["security_events"] = state.security_results()
+
+        if AnalysisType.BUSINESS_METRICS in analysis_types:
+            results["business_metrics"] = state.business_results()
+
+        if AnalysisType.ANOMALY_DETECTION in analysis_types:
+            results["anomalies"] = state.anomaly_results()
+
+        if AnalysisType.PREDICTIVE_ANALYSIS in analysis_types:
+            results["predictions"] = state.prediction_results()
+
+        results["metadata"] = {
+            "analysis_timestamp": datetime.now().isoformat(),
+            "timeframe": timeframe,
+            "total_log_entries": state.total_entries,
+            "analysis_types": [t.value for t in analysis_types],
+            "log_sources": [str(s) for s in log_sources],
+            "mode": "streaming",
+            "byte_ranges": len(tasks),
+        }
+
+        self.analysis_results = results
+
+        logger.info(
+            f"Streaming analysis completed. Processed {state.total_entries} log entries"
+        )
+
+        return results
+
     def _load_logs(self, log_sources: list[str | Path], timeframe: str) -> None:
         """Load and parse log files within the specified timeframe."""
 
         # Calculate time window
-        end_time = datetime.now()
-        if timeframe.endswith("h"):
-            hours = int(timeframe[:-1])
-            start_time = end_time - timedelta(hours=hours)
-        elif timeframe.endswith("d"):
-            days = int(timeframe[:-1])
-            start_time = end_time - timedelta(days=days)
-        elif timeframe.endswith("m"):
-            minutes = int(timeframe[:-1])
-            start_time = end_time - timedelta(minutes=minutes)
-        else:
-            # Default to 24 hours
-            start_time = end_time - timedelta(hours=24)
+        start_time, end_time = resolve_time_window(timeframe)
 
         logger.info(f"Loading logs from {start_time} to {end_time}")
 
@@ -710,59 +948,27 @@ class LogAnalysisEngine:
             # Calculate trend (simple approach using recent vs older data)
             if len(response_times) >= 10:
                 mid_point = len(response_times) // 2
-                recent_avg = statistics.mean(response_times[mid_point:])
-                older_avg = statistics.mean(response_times[:mid_point])
-
-                if recent_avg > older_avg * 1.2:
-                    trend = "increasing"
-                elif recent_avg < older_avg * 0.8:
-                    trend = "decreasing"
-                else:
-                    trend = "stable"
+                trend = classify_trend(
+                    statistics.mean(response_times[:mid_point]),
+                    statistics.mean(response_times[mid_point:]),
+                )
             else:
                 trend = "insufficient_data"
 
-            # Determine severity
-            if avg_time > 5000 or percentile_95 > 10000:  # 5s avg or 10s p95
-                severity = "critical"
-            elif avg_time > 2000 or percentile_95 > 5000:  # 2s avg or 5s p95
-                severity = "high"
-            elif avg_time > 1000 or percentile_95 > 2000:  # 1s avg or 2s p95
-                severity = "medium"
-            else:
-                severity = "low"
-
-            # Generate recommendations
-            recommendations = []
-            if avg_time > 2000:
-                recommendations.append("Optimize endpoint performance")
-            if error_rate > 5:
-                recommendations.append("Investigate error causes")
-            if trend == "increasing":
-                recommendations.append("Monitor for performance regression")
-            if percentile_95 > avg_time * 3:
-                recommendations.append("Check for performance outliers")
-
-            bottleneck = PerformanceBottleneck(
-                endpoint=endpoint,
-                avg_response_time=avg_time,
-                max_response_time=max_time,
-                min_response_time=min_time,
-                percentile_95=percentile_95,
-                request_count=request_count,
-                error_rate=error_rate,
-                trend=trend,
-                severity=severity,
-                recommendations=recommendations,
+            bottlenecks.append(
+                build_performance_bottleneck(
+                    endpoint,
+                    avg_time,
+                    max_time,
+                    min_time,
+                    percentile_95,
+                    request_count,
+                    error_rate,
+                    trend,
+                )
             )
 
-            bottlenecks.append(bottleneck)
-
-        # Sort by severity and response time
-        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        bottlenecks.sort(
-            key=lambda x: (severity_order.get(x.severity, 999), -x.avg_response_time)
-        )
+        sort_bottlenecks(bottlenecks)
 
         logger.info(f"Found {len(bottlenecks)} performance bottlenecks")
         return bottlenecks
@@ -803,76 +1009,17 @@ class LogAnalysisEngine:
                 if not events:
                     continue
 
-                pattern_config = self.pattern_library.SECURITY_PATTERNS[pattern_id]
-
-                # Determine risk level based on frequency and pattern type
-                frequency = len(events)
-
-                if frequency > 50 or pattern_config["severity"] == "critical":
-                    risk_level = "high"
-                elif frequency > 10 or pattern_config["severity"] == "high":
-                    risk_level = "medium"
-                else:
-                    risk_level = "low"
-
-                # Generate countermeasures
-                countermeasures = []
-                if pattern_id in ["sql_injection_attempt", "xss_attempt"]:
-                    countermeasures.extend(
-                        [
-                            "Block IP address",
-                            "Review input validation",
-                            "Enable WAF protection",
-                        ]
-                    )
-                elif pattern_id == "failed_login_burst":
-                    countermeasures.extend(
-                        [
-                            "Implement account lockout",
-                            "Enable rate limiting",
-                            "Monitor for credential stuffing",
-                        ]
-                    )
-                elif pattern_id == "suspicious_user_agent":
-                    countermeasures.extend(
-                        [
-                            "Block bot traffic",
-                            "Implement CAPTCHA",
-                            "Monitor for automated attacks",
-                        ]
+                security_events.append(
+                    build_security_event(
+                        pattern_id,
+                        ip,
+                        Counter(e["endpoint"] for e in events),
+                        min(e["timestamp"] for e in events),
+                        max(e["timestamp"] for e in events),
                     )
-
-                # Determine attack pattern
-                attack_pattern = None
-                if frequency > 20 and len(set[str](e["endpoint"] for e in events)) > 5:
-                    attack_pattern = "reconnaissance_scan"
-                elif frequency > 50:
-                    attack_pattern = "brute_force_attack"
-                elif pattern_id == "sql_injection_attempt":
-                    attack_pattern = "sql_injection_attack"
-
-                security_event = SecurityEvent(
-                    event_type=pattern_config["name"],
-                    source_ip=ip,
-                    target_endpoint=max(
-                        set[str](e["endpoint"] for e in events),
-                        key=lambda x: sum(1 for e in events if e["endpoint"] == x),
-                    ),
-                    frequency=frequency,
-                    first_seen=min(e["timestamp"] for e in events),
-                    last_seen=max(e["timestamp"] for e in events),
-                    risk_level=risk_level,
-                    attack_pattern=attack_pattern,
-                    countermeasures=countermeasures,
                 )
 
-                security_events.append(security_event)
-
-        # Sort by risk level and frequency
-        risk_order = {"high": 0, "medium": 1, "low": 2}
-        security_events.sort(
-            key=lambda x: (risk_order.get(x.risk_level, 999), -x.frequency)
-        )
+        sort_security_events(security_events)
 
         logger.info(f"Found {len(security_events)} security events")
         return security_events
@@ -1216,6 +1363,738 @@ class LogAnalysisEngine:
         return predictions
 
 
+# ============================================================================
+# Streaming Analysis
+# ============================================================================
+
+
+class RunningStats:
+    """Mergeable count/mean/variance/min/max using Welford's algorithm."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a single observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Merge another accumulator (Chan's parallel formula)."""
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class TDigest:
+    """
+    Merging t-digest for streaming quantile estimation.
+
+    Keeps O(compression) centroids regardless of how many values are added;
+    centroids near the tails stay small so high percentiles remain accurate.
+    """
+
+    def __init__(self, compression: float = 100.0) -> None:
+        self.compression = compression
+        self.centroids: list[tuple[float, float]] = []  # (mean, weight)
+        self.buffer: list[float] = []
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a single observation."""
+        self.buffer.append(value)
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self.buffer) >= self.compression * 5:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> None:
+        """Merge another digest into this one."""
+        if not other.count:
+            return
+        self.centroids.extend(other.centroids)
+        self.buffer.extend(other.buffer)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(force=True)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile ``q`` (0..1)."""
+        self._compress()
+        if not self.centroids:
+            return 0.0
+        if len(self.centroids) == 1:
+            return self.centroids[0][0]
+
+        target = q * self.count
+        cumulative = 0.0
+        previous_position, previous_mean = 0.0, self.min
+        for mean, weight in self.centroids:
+            position = cumulative + weight / 2
+            if target < position:
+                span = position - previous_position
+                fraction = (target - previous_position) / span if span else 0.0
+                return previous_mean + fraction * (mean - previous_mean)
+            previous_position, previous_mean = position, mean
+            cumulative += weight
+
+        span = self.count - previous_position
+        fraction = (target - previous_position) / span if span else 0.0
+        return previous_mean + fraction * (self.max - previous_mean)
+
+    def fraction_above(self, value: float) -> float:
+        """Estimate the fraction of observations greater than ``value``."""
+        self._compress()
+        if not self.count or value >= self.max:
+            return 0.0
+        if value < self.min:
+            return 1.0
+        below = 0.0
+        for mean, weight in self.centroids:
+            if mean > value:
+                break
+            below += weight
+        return max(0.0, 1.0 - below / self.count)
+
+    def _compress(self, force: bool = False) -> None:
+        """Fold buffered values into size-bounded centroids."""
+        if not self.buffer and not force:
+            return
+        if not self.buffer and not self.centroids:
+            return
+        points = sorted(self.centroids + [(value, 1.0) for value in self.buffer])
+        self.buffer = []
+
+        total = float(self.count)
+        compressed: list[tuple[float, float]] = []
+        cumulative = 0.0
+        current_mean, current_weight = points[0]
+        # k1 scale function: each centroid may span at most one unit of k
+        k_limit = self._scale(0.0) + 1
+        for mean, weight in points[1:]:
+            merged_weight = current_weight + weight
+            if self._scale((cumulative + merged_weight) / total) <= k_limit:
+                current_mean += (mean - current_mean) * weight / merged_weight
+                current_weight = merged_weight
+            else:
+                compressed.append((current_mean, current_weight))
+                cumulative += current_weight
+                k_limit = self._scale(cumulative / total) + 1
+                current_mean, current_weight = mean, weight
+        compressed.append((current_mean, current_weight))
+        self.centroids = compressed
+
+    def _scale(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * min(q, 1.0) - 1)
+
+
+class ReservoirSample:
+    """Fixed-size uniform sample of a stream (Algorithm R), mergeable."""
+
+    def __init__(self, capacity: int = 20, seed: int | None = None) -> None:
+        self.capacity = capacity
+        self.items: list[Any] = []
+        self.seen = 0
+        self.rng = random.Random(seed)
+
+    def add(self, item: Any) -> None:
+        """Offer an item to the sample."""
+        self.seen += 1
+        if len(self.items) < self.capacity:
+            self.items.append(item)
+        else:
+            slot = self.rng.randrange(self.seen)
+            if slot < self.capacity:
+                self.items[slot] = item
+
+    def merge(self, other: "ReservoirSample") -> None:
+        """Merge another sample, weighting items by the stream size they represent."""
+        if not other.seen:
+            return
+        if self.seen + other.seen <= self.capacity:
+            self.items.extend(other.items)
+        else:
+            # Weighted sampling without replacement (Efraimidis-Spirakis keys)
+            weighted = [
+                (self.rng.random() ** (len(sample.items) / sample.seen), item)
+                for sample in (self, other)
+                for item in sample.items
+            ]
+            weighted.sort(key=lambda pair: pair[0], reverse=True)
+            self.items = [item for _, item in weighted[: self.capacity]]
+        self.seen += other.seen
+
+
+_ERROR_LEVELS = frozenset({LogLevel.ERROR, LogLevel.CRITICAL})
+_WARNING_LEVELS = frozenset({LogLevel.ERROR, LogLevel.CRITICAL, LogLevel.WARNING})
+
+# Patterns compiled once per process instead of once per analysis pass
+_COMPILED_ERROR_PATTERNS = [
+    (pattern_id, re.compile(config["regex"], re.IGNORECASE))
+    for pattern_id, config in LogPatternLibrary.ERROR_PATTERNS.items()
+]
+_COMPILED_SECURITY_PATTERNS = [
+    (pattern_id, re.compile(config["regex"], re.IGNORECASE))
+    for pattern_id, config in LogPatternLibrary.SECURITY_PATTERNS.items()
+]
+_COMPILED_BUSINESS_PATTERNS = [
+    (pattern_id, re.compile(config["regex"], re.IGNORECASE))
+    for pattern_id, config in LogPatternLibrary.BUSINESS_PATTERNS.items()
+]
+
+
+@dataclass
+class HourBucket:
+    """Per-hour aggregates used by anomaly detection and predictions."""
+
+    total: int = 0
+    errors: int = 0
+    response_time_sum: float = 0.0
+    response_time_count: int = 0
+    response_time_max: float = 0.0
+    security_events: int = 0
+
+    def merge(self, other: "HourBucket") -> None:
+        """Merge another bucket for the same hour."""
+        self.total += other.total
+        self.errors += other.errors
+        self.response_time_sum += other.response_time_sum
+        self.response_time_count += other.response_time_count
+        self.response_time_max = max(self.response_time_max, other.response_time_max)
+        self.security_events += other.security_events
+
+
+class StreamingAnalysisState:
+    """
+    Incremental aggregators for every analysis type.
+
+    Each log entry is pushed through all analyzers exactly once. Memory is
+    bounded by the number of distinct endpoints, patterns, source IPs and
+    hours rather than the number of log lines, and partial states from
+    worker processes are combined with ``merge``.
+    """
+
+    def __init__(self, sample_size: int = 20) -> None:
+        self.sample_size = sample_size
+        self.total_entries = 0
+        # pattern_id -> [count, first_seen, last_seen, sample]
+        self.error_patterns: dict[str, list[Any]] = {}
+        # endpoint -> aggregates
+        self.endpoint_requests: Counter[str] = Counter()
+        self.endpoint_errors: Counter[str] = Counter()
+        self.endpoint_stats: dict[str, RunningStats] = {}
+        self.endpoint_digests: dict[str, TDigest] = {}
+        self.endpoint_hourly: dict[str, dict[datetime, list[float]]] = {}
+        # (ip, pattern_id) -> [endpoint counts, first_seen, last_seen]
+        self.security: dict[tuple[str, str], list[Any]] = {}
+        self.business_counts: Counter[str] = Counter()
+        self.response_times = RunningStats()
+        self.response_digest = TDigest()
+        self.hours: dict[datetime, HourBucket] = {}
+        self.security_ips_by_hour: dict[datetime, set[str]] = {}
+
+    def add(self, entry: LogEntry) -> None:
+        """Push one entry through all analyzers."""
+        self.total_entries += 1
+        hour = entry.timestamp.replace(minute=0, second=0, microsecond=0)
+        bucket = self.hours.get(hour)
+        if bucket is None:
+            bucket = self.hours[hour] = HourBucket()
+        bucket.total += 1
+        if entry.level in _ERROR_LEVELS:
+            bucket.errors += 1
+
+        message = entry.message
+        raw_line = entry.raw_line
+
+        # Error patterns
+        if entry.level in _WARNING_LEVELS:
+            for pattern_id, regex in _COMPILED_ERROR_PATTERNS:
+                if regex.search(message) or (raw_line and regex.search(raw_line)):
+                    self._record_error_pattern(pattern_id, entry)
+
+        # Endpoint performance
+        response_time = entry.response_time
+        if entry.endpoint:
+            endpoint = entry.endpoint
+            self.endpoint_requests[endpoint] += 1
+            if response_time:
+                if endpoint not in self.endpoint_stats:
+                    self.endpoint_stats[endpoint] = RunningStats()
+                    self.endpoint_digests[endpoint] = TDigest()
+                    self.endpoint_hourly[endpoint] = {}
+                self.endpoint_stats[endpoint].add(response_time)
+                self.endpoint_digests[endpoint].add(response_time)
+                hourly = self.endpoint_hourly[endpoint].setdefault(hour, [0.0, 0])
+                hourly[0] += response_time
+                hourly[1] += 1
+            if entry.status_code and entry.status_code >= 500:
+                self.endpoint_errors[endpoint] += 1
+
+        # Global response times
+        if response_time:
+            self.response_times.add(response_time)
+            self.response_digest.add(response_time)
+            if response_time > 0:
+                bucket.response_time_sum += response_time
+                bucket.response_time_count += 1
+                bucket.response_time_max = max(bucket.response_time_max, response_time)
+
+        # Security events
+        security_text = message + (raw_line or "")
+        security_hit = False
+        for pattern_id, regex in _COMPILED_SECURITY_PATTERNS:
+            if regex.search(security_text):
+                security_hit = True
+                self._record_security_event(pattern_id, entry)
+        if security_hit:
+            bucket.security_events += 1
+            if entry.ip_address:
+                self.security_ips_by_hour.setdefault(hour, set()).add(entry.ip_address)
+
+        # Business metrics
+        for pattern_id, regex in _COMPILED_BUSINESS_PATTERNS:
+            if regex.search(message) or (raw_line and regex.search(raw_line)):
+                self.business_counts[pattern_id] += 1
+
+    def _record_error_pattern(self, pattern_id: str, entry: LogEntry) -> None:
+        state = self.error_patterns.get(pattern_id)
+        if state is None:
+            state = [0, entry.timestamp, entry.timestamp]
+            state.append(ReservoirSample(self.sample_size))
+            self.error_patterns[pattern_id] = state
+        state[0] += 1
+        state[1] = min(state[1], entry.timestamp)
+        state[2] = max(state[2], entry.timestamp)
+        state[3].add(entry)
+
+    def _record_security_event(self, pattern_id: str, entry: LogEntry) -> None:
+        key = (entry.ip_address or "unknown", pattern_id)
+        state = self.security.get(key)
+        if state is None:
+            state = self.security[key] = [Counter(), entry.timestamp, entry.timestamp]
+        state[0][entry.endpoint or "unknown"] += 1
+        state[1] = min(state[1], entry.timestamp)
+        state[2] = max(state[2], entry.timestamp)
+
+    def merge(self, other: "StreamingAnalysisState") -> None:
+        """Merge a partial state from another worker."""
+        self.total_entries += other.total_entries
+
+        for pattern_id, (count, first, last, sample) in other.error_patterns.items():
+            state = self.error_patterns.get(pattern_id)
+            if state is None:
+                self.error_patterns[pattern_id] = [count, first, last, sample]
+                continue
+            state[0] += count
+            state[1] = min(state[1], first)
+            state[2] = max(state[2], last)
+            state[3].merge(sample)
+
+        self.endpoint_requests.update(other.endpoint_requests)
+        self.endpoint_errors.update(other.endpoint_errors)
+        for endpoint, stats in other.endpoint_stats.items():
+            if endpoint not in self.endpoint_stats:
+                self.endpoint_stats[endpoint] = stats
+                self.endpoint_digests[endpoint] = other.endpoint_digests[endpoint]
+                self.endpoint_hourly[endpoint] = other.endpoint_hourly[endpoint]
+                continue
+            self.endpoint_stats[endpoint].merge(stats)
+            self.endpoint_digests[endpoint].merge(other.endpoint_digests[endpoint])
+            hourly = self.endpoint_hourly[endpoint]
+            for hour, (total, count) in other.endpoint_hourly[endpoint].items():
+                merged = hourly.setdefault(hour, [0.0, 0])
+                merged[0] += total
+                merged[1] += count
+
+        for key, (endpoints, first, last) in other.security.items():
+            state = self.security.get(key)
+            if state is None:
+                self.security[key] = [endpoints, first, last]
+                continue
+            state[0].update(endpoints)
+            state[1] = min(state[1], first)
+            state[2] = max(state[2], last)
+
+        self.business_counts.update(other.business_counts)
+        self.response_times.merge(other.response_times)
+        self.response_digest.merge(other.response_digest)
+        for hour, bucket in other.hours.items():
+            if hour in self.hours:
+                self.hours[hour].merge(bucket)
+            else:
+                self.hours[hour] = bucket
+        for hour, ips in other.security_ips_by_hour.items():
+            self.security_ips_by_hour.setdefault(hour, set()).update(ips)
+
+    # ------------------------------------------------------------------
+    # Result finalization
+    # ------------------------------------------------------------------
+
+    def error_pattern_results(self) -> list[PatternMatch]:
+        """Finalize error pattern matches with sampled example entries."""
+        pattern_matches = []
+        for pattern_id, (count, first, last, sample) in self.error_patterns.items():
+            pattern_config = LogPatternLibrary.ERROR_PATTERNS[pattern_id]
+            pattern_matches.append(
+                PatternMatch(
+                    pattern_id=pattern_id,
+                    pattern_name=pattern_config["name"],
+                    pattern_regex=pattern_config["regex"],
+                    matches=sorted(sample.items, key=lambda e: e.timestamp),
+                    frequency=count,
+                    first_seen=first,
+                    last_seen=last,
+                    severity=pattern_config["severity"],
+                    impact_score=pattern_config["impact_score"],
+                    confidence=min(0.95, 0.5 + (count * 0.1)),
+                )
+            )
+        pattern_matches.sort(key=lambda x: (x.impact_score, x.frequency), reverse=True)
+        return pattern_matches
+
+    def bottleneck_results(self) -> list[PerformanceBottleneck]:
+        """Finalize per-endpoint bottlenecks from digests and hourly trends."""
+        bottlenecks = []
+        for endpoint, stats in self.endpoint_stats.items():
+            if stats.count < 5:  # Need minimum data
+                continue
+
+            request_count = self.endpoint_requests[endpoint]
+            error_count = self.endpoint_errors[endpoint]
+            error_rate = (error_count / request_count) * 100 if request_count > 0 else 0
+
+            # Trend: compare the older and newer halves of the traffic by hour
+            if stats.count >= 10:
+                older = [0.0, 0]
+                recent = [0.0, 0]
+                seen = 0
+                for _, (total, count) in sorted(self.endpoint_hourly[endpoint].items()):
+                    half = older if seen < stats.count // 2 else recent
+                    half[0] += total
+                    half[1] += count
+                    seen += count
+                if older[1] and recent[1]:
+                    trend = classify_trend(older[0] / older[1], recent[0] / recent[1])
+                else:
+                    trend = "stable"
+            else:
+                trend = "insufficient_data"
+
+            bottlenecks.append(
+                build_performance_bottleneck(
+                    endpoint,
+                    stats.mean,
+                    stats.max,
+                    stats.min,
+                    self.endpoint_digests[endpoint].quantile(0.95),
+                    request_count,
+                    error_rate,
+                    trend,
+                )
+            )
+        sort_bottlenecks(bottlenecks)
+        return bottlenecks
+
+    def security_results(self) -> list[SecurityEvent]:
+        """Finalize security events per source IP and pattern."""
+        security_events = [
+            build_security_event(pattern_id, ip, endpoints, first, last)
+            for (ip, pattern_id), (endpoints, first, last) in self.security.items()
+        ]
+        sort_security_events(security_events)
+        return security_events
+
+    def business_results(self) -> list[BusinessMetric]:
+        """Finalize business metric counters."""
+        metrics = [
+            BusinessMetric(
+                metric_name=LogPatternLibrary.BUSINESS_PATTERNS[pattern_id]["name"],
+                metric_value=count,
+                metric_type=LogPatternLibrary.BUSINESS_PATTERNS[pattern_id][
+                    "metric_type"
+                ],
+                time_period="analysis_window",
+            )
+            for pattern_id, count in self.business_counts.items()
+            if count > 0
+        ]
+        uploads = self.business_counts.get("document_upload", 0)
+        queries = self.business_counts.get("rag_query", 0)
+        if uploads > 0 and queries > 0:
+            metrics.append(
+                BusinessMetric(
+                    metric_name="Query to Upload Ratio",
+                    metric_value=round(queries / uploads, 2),
+                    metric_type="ratio",
+                    time_period="analysis_window",
+                )
+            )
+        return metrics
+
+    def anomaly_results(self) -> list[Anomaly]:
+        """Finalize anomalies from global digests and hourly buckets."""
+        anomalies = []
+        hours = sorted(self.hours)
+
+        # 1. Response time anomalies
+        stats = self.response_times
+        if stats.count > 50:
+            threshold = stats.mean + (3 * stats.stdev)  # 3 sigma rule
+            outlier_fraction = self.response_digest.fraction_above(threshold)
+            if outlier_fraction > 0.05:  # More than 5% outliers
+                spike_hours = [
+                    hour
+                    for hour in hours
+                    if self.hours[hour].response_time_max > threshold
+                ]
+                outlier_count = round(outlier_fraction * stats.count)
+                anomalies.append(
+                    Anomaly(
+                        anomaly_type="response_time_spike",
+                        description=f"Unusual spike in response times detected. ~{outlier_count} requests exceeded {threshold:.2f}ms",
+                        severity="medium" if outlier_fraction < 0.1 else "high",
+                        confidence=0.8,
+                        affected_components=["api_endpoints"],
+                        time_window=(
+                            spike_hours[0],
+                            spike_hours[-1] + timedelta(hours=1),
+                        ),
+                        baseline_value=stats.mean,
+                        anomalous_value=stats.max,
+                        deviation_score=(stats.max - stats.mean)
+                        / max(stats.stdev, 1e-9),
+                    )
+                )
+
+        # 2. Error rate anomalies
+        error_rates = [
+            (self.hours[hour].errors / self.hours[hour].total) * 100
+            for hour in hours
+            if self.hours[hour].total > 0
+        ]
+        if len(error_rates) > 5:
+            mean_error_rate = statistics.mean(error_rates)
+            std_error_rate = statistics.stdev(error_rates)
+            if std_error_rate > 0:
+                threshold = mean_error_rate + (2 * std_error_rate)
+                high_error_periods = [rate for rate in error_rates if rate > threshold]
+                if high_error_periods and max(high_error_periods) > mean_error_rate * 2:
+                    peak = max(high_error_periods)
+                    anomalies.append(
+                        Anomaly(
+                            anomaly_type="error_rate_spike",
+                            description=f"Error rate spike detected. Peak error rate: {peak:.2f}%",
+                            severity="high" if peak > 10 else "medium",
+                            confidence=0.75,
+                            affected_components=["application"],
+                            time_window=(hours[0], hours[-1] + timedelta(hours=1)),
+                            baseline_value=mean_error_rate,
+                            anomalous_value=peak,
+                            deviation_score=(peak - mean_error_rate)
+                            / max(std_error_rate, 0.1),
+                        )
+                    )
+
+        # 3. Traffic volume anomalies
+        if len(hours) > 5:
+            traffic_volumes = [self.hours[hour].total for hour in hours]
+            mean_traffic = statistics.mean(traffic_volumes)
+            std_traffic = statistics.stdev(traffic_volumes)
+            max_traffic = max(traffic_volumes)
+            if std_traffic > mean_traffic * 0.5 and max_traffic > mean_traffic + (
+                3 * std_traffic
+            ):
+                anomalies.append(
+                    Anomaly(
+                        anomaly_type="traffic_spike",
+                        description=f"Unusual traffic spike detected. Peak: {max_traffic} requests/hour",
+                        severity="medium",
+                        confidence=0.7,
+                        affected_components=["infrastructure"],
+                        time_window=(hours[0], hours[-1]),
+                        baseline_value=mean_traffic,
+                        anomalous_value=max_traffic,
+                        deviation_score=(max_traffic - mean_traffic)
+                        / max(std_traffic, 1),
+                    )
+                )
+
+        return anomalies
+
+    def prediction_results(self) -> list[PredictiveInsight]:
+        """Finalize predictive insights from hourly buckets."""
+        predictions = []
+        hours = sorted(self.hours)
+
+        # 1. Error trend prediction
+        recent_errors = [
+            self.hours[hour].errors for hour in hours if self.hours[hour].errors
+        ][-6:]
+        if len(recent_errors) >= 6:
+            x = list(range(len(recent_errors)))
+            mean_x = statistics.mean(x)
+            mean_errors = statistics.mean(recent_errors)
+            slope = sum(
+                (x[i] - mean_x) * (recent_errors[i] - mean_errors) for i in x
+            ) / sum((x[i] - mean_x) ** 2 for i in x)
+            if slope > 0.5:  # Increasing trend
+                predictions.append(
+                    PredictiveInsight(
+                        prediction_type="error_trend",
+                        prediction="Error rates are trending upward. System stability may degrade if current trend continues.",
+                        confidence=0.7,
+                        time_horizon="next_6_hours",
+                        supporting_data={
+                            "recent_error_counts": recent_errors,
+                            "trend_slope": slope,
+                            "analysis_period": "6_hours",
+                        },
+                        recommended_actions=[
+                            "Monitor error logs closely",
+                            "Prepare incident response procedures",
+                            "Consider scaling resources",
+                            "Review recent deployments",
+                        ],
+                        risk_level="medium" if slope < 1.0 else "high",
+                    )
+                )
+
+        # 2. Performance degradation prediction
+        timed_hours = [hour for hour in hours if self.hours[hour].response_time_count]
+        timed_count = sum(self.hours[hour].response_time_count for hour in timed_hours)
+        if timed_count > 50 and len(timed_hours) >= 4:
+            recent_performance = [
+                self.hours[hour].response_time_sum
+                / self.hours[hour].response_time_count
+                for hour in timed_hours[-4:]
+            ]
+            improvement = (
+                recent_performance[0] - recent_performance[-1]
+            ) / recent_performance[0]
+            if improvement < -0.2:  # 20% degradation
+                predictions.append(
+                    PredictiveInsight(
+                        prediction_type="performance_degradation",
+                        prediction="Performance is degrading. Response times may continue to increase without intervention.",
+                        confidence=0.65,
+                        time_horizon="next_4_hours",
+                        supporting_data={
+                            "recent_avg_response_times": recent_performance,
+                            "degradation_percentage": abs(improvement * 100),
+                            "analysis_period": "4_hours",
+                        },
+                        recommended_actions=[
+                            "Investigate performance bottlenecks",
+                            "Check system resource usage",
+                            "Review database query performance",
+                            "Consider horizontal scaling",
+                        ],
+                        risk_level="medium" if abs(improvement) < 0.5 else "high",
+                    )
+                )
+
+        # 3. Security threat escalation prediction
+        recent_security_activity = [
+            self.hours[hour].security_events
+            for hour in hours
+            if self.hours[hour].security_events
+        ][-6:]
+        if len(recent_security_activity) > 3 and sum(recent_security_activity) > 20:
+            total_recent_events = sum(recent_security_activity)
+            unique_ips_count = len(set().union(*self.security_ips_by_hour.values()))
+            predictions.append(
+                PredictiveInsight(
+                    prediction_type="security_threat_escalation",
+                    prediction=f"Elevated security activity detected. {total_recent_events} suspicious events from {unique_ips_count} unique IPs. Monitor for potential coordinated attack.",
+                    confidence=0.6,
+                    time_horizon="next_2_hours",
+                    supporting_data={
+                        "recent_security_events": recent_security_activity,
+                        "unique_source_ips": unique_ips_count,
+                        "total_events": total_recent_events,
+                    },
+                    recommended_actions=[
+                        "Enable additional security monitoring",
+                        "Review firewall rules",
+                        "Consider implementing rate limiting",
+                        "Prepare incident response plan",
+                    ],
+                    risk_level="high" if total_recent_events > 50 else "medium",
+                )
+            )
+
+        return predictions
+
+
+def split_log_file(path: Path, chunk_size: int) -> list[tuple[int, int]]:
+    """Split a file into byte ranges of roughly ``chunk_size`` bytes."""
+    size = path.stat().st_size
+    if size == 0:
+        return []
+    return [
+        (start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)
+    ]
+
+
+def analyze_log_range(
+    path: str,
+    start: int,
+    end: int,
+    start_time: datetime,
+    end_time: datetime,
+    sample_size: int = 20,
+) -> StreamingAnalysisState:
+    """
+    Analyze the lines whose first byte falls in ``[start, end)``.
+
+    Runs inside worker processes; a line straddling ``start`` belongs to the
+    previous range, so every line is analyzed exactly once.
+    """
+    parser = LogParser()
+    state = StreamingAnalysisState(sample_size=sample_size)
+
+    with open(path, "rb") as f:
+        if start > 0:
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                f.readline()  # Skip the partial line owned by the previous range
+        position = f.tell()
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            log_entry = parser.parse_log_line(line.decode("utf-8", errors="ignore"))
+            if log_entry and start_time <= log_entry.timestamp <= end_time:
+                state.add(log_entry)
+
+    return state
+
+
 # ============================================================================
 # Output Formatters
 # ============================================================================
@@ -1542,6 +2421,9 @@ Examples:
 
   # Focus on performance issues
   python log_analyzer.py /var/log/*.log --analysis performance_bottlenecks --timeframe 6h
+
+  # Stream very large logs across 8 worker processes
+  python log_analyzer.py /var/log/*.log --streaming --workers 8
         """,
     )
 
@@ -1576,6 +2458,18 @@ Examples:
         help="Cache directory for analysis data. Default: /tmp/log_analysis_cache",
     )
 
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Single-pass, bounded-memory analysis split across worker processes",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for --streaming. Default: CPU count",
+    )
+
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
@@ -1603,12 +2497,20 @@ Examples:
         logger.info(f"Starting analysis of {len(args.log_files)} log sources")
 
         # Run analysis
-        results = engine.analyze_logs(
-            log_sources=args.log_files,
-            timeframe=args.timeframe,
-            analysis_types=analysis_types,
-            output_format=args.format,
-        )
+        if args.streaming:
+            results = engine.analyze_logs_streaming(
+                log_sources=args.log_files,
+                timeframe=args.timeframe,
+                analysis_types=analysis_types,
+                workers=args.workers,
+            )
+        else:
+            results = engine.analyze_logs(
+                log_sources=args.log_files,
+                timeframe=args.timeframe,
+                analysis_types=analysis_types,
+                output_format=args.format,
+            )
 
         # Format output
         formatted_output = OutputFormatter.format_results(results, args.format)
@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -297,6 +298,49 @@ class WebAPILibraryController(BaseLibraryController):
         Raises:
             ValueError: If RAG service unavailable or document not found
         """
+        rag_service = self._prepare_document_index(document_id)
+
+        # Execute query
+        try:
+            return rag_service.query(query)
+        except Exception as e:
+            logger.error(f"Query execution failed for document {document_id}: {e}")
+            raise ValueError(f"Query execution failed: {e}") from e
+
+    def stream_query_document(self, document_id: int, query: str) -> Iterator[str]:
+        """
+        Query a document, yielding answer tokens as they are generated.
+        Args:
+            document_id: ID of the document to query
+            query: Search query to execute against the document
+        Returns:
+            Iterator over answer text deltas
+        Raises:
+            ValueError: If RAG service unavailable, document not found, or
+                the query fails
+        """
+        rag_service = self._prepare_document_index(document_id)
+
+        try:
+            yield from rag_service.stream_query(query)
+        except Exception as e:
+            logger.error(f"Streaming query failed for document {document_id}: {e}")
+            raise ValueError(f"Query execution failed: {e}") from e
+
+    def get_index_status(self, document_id: int) -> dict[str, Any]:
+        """
+        Get the vector index status for a document.
+        Args:
+            document_id: ID of the document to check
+        Returns:
+            Index status including a "can_query" flag
+        """
+        if not self.enhanced_rag_service:
+            return {"document_id": document_id, "can_query": False}
+        return self.enhanced_rag_service.get_document_index_status(document_id)
+
+    def _prepare_document_index(self, document_id: int) -> EnhancedRAGService:
+        """Validate the document and make its vector index the current one."""
         if not self.enhanced_rag_service:
             raise ValueError("Enhanced RAG service not available for document querying")
 
@@ -315,13 +359,7 @@ class WebAPILibraryController(BaseLibraryController):
                     f"Failed to build or load vector index for document {document_id}. "
                     "Check document file accessibility and vector service config."
                 )
-
-        # Execute query
-        try:
-            return self.enhanced_rag_service.query(query)
-        except Exception as e:
-            logger.error(f"Query execution failed for document {document_id}: {e}")
-            raise ValueError(f"Query execution failed: {e}") from e
+        return self.enhanced_rag_service
 
 
 class DesktopLibraryController(BaseLibraryController):
@@ -0,0 +1,147 @@
+"""
+Database Executor
+Runs blocking sqlite3 work on dedicated database threads so async callers
+(API routes) await a future instead of stalling the event loop. A slow query
+holds one of the database threads; everything else keeps flowing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from src.database.connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# Executor of the async transaction the current task is inside, if any. Work
+# submitted from inside the transaction must run on its thread, since SQLite
+# transactions belong to the connection that thread holds.
+_transaction_executor: contextvars.ContextVar[ThreadPoolExecutor | None] = (
+    contextvars.ContextVar("database_transaction_executor", default=None)
+)
+
+
+class DatabaseExecutor:
+    """
+    {
+        "name": "DatabaseExecutor",
+        "version": "1.0.0",
+        "description": "Dedicated database threads for async callers.",
+        "dependencies": ["DatabaseConnection"],
+        "interface": {
+            "inputs": ["func: Callable", "db: DatabaseConnection"],
+            "outputs": "Awaitable results and async transactions"
+        }
+    }
+    Pool of threads reserved for database calls. ``run()`` schedules a call
+    and returns its result as an awaitable; ``transaction()`` pins every call
+    made inside the block to one thread holding the transaction open.
+    """
+
+    DEFAULT_WORKERS = 8
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS) -> None:
+        """
+        Initialize database executor.
+        Args:
+            max_workers: Number of database threads
+        """
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="db"
+        )
+
+    async def run(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Run a blocking database call on a database thread.
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        Returns:
+            Whatever func returns
+        """
+        executor = _transaction_executor.get() or self._executor
+        call = functools.partial(func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+    @asynccontextmanager
+    async def transaction(
+        self, db: DatabaseConnection, savepoint_name: str | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Async counterpart of DatabaseConnection.transaction().
+
+        The transaction is opened on a thread of its own, and every ``run()``
+        awaited inside the block (directly or through an async repository)
+        executes there, so it sees the uncommitted changes. Nested blocks
+        become savepoints on the same thread.
+        Args:
+            db: Database connection to open the transaction on
+            savepoint_name: Optional savepoint name for nested transactions
+        Usage:
+            async with executor.transaction(db):
+                await repo.update(document)
+                await repo.delete(other_id)
+        """
+        loop = asyncio.get_running_loop()
+        outer = _transaction_executor.get()
+        executor = outer or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="db-transaction"
+        )
+        token = _transaction_executor.set(executor)
+        context = db.transaction(savepoint_name)
+        try:
+            await loop.run_in_executor(executor, context.__enter__)
+            try:
+                yield
+            except BaseException as exc:
+                # Also covers cancellation: roll back before propagating
+                await loop.run_in_executor(
+                    executor, context.__exit__, type(exc), exc, exc.__traceback__
+                )
+                raise
+            else:
+                await loop.run_in_executor(executor, context.__exit__, None, None, None)
+        finally:
+            _transaction_executor.reset(token)
+            if outer is None:
+                # Hand the thread's pooled connection back before it exits
+                await loop.run_in_executor(executor, db.close_connection)
+                executor.shutdown(wait=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Database thread statistics."""
+        return {
+            "max_workers": self.max_workers,
+            "threads": len(self._executor._threads),
+            "queued": self._executor._work_queue.qsize(),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and optionally wait for running calls."""
+        self._executor.shutdown(wait=wait)
+
+
+_database_executor: DatabaseExecutor | None = None
+_database_executor_lock = threading.Lock()
+
+
+def get_database_executor() -> DatabaseExecutor:
+    """Get the process-wide database executor."""
+    global _database_executor
+    if _database_executor is None:
+        with _database_executor_lock:
+            if _database_executor is None:
+                _database_executor = DatabaseExecutor()
+    return _database_executor
@@ -0,0 +1,75 @@
+"""
+Migration 010: Citation keyset pagination indexes
+
+Adds composite indexes matching the citation search order
+(COALESCE(publication_year, 0) DESC, id DESC) so that cursor pages are
+served by an index range scan regardless of depth, optionally narrowed by
+document or citation type.
+"""
+
+import logging
+
+try:
+    from ..base import BaseMigration
+except ImportError:
+    import sys
+    from pathlib import Path
+
+    sys.path.append(str(Path(__file__).parent.parent))
+    from base import BaseMigration
+
+logger = logging.getLogger(__name__)
+
+
+class AddCitationKeysetIndexesMigration(BaseMigration):
+    """Create indexes backing keyset-paginated citation search."""
+
+    KEYSET_INDEXES = {
+        "idx_citations_keyset": (
+            "CREATE INDEX IF NOT EXISTS idx_citations_keyset "
+            "ON citations(COALESCE(publication_year, 0), id)"
+        ),
+        "idx_citations_document_keyset": (
+            "CREATE INDEX IF NOT EXISTS idx_citations_document_keyset "
+            "ON citations(document_id, COALESCE(publication_year, 0), id)"
+        ),
+        "idx_citations_type_keyset": (
+            "CREATE INDEX IF NOT EXISTS idx_citations_type_keyset "
+            "ON citations(citation_type, COALESCE(publication_year, 0), id)"
+        ),
+    }
+
+    @property
+    def version(self) -> int:
+        return 10
+
+    @property
+    def description(self) -> str:
+        return "Add composite indexes for keyset-paginated citation search"
+
+    @property
+    def dependencies(self) -> list[int]:
+        return [3]  # Requires citation tables
+
+    @property
+    def rollback_supported(self) -> bool:
+        return True  # Can drop indexes safely
+
+    def up(self) -> None:
+        """Create keyset indexes."""
+        logger.info("Creating citation keyset pagination indexes")
+
+        for index_name, index_sql in self.KEYSET_INDEXES.items():
+            self.create_index_if_not_exists(index_name, index_sql)
+
+        try:
+            self.execute_sql("ANALYZE citations")
+        except Exception as e:
+            logger.warning(f"Could not analyze citations table: {e}")
+
+    def down(self) -> None:
+        """Drop keyset indexes."""
+        logger.info("Dropping citation keyset pagination indexes")
+
+        for index_name in self.KEYSET_INDEXES:
+            self.execute_sql(f"DROP INDEX IF EXISTS {index_name}")
@@ -0,0 +1,123 @@
+"""
+Migration 011: Citation natural keys
+
+Adds unique indexes on the natural keys of citations and citation relations
+so bulk ingestion can resolve duplicates with INSERT ... ON CONFLICT.
+
+- citations: (document_id, raw_text)
+- citation_relations: (source_citation_id, relation_type, target_document_id,
+  target_citation_id), with missing targets treated as 0
+
+Existing duplicates are merged first: relations are repointed to the oldest
+citation of each duplicate group and the newer copies are deleted. Rollback
+drops the indexes but does not restore merged rows.
+"""
+
+import logging
+
+try:
+    from ..base import BaseMigration
+except ImportError:
+    import sys
+    from pathlib import Path
+
+    sys.path.append(str(Path(__file__).parent.parent))
+    from base import BaseMigration
+
+logger = logging.getLogger(__name__)
+
+
+class AddCitationNaturalKeysMigration(BaseMigration):
+    """Create unique natural-key indexes backing citation UPSERTs."""
+
+    NATURAL_KEY_INDEXES = {
+        "idx_citations_natural_key": (
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_citations_natural_key "
+            "ON citations(document_id, raw_text)"
+        ),
+        "idx_citation_relations_natural_key": (
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_citation_relations_natural_key "
+            "ON citation_relations(source_citation_id, relation_type, "
+            "COALESCE(target_document_id, 0), COALESCE(target_citation_id, 0))"
+        ),
+    }
+
+    @property
+    def version(self) -> int:
+        return 11
+
+    @property
+    def description(self) -> str:
+        return "Add unique natural-key indexes for bulk citation ingestion"
+
+    @property
+    def dependencies(self) -> list[int]:
+        return [3]  # Requires citation tables
+
+    @property
+    def rollback_supported(self) -> bool:
+        return True  # Can drop indexes safely
+
+    def up(self) -> None:
+        """Merge duplicates and create natural-key indexes."""
+        logger.info("Creating citation natural-key indexes")
+
+        self._merge_duplicate_citations()
+        self._delete_duplicate_relations()
+
+        for index_name, index_sql in self.NATURAL_KEY_INDEXES.items():
+            self.create_index_if_not_exists(index_name, index_sql)
+
+    def down(self) -> None:
+        """Drop natural-key indexes."""
+        logger.info("Dropping citation natural-key indexes")
+
+        for index_name in self.NATURAL_KEY_INDEXES:
+            self.execute_sql(f"DROP INDEX IF EXISTS {index_name}")
+
+    def _merge_duplicate_citations(self) -> None:
+        """Keep the oldest citation per natural key and repoint relations to it."""
+        self.execute_sql("DROP TABLE IF EXISTS temp.citation_id_map")
+        self.execute_sql("""
+            CREATE TEMP TABLE citation_id_map AS
+            SELECT c.id AS old_id, k.keep_id
+            FROM citations c
+            JOIN (
+                SELECT document_id, raw_text, MIN(id) AS keep_id
+                FROM citations
+                GROUP BY document_id, raw_text
+                HAVING COUNT(*) > 1
+            ) k ON c.document_id = k.document_id AND c.raw_text = k.raw_text
+            WHERE c.id <> k.keep_id
+            """)
+
+        result = self.db.fetch_one("SELECT COUNT(*) AS count FROM citation_id_map")
+        duplicates = result["count"] if result else 0
+        if duplicates:
+            for column in ("source_citation_id", "target_citation_id"):
+                self.execute_sql(f"""
+                    UPDATE citation_relations
+                    SET {column} = (
+                        SELECT keep_id FROM citation_id_map WHERE old_id = {column}
+                    )
+                    WHERE {column} IN (SELECT old_id FROM citation_id_map)
+                    """)  # noqa: S608 - fixed column names
+            self.execute_sql(
+                "DELETE FROM citations WHERE id IN (SELECT old_id FROM citation_id_map)"
+            )
+            logger.info(f"Merged {duplicates} duplicate citations")
+
+        self.execute_sql("DROP TABLE citation_id_map")
+
+    def _delete_duplicate_relations(self) -> None:
+        """Keep the oldest relation per natural key."""
+        cursor = self.execute_sql("""
+            DELETE FROM citation_relations
+            WHERE id NOT IN (
+                SELECT MIN(id) FROM citation_relations
+                GROUP BY source_citation_id, relation_type,
+                    COALESCE(target_document_id, 0), COALESCE(target_citation_id, 0)
+            )
+            """)
+        if cursor is not None and cursor.rowcount > 0:
+            logger.info(f"Deleted {cursor.rowcount} duplicate citation relations")
@@ -0,0 +1,132 @@
+"""
+Migration 012: Document keyset pagination and counters
+
+Adds a (sort key, id) index for every sortable document column so that
+cursor pages of the document list and title search are served by index
+seeks regardless of depth, plus a trigger-maintained document_stats row
+holding the total document count and a generation number that changes
+whenever the count or any title changes (used to cache search totals).
+"""
+
+import logging
+
+try:
+    from ..base import BaseMigration
+except ImportError:
+    import sys
+    from pathlib import Path
+
+    sys.path.append(str(Path(__file__).parent.parent))
+    from base import BaseMigration
+
+logger = logging.getLogger(__name__)
+
+
+class AddDocumentKeysetIndexesMigration(BaseMigration):
+    """Create document keyset indexes and the counter table."""
+
+    KEYSET_INDEXES = {
+        "idx_documents_keyset_created": (
+            "CREATE INDEX IF NOT EXISTS idx_documents_keyset_created "
+            "ON documents(COALESCE(created_at, ''), id)"
+        ),
+        "idx_documents_keyset_updated": (
+            "CREATE INDEX IF NOT EXISTS idx_documents_keyset_updated "
+            "ON documents(COALESCE(updated_at, ''), id)"
+        ),
+        "idx_documents_keyset_accessed": (
+            "CREATE INDEX IF NOT EXISTS idx_documents_keyset_accessed "
+            "ON documents(COALESCE(last_accessed, ''), id)"
+        ),
+        "idx_documents_keyset_title": (
+            "CREATE INDEX IF NOT EXISTS idx_documents_keyset_title "
+            "ON documents(title, id)"
+        ),
+        "idx_documents_keyset_size": (
+            "CREATE INDEX IF NOT EXISTS idx_documents_keyset_size "
+            "ON documents(file_size, id)"
+        ),
+    }
+
+    COUNTER_TRIGGERS = {
+        "trg_document_stats_insert": """
+            CREATE TRIGGER IF NOT EXISTS trg_document_stats_insert
+            AFTER INSERT ON documents
+            BEGIN
+                UPDATE document_stats
+                SET document_count = document_count + 1,
+                    generation = generation + 1
+                WHERE id = 1;
+            END
+        """,
+        "trg_document_stats_delete": """
+            CREATE TRIGGER IF NOT EXISTS trg_document_stats_delete
+            AFTER DELETE ON documents
+            BEGIN
+                UPDATE document_stats
+                SET document_count = document_count - 1,
+                    generation = generation + 1
+                WHERE id = 1;
+            END
+        """,
+        "trg_document_stats_title": """
+            CREATE TRIGGER IF NOT EXISTS trg_document_stats_title
+            AFTER UPDATE OF title ON documents
+            WHEN OLD.title IS NOT NEW.title
+            BEGIN
+                UPDATE document_stats SET generation = generation + 1 WHERE id = 1;
+            END
+        """,
+    }
+
+    @property
+    def version(self) -> int:
+        return 12
+
+    @property
+    def description(self) -> str:
+        return "Add document keyset indexes and trigger-maintained counters"
+
+    @property
+    def dependencies(self) -> list[int]:
+        return [1]  # Requires documents table
+
+    @property
+    def rollback_supported(self) -> bool:
+        return True  # Indexes, triggers and the counter table can be dropped
+
+    def up(self) -> None:
+        """Create keyset indexes, the counter table and its triggers."""
+        logger.info("Creating document keyset indexes and counters")
+
+        for index_name, index_sql in self.KEYSET_INDEXES.items():
+            self.create_index_if_not_exists(index_name, index_sql)
+
+        self.execute_sql("""
+            CREATE TABLE IF NOT EXISTS document_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                document_count INTEGER NOT NULL,
+                generation INTEGER NOT NULL DEFAULT 0
+            )
+            """)
+        self.execute_sql("""
+            INSERT OR REPLACE INTO document_stats (id, document_count, generation)
+            SELECT 1, COUNT(*), 0 FROM documents
+            """)
+        for trigger_sql in self.COUNTER_TRIGGERS.values():
+            self.execute_sql(trigger_sql)
+
+        try:
+            self.execute_sql("ANALYZE documents")
+        except Exception as e:
+            logger.warning(f"Could not analyze documents table: {e}")
+
+    def down(self) -> None:
+        """Drop keyset indexes, triggers and the counter table."""
+        logger.info("Dropping document keyset indexes and counters")
+
+        for trigger_name in self.COUNTER_TRIGGERS:
+            self.execute_sql(f"DROP TRIGGER IF EXISTS {trigger_name}")
+        self.execute_sql("DROP TABLE IF EXISTS document_stats")
+        for index_name in self.KEYSET_INDEXES:
+            self.execute_sql(f"DROP INDEX IF EXISTS {index_name}")
@@ -0,0 +1,65 @@
+"""
+Migration 013: Document MinHash signatures
+
+Adds the document_signatures table holding one MinHash signature per
+document and signature kind (title, or extracted content). Signatures are
+computed once and loaded into the in-memory LSH index used for near-duplicate
+detection; source_digest identifies the shingles a signature was built from
+so stale rows are recomputed after a document is retitled.
+"""
+
+import logging
+
+try:
+    from ..base import BaseMigration
+except ImportError:
+    import sys
+    from pathlib import Path
+
+    sys.path.append(str(Path(__file__).parent.parent))
+    from base import BaseMigration
+
+logger = logging.getLogger(__name__)
+
+
+class AddDocumentSignaturesMigration(BaseMigration):
+    """Create the document_signatures table."""
+
+    @property
+    def version(self) -> int:
+        return 13
+
+    @property
+    def description(self) -> str:
+        return "Add document MinHash signatures for near-duplicate detection"
+
+    @property
+    def dependencies(self) -> list[int]:
+        return [1]  # Requires documents table
+
+    @property
+    def rollback_supported(self) -> bool:
+        return True  # Signatures are derived data and can be rebuilt
+
+    def up(self) -> None:
+        """Create the signature table."""
+        logger.info("Creating document_signatures table")
+
+        self.execute_sql("""
+            CREATE TABLE IF NOT EXISTS document_signatures (
+                document_id INTEGER NOT NULL,
+                kind TEXT NOT NULL CHECK (kind IN ('title', 'content')),
+                num_perm INTEGER NOT NULL,
+                source_digest INTEGER NOT NULL,
+                signature BLOB NOT NULL,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (document_id, kind),
+                FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+            """)
+
+    def down(self) -> None:
+        """Drop the signature table."""
+        logger.info("Dropping document_signatures table")
+
+        self.execute_sql("DROP TABLE IF EXISTS document_signatures")
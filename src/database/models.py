@@ -22,6 +22,36 @@ def safe_get(row_obj, key) -> Any:
             return None
 
 
+class LazyJSONField:
+    """
+    Dataclass field descriptor for a JSON column decoded on first access.
+
+    Assigning a ``str`` stores the column text as-is; reading the attribute
+    decodes it once and caches the result, and ``None`` reads as ``{}``.
+    Rows that are listed but never have the field read skip json.loads.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}_value"
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return None  # Dataclass default
+        value = obj.__dict__.get(self._attr)
+        if value is None or isinstance(value, str):
+            value = json.loads(value) if value else {}
+            obj.__dict__[self._attr] = value
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self._attr] = value
+
+    def raw(self, obj: Any) -> str | None:
+        """Column text if the value has not been decoded yet."""
+        value = obj.__dict__.get(self._attr)
+        return value if isinstance(value, str) else None
+
+
 @dataclass
 class DocumentModel:
     """
@@ -53,8 +83,8 @@ class DocumentModel:
     last_accessed: datetime | None = None
     # Database ID (set after insertion)
     id: int | None = None
-    # Metadata as JSON dict
-    metadata: dict[str, Any] | None = None
+    # Metadata as JSON dict, decoded from the row on first access
+    metadata: dict[str, Any] | None = LazyJSONField()  # type: ignore[assignment]
     # Tags as comma-separated string
     tags: str = ""
     # Internal flag to distinguish between new creation and database loading
@@ -69,9 +99,7 @@ class DocumentModel:
                 self.created_at = datetime.now()
             if self.updated_at is None:
                 self.updated_at = self.created_at
-        # Initialize metadata if not provided
-        if self.metadata is None:
-            self.metadata = {}
+        # Metadata defaults to {} on read (see LazyJSONField)
         # Normalize file type; fallback to path extension if missing
         normalized_type = self._normalize_file_type(self.file_type)
         if not normalized_type and self.file_path:
@@ -137,9 +165,6 @@ class DocumentModel:
         last_accessed = (
             datetime.fromisoformat(last_accessed_str) if last_accessed_str else None
         )
-        # Parse metadata JSON
-        metadata_str = safe_get(row, "metadata")
-        metadata = json.loads(metadata_str) if metadata_str else {}
         return cls(
             id=row["id"],
             title=row["title"],
@@ -152,7 +177,8 @@ class DocumentModel:
             created_at=created_at,
             updated_at=updated_at,
             last_accessed=last_accessed,
-            metadata=metadata,
+            # Kept as JSON text until read; absent in projected rows
+            metadata=safe_get(row, "metadata"),
             tags=safe_get(row, "tags") or "",
             _from_database=True,
         )
@@ -177,10 +203,17 @@ class DocumentModel:
             "last_accessed": (
                 self.last_accessed.isoformat() if self.last_accessed else None
             ),
-            "metadata": json.dumps(self.metadata) if self.metadata else "{}",
+            "metadata": self._metadata_json(),
             "tags": self.tags,
         }
 
+    def _metadata_json(self) -> str:
+        """Metadata as column text, reusing the loaded text if never decoded."""
+        raw = DocumentModel.__dict__["metadata"].raw(self)
+        if raw is not None:
+            return raw
+        return json.dumps(self.metadata) if self.metadata else "{}"
+
     def to_api_dict(self) -> dict[str, Any]:
         """
         Convert model to dictionary for API responses.
@@ -9,7 +9,12 @@ import logging
 from typing import Any
 
 from .connection import DatabaseConnection
-from .migrations import MigrationManager, MigrationRunner, VersionTracker
+from .migrations import (
+    CURRENT_VERSION,
+    MigrationManager,
+    MigrationRunner,
+    VersionTracker,
+)
 from .migrations.base import MigrationError
 
 logger = logging.getLogger(__name__)
@@ -23,7 +28,8 @@ class ModularDatabaseMigrator:
     using the new modular migration system underneath.
     """
 
-    CURRENT_VERSION = 8  # Updated to include multi-document tables
+    # Single source of truth: the migrations package constant
+    CURRENT_VERSION = CURRENT_VERSION
 
     def __init__(self, db_connection: DatabaseConnection) -> None:
         """
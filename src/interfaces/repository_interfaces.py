@@ -5,6 +5,7 @@ following the Interface Segregation Principle (ISP).
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
 from typing import Any, Generic, TypeVar
 
 from src.database.models import (
@@ -90,11 +91,43 @@ class IDocumentRepository(IRepository[DocumentModel]):
         """Get all documents with pagination and sorting."""
         pass
 
+    @abstractmethod
+    def get_page(
+        self,
+        *,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        after: tuple[Any, int] | None = None,
+        offset: int = 0,
+        limit: int = 50,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[DocumentModel], tuple[Any, int] | None]:
+        """List documents one keyset page at a time."""
+        pass
+
+    @abstractmethod
+    def search_page(
+        self,
+        query: str,
+        *,
+        after: tuple[Any, int] | None = None,
+        offset: int = 0,
+        limit: int = 50,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[DocumentModel], tuple[Any, int] | None]:
+        """Search documents by title one keyset page at a time."""
+        pass
+
     @abstractmethod
     def count(self) -> int:
         """Get total document count."""
         pass
 
+    @abstractmethod
+    def count_search(self, query: str) -> int:
+        """Get the number of documents matching a search query."""
+        pass
+
 
 class IVectorIndexRepository(IRepository[VectorIndexModel]):
     """
@@ -159,6 +192,42 @@ class ICitationRepository(IRepository[CitationModel]):
         """Get citations by type (journal, conference, book, etc.)."""
         pass
 
+    @abstractmethod
+    def search_page(
+        self,
+        *,
+        author: str | None = None,
+        title: str | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        document_id: int | None = None,
+        citation_type: str | None = None,
+        doi: str | None = None,
+        min_confidence: float = 0.0,
+        after: tuple[int, int] | None = None,
+        limit: int = 50,
+    ) -> tuple[list[CitationModel], tuple[int, int] | None]:
+        """Search citations one keyset page at a time."""
+        pass
+
+    @abstractmethod
+    def iter_batches(
+        self,
+        *,
+        document_id: int | None = None,
+        author: str | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[CitationModel]]:
+        """Iterate over matching citations in id order, one batch at a time."""
+        pass
+
+    @abstractmethod
+    def bulk_upsert(self, citations: Sequence[CitationModel]) -> list[CitationModel]:
+        """Insert or update many citations in one transaction, assigning IDs."""
+        pass
+
     @abstractmethod
     def get_statistics(self) -> dict[str, Any]:
         """Get citation statistics."""
@@ -191,15 +260,34 @@ class ICitationRelationRepository(IRepository[CitationRelationModel]):
         pass
 
     @abstractmethod
-    def get_citation_network(self, document_id: int, depth: int = 1) -> dict[str, Any]:
+    def get_citation_network(
+        self, document_id: int, depth: int = 1, min_confidence: float = 0.0
+    ) -> dict[str, Any]:
         """Get citation network for a document up to specified depth."""
         pass
 
+    @abstractmethod
+    def get_connected_components(self, min_size: int = 1) -> list[dict[str, Any]]:
+        """Get groups of documents connected through citations."""
+        pass
+
+    @abstractmethod
+    def get_pagerank_scores(self, damping: float = 0.85) -> dict[int, float]:
+        """Get PageRank influence scores for documents in the citation graph."""
+        pass
+
     @abstractmethod
     def get_most_cited_documents(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get most cited documents in the library."""
         pass
 
+    @abstractmethod
+    def bulk_upsert(
+        self, relations: Sequence[CitationRelationModel]
+    ) -> list[CitationRelationModel]:
+        """Insert or update many relations in one transaction, assigning IDs."""
+        pass
+
     @abstractmethod
     def get_relations_by_source(
         self, source_document_id: int
@@ -4,8 +4,15 @@ This package provides data access layer implementations following Repository pat
 All database operations are encapsulated here to maintain separation of concerns.
 """
 
+from .async_repository import AsyncBaseRepository, AsyncDocumentRepository
 from .base_repository import BaseRepository
 from .document_repository import DocumentRepository
 from .vector_repository import VectorIndexRepository
 
-__all__ = ["BaseRepository", "DocumentRepository", "VectorIndexRepository"]
+__all__ = [
+    "AsyncBaseRepository",
+    "AsyncDocumentRepository",
+    "BaseRepository",
+    "DocumentRepository",
+    "VectorIndexRepository",
+]
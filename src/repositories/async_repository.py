@@ -0,0 +1,263 @@
+"""
+Async Repositories
+Awaitable counterparts of BaseRepository and DocumentRepository for async
+callers such as API routes. Each call runs the synchronous repository method
+on the database executor's threads, so queries never block the event loop.
+"""
+
+import logging
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+from src.database.executor import DatabaseExecutor, get_database_executor
+from src.database.models import DocumentModel
+from src.interfaces.repository_interfaces import IDocumentRepository
+
+from .base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+# Generic type for model classes
+T = TypeVar("T")
+
+
+class AsyncBaseRepository(Generic[T]):
+    """
+    {
+        "name": "AsyncBaseRepository",
+        "version": "1.0.0",
+        "description": "Awaitable wrapper around a synchronous repository.",
+        "dependencies": ["BaseRepository", "DatabaseExecutor"],
+        "interface": {
+            "inputs": ["repository: BaseRepository", "executor: DatabaseExecutor"],
+            "outputs": "Awaitable CRUD operations for database entities"
+        }
+    }
+    Async mirror of BaseRepository. Methods keep the names, arguments and
+    return values of the wrapped repository; only the calling convention
+    changes.
+    """
+
+    def __init__(
+        self,
+        repository: BaseRepository[T],
+        executor: DatabaseExecutor | None = None,
+    ) -> None:
+        """
+        Initialize async repository.
+        Args:
+            repository: Synchronous repository to delegate to
+            executor: Database executor (process-wide one when omitted)
+        """
+        self.repository = repository
+        self.executor = executor or get_database_executor()
+
+    @asynccontextmanager
+    async def transaction(
+        self, savepoint_name: str | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Run the awaited repository calls inside the block in one transaction.
+        Args:
+            savepoint_name: Optional savepoint name for nested transactions
+        """
+        async with self.executor.transaction(self.repository.db, savepoint_name):
+            yield
+
+    async def find_by_id(self, id: int) -> T | None:
+        """Find entity by ID."""
+        return await self.executor.run(self.repository.find_by_id, id)
+
+    async def find_all(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+        columns: Sequence[str] | None = None,
+    ) -> list[T]:
+        """Find all entities with optional pagination."""
+        return await self.executor.run(self.repository.find_all, limit, offset, columns)
+
+    async def count(self) -> int:
+        """Count total number of entities."""
+        return await self.executor.run(self.repository.count)
+
+    async def create(self, model: T) -> T:
+        """Create new entity."""
+        return await self.executor.run(self.repository.create, model)
+
+    async def update(self, model: T) -> T:
+        """Update existing entity."""
+        return await self.executor.run(self.repository.update, model)
+
+    async def delete(self, id: int) -> bool:
+        """Delete entity by ID."""
+        return await self.executor.run(self.repository.delete, id)
+
+    async def exists(self, id: int) -> bool:
+        """Check if entity exists by ID."""
+        return await self.executor.run(self.repository.exists, id)
+
+    async def find_by_field(
+        self, field: str, value: Any, columns: Sequence[str] | None = None
+    ) -> list[T]:
+        """Find entities by specific field value."""
+        return await self.executor.run(
+            self.repository.find_by_field, field, value, columns
+        )
+
+    async def execute_custom_query(
+        self, query: str, params: tuple[Any, ...] | None = None
+    ) -> list[T]:
+        """Execute custom query and return model objects."""
+        return await self.executor.run(
+            self.repository.execute_custom_query, query, params
+        )
+
+
+class AsyncDocumentRepository(AsyncBaseRepository[DocumentModel]):
+    """
+    {
+        "name": "AsyncDocumentRepository",
+        "version": "1.0.0",
+        "description": "Awaitable document repository for API routes.",
+        "dependencies": ["AsyncBaseRepository", "IDocumentRepository"],
+        "interface": {
+            "inputs": ["repository: IDocumentRepository"],
+            "outputs": "Awaitable document queries"
+        }
+    }
+    Async mirror of DocumentRepository. Accepts any IDocumentRepository, so
+    alternative implementations can be wrapped the same way.
+    """
+
+    repository: Any  # Any IDocumentRepository implementation
+
+    def __init__(
+        self,
+        repository: IDocumentRepository,
+        executor: DatabaseExecutor | None = None,
+    ) -> None:
+        super().__init__(repository, executor)  # type: ignore[arg-type]
+
+    async def get_by_id(self, entity_id: int) -> DocumentModel | None:
+        """Get a document by ID."""
+        return await self.executor.run(self.repository.get_by_id, entity_id)
+
+    async def get_by_ids(self, entity_ids: list[int]) -> list[DocumentModel]:
+        """Get multiple documents by their IDs."""
+        return await self.executor.run(self.repository.get_by_ids, entity_ids)
+
+    async def find_by_file_hash(self, file_hash: str) -> DocumentModel | None:
+        """Find document by file hash."""
+        return await self.executor.run(self.repository.find_by_file_hash, file_hash)
+
+    async def find_by_content_hash(self, content_hash: str) -> DocumentModel | None:
+        """Find document by content hash."""
+        return await self.executor.run(
+            self.repository.find_by_content_hash, content_hash
+        )
+
+    async def find_by_file_path(self, file_path: str) -> DocumentModel | None:
+        """Find document by file path."""
+        return await self.executor.run(self.repository.find_by_file_path, file_path)
+
+    async def search(
+        self, query: str, limit: int = 50, offset: int = 0
+    ) -> tuple[list[DocumentModel], int]:
+        """Search documents, returning the page and the total match count."""
+        return await self.executor.run(self.repository.search, query, limit, offset)
+
+    async def search_page(
+        self,
+        query: str,
+        *,
+        after: tuple[Any, int] | None = None,
+        offset: int = 0,
+        limit: int = 50,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[DocumentModel], tuple[Any, int] | None]:
+        """Search documents by title one keyset page at a time."""
+        return await self.executor.run(
+            self.repository.search_page,
+            query,
+            after=after,
+            offset=offset,
+            limit=limit,
+            columns=columns,
+        )
+
+    async def count_search(self, query: str) -> int:
+        """Count documents matching a title search."""
+        return await self.executor.run(self.repository.count_search, query)
+
+    async def get_all(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+    ) -> list[DocumentModel]:
+        """Get all documents with pagination and sorting."""
+        return await self.executor.run(
+            self.repository.get_all, limit, offset, sort_by, sort_order
+        )
+
+    async def get_page(
+        self,
+        *,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        after: tuple[Any, int] | None = None,
+        offset: int = 0,
+        limit: int = 50,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[DocumentModel], tuple[Any, int] | None]:
+        """List documents one keyset page at a time."""
+        return await self.executor.run(
+            self.repository.get_page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            after=after,
+            offset=offset,
+            limit=limit,
+            columns=columns,
+        )
+
+    async def find_recent_documents(self, limit: int = 20) -> list[DocumentModel]:
+        """Find recently accessed documents."""
+        return await self.executor.run(self.repository.find_recent_documents, limit)
+
+    async def find_by_size_range(
+        self, min_size: int | None = None, max_size: int | None = None
+    ) -> list[DocumentModel]:
+        """Find documents within a file size range."""
+        return await self.executor.run(
+            self.repository.find_by_size_range, min_size, max_size
+        )
+
+    async def find_by_date_range(
+        self, start_date: datetime | None = None, end_date: datetime | None = None
+    ) -> list[DocumentModel]:
+        """Find documents created within a date range."""
+        return await self.executor.run(
+            self.repository.find_by_date_range, start_date, end_date
+        )
+
+    async def update_access_time(self, document_id: int) -> bool:
+        """Update a document's last access time."""
+        return await self.executor.run(self.repository.update_access_time, document_id)
+
+    async def get_statistics(self) -> dict[str, Any]:
+        """Get document library statistics."""
+        return await self.executor.run(self.repository.get_statistics)
+
+    async def find_duplicates_by_content_hash(
+        self,
+    ) -> list[tuple[str, list[DocumentModel]]]:
+        """Find documents sharing a content hash."""
+        return await self.executor.run(self.repository.find_duplicates_by_content_hash)
+
+    async def advanced_search(self, **filters: Any) -> list[DocumentModel]:
+        """Search documents with DocumentRepository.advanced_search filters."""
+        return await self.executor.run(self.repository.advanced_search, **filters)
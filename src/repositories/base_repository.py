@@ -7,6 +7,8 @@ Follows the Repository pattern to encapsulate data access logic.
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any, Generic, TypeVar
 
 from src.database.connection import DatabaseConnection
@@ -15,6 +17,65 @@ logger = logging.getLogger(__name__)
 # Generic type for model classes
 T = TypeVar("T")
 
+IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+# Distinct statement shapes (kind, table, columns) kept as built SQL text.
+# Identical text also lets sqlite3 reuse its prepared statement.
+STATEMENT_CACHE_SIZE = 512
+
+STATEMENT_TEMPLATES = {
+    "select_by_id": "SELECT {columns} FROM {table} WHERE id = ?",
+    "select_by_ids": "SELECT {columns} FROM {table} WHERE id IN ({placeholders})",
+    "select_all": "SELECT {columns} FROM {table} ORDER BY id",
+    "select_page": "SELECT {columns} FROM {table} ORDER BY id LIMIT ? OFFSET ?",
+    "select_by_field": "SELECT {columns} FROM {table} WHERE {field} = ?",
+    "count": "SELECT COUNT(*) as count FROM {table}",
+    "exists": "SELECT 1 FROM {table} WHERE id = ? LIMIT 1",
+    "insert": "INSERT INTO {table} ({names}) VALUES ({placeholders})",
+    "insert_returning": (
+        "INSERT INTO {table} ({names}) VALUES ({placeholders}) RETURNING id"
+    ),
+    "update": "UPDATE {table} SET {assignments} WHERE id = ?",
+    "delete": "DELETE FROM {table} WHERE id = ?",
+}
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def build_statement(
+    kind: str,
+    table: str,
+    columns: tuple[str, ...] = (),
+    field: str = "",
+    placeholders: int = 0,
+) -> str:
+    """
+    Build (once per shape) the SQL for a repository operation.
+    Args:
+        kind: Key of STATEMENT_TEMPLATES
+        table: Table name
+        columns: Selected columns (empty selects all) or written columns
+        field: Column filtered on by select_by_field
+        placeholders: Number of ids for select_by_ids
+    Returns:
+        SQL text
+    Raises:
+        ValueError: If an identifier is not a plain SQL name
+    """
+    if not IDENTIFIER_PATTERN.match(table):
+        raise ValueError(f"Invalid table name: {table}")
+    if field and not IDENTIFIER_PATTERN.match(field):
+        raise ValueError(f"Invalid field name: {field}")
+    for column in columns:
+        if not IDENTIFIER_PATTERN.match(column):
+            raise ValueError(f"Invalid column name: {column}")
+    return STATEMENT_TEMPLATES[kind].format(
+        table=table,
+        columns=", ".join(columns) if columns else "*",
+        names=", ".join(columns),
+        placeholders=", ".join("?" * (placeholders or len(columns))),
+        assignments=", ".join(f"{column} = ?" for column in columns),
+        field=field,
+    )
+
 
 class BaseRepository(ABC, Generic[T]):
     """
@@ -80,7 +141,23 @@ class BaseRepository(ABC, Generic[T]):
         Returns:
             True if valid, False otherwise
         """
-        return bool(re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", table_name))
+        return bool(IDENTIFIER_PATTERN.match(table_name))
+
+    def _statement(
+        self,
+        kind: str,
+        columns: Sequence[str] | None = None,
+        field: str = "",
+        placeholders: int = 0,
+    ) -> str:
+        """SQL for an operation on this repository's table, from the cache."""
+        return build_statement(
+            kind,
+            self.get_table_name(),
+            tuple(columns) if columns else (),
+            field,
+            placeholders,
+        )
 
     def find_by_id(self, id: int) -> T | None:
         """
@@ -91,13 +168,7 @@ class BaseRepository(ABC, Generic[T]):
             Model object or None if not found
         """
         try:
-            # Use parameterized query with table name validation
-            table_name = self.get_table_name()
-            # Validate table name to prevent SQL injection
-            if not self._is_valid_table_name(table_name):
-                raise ValueError(f"Invalid table name: {table_name}")
-            query = f"SELECT * FROM {table_name} WHERE id = ?"  # noqa: S608 - table name validated
-            row = self.db.fetch_one(query, (id,))
+            row = self.db.fetch_one(self._statement("select_by_id"), (id,))
             if row:
                 return self.to_model(dict(row))
             return None
@@ -105,27 +176,29 @@ class BaseRepository(ABC, Generic[T]):
             logger.error(f"Failed to find {self.get_table_name()} by ID {id}: {e}")
             raise
 
-    def find_all(self, limit: int | None = None, offset: int = 0) -> list[T]:
+    def find_all(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+        columns: Sequence[str] | None = None,
+    ) -> list[T]:
         """
         Find all entities with optional pagination.
         Args:
             limit: Maximum number of records to return
             offset: Number of records to skip
+            columns: Columns to load (all when omitted); the model must
+                accept rows without the others
         Returns:
             List of model objects
         """
         try:
-            table_name = self.get_table_name()
-            if not self._is_valid_table_name(table_name):
-                raise ValueError(f"Invalid table name: {table_name}")
-
             if limit is not None:
                 # Use parameterized query for pagination
-                query = f"SELECT * FROM {table_name} ORDER BY id LIMIT ? OFFSET ?"  # noqa: S608 - table name validated
+                query = self._statement("select_page", columns)
                 rows = self.db.fetch_all(query, (limit, offset))
             else:
-                query = f"SELECT * FROM {table_name} ORDER BY id"  # noqa: S608 - table name validated
-                rows = self.db.fetch_all(query)
+                rows = self.db.fetch_all(self._statement("select_all", columns))
             return [self.to_model(dict(row)) for row in rows]
         except Exception as e:
             logger.error(f"Failed to find all {self.get_table_name()}: {e}")
@@ -138,11 +211,7 @@ class BaseRepository(ABC, Generic[T]):
             Total count
         """
         try:
-            table_name = self.get_table_name()
-            if not self._is_valid_table_name(table_name):
-                raise ValueError(f"Invalid table name: {table_name}")
-            query = f"SELECT COUNT(*) as count FROM {table_name}"  # noqa: S608 - table name validated
-            result = self.db.fetch_one(query)
+            result = self.db.fetch_one(self._statement("count"))
             return result["count"] if result else 0
         except Exception as e:
             logger.error(f"Failed to count {self.get_table_name()}: {e}")
@@ -160,18 +229,13 @@ class BaseRepository(ABC, Generic[T]):
             db_dict = self.to_database_dict(model)
             # Remove ID if present (will be auto-generated)
             db_dict.pop("id", None)
-            # Build INSERT query
             columns = list(db_dict.keys())
-            placeholders = ", ".join(["?" for _ in columns])
             values = [db_dict[col] for col in columns]
-            cols = ", ".join(columns)
             table_name = self.get_table_name()
-            if not self._is_valid_table_name(table_name):
-                raise ValueError(f"Invalid table name: {table_name}")
 
             # Try using INSERT ... RETURNING first (SQLite 3.35+)
             try:
-                query = f"INSERT INTO {table_name} ({cols}) VALUES ({placeholders}) RETURNING id"  # noqa: S608 - table name validated
+                query = self._statement("insert_returning", columns)
                 cursor = self.db.execute(query, tuple(values))
                 result = cursor.fetchone()
                 if result is None:
@@ -181,8 +245,7 @@ class BaseRepository(ABC, Generic[T]):
                 new_id = result[0]
             except Exception as fallback_error:
                 # Fallback to traditional INSERT + last_insert_rowid()
-                query = f"INSERT INTO {table_name} ({cols}) VALUES ({placeholders})"  # noqa: S608 - table name validated
-                self.db.execute(query, tuple(values))
+                self.db.execute(self._statement("insert", columns), tuple(values))
                 new_id = self.db.get_last_insert_id()
                 if new_id is None or new_id <= 0:
                     raise RuntimeError(
@@ -213,15 +276,10 @@ class BaseRepository(ABC, Generic[T]):
             entity_id = db_dict.pop("id")
             if entity_id is None:
                 raise ValueError("Cannot update entity without ID")
-            # Build UPDATE query
             columns = list(db_dict.keys())
-            set_clause = ", ".join([f"{col} = ?" for col in columns])
             values = [db_dict[col] for col in columns]
             values.append(entity_id)  # Add ID for WHERE clause
-            table_name = self.get_table_name()
-            if not self._is_valid_table_name(table_name):
-                raise ValueError(f"Invalid table name: {table_name}")
-            query = f"UPDATE {table_name} SET {set_clause} WHERE id = ?"  # noqa: S608 - table name validated
+            query = self._statement("update", columns)
             result = self.db.execute(query, tuple(values))
             if result.rowcount == 0:
                 raise ValueError(
@@ -246,11 +304,7 @@ class BaseRepository(ABC, Generic[T]):
             True if deleted, False if not found
         """
         try:
-            table_name = self.get_table_name()
-            if not self._is_valid_table_name(table_name):
-                raise ValueError(f"Invalid table name: {table_name}")
-            query = f"DELETE FROM {table_name} WHERE id = ?"  # noqa: S608 - table name validated
-            result = self.db.execute(query, (id,))
+            result = self.db.execute(self._statement("delete"), (id,))
             return result.rowcount > 0
         except Exception as e:
             logger.error(f"Failed to delete {self.get_table_name()} ID {id}: {e}")
@@ -265,11 +319,7 @@ class BaseRepository(ABC, Generic[T]):
             True if exists, False otherwise
         """
         try:
-            table_name = self.get_table_name()
-            if not self._is_valid_table_name(table_name):
-                raise ValueError(f"Invalid table name: {table_name}")
-            query = f"SELECT 1 FROM {table_name} WHERE id = ? LIMIT 1"  # noqa: S608 - table name validated
-            result = self.db.fetch_one(query, (id,))
+            result = self.db.fetch_one(self._statement("exists"), (id,))
             return result is not None
         except Exception as e:
             logger.error(
@@ -277,23 +327,20 @@ class BaseRepository(ABC, Generic[T]):
             )
             raise
 
-    def find_by_field(self, field: str, value: Any) -> list[T]:
+    def find_by_field(
+        self, field: str, value: Any, columns: Sequence[str] | None = None
+    ) -> list[T]:
         """
         Find entities by specific field value.
         Args:
             field: Field name to search
             value: Value to match
+            columns: Columns to load (all when omitted)
         Returns:
             List of matching model objects
         """
         try:
-            table_name = self.get_table_name()
-            if not self._is_valid_table_name(table_name):
-                raise ValueError(f"Invalid table name: {table_name}")
-            # Validate field name to prevent SQL injection
-            if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", field):
-                raise ValueError(f"Invalid field name: {field}")
-            query = f"SELECT * FROM {table_name} WHERE {field} = ?"  # noqa: S608 - table name validated
+            query = self._statement("select_by_field", columns, field=field)
             rows = self.db.fetch_all(query, (value,))
             return [self.to_model(dict(row)) for row in rows]
         except Exception as e:
@@ -0,0 +1,556 @@
+"""
+Citation Graph Engine
+In-memory CSR adjacency for the document-level citation graph. Loaded from
+citation_relations once per database and kept current by the relation
+repository, so network traversal, clustering and ranking never issue
+per-node SQL queries.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from typing import Any
+
+import numpy as np
+
+from src.database.connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+class CitationGraph:
+    """
+    {
+        "name": "CitationGraph",
+        "version": "1.0.0",
+        "description": "Incrementally maintained CSR citation graph with NumPy BFS, components and PageRank.",
+        "dependencies": ["DatabaseConnection", "numpy"],
+        "interface": {
+            "inputs": ["citation relation rows"],
+            "outputs": "Neighbourhoods, connected components, centrality scores"
+        }
+    }
+    Directed document citation graph stored as compressed sparse rows.
+
+    Edges live in append-only columnar arrays indexed by position. Outgoing
+    and incoming CSR indexes cover the positions present at the last
+    compaction; newer edges sit in a small pending tail that is scanned
+    directly, and deleted edges are tombstoned. The CSR is rebuilt once the
+    tail or the tombstones grow past a fraction of the graph.
+    """
+
+    # Edges whose target is not a library document cannot form graph links
+    LOAD_SQL = """
+        SELECT id, source_document_id, target_document_id, relation_type,
+               confidence_score
+        FROM citation_relations
+        WHERE target_document_id IS NOT NULL
+    """
+    FINGERPRINT_SQL = """
+        SELECT COUNT(*) AS edge_count, COALESCE(MAX(id), 0) AS max_id
+        FROM citation_relations
+        WHERE target_document_id IS NOT NULL
+    """
+
+    def __init__(self, reconcile_interval: float = 5.0) -> None:
+        """
+        Initialize an empty graph.
+
+        Args:
+            reconcile_interval: Seconds between checks that the graph still
+                matches the database (catches cascaded and bulk deletes)
+        """
+        self.reconcile_interval = reconcile_interval
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._last_reconciled = 0.0
+        self._reset()
+
+    def _reset(self) -> None:
+        # Node mapping
+        self._node_index: dict[int, int] = {}
+        self._node_ids: list[int] = []
+        # Edge columns (first _edge_count entries are used)
+        self._edge_count = 0
+        self._relation_ids = np.zeros(0, dtype=np.int64)
+        self._sources = np.zeros(0, dtype=np.int64)
+        self._targets = np.zeros(0, dtype=np.int64)
+        self._confidences = np.zeros(0, dtype=np.float64)
+        self._type_codes = np.zeros(0, dtype=np.int32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._edge_position: dict[int, int] = {}
+        self._relation_types: list[str] = []
+        self._type_code: dict[str, int] = {}
+        self._dead_count = 0
+        # CSR over positions [0, _indexed_count)
+        self._indexed_count = 0
+        self._out_indptr = np.zeros(1, dtype=np.int64)
+        self._out_edges = np.zeros(0, dtype=np.int64)
+        self._in_indptr = np.zeros(1, dtype=np.int64)
+        self._in_edges = np.zeros(0, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Loading and maintenance
+    # ------------------------------------------------------------------
+
+    @property
+    def node_count(self) -> int:
+        """Number of documents that ever appeared in a relation."""
+        return len(self._node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of live document-to-document relations."""
+        return self._edge_count - self._dead_count
+
+    def ensure_loaded(self, db: DatabaseConnection) -> None:
+        """
+        Load the graph on first use and periodically reconcile with the database.
+
+        Args:
+            db: Database connection holding citation_relations
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded and now - self._last_reconciled < self.reconcile_interval:
+                return
+            if self._loaded and self._fingerprint() == self._db_fingerprint(db):
+                self._last_reconciled = now
+                return
+            self.load(db)
+
+    def load(self, db: DatabaseConnection) -> None:
+        """
+        (Re)build the graph from the citation_relations table.
+
+        Args:
+            db: Database connection holding citation_relations
+        """
+        started = time.perf_counter()
+        rows = db.fetch_all(self.LOAD_SQL)
+        with self._lock:
+            self._reset()
+            for row in rows:
+                self._append_edge(
+                    row["id"],
+                    row["source_document_id"],
+                    row["target_document_id"],
+                    row["relation_type"],
+                    row["confidence_score"],
+                )
+            self._compact()
+            self._loaded = True
+            self._last_reconciled = time.monotonic()
+        logger.info(
+            f"Loaded citation graph with {self.node_count} documents and "
+            f"{self.edge_count} relations in {time.perf_counter() - started:.3f}s"
+        )
+
+    def invalidate(self) -> None:
+        """Force a reload on next use (after bulk or out-of-band changes)."""
+        with self._lock:
+            self._loaded = False
+
+    def add_relation(
+        self,
+        relation_id: int,
+        source_document_id: int,
+        target_document_id: int | None,
+        relation_type: str = "cites",
+        confidence_score: float | None = None,
+    ) -> None:
+        """Apply a newly created relation; relations without a target are ignored."""
+        if target_document_id is None:
+            return
+        with self._lock:
+            if not self._loaded:
+                return  # Picked up by the initial load
+            if relation_id in self._edge_position:
+                self._remove_edge(relation_id)
+            self._append_edge(
+                relation_id,
+                source_document_id,
+                target_document_id,
+                relation_type,
+                confidence_score,
+            )
+            self._maybe_compact()
+
+    def remove_relation(self, relation_id: int) -> None:
+        """Apply a relation deletion."""
+        with self._lock:
+            if self._loaded and self._remove_edge(relation_id):
+                self._maybe_compact()
+
+    def _node(self, document_id: int) -> int:
+        index = self._node_index.get(document_id)
+        if index is None:
+            index = self._node_index[document_id] = len(self._node_ids)
+            self._node_ids.append(document_id)
+        return index
+
+    def _append_edge(
+        self,
+        relation_id: int,
+        source_document_id: int,
+        target_document_id: int,
+        relation_type: str | None,
+        confidence_score: float | None,
+    ) -> None:
+        position = self._edge_count
+        if position == len(self._relation_ids):
+            self._grow(max(1024, position * 2))
+
+        relation_type = relation_type or "cites"
+        type_code = self._type_code.get(relation_type)
+        if type_code is None:
+            type_code = self._type_code[relation_type] = len(self._relation_types)
+            self._relation_types.append(relation_type)
+
+        self._relation_ids[position] = relation_id
+        self._sources[position] = self._node(source_document_id)
+        self._targets[position] = self._node(target_document_id)
+        # Unknown confidence is stored as NaN and never filtered out
+        self._confidences[position] = (
+            np.nan if confidence_score is None else confidence_score
+        )
+        self._type_codes[position] = type_code
+        self._alive[position] = True
+        self._edge_position[relation_id] = position
+        self._edge_count += 1
+
+    def _remove_edge(self, relation_id: int) -> bool:
+        position = self._edge_position.pop(relation_id, None)
+        if position is None:
+            return False
+        self._alive[position] = False
+        self._dead_count += 1
+        return True
+
+    def _grow(self, capacity: int) -> None:
+        def resize(array: np.ndarray) -> np.ndarray:
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[: len(array)] = array
+            return grown
+
+        self._relation_ids = resize(self._relation_ids)
+        self._sources = resize(self._sources)
+        self._targets = resize(self._targets)
+        self._confidences = resize(self._confidences)
+        self._type_codes = resize(self._type_codes)
+        self._alive = resize(self._alive)
+
+    def _maybe_compact(self) -> None:
+        pending = self._edge_count - self._indexed_count
+        threshold = max(1024, self._edge_count // 20)
+        if pending > threshold or self._dead_count > max(1024, self._edge_count // 5):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop tombstones and rebuild both CSR indexes over all edges."""
+        if self._dead_count:
+            keep = np.flatnonzero(self._alive[: self._edge_count])
+            for name in (
+                "_relation_ids",
+                "_sources",
+                "_targets",
+                "_confidences",
+                "_type_codes",
+            ):
+                setattr(self, name, getattr(self, name)[keep].copy())
+            self._alive = np.ones(len(keep), dtype=bool)
+            self._edge_count = len(keep)
+            self._dead_count = 0
+            self._edge_position = {
+                int(relation_id): position
+                for position, relation_id in enumerate(self._relation_ids)
+            }
+
+        count = self._edge_count
+        node_count = self.node_count
+        self._out_indptr, self._out_edges = self._build_csr(
+            self._sources[:count], node_count
+        )
+        self._in_indptr, self._in_edges = self._build_csr(
+            self._targets[:count], node_count
+        )
+        self._indexed_count = count
+
+    @staticmethod
+    def _build_csr(keys: np.ndarray, node_count: int) -> tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(keys, kind="stable")
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=node_count), out=indptr[1:])
+        return indptr, order.astype(np.int64)
+
+    def _fingerprint(self) -> tuple[int, int]:
+        alive = self._alive[: self._edge_count]
+        if not alive.any():
+            return 0, 0
+        return (
+            int(alive.sum()),
+            int(self._relation_ids[: self._edge_count][alive].max()),
+        )
+
+    def _db_fingerprint(self, db: DatabaseConnection) -> tuple[int, int]:
+        row = db.fetch_one(self.FINGERPRINT_SQL)
+        if not row:
+            return 0, 0
+        return int(row["edge_count"]), int(row["max_id"])
+
+    # ------------------------------------------------------------------
+    # Traversal
+    # ------------------------------------------------------------------
+
+    def _gather(
+        self, indptr: np.ndarray, edges: np.ndarray, nodes: np.ndarray
+    ) -> np.ndarray:
+        """Concatenate the CSR rows of ``nodes`` without a Python loop."""
+        nodes = nodes[nodes < len(indptr) - 1]
+        starts = indptr[nodes]
+        lengths = indptr[nodes + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return edges[offsets + np.arange(total)]
+
+    def _incident_edges(
+        self, nodes: np.ndarray, node_mask: np.ndarray, min_confidence: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Live outgoing and incoming edge positions of a node set."""
+        outgoing = self._gather(self._out_indptr, self._out_edges, nodes)
+        incoming = self._gather(self._in_indptr, self._in_edges, nodes)
+
+        if self._edge_count > self._indexed_count:
+            pending = np.arange(self._indexed_count, self._edge_count)
+            outgoing = np.concatenate(
+                [outgoing, pending[node_mask[self._sources[pending]]]]
+            )
+            incoming = np.concatenate(
+                [incoming, pending[node_mask[self._targets[pending]]]]
+            )
+
+        def usable(positions: np.ndarray) -> np.ndarray:
+            keep = self._alive[positions]
+            if min_confidence > 0:
+                confidences = self._confidences[positions]
+                keep &= np.isnan(confidences) | (confidences >= min_confidence)
+            return positions[keep]
+
+        return usable(outgoing), usable(incoming)
+
+    def neighborhood(
+        self, document_id: int, depth: int = 1, min_confidence: float = 0.0
+    ) -> dict[str, Any]:
+        """
+        Level-synchronous BFS around a document, following citations both ways.
+
+        Args:
+            document_id: Center document
+            depth: Number of hops to expand
+            min_confidence: Ignore relations below this confidence
+
+        Returns:
+            Dictionary with node ids, per-node hop distance, induced edges
+            and the deepest level actually reached
+        """
+        with self._lock:
+            center = self._node_index.get(document_id)
+            if center is None:
+                return {
+                    "node_ids": [document_id],
+                    "distances": {document_id: 0},
+                    "edges": [],
+                    "depth_reached": 0,
+                }
+
+            distances = np.full(self.node_count, -1, dtype=np.int64)
+            distances[center] = 0
+            frontier = np.array([center], dtype=np.int64)
+            depth_reached = 0
+
+            for level in range(1, depth + 1):
+                frontier_mask = np.zeros(self.node_count, dtype=bool)
+                frontier_mask[frontier] = True
+                outgoing, incoming = self._incident_edges(
+                    frontier, frontier_mask, min_confidence
+                )
+                neighbors = np.concatenate(
+                    [self._targets[outgoing], self._sources[incoming]]
+                )
+                neighbors = np.unique(neighbors[distances[neighbors] < 0])
+                if len(neighbors) == 0:
+                    break
+                distances[neighbors] = level
+                frontier = neighbors
+                depth_reached = level
+
+            members = np.flatnonzero(distances >= 0)
+            member_mask = distances >= 0
+            outgoing, _ = self._incident_edges(members, member_mask, min_confidence)
+            edges = outgoing[member_mask[self._targets[outgoing]]]
+            edges.sort()
+
+            return {
+                "node_ids": [self._node_ids[i] for i in members],
+                "distances": {self._node_ids[i]: int(distances[i]) for i in members},
+                "edges": [
+                    {
+                        "id": int(self._relation_ids[position]),
+                        "source": self._node_ids[self._sources[position]],
+                        "target": self._node_ids[self._targets[position]],
+                        "type": self._relation_types[self._type_codes[position]],
+                        "confidence": (
+                            None
+                            if np.isnan(self._confidences[position])
+                            else float(self._confidences[position])
+                        ),
+                    }
+                    for position in edges
+                ],
+                "depth_reached": depth_reached,
+            }
+
+    # ------------------------------------------------------------------
+    # Whole-graph analytics
+    # ------------------------------------------------------------------
+
+    def _live_edges(self) -> tuple[np.ndarray, np.ndarray]:
+        alive = self._alive[: self._edge_count]
+        return (
+            self._sources[: self._edge_count][alive],
+            self._targets[: self._edge_count][alive],
+        )
+
+    def connected_components(self, min_size: int = 1) -> list[dict[str, Any]]:
+        """
+        Weakly connected components via iterative min-label propagation.
+
+        Labels are propagated along edges and shortcut with pointer jumping
+        until stable, so the number of rounds grows with log(diameter)
+        rather than component size, and there is no recursion.
+
+        Args:
+            min_size: Smallest component to report
+
+        Returns:
+            Components (largest first) with document ids, size and number
+            of relations inside the component
+        """
+        with self._lock:
+            sources, targets = self._live_edges()
+            node_count = self.node_count
+            if node_count == 0 or len(sources) == 0:
+                return []
+
+            labels = np.arange(node_count, dtype=np.int64)
+            while True:
+                previous = labels.copy()
+                lowest = np.minimum(labels[sources], labels[targets])
+                np.minimum.at(labels, sources, lowest)
+                np.minimum.at(labels, targets, lowest)
+                # Hook roots as well so whole trees converge together
+                np.minimum.at(labels, previous[sources], lowest)
+                np.minimum.at(labels, previous[targets], lowest)
+                while True:
+                    jumped = labels[labels]
+                    if np.array_equal(jumped, labels):
+                        break
+                    labels = jumped
+                if np.array_equal(labels, previous):
+                    break
+
+            connected = np.zeros(node_count, dtype=bool)
+            connected[sources] = True
+            connected[targets] = True
+            sizes = np.bincount(labels[connected], minlength=node_count)
+            internal = np.bincount(labels[sources], minlength=node_count)
+
+            components = []
+            for root in np.flatnonzero(sizes >= max(min_size, 1)):
+                members = np.flatnonzero((labels == root) & connected)
+                components.append(
+                    {
+                        "document_ids": [self._node_ids[i] for i in members],
+                        "size": int(sizes[root]),
+                        "internal_connections": int(internal[root]),
+                    }
+                )
+            components.sort(key=lambda c: c["size"], reverse=True)
+            return components
+
+    def pagerank(
+        self,
+        damping: float = 0.85,
+        tolerance: float = 1e-8,
+        max_iterations: int = 100,
+    ) -> dict[int, float]:
+        """
+        PageRank over citation direction (being cited raises rank).
+
+        Args:
+            damping: Probability of following a citation
+            tolerance: L1 convergence threshold
+            max_iterations: Upper bound on power iterations
+
+        Returns:
+            Mapping of document id to score (scores sum to 1)
+        """
+        with self._lock:
+            sources, targets = self._live_edges()
+            node_count = self.node_count
+            if node_count == 0:
+                return {}
+
+            out_degree = np.bincount(sources, minlength=node_count).astype(np.float64)
+            dangling = out_degree == 0
+            inverse_degree = np.divide(
+                1.0, out_degree, out=np.zeros(node_count), where=~dangling
+            )
+            rank = np.full(node_count, 1.0 / node_count)
+            for _ in range(max_iterations):
+                contributions = rank * inverse_degree
+                updated = damping * np.bincount(
+                    targets, weights=contributions[sources], minlength=node_count
+                )
+                updated += (1 - damping + damping * rank[dangling].sum()) / node_count
+                converged = np.abs(updated - rank).sum() < tolerance
+                rank = updated
+                if converged:
+                    break
+
+            return {
+                document_id: float(rank[index])
+                for document_id, index in self._node_index.items()
+            }
+
+    def degree_counts(self) -> dict[int, tuple[int, int]]:
+        """Mapping of document id to (in_degree, out_degree) over live relations."""
+        with self._lock:
+            sources, targets = self._live_edges()
+            in_degree = np.bincount(targets, minlength=self.node_count)
+            out_degree = np.bincount(sources, minlength=self.node_count)
+            return {
+                document_id: (int(in_degree[index]), int(out_degree[index]))
+                for document_id, index in self._node_index.items()
+            }
+
+
+# One graph per database connection, shared by all repository instances
+_graphs: weakref.WeakKeyDictionary[DatabaseConnection, CitationGraph] = (
+    weakref.WeakKeyDictionary()
+)
+_graphs_lock = threading.Lock()
+
+
+def get_citation_graph(db: DatabaseConnection) -> CitationGraph:
+    """Get the shared citation graph for a database connection."""
+    with _graphs_lock:
+        graph = _graphs.get(db)
+        if graph is None:
+            graph = _graphs[db] = CitationGraph()
+        return graph
@@ -6,15 +6,36 @@ Handles all database operations for CitationRelationModel entities.
 """
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 from src.database.connection import DatabaseConnection
 from src.database.models import CitationRelationModel
 from src.interfaces.repository_interfaces import ICitationRelationRepository
 from src.repositories.base_repository import BaseRepository
+from src.repositories.citation_graph import CitationGraph, get_citation_graph
 
 logger = logging.getLogger(__name__)
 
+RELATION_COLUMNS = (
+    "source_document_id",
+    "source_citation_id",
+    "target_document_id",
+    "target_citation_id",
+    "relation_type",
+    "confidence_score",
+    "created_at",
+)
+
+# Conflict target matching idx_citation_relations_natural_key
+RELATION_NATURAL_KEY = (
+    "source_citation_id, relation_type, "
+    "COALESCE(target_document_id, 0), COALESCE(target_citation_id, 0)"
+)
+
+# Source citations per IN (...) lookup, well under SQLite's variable limit
+BULK_LOOKUP_BATCH_SIZE = 500
+
 
 class CitationRelationRepository(
     BaseRepository[CitationRelationModel], ICitationRelationRepository
@@ -53,6 +74,13 @@ class CitationRelationRepository(
         super().__init__(db_connection)
         self.db = db_connection
 
+    @property
+    def graph(self) -> CitationGraph:
+        """Shared in-memory citation graph for this database, loaded on demand."""
+        graph = get_citation_graph(self.db)
+        graph.ensure_loaded(self.db)
+        return graph
+
     def get_table_name(self) -> str:
         """Get the database table name for citation relations."""
         return "citation_relations"
@@ -93,12 +121,19 @@ class CitationRelationRepository(
                 VALUES ({", ".join(placeholders)})
             """  # noqa: S608 - safe SQL construction
 
-            self.db.execute(sql, values)
-
-            # Get the inserted ID
-            result = self.db.fetch_one("SELECT last_insert_rowid() as id")
-            if result:
-                relation.id = result["id"]
+            cursor = self.db.execute(sql, values)
+
+            # The writer may run the insert on another connection, so take the
+            # ID from the cursor rather than last_insert_rowid()
+            if cursor.lastrowid:
+                relation.id = cursor.lastrowid
+                get_citation_graph(self.db).add_relation(
+                    relation.id,
+                    relation.source_document_id,
+                    relation.target_document_id,
+                    relation.relation_type,
+                    relation.confidence_score,
+                )
 
             logger.info(f"Created citation relation with ID {relation.id}")
             return relation
@@ -107,6 +142,96 @@ class CitationRelationRepository(
             logger.error(f"Failed to create citation relation: {e}")
             raise
 
+    def bulk_upsert(
+        self, relations: Sequence[CitationRelationModel]
+    ) -> list[CitationRelationModel]:
+        """
+        Insert or update many citation relations in a single transaction.
+
+        Rows are written with one executemany() UPSERT keyed on
+        (source_citation_id, relation_type, target_document_id,
+        target_citation_id); an existing relation keeps its ID and gets the new
+        confidence score. Assigned IDs are read back per source citation and
+        the shared citation graph is updated once the transaction commits.
+
+        Args:
+            relations: Relations to ingest
+
+        Returns:
+            The same relation objects with IDs assigned
+
+        Raises:
+            DatabaseError: If ingestion fails (nothing is written)
+        """
+        if not relations:
+            return []
+
+        try:
+            rows = []
+            for relation in relations:
+                relation_dict = relation.to_database_dict()
+                rows.append(tuple(relation_dict[col] for col in RELATION_COLUMNS))
+
+            sql = f"""
+                INSERT INTO citation_relations ({", ".join(RELATION_COLUMNS)})
+                VALUES ({", ".join("?" for _ in RELATION_COLUMNS)})
+                ON CONFLICT ({RELATION_NATURAL_KEY}) DO UPDATE SET
+                source_document_id = excluded.source_document_id,
+                confidence_score = excluded.confidence_score
+            """  # noqa: S608 - safe SQL construction
+
+            source_ids = list({relation.source_citation_id for relation in relations})
+            ids: dict[tuple[int, str, int, int], int] = {}
+            with self.db.transaction():
+                self.db.execute_many(sql, rows)
+                for start in range(0, len(source_ids), BULK_LOOKUP_BATCH_SIZE):
+                    chunk = source_ids[start : start + BULK_LOOKUP_BATCH_SIZE]
+                    placeholders = ",".join("?" for _ in chunk)
+                    results = self.db.fetch_all(
+                        f"""
+                        SELECT id, source_citation_id, relation_type,
+                               target_document_id, target_citation_id
+                        FROM citation_relations
+                        WHERE source_citation_id IN ({placeholders})
+                        """,  # noqa: S608 - safe SQL construction
+                        tuple(chunk),
+                    )
+                    for row in results:
+                        key = (
+                            row["source_citation_id"],
+                            row["relation_type"],
+                            row["target_document_id"] or 0,
+                            row["target_citation_id"] or 0,
+                        )
+                        ids[key] = row["id"]
+
+            graph = get_citation_graph(self.db)
+            for relation in relations:
+                relation.id = ids[
+                    (
+                        relation.source_citation_id,
+                        relation.relation_type,
+                        relation.target_document_id or 0,
+                        relation.target_citation_id or 0,
+                    )
+                ]
+                graph.add_relation(
+                    relation.id,
+                    relation.source_document_id,
+                    relation.target_document_id,
+                    relation.relation_type,
+                    relation.confidence_score,
+                )
+
+            logger.info(f"Bulk upserted {len(relations)} citation relations")
+            return list(relations)
+
+        except Exception as e:
+            logger.error(
+                f"Failed to bulk upsert {len(relations)} citation relations: {e}"
+            )
+            raise
+
     def get_by_id(self, relation_id: int) -> CitationRelationModel | None:
         """
         Get citation relation by ID.
@@ -163,6 +288,16 @@ class CitationRelationRepository(
 
             self.db.execute(sql, values)
 
+            graph = get_citation_graph(self.db)
+            graph.remove_relation(relation.id)
+            graph.add_relation(
+                relation.id,
+                relation.source_document_id,
+                relation.target_document_id,
+                relation.relation_type,
+                relation.confidence_score,
+            )
+
             logger.info(f"Updated citation relation with ID {relation.id}")
             return relation
 
@@ -192,6 +327,7 @@ class CitationRelationRepository(
             success = rows_affected > 0
 
             if success:
+                get_citation_graph(self.db).remove_relation(relation_id)
                 logger.info(f"Deleted citation relation with ID {relation_id}")
             else:
                 logger.warning(
@@ -345,105 +481,55 @@ class CitationRelationRepository(
             logger.error(f"Failed to find relations for citation {citation_id}: {e}")
             raise
 
-    def get_citation_network(self, document_id: int, depth: int = 1) -> dict[str, Any]:
+    def get_citation_network(
+        self, document_id: int, depth: int = 1, min_confidence: float = 0.0
+    ) -> dict[str, Any]:
         """
         Get citation network for a document up to specified depth.
 
+        Traversal runs on the in-memory citation graph; only node details
+        are read from the database, in a single query.
+
         Args:
             document_id: Document ID to start from
             depth: Network depth to traverse
+            min_confidence: Ignore relations with a lower confidence score
 
         Returns:
             Dictionary containing nodes and edges for network visualization
         """
         try:
-            nodes = set()
-            edges = []
-            processed_docs = set()
-
-            def _traverse_network(doc_id: int, current_depth: int) -> None:
-                if current_depth > depth or doc_id in processed_docs:
-                    return
-
-                processed_docs.add(doc_id)
-                nodes.add(doc_id)
-
-                # Get outgoing citations (documents this one cites)
-                outgoing_sql = """
-                    SELECT cr.*, d.title as target_title
-                    FROM citation_relations cr
-                    LEFT JOIN documents d ON cr.target_document_id = d.id
-                    WHERE cr.source_document_id = ?
-                    AND cr.target_document_id IS NOT NULL
-                """
-                outgoing = self.db.fetch_all(outgoing_sql, (doc_id,))
-
-                for relation in outgoing:
-                    target_id = relation["target_document_id"]
-                    if target_id:
-                        nodes.add(target_id)
-                        edges.append(
-                            {
-                                "source": doc_id,
-                                "target": target_id,
-                                "type": relation["relation_type"],
-                                "confidence": relation["confidence_score"],
-                            }
-                        )
-                        if current_depth < depth:
-                            _traverse_network(target_id, current_depth + 1)
-
-                # Get incoming citations (documents that cite this one)
-                incoming_sql = """
-                    SELECT cr.*, d.title as source_title
-                    FROM citation_relations cr
-                    LEFT JOIN documents d ON cr.source_document_id = d.id
-                    WHERE cr.target_document_id = ?
-                """
-                incoming = self.db.fetch_all(incoming_sql, (doc_id,))
-
-                for relation in incoming:
-                    source_id = relation["source_document_id"]
-                    nodes.add(source_id)
-                    edges.append(
-                        {
-                            "source": source_id,
-                            "target": doc_id,
-                            "type": relation["relation_type"],
-                            "confidence": relation["confidence_score"],
-                        }
-                    )
-                    if current_depth < depth:
-                        _traverse_network(source_id, current_depth + 1)
-
-            # Start traversal
-            _traverse_network(document_id, 0)
+            neighborhood = self.graph.neighborhood(document_id, depth, min_confidence)
+            node_ids = neighborhood["node_ids"]
 
             # Get node details
             node_details = {}
-            if nodes:
-                placeholders = ",".join(["?" for _ in nodes])
-                node_sql = f"""
-                    SELECT id, title, created_at
-                    FROM documents
-                    WHERE id IN ({placeholders})
-                """  # noqa: S608 - safe SQL construction
-                node_results = self.db.fetch_all(node_sql, list(nodes))
-
-                for node in node_results:
-                    node_details[node["id"]] = {
-                        "id": node["id"],
-                        "title": node["title"],
-                        "created_at": node["created_at"],
-                    }
+            placeholders = ",".join(["?" for _ in node_ids])
+            node_sql = f"""
+                SELECT id, title, created_at
+                FROM documents
+                WHERE id IN ({placeholders})
+            """  # noqa: S608 - safe SQL construction
+            for node in self.db.fetch_all(node_sql, list(node_ids)):
+                node_details[node["id"]] = {
+                    "id": node["id"],
+                    "title": node["title"],
+                    "created_at": node["created_at"],
+                }
+
+            nodes = []
+            for node_id in node_ids:
+                node = node_details.get(node_id, {"id": node_id})
+                node["distance"] = neighborhood["distances"][node_id]
+                nodes.append(node)
 
+            edges = neighborhood["edges"]
             network = {
-                "nodes": [
-                    node_details.get(node_id, {"id": node_id}) for node_id in nodes
-                ],
+                "nodes": nodes,
                 "edges": edges,
                 "center_document": document_id,
                 "depth": depth,
+                "depth_reached": neighborhood["depth_reached"],
                 "total_nodes": len(nodes),
                 "total_edges": len(edges),
             }
@@ -460,6 +546,42 @@ class CitationRelationRepository(
             )
             raise
 
+    def get_connected_components(self, min_size: int = 1) -> list[dict[str, Any]]:
+        """
+        Get groups of documents connected through citations in either direction.
+
+        Args:
+            min_size: Minimum number of documents in a component
+
+        Returns:
+            Components with document IDs, size and internal relation count
+        """
+        try:
+            components = self.graph.connected_components(min_size)
+            logger.debug(f"Found {len(components)} connected citation components")
+            return components
+
+        except Exception as e:
+            logger.error(f"Failed to compute citation components: {e}")
+            raise
+
+    def get_pagerank_scores(self, damping: float = 0.85) -> dict[int, float]:
+        """
+        Get PageRank influence scores for every document in the citation graph.
+
+        Args:
+            damping: Probability of following a citation link
+
+        Returns:
+            Mapping of document ID to PageRank score
+        """
+        try:
+            return self.graph.pagerank(damping=damping)
+
+        except Exception as e:
+            logger.error(f"Failed to compute PageRank scores: {e}")
+            raise
+
     def get_most_cited_documents(self, limit: int = 10) -> list[dict[str, Any]]:
         """
         Get most cited documents in the library.
@@ -552,6 +674,9 @@ class CitationRelationRepository(
                 + removed_target_citation
             )
 
+            if total_removed:
+                get_citation_graph(self.db).invalidate()
+
             logger.info(f"Cleaned up {total_removed} orphaned citation relations")
             return total_removed
 
@@ -5,6 +5,8 @@ Handles all database operations for CitationModel entities.
 """
 
 import logging
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 from src.database.connection import DatabaseConnection
@@ -14,6 +16,24 @@ from src.repositories.base_repository import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+CITATION_COLUMNS = (
+    "document_id",
+    "raw_text",
+    "authors",
+    "title",
+    "publication_year",
+    "journal_or_venue",
+    "doi",
+    "page_range",
+    "citation_type",
+    "confidence_score",
+    "created_at",
+    "updated_at",
+)
+
+# Natural keys per IN (...) lookup, well under SQLite's variable limit
+BULK_LOOKUP_BATCH_SIZE = 500
+
 
 class CitationRepository(BaseRepository[CitationModel], ICitationRepository):
     """
@@ -82,12 +102,12 @@ class CitationRepository(BaseRepository[CitationModel], ICitationRepository):
                 VALUES ({", ".join(placeholders)})
             """  # noqa: S608 - safe SQL construction
 
-            self.db.execute(sql, values)
+            cursor = self.db.execute(sql, values)
 
-            # Get the inserted ID
-            result = self.db.fetch_one("SELECT last_insert_rowid() as id")
-            if result:
-                citation.id = result["id"]
+            # The writer may run the insert on another connection, so take the
+            # ID from the cursor rather than last_insert_rowid()
+            if cursor.lastrowid:
+                citation.id = cursor.lastrowid
 
             logger.info(f"Created citation with ID {citation.id}")
             return citation
@@ -96,6 +116,78 @@ class CitationRepository(BaseRepository[CitationModel], ICitationRepository):
             logger.error(f"Failed to create citation: {e}")
             raise
 
+    def bulk_upsert(self, citations: Sequence[CitationModel]) -> list[CitationModel]:
+        """
+        Insert or update many citations in a single transaction.
+
+        Rows are written with one executemany() UPSERT keyed on
+        (document_id, raw_text): an existing citation keeps its ID and
+        created_at, and its parsed fields are replaced. Assigned IDs are then
+        read back per document with batched IN (...) lookups.
+
+        Args:
+            citations: Citations to ingest; repeated natural keys resolve to
+                the same row, with the last occurrence's fields winning
+
+        Returns:
+            The same citation objects with IDs assigned
+
+        Raises:
+            DatabaseError: If ingestion fails (nothing is written)
+        """
+        if not citations:
+            return []
+
+        try:
+            rows = []
+            for citation in citations:
+                citation_dict = citation.to_database_dict()
+                rows.append(tuple(citation_dict[col] for col in CITATION_COLUMNS))
+
+            update_columns = [
+                col
+                for col in CITATION_COLUMNS
+                if col not in ("document_id", "raw_text", "created_at")
+            ]
+            sql = f"""
+                INSERT INTO citations ({", ".join(CITATION_COLUMNS)})
+                VALUES ({", ".join("?" for _ in CITATION_COLUMNS)})
+                ON CONFLICT (document_id, raw_text) DO UPDATE SET
+                {", ".join(f"{col} = excluded.{col}" for col in update_columns)}
+            """  # noqa: S608 - safe SQL construction
+
+            texts_by_document: dict[int, set[str]] = defaultdict(set)
+            for citation in citations:
+                texts_by_document[citation.document_id].add(citation.raw_text)
+
+            ids: dict[tuple[int, str], int] = {}
+            with self.db.transaction():
+                self.db.execute_many(sql, rows)
+                for document_id, raw_texts in texts_by_document.items():
+                    texts = list(raw_texts)
+                    for start in range(0, len(texts), BULK_LOOKUP_BATCH_SIZE):
+                        chunk = texts[start : start + BULK_LOOKUP_BATCH_SIZE]
+                        placeholders = ",".join("?" for _ in chunk)
+                        results = self.db.fetch_all(
+                            f"""
+                            SELECT id, raw_text FROM citations
+                            WHERE document_id = ? AND raw_text IN ({placeholders})
+                            """,  # noqa: S608 - safe SQL construction
+                            (document_id, *chunk),
+                        )
+                        for row in results:
+                            ids[(document_id, row["raw_text"])] = row["id"]
+
+            for citation in citations:
+                citation.id = ids[(citation.document_id, citation.raw_text)]
+
+            logger.info(f"Bulk upserted {len(citations)} citations")
+            return list(citations)
+
+        except Exception as e:
+            logger.error(f"Failed to bulk upsert {len(citations)} citations: {e}")
+            raise
+
     def get_by_id(self, citation_id: int) -> CitationModel | None:
         """
         Get citation by ID.
@@ -362,6 +454,194 @@ class CitationRepository(BaseRepository[CitationModel], ICitationRepository):
             logger.error(f"Failed to find citations by type '{citation_type}': {e}")
             raise
 
+    def search_page(
+        self,
+        *,
+        author: str | None = None,
+        title: str | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        document_id: int | None = None,
+        citation_type: str | None = None,
+        doi: str | None = None,
+        min_confidence: float = 0.0,
+        after: tuple[int, int] | None = None,
+        limit: int = 50,
+    ) -> tuple[list[CitationModel], tuple[int, int] | None]:
+        """
+        Search citations one keyset page at a time.
+
+        Results are ordered by (publication year, id) descending, with a
+        missing year sorting as 0. Every filter is a SQL predicate and the
+        page boundary becomes index seeks on the sort key, so deep pages
+        cost the same as the first one.
+
+        Args:
+            author: Author substring
+            title: Title substring
+            year_from: Earliest publication year (inclusive)
+            year_to: Latest publication year (inclusive)
+            document_id: Restrict to citations extracted from a document
+            citation_type: Citation type
+            doi: Exact DOI
+            min_confidence: Minimum confidence score
+            after: Sort key of the last row of the previous page
+            limit: Page size
+
+        Returns:
+            Tuple of (citations, sort key to continue after or None if last page)
+        """
+        try:
+            conditions: list[str] = []
+            params: list[Any] = []
+
+            if document_id is not None:
+                conditions.append("document_id = ?")
+                params.append(document_id)
+            if citation_type:
+                conditions.append("citation_type = ?")
+                params.append(citation_type)
+            if doi:
+                conditions.append("doi = ?")
+                params.append(doi)
+            if year_from is not None:
+                conditions.append("COALESCE(publication_year, 0) >= ?")
+                params.append(year_from)
+            if min_confidence > 0:
+                conditions.append("confidence_score >= ?")
+                params.append(min_confidence)
+            if author:
+                conditions.append("authors LIKE ?")
+                params.append(f"%{author}%")
+            if title:
+                conditions.append("title LIKE ?")
+                params.append(f"%{title}%")
+
+            if after is None:
+                year_conditions = []
+                year_params: list[Any] = []
+                if year_to is not None:
+                    year_conditions.append("COALESCE(publication_year, 0) <= ?")
+                    year_params.append(year_to)
+                results = self._fetch_keyset_rows(
+                    conditions + year_conditions, params + year_params, limit + 1
+                )
+            else:
+                # (year, id) < cursor is split into two index seeks: the rest
+                # of the cursor's year, then strictly older years. SQLite
+                # cannot seek a row-value comparison on an expression index.
+                cursor_year, cursor_id = after
+                results = self._fetch_keyset_rows(
+                    conditions + ["COALESCE(publication_year, 0) = ?", "id < ?"],
+                    params + [cursor_year, cursor_id],
+                    limit + 1,
+                    order_by="id DESC",
+                )
+                if len(results) <= limit:
+                    older_than = cursor_year
+                    if year_to is not None and year_to < cursor_year:
+                        older_than = year_to + 1
+                    results += self._fetch_keyset_rows(
+                        conditions + ["COALESCE(publication_year, 0) < ?"],
+                        params + [older_than],
+                        limit + 1 - len(results),
+                    )
+
+            citations = [
+                CitationModel.from_database_row(row) for row in results[:limit]
+            ]
+            next_key = None
+            if len(results) > limit:
+                last = citations[-1]
+                next_key = (last.publication_year or 0, last.id)
+
+            logger.debug(f"Found {len(citations)} citations in keyset page")
+            return citations, next_key
+
+        except Exception as e:
+            logger.error(f"Failed to search citations page: {e}")
+            raise
+
+    def _fetch_keyset_rows(
+        self,
+        conditions: list[str],
+        params: list[Any],
+        limit: int,
+        order_by: str = "COALESCE(publication_year, 0) DESC, id DESC",
+    ) -> list[Any]:
+        """Fetch rows in keyset order (year, id descending)."""
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"""
+            SELECT * FROM citations
+            {where_clause}
+            ORDER BY {order_by}
+            LIMIT ?
+        """  # noqa: S608 - safe SQL construction
+        return list(self.db.fetch_all(sql, (*params, limit)))
+
+    def iter_batches(
+        self,
+        *,
+        document_id: int | None = None,
+        author: str | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[CitationModel]]:
+        """
+        Iterate over matching citations in id order, one batch at a time.
+
+        Each batch is a single primary-key range query (``id > last_id``),
+        so memory stays bounded by ``batch_size`` however many citations
+        match and no batch re-scans rows returned by the previous one.
+
+        Args:
+            document_id: Only citations extracted from this document
+            author: Author substring to match
+            year_from: Minimum publication year
+            year_to: Maximum publication year
+            batch_size: Maximum citations per batch
+
+        Yields:
+            Non-empty lists of citations
+        """
+        conditions = ["id > ?"]
+        params: list[Any] = []
+        if document_id is not None:
+            conditions.append("document_id = ?")
+            params.append(document_id)
+        if author:
+            conditions.append("authors LIKE ?")
+            params.append(f"%{author}%")
+        if year_from is not None:
+            conditions.append("publication_year >= ?")
+            params.append(year_from)
+        if year_to is not None:
+            conditions.append("publication_year <= ?")
+            params.append(year_to)
+
+        sql = f"""
+            SELECT * FROM citations
+            WHERE {" AND ".join(conditions)}
+            ORDER BY id
+            LIMIT ?
+        """  # noqa: S608 - safe SQL construction
+
+        last_id = 0
+        while True:
+            try:
+                rows = self.db.fetch_all(sql, (last_id, *params, batch_size))
+            except Exception as e:
+                logger.error(f"Failed to fetch citation batch after id {last_id}: {e}")
+                raise
+            if not rows:
+                return
+            batch = [CitationModel.from_database_row(row) for row in rows]
+            yield batch
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1].id
+
     def get_by_ids(self, citation_ids: list[int]) -> list[CitationModel]:
         """
         Get multiple citations by their IDs.
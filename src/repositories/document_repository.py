@@ -5,17 +5,71 @@ Provides methods for document search, filtering, and duplicate detection.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from src.database.connection import DatabaseConnection
 from src.database.models import DocumentModel
 from src.interfaces.repository_interfaces import IDocumentRepository
 
-from .base_repository import BaseRepository
+from .base_repository import (
+    IDENTIFIER_PATTERN,
+    STATEMENT_CACHE_SIZE,
+    BaseRepository,
+)
 
 logger = logging.getLogger(__name__)
 
+# Whitelisted sort fields mapped to their keyset sort expression. Nullable
+# timestamps sort as '' so every row has a comparable key; the expressions
+# must match the (expression, id) indexes created by migration 012.
+SORT_KEYS = {
+    "created_at": "COALESCE(created_at, '')",
+    "updated_at": "COALESCE(updated_at, '')",
+    "last_accessed": "COALESCE(last_accessed, '')",
+    "title": "title",
+    "file_size": "file_size",
+}
+SORT_ORDERS = {"asc": "ASC", "desc": "DESC"}
+
+# Columns listings need; skips the metadata JSON and tags text
+SUMMARY_COLUMNS = (
+    "id",
+    "title",
+    "file_path",
+    "file_hash",
+    "content_hash",
+    "file_size",
+    "file_type",
+    "page_count",
+    "created_at",
+    "updated_at",
+    "last_accessed",
+)
+# Distinct search queries whose totals are cached
+SEARCH_COUNT_CACHE_SIZE = 256
+# Seconds before probing again for a missing document_stats table
+STATS_RETRY_SECONDS = 60.0
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _keyset_statement(
+    select: str, sort_expr: str, conditions: tuple[str, ...], order_by: str
+) -> str:
+    """SQL for one keyset page query; callers pass whitelisted fragments only."""
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"""
+        SELECT {select}, {sort_expr} AS keyset_value FROM documents
+        {where_clause}
+        ORDER BY {order_by}
+        LIMIT ? OFFSET ?
+    """  # noqa: S608 - whitelisted sort expressions only
+
 
 class DocumentRepository(BaseRepository[DocumentModel], IDocumentRepository):
     """
@@ -40,6 +94,9 @@ class DocumentRepository(BaseRepository[DocumentModel], IDocumentRepository):
             db_connection: Database connection instance
         """
         super().__init__(db_connection)
+        self._stats_unavailable_since: float | None = None
+        self._search_totals: OrderedDict[str, tuple[int, int]] = OrderedDict()
+        self._search_totals_lock = threading.Lock()
 
     def get_table_name(self) -> str:
         """Get the database table name."""
@@ -63,9 +120,7 @@ class DocumentRepository(BaseRepository[DocumentModel], IDocumentRepository):
             return []
 
         try:
-            # Create placeholders for SQL IN clause
-            placeholders = ",".join("?" * len(entity_ids))
-            query = f"SELECT * FROM documents WHERE id IN ({placeholders})"  # noqa: S608
+            query = self._statement("select_by_ids", placeholders=len(entity_ids))
             rows = self.db.fetch_all(query, tuple(entity_ids))
             return [self.to_model(dict(row)) for row in rows]
         except Exception as e:
@@ -130,33 +185,6 @@ class DocumentRepository(BaseRepository[DocumentModel], IDocumentRepository):
             logger.error(f"Failed to find document by content hash {content_hash}: {e}")
             raise
 
-    def _search_documents_with_total(
-        self, search_query: str, limit: int, offset: int
-    ) -> tuple[list[DocumentModel], int]:
-        """
-        Internal helper to execute the paginated LIKE query alongside the total count.
-        """
-        try:
-            search_pattern = f"%{search_query}%"
-            rows_query = """
-            SELECT * FROM documents
-            WHERE title LIKE ?
-            ORDER BY title
-            LIMIT ? OFFSET ?
-            """
-            count_query = """
-            SELECT COUNT(*) as total
-            FROM documents
-            WHERE title LIKE ?
-            """
-            rows = self.db.fetch_all(rows_query, (search_pattern, limit, offset))
-            total_row = self.db.fetch_one(count_query, (search_pattern,))
-            total = int(total_row["total"]) if total_row and total_row["total"] else 0
-            return [self.to_model(dict(row)) for row in rows], total
-        except Exception as e:
-            logger.error(f"Failed to search documents for query '{search_query}': {e}")
-            raise
-
     def search_by_title(
         self, search_query: str, limit: int = 50, offset: int = 0
     ) -> list[DocumentModel]:
@@ -168,14 +196,53 @@ class DocumentRepository(BaseRepository[DocumentModel], IDocumentRepository):
         Returns:
             List of matching documents
         """
-        documents, _ = self._search_documents_with_total(search_query, limit, offset)
+        documents, _ = self.search_page(search_query, offset=offset, limit=limit)
         return documents
 
     def search(
         self, query: str, limit: int = 50, offset: int = 0
     ) -> tuple[list[DocumentModel], int]:
         """Interface method - search documents by query with pagination metadata."""
-        return self._search_documents_with_total(query, limit, offset)
+        documents, _ = self.search_page(query, offset=offset, limit=limit)
+        return documents, self.count_search(query)
+
+    def search_page(
+        self,
+        query: str,
+        *,
+        after: tuple[Any, int] | None = None,
+        offset: int = 0,
+        limit: int = 50,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[DocumentModel], tuple[Any, int] | None]:
+        """
+        Search documents by title one keyset page at a time.
+
+        Matches are ordered by (title, id). With a cursor the page starts with
+        an index seek just past it, so later pages do not rescan earlier ones.
+        Args:
+            query: Title substring
+            after: Sort key of the last row of the previous page
+            offset: Rows to skip when no cursor is given (legacy page numbers)
+            limit: Page size
+            columns: Columns to load, e.g. SUMMARY_COLUMNS (all when omitted)
+        Returns:
+            Tuple of (documents, sort key to continue after or None if last page)
+        """
+        try:
+            return self._fetch_keyset_page(
+                SORT_KEYS["title"],
+                "ASC",
+                ["title LIKE ?"],
+                [f"%{query}%"],
+                after,
+                offset,
+                limit,
+                columns,
+            )
+        except Exception as e:
+            logger.error(f"Failed to search documents for query '{query}': {e}")
+            raise
 
     def get_all(
         self,
@@ -185,41 +252,191 @@ class DocumentRepository(BaseRepository[DocumentModel], IDocumentRepository):
         sort_order: str = "desc",
     ) -> list[DocumentModel]:
         """Interface method - get all documents with pagination and sorting."""
+        documents, _ = self.get_page(
+            sort_by=sort_by, sort_order=sort_order, offset=offset, limit=limit
+        )
+        return documents
+
+    def get_page(
+        self,
+        *,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        after: tuple[Any, int] | None = None,
+        offset: int = 0,
+        limit: int = 50,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[DocumentModel], tuple[Any, int] | None]:
+        """
+        List documents one keyset page at a time.
+
+        Documents are ordered by the sort field with the ID as tiebreaker.
+        Unknown sort fields fall back to created_at and unknown orders to
+        descending. With a cursor the page is served by index seeks, so deep
+        pages cost the same as the first one.
+        Args:
+            sort_by: Field to sort by (created_at, updated_at, last_accessed,
+                title, file_size)
+            sort_order: Sort direction (asc/desc)
+            after: Sort key of the last row of the previous page
+            offset: Rows to skip when no cursor is given (legacy page numbers)
+            limit: Page size
+            columns: Columns to load, e.g. SUMMARY_COLUMNS (all when omitted)
+        Returns:
+            Tuple of (documents, sort key to continue after or None if last page)
+        """
         try:
-            # Secure whitelist-based validation for sort_by parameter
-            valid_sort_fields = {
-                "created_at": "created_at",
-                "updated_at": "updated_at",
-                "last_accessed": "last_accessed",
-                "title": "title",
-                "file_size": "file_size",
-            }
-
-            # Use whitelist lookup to prevent injection
-            safe_sort_by = valid_sort_fields.get(sort_by.lower(), "created_at")
-
-            # Secure validation for sort_order using whitelist
-            valid_sort_orders = {"asc": "ASC", "desc": "DESC"}
-            safe_sort_order = valid_sort_orders.get(sort_order.lower(), "DESC")
-
-            # Use parameterized query - build safe SQL using whitelisted values
-            query = (
-                "SELECT * FROM documents "  # noqa: S608
-                f"ORDER BY {safe_sort_by} {safe_sort_order} "
-                "LIMIT ? OFFSET ?"
-            )
+            # Whitelist lookups keep sort input out of the SQL text
+            sort_expr = SORT_KEYS.get(sort_by.lower(), SORT_KEYS["created_at"])
+            direction = SORT_ORDERS.get(sort_order.lower(), "DESC")
 
-            # Log the safe query for security auditing
             logger.debug(
-                f"Executing secure query with sort_by='{safe_sort_by}', sort_order='{safe_sort_order}'"
+                f"Executing keyset page with sort '{sort_expr} {direction}', "
+                f"after={after}, offset={offset}"
+            )
+            return self._fetch_keyset_page(
+                sort_expr, direction, [], [], after, offset, limit, columns
             )
-
-            rows = self.db.fetch_all(query, (limit, offset))
-            return [self.to_model(dict(row)) for row in rows]
         except Exception as e:
             logger.error(f"Failed to get all documents: {e}")
             raise
 
+    def _fetch_keyset_page(
+        self,
+        sort_expr: str,
+        direction: str,
+        conditions: list[str],
+        params: list[Any],
+        after: tuple[Any, int] | None,
+        offset: int,
+        limit: int,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[DocumentModel], tuple[Any, int] | None]:
+        """Fetch one page ordered by (sort_expr, id) in the given direction."""
+        order_by = f"{sort_expr} {direction}, id {direction}"
+        if columns and not all(map(IDENTIFIER_PATTERN.match, columns)):
+            raise ValueError(f"Invalid column names: {columns}")
+        select = ", ".join(columns) if columns else "*"
+        if after is None:
+            rows = self._fetch_keyset_rows(
+                select, sort_expr, conditions, params, order_by, limit + 1, offset
+            )
+        else:
+            # (key, id) past the cursor is split into two index seeks: the rest
+            # of the cursor's key, then the following keys. SQLite cannot seek
+            # a row-value comparison on an expression index.
+            past = "<" if direction == "DESC" else ">"
+            cursor_key, cursor_id = after
+            rows = self._fetch_keyset_rows(
+                select,
+                sort_expr,
+                conditions + [f"{sort_expr} = ?", f"id {past} ?"],
+                params + [cursor_key, cursor_id],
+                f"id {direction}",
+                limit + 1,
+            )
+            if len(rows) <= limit:
+                rows += self._fetch_keyset_rows(
+                    select,
+                    sort_expr,
+                    conditions + [f"{sort_expr} {past} ?"],
+                    params + [cursor_key],
+                    order_by,
+                    limit + 1 - len(rows),
+                )
+
+        next_key = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_key = (last["keyset_value"], last["id"])
+
+        documents = []
+        for row in rows[:limit]:
+            row.pop("keyset_value")
+            documents.append(self.to_model(row))
+        return documents, next_key
+
+    def _fetch_keyset_rows(
+        self,
+        select: str,
+        sort_expr: str,
+        conditions: list[str],
+        params: list[Any],
+        order_by: str,
+        limit: int,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Fetch rows with their sort key exposed as keyset_value."""
+        query = _keyset_statement(select, sort_expr, tuple(conditions), order_by)
+        rows = self.db.fetch_all(query, (*params, limit, offset))
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        """Interface method - total documents, read from the maintained counter."""
+        stats = self._document_stats()
+        if stats is None:
+            return super().count()
+        return stats[0]
+
+    def count_search(self, query: str) -> int:
+        """
+        Count documents whose title matches a search query.
+
+        Totals are cached per query and reused until the document_stats
+        generation changes, i.e. until a document is added, removed or
+        retitled.
+        Args:
+            query: Title substring
+        Returns:
+            Number of matching documents
+        """
+        try:
+            stats = self._document_stats()
+            if stats is not None:
+                with self._search_totals_lock:
+                    cached = self._search_totals.get(query)
+                    if cached is not None and cached[0] == stats[1]:
+                        self._search_totals.move_to_end(query)
+                        return cached[1]
+
+            row = self.db.fetch_one(
+                "SELECT COUNT(*) as total FROM documents WHERE title LIKE ?",
+                (f"%{query}%",),
+            )
+            total = int(row["total"]) if row and row["total"] else 0
+
+            if stats is not None:
+                with self._search_totals_lock:
+                    self._search_totals[query] = (stats[1], total)
+                    self._search_totals.move_to_end(query)
+                    while len(self._search_totals) > SEARCH_COUNT_CACHE_SIZE:
+                        self._search_totals.popitem(last=False)
+            return total
+        except Exception as e:
+            logger.error(f"Failed to count documents for query '{query}': {e}")
+            raise
+
+    def _document_stats(self) -> tuple[int, int] | None:
+        """(document count, generation) from document_stats, if migrated."""
+        unavailable_since = self._stats_unavailable_since
+        if (
+            unavailable_since is not None
+            and time.monotonic() - unavailable_since < STATS_RETRY_SECONDS
+        ):
+            return None
+        try:
+            row = self.db.fetch_one(
+                "SELECT document_count, generation FROM document_stats WHERE id = 1"
+            )
+        except Exception as e:
+            logger.debug(f"document_stats unavailable, counting directly: {e}")
+            self._stats_unavailable_since = time.monotonic()
+            return None
+        self._stats_unavailable_since = None
+        if not row:
+            return None
+        return int(row["document_count"]), int(row["generation"])
+
     def create(self, entity: DocumentModel) -> DocumentModel:
         """Interface method - create new document."""
         return super().create(entity)
@@ -501,26 +718,11 @@ class DocumentRepository(BaseRepository[DocumentModel], IDocumentRepository):
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        # Normalize titles (lowercase, strip whitespace)
-        t1 = title1.lower().strip()
-        t2 = title2.lower().strip()
-
-        if t1 == t2:
-            return 1.0
-        if not t1 or not t2:
-            return 0.0
-
-        # Simple Jaccard similarity using word sets
-        words1 = set(t1.split())
-        words2 = set(t2.split())
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
+        # Jaccard similarity of the word sets, shared with the LSH index. The
+        # index module needs NumPy (optional), so only import it when used.
+        from .document_similarity_index import title_similarity
 
-        return intersection / union if union > 0 else 0.0
+        return title_similarity(title1, title2)
 
     def _build_advanced_search_query(
         self,
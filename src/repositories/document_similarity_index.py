@@ -0,0 +1,738 @@
+"""
+Document Similarity Index
+MinHash signatures of document titles (and optionally extracted text) with a
+banded LSH index, so near-duplicate lookups touch a handful of candidates
+instead of comparing every pair of documents. Signatures are computed once
+per document, persisted in document_signatures and loaded once per database.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+import zlib
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+from src.database.connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_KIND_TITLE = "title"
+SIGNATURE_KIND_CONTENT = "content"
+
+# Multiply-shift hashing ((a * x + b) mod 2**64) >> 32 over 32-bit shingle hashes
+_SHIFT = np.uint64(32)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+# Shingle-hash x permutation cells processed per NumPy batch
+_BATCH_CELLS = 1 << 22
+
+
+def title_words(title: str | None) -> frozenset[str]:
+    """Normalized word set used for title similarity."""
+    return frozenset(title.lower().split()) if title else frozenset()
+
+
+def title_similarity(title1: str, title2: str) -> float:
+    """
+    Jaccard similarity of the word sets of two titles.
+
+    Args:
+        title1: First title
+        title2: Second title
+    Returns:
+        Similarity score between 0.0 and 1.0
+    """
+    t1 = title1.lower().strip()
+    t2 = title2.lower().strip()
+    if t1 == t2:
+        return 1.0
+    return _jaccard(title_words(t1), title_words(t2))
+
+
+def _jaccard(words1: frozenset[str], words2: frozenset[str]) -> float:
+    if not words1 or not words2:
+        return 0.0
+    return len(words1 & words2) / len(words1 | words2)
+
+
+def _digest(words: Iterable[str]) -> int:
+    """Digest of the shingles a stored signature was computed from."""
+    return zlib.crc32(" ".join(sorted(words)).encode("utf-8"))
+
+
+def text_shingles(text: str | None, size: int = 3) -> set[str]:
+    """Overlapping word n-grams of normalized extracted text."""
+    words = text.lower().split() if text else []
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """
+    MinHash signatures over string shingles.
+
+    Shingles are hashed with CRC32 and permuted with seeded universal hash
+    functions, so signatures are stable across processes and can be stored.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1) -> None:
+        """
+        Initialize the permutation functions.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            seed: Seed for the permutation coefficients
+        """
+        self.num_perm = num_perm
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 1 << 64, num_perm, dtype=np.uint64, endpoint=False)
+        self._a |= np.uint64(1)
+        self._b = rng.integers(0, 1 << 64, num_perm, dtype=np.uint64, endpoint=False)
+
+    def signature(self, shingles: Iterable[str]) -> np.ndarray | None:
+        """Signature of one shingle set, or None if the set is empty."""
+        signatures, present = self.signatures([shingles])
+        return signatures[0] if present[0] else None
+
+    def signatures(
+        self, shingle_sets: Sequence[Iterable[str]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Signatures of many shingle sets in vectorized batches.
+
+        Args:
+            shingle_sets: One shingle collection per item
+        Returns:
+            Tuple of (uint32 signature matrix with one row per item, boolean
+            mask of items that had shingles; rows of empty items are unusable)
+        """
+        hashed = [
+            np.fromiter(
+                {zlib.crc32(s.encode("utf-8")) for s in shingles}, dtype=np.uint64
+            )
+            for shingles in shingle_sets
+        ]
+        sizes = np.array([len(h) for h in hashed], dtype=np.int64)
+        result = np.full((len(hashed), self.num_perm), _MAX_HASH, dtype=np.uint32)
+
+        start = 0
+        while start < len(hashed):
+            # Grow the batch until it reaches the cell budget
+            stop, cells = start, 0
+            while stop < len(hashed):
+                size = int(sizes[stop]) * self.num_perm
+                if stop > start and cells + size > _BATCH_CELLS:
+                    break
+                cells += size
+                stop += 1
+            rows = [i for i in range(start, stop) if sizes[i]]
+            if rows:
+                values = np.concatenate([hashed[i] for i in rows])
+                offsets = np.concatenate(([0], np.cumsum(sizes[rows])[:-1]))
+                permuted = (values[:, None] * self._a + self._b) >> _SHIFT
+                result[rows] = np.minimum.reduceat(permuted, offsets, axis=0)
+            start = stop
+        return result, sizes > 0
+
+
+class _BandTable:
+    """
+    LSH band buckets over append-only columns.
+
+    Band hashes of the first _indexed_count rows are kept sorted per band for
+    binary-search lookups; newer rows sit in a pending tail that is scanned
+    directly, and removed rows are tombstoned until the next compaction.
+    """
+
+    def __init__(
+        self, num_perm: int, bands: int, rows: int, keep_signatures: bool
+    ) -> None:
+        self.bands = bands
+        self.rows = rows
+        self.keep_signatures = keep_signatures
+        rng = np.random.default_rng(bands * 1000 + rows)
+        self._mixers = rng.integers(1, 1 << 63, rows, dtype=np.uint64) | np.uint64(1)
+        self._count = 0
+        self._dead_count = 0
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._hashes = np.zeros((0, bands), dtype=np.uint64)
+        self._signatures = np.zeros((0, num_perm), dtype=np.uint32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._position: dict[int, int] = {}
+        self._indexed_count = 0
+        self._sorted_hashes = np.zeros((bands, 0), dtype=np.uint64)
+        self._sorted_positions = np.zeros((bands, 0), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._count - self._dead_count
+
+    def __contains__(self, document_id: int) -> bool:
+        return document_id in self._position
+
+    def band_hashes(self, signatures: np.ndarray) -> np.ndarray:
+        """Hash each band of each signature row to one uint64."""
+        banded = signatures[:, : self.bands * self.rows].reshape(
+            len(signatures), self.bands, self.rows
+        )
+        return (banded.astype(np.uint64) * self._mixers).sum(axis=2, dtype=np.uint64)
+
+    def add_many(self, document_ids: Sequence[int], signatures: np.ndarray) -> None:
+        """Insert or replace the signatures of several documents."""
+        if not len(document_ids):
+            return
+        for document_id in document_ids:
+            self.remove(document_id)
+        needed = self._count + len(document_ids)
+        if needed > len(self._ids):
+            self._grow(max(1024, needed, len(self._ids) * 2))
+
+        positions = slice(self._count, needed)
+        self._ids[positions] = document_ids
+        self._hashes[positions] = self.band_hashes(signatures)
+        if self.keep_signatures:
+            self._signatures[positions] = signatures
+        self._alive[positions] = True
+        for offset, document_id in enumerate(document_ids):
+            self._position[int(document_id)] = self._count + offset
+        self._count = needed
+        self._maybe_compact()
+
+    def remove(self, document_id: int) -> bool:
+        position = self._position.pop(document_id, None)
+        if position is None:
+            return False
+        self._alive[position] = False
+        self._dead_count += 1
+        return True
+
+    def signature(self, document_id: int) -> np.ndarray | None:
+        position = self._position.get(document_id)
+        if position is None or not self.keep_signatures:
+            return None
+        return self._signatures[position]
+
+    def candidates(self, signature: np.ndarray) -> np.ndarray:
+        """IDs of documents sharing at least one band with a signature."""
+        hashes = self.band_hashes(signature[None, :])[0]
+        found = []
+        for band in range(self.bands):
+            sorted_band = self._sorted_hashes[band]
+            low = np.searchsorted(sorted_band, hashes[band], side="left")
+            high = np.searchsorted(sorted_band, hashes[band], side="right")
+            if high > low:
+                found.append(self._sorted_positions[band, low:high])
+        tail = self._hashes[self._indexed_count : self._count]
+        found.append(np.flatnonzero((tail == hashes).any(axis=1)) + self._indexed_count)
+        positions = np.unique(np.concatenate(found))
+        positions = positions[self._alive[positions]]
+        return self._ids[positions]
+
+    def candidate_pairs(self) -> np.ndarray:
+        """
+        All ID pairs that share at least one band.
+
+        Returns:
+            Array of shape (n, 2) with the smaller ID first, without repeats
+        """
+        self.compact()
+        count = self._count
+        base = int(self._ids[:count].max()) + 1 if count else 1
+        encoded = []
+        for band in range(self.bands if count > 1 else 0):
+            sorted_band = self._sorted_hashes[band]
+            ids = self._ids[self._sorted_positions[band]]
+            # Rows i and i + shift share a bucket when every neighbour in
+            # between has the same hash; most buckets hold a single row
+            same = sorted_band[1:] == sorted_band[:-1]
+            in_run = same
+            shift = 1
+            while in_run.any():
+                first = np.flatnonzero(in_run)
+                low, high = ids[first], ids[first + shift]
+                encoded.append(np.minimum(low, high) * base + np.maximum(low, high))
+                shift += 1
+                in_run = in_run[:-1] & same[shift - 1 :]
+        if not encoded:
+            return np.zeros((0, 2), dtype=np.int64)
+        codes = np.unique(np.concatenate(encoded))
+        return np.stack((codes // base, codes % base), axis=1)
+
+    def _grow(self, capacity: int) -> None:
+        def resize(array: np.ndarray) -> np.ndarray:
+            grown = np.zeros((capacity, *array.shape[1:]), dtype=array.dtype)
+            grown[: len(array)] = array
+            return grown
+
+        self._ids = resize(self._ids)
+        self._hashes = resize(self._hashes)
+        self._alive = resize(self._alive)
+        if self.keep_signatures:
+            self._signatures = resize(self._signatures)
+
+    def _maybe_compact(self) -> None:
+        pending = self._count - self._indexed_count
+        if pending > max(256, self._count // 20) or self._dead_count > max(
+            1024, self._count // 5
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop tombstones and re-sort every band over all rows."""
+        if self._indexed_count == self._count and not self._dead_count:
+            return
+        if self._dead_count:
+            keep = np.flatnonzero(self._alive[: self._count])
+            self._ids = self._ids[keep].copy()
+            self._hashes = self._hashes[keep].copy()
+            if self.keep_signatures:
+                self._signatures = self._signatures[keep].copy()
+            self._alive = np.ones(len(keep), dtype=bool)
+            self._count = len(keep)
+            self._dead_count = 0
+            self._position = {
+                int(document_id): position
+                for position, document_id in enumerate(self._ids)
+            }
+        hashes = self._hashes[: self._count].T
+        self._sorted_positions = np.argsort(hashes, axis=1, kind="stable")
+        self._sorted_hashes = np.take_along_axis(hashes, self._sorted_positions, 1)
+        self._indexed_count = self._count
+
+
+class DocumentSimilarityIndex:
+    """
+    {
+        "name": "DocumentSimilarityIndex",
+        "version": "1.0.0",
+        "description": "Persisted MinHash signatures with a banded LSH index for near-duplicate documents.",
+        "dependencies": ["DatabaseConnection", "numpy"],
+        "interface": {
+            "inputs": ["document titles", "extracted document text (optional)"],
+            "outputs": "Near-duplicate candidates and title similarity groups"
+        }
+    }
+    Near-duplicate index over document titles and extracted text.
+
+    Title candidates are verified with the exact word-set Jaccard similarity,
+    so results match a full pairwise comparison except for pairs the LSH
+    banding misses (see recall_at). Content candidates are scored with the
+    MinHash estimate, since extracted text is not stored.
+    """
+
+    TITLES_SQL = "SELECT id, title FROM documents"
+    SIGNATURES_SQL = """
+        SELECT document_id, kind, num_perm, source_digest, signature
+        FROM document_signatures
+    """
+    UPSERT_SQL = """
+        INSERT INTO document_signatures
+            (document_id, kind, num_perm, source_digest, signature)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(document_id, kind) DO UPDATE SET
+            num_perm = excluded.num_perm,
+            source_digest = excluded.source_digest,
+            signature = excluded.signature,
+            updated_at = CURRENT_TIMESTAMP
+    """
+    # Minimum recall the banding must reach at a threshold to be used
+    MIN_RECALL = 0.9
+
+    def __init__(
+        self, num_perm: int = 128, bands: int = 32, reconcile_interval: float = 5.0
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            num_perm: MinHash signature length
+            bands: Number of LSH bands; each covers num_perm // bands values
+            reconcile_interval: Seconds between checks that the index still
+                matches the documents table
+        """
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.reconcile_interval = reconcile_interval
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._persist = True
+        self._last_reconciled = 0.0
+        self._fingerprint: tuple[int, ...] | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        num_perm = self.hasher.num_perm
+        self._titles: dict[int, str] = {}
+        self._title_words: dict[int, frozenset[str]] = {}
+        self._tables = {
+            SIGNATURE_KIND_TITLE: _BandTable(num_perm, self.bands, self.rows, False),
+            SIGNATURE_KIND_CONTENT: _BandTable(num_perm, self.bands, self.rows, True),
+        }
+
+    # ------------------------------------------------------------------
+    # Loading and maintenance
+    # ------------------------------------------------------------------
+
+    def recall_at(self, threshold: float) -> float:
+        """Probability that a pair with the given similarity becomes a candidate."""
+        return 1.0 - (1.0 - threshold**self.rows) ** self.bands
+
+    @property
+    def min_threshold(self) -> float:
+        """Lowest similarity threshold the banding serves with MIN_RECALL."""
+        threshold = 0.0
+        while self.recall_at(threshold) < self.MIN_RECALL:
+            threshold += 0.01
+        return round(threshold, 2)
+
+    def ensure_loaded(self, db: DatabaseConnection) -> None:
+        """
+        Load the index on first use and periodically sync it with the database.
+
+        Args:
+            db: Database connection holding documents and document_signatures
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded and now - self._last_reconciled < self.reconcile_interval:
+                return
+            if not self._loaded:
+                self.load(db)
+            elif self._db_fingerprint(db) != self._fingerprint:
+                self.sync(db)
+            self._last_reconciled = time.monotonic()
+
+    def load(self, db: DatabaseConnection) -> None:
+        """
+        (Re)build the index from persisted signatures, signing new documents.
+
+        Args:
+            db: Database connection holding documents and document_signatures
+        """
+        started = time.perf_counter()
+        with self._lock:
+            self._reset()
+            stored: dict[str, dict[int, tuple[int, np.ndarray]]] = {
+                SIGNATURE_KIND_TITLE: {},
+                SIGNATURE_KIND_CONTENT: {},
+            }
+            try:
+                for row in db.fetch_all(self.SIGNATURES_SQL):
+                    if (
+                        row["num_perm"] == self.hasher.num_perm
+                        and row["kind"] in stored
+                    ):
+                        stored[row["kind"]][row["document_id"]] = (
+                            row["source_digest"],
+                            np.frombuffer(row["signature"], dtype=np.uint32),
+                        )
+                self._persist = True
+            except Exception as e:
+                logger.warning(f"Document signatures unavailable, not persisting: {e}")
+                self._persist = False
+
+            self._fingerprint = self._db_fingerprint(db)
+            titles = {row["id"]: row["title"] for row in db.fetch_all(self.TITLES_SQL)}
+            content = stored[SIGNATURE_KIND_CONTENT]
+            content_ids = [i for i in content if i in titles]
+            if content_ids:
+                self._tables[SIGNATURE_KIND_CONTENT].add_many(
+                    content_ids, np.stack([content[i][1] for i in content_ids])
+                )
+            self._apply_titles(db, titles, stored[SIGNATURE_KIND_TITLE])
+            for table in self._tables.values():
+                table.compact()
+            self._loaded = True
+            self._last_reconciled = time.monotonic()
+        logger.info(
+            f"Loaded document similarity index with {len(self._titles)} titles in "
+            f"{time.perf_counter() - started:.3f}s"
+        )
+
+    def sync(self, db: DatabaseConnection) -> None:
+        """
+        Apply documents added, retitled or removed outside this index.
+
+        Args:
+            db: Database connection holding documents and document_signatures
+        """
+        with self._lock:
+            self._fingerprint = self._db_fingerprint(db)
+            titles = {row["id"]: row["title"] for row in db.fetch_all(self.TITLES_SQL)}
+            for document_id in set(self._titles) - set(titles):
+                self._forget(document_id)
+            changed = {
+                document_id: title
+                for document_id, title in titles.items()
+                if self._titles.get(document_id) != title
+            }
+            self._apply_titles(db, changed, {})
+
+    def invalidate(self) -> None:
+        """Force a reload on next use (after bulk or out-of-band changes)."""
+        with self._lock:
+            self._loaded = False
+
+    def index_document(
+        self,
+        db: DatabaseConnection,
+        document_id: int,
+        title: str,
+        text: str | None = None,
+    ) -> None:
+        """
+        Sign and index one document, persisting its signatures.
+
+        Args:
+            db: Database connection holding document_signatures
+            document_id: Document primary key
+            title: Document title
+            text: Extracted document text, if content matching is wanted
+        """
+        with self._lock:
+            self.ensure_loaded(db)
+            if self._titles.get(document_id) != title:
+                self._apply_titles(db, {document_id: title}, {})
+            if text is None:
+                return
+            shingles = text_shingles(text)
+            signature = self.hasher.signature(shingles)
+            if signature is None:
+                return
+            self._tables[SIGNATURE_KIND_CONTENT].add_many(
+                [document_id], signature[None]
+            )
+            self._store(
+                db,
+                [(document_id, SIGNATURE_KIND_CONTENT, _digest(shingles), signature)],
+            )
+
+    def remove_document(self, db: DatabaseConnection, document_id: int) -> None:
+        """
+        Drop a document from the index and its persisted signatures.
+
+        Args:
+            db: Database connection holding document_signatures
+            document_id: Document primary key
+        """
+        with self._lock:
+            if not self._loaded:
+                return  # Picked up by the initial load
+            self._forget(document_id)
+            if self._persist:
+                db.execute(
+                    "DELETE FROM document_signatures WHERE document_id = ?",
+                    (document_id,),
+                )
+
+    def _forget(self, document_id: int) -> None:
+        self._titles.pop(document_id, None)
+        self._title_words.pop(document_id, None)
+        for table in self._tables.values():
+            table.remove(document_id)
+
+    def _apply_titles(
+        self,
+        db: DatabaseConnection,
+        titles: dict[int, str],
+        stored: dict[int, tuple[int, np.ndarray]],
+    ) -> None:
+        """Index titles, reusing current stored signatures and signing the rest."""
+        table = self._tables[SIGNATURE_KIND_TITLE]
+        reused, to_sign = [], []
+        for document_id, title in titles.items():
+            words = title_words(title)
+            self._titles[document_id] = title
+            self._title_words[document_id] = words
+            entry = stored.get(document_id)
+            if not words:
+                table.remove(document_id)
+            elif entry is not None and entry[0] == _digest(words):
+                reused.append(document_id)
+            else:
+                to_sign.append(document_id)
+
+        if reused:
+            table.add_many(reused, np.stack([stored[i][1] for i in reused]))
+        if to_sign:
+            signatures, _ = self.hasher.signatures(
+                [self._title_words[i] for i in to_sign]
+            )
+            table.add_many(to_sign, signatures)
+            self._store(
+                db,
+                [
+                    (
+                        document_id,
+                        SIGNATURE_KIND_TITLE,
+                        _digest(self._title_words[document_id]),
+                        signature,
+                    )
+                    for document_id, signature in zip(to_sign, signatures, strict=True)
+                ],
+            )
+
+    def _store(
+        self,
+        db: DatabaseConnection,
+        entries: list[tuple[int, str, int, np.ndarray]],
+    ) -> None:
+        if not self._persist or not entries:
+            return
+        try:
+            db.execute_many(
+                self.UPSERT_SQL,
+                [
+                    (
+                        document_id,
+                        kind,
+                        self.hasher.num_perm,
+                        digest,
+                        signature.tobytes(),
+                    )
+                    for document_id, kind, digest, signature in entries
+                ],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to persist document signatures: {e}")
+
+    def _db_fingerprint(self, db: DatabaseConnection) -> tuple[int, ...]:
+        """Changes whenever a document is added, removed or retitled."""
+        try:
+            row = db.fetch_one(
+                "SELECT document_count, generation FROM document_stats WHERE id = 1"
+            )
+            if row:
+                return (row["document_count"], row["generation"])
+        except Exception:  # Counter table not migrated yet
+            pass
+        row = db.fetch_one("SELECT COUNT(*) AS total, MAX(id) AS max_id FROM documents")
+        return (row["total"], row["max_id"] or 0) if row else (0, 0)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def find_similar(
+        self,
+        db: DatabaseConnection,
+        title: str | None = None,
+        text: str | None = None,
+        threshold: float = 0.8,
+        exclude_id: int | None = None,
+        content_of: int | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Find indexed documents similar to a title and/or extracted text.
+
+        Args:
+            db: Database connection holding the documents
+            title: Title to match by word-set similarity
+            text: Extracted text to match by estimated shingle similarity
+            threshold: Minimum similarity score (0.0 to 1.0)
+            exclude_id: Document to leave out (usually the query document)
+            content_of: Indexed document whose stored content signature is
+                matched when no text is given
+        Returns:
+            List of (document_id, score) sorted by descending score; a document
+            matching both ways is scored by its best match
+        """
+        with self._lock:
+            self.ensure_loaded(db)
+            scores: dict[int, float] = {}
+
+            words = title_words(title)
+            signature = self.hasher.signature(words) if words else None
+            if signature is not None:
+                table = self._tables[SIGNATURE_KIND_TITLE]
+                for candidate in table.candidates(signature).tolist():
+                    score = _jaccard(
+                        words, self._title_words.get(candidate, frozenset())
+                    )
+                    if title.lower().strip() == self._titles[candidate].lower().strip():
+                        score = 1.0
+                    if score >= threshold:
+                        scores[candidate] = score
+
+            table = self._tables[SIGNATURE_KIND_CONTENT]
+            if text:
+                signature = self.hasher.signature(text_shingles(text))
+            else:
+                signature = table.signature(content_of) if content_of else None
+            if signature is not None:
+                for candidate in table.candidates(signature).tolist():
+                    score = float(np.mean(table.signature(candidate) == signature))
+                    if score >= threshold:
+                        scores[candidate] = max(scores.get(candidate, 0.0), score)
+
+        scores.pop(exclude_id, None)
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def similar_title_groups(
+        self, db: DatabaseConnection, threshold: float = 0.8
+    ) -> list[list[int]]:
+        """
+        Group the library by title similarity.
+
+        Documents are visited in ID order; each ungrouped document collects
+        every later ungrouped document whose title reaches the threshold.
+        Args:
+            db: Database connection holding the documents
+            threshold: Minimum similarity score (0.0 to 1.0)
+        Returns:
+            Lists of document IDs with more than one member
+        """
+        with self._lock:
+            self.ensure_loaded(db)
+            pairs = self._tables[SIGNATURE_KIND_TITLE].candidate_pairs()
+            later: dict[int, list[int]] = {}
+            for first, second in pairs.tolist():
+                if title_similarity(self._titles[first], self._titles[second]) >= (
+                    threshold
+                ):
+                    later.setdefault(first, []).append(second)
+
+        groups = []
+        grouped: set[int] = set()
+        for document_id in sorted(later):
+            if document_id in grouped:
+                continue
+            members = [d for d in sorted(later[document_id]) if d not in grouped]
+            if members:
+                grouped.add(document_id)
+                grouped.update(members)
+                groups.append([document_id, *members])
+        return groups
+
+    def stats(self) -> dict[str, Any]:
+        """Index size and banding parameters."""
+        return {
+            "titles": len(self._tables[SIGNATURE_KIND_TITLE]),
+            "contents": len(self._tables[SIGNATURE_KIND_CONTENT]),
+            "num_perm": self.hasher.num_perm,
+            "bands": self.bands,
+            "rows_per_band": self.rows,
+            "min_threshold": self.min_threshold,
+        }
+
+
+# One index per database connection, shared by all service instances
+_indexes: weakref.WeakKeyDictionary[DatabaseConnection, DocumentSimilarityIndex] = (
+    weakref.WeakKeyDictionary()
+)
+_indexes_lock = threading.Lock()
+
+
+def get_document_similarity_index(db: DatabaseConnection) -> DocumentSimilarityIndex:
+    """Get the shared document similarity index for a database connection."""
+    with _indexes_lock:
+        index = _indexes.get(db)
+        if index is None:
+            index = _indexes[db] = DocumentSimilarityIndex()
+        return index
@@ -227,11 +227,16 @@ class VectorIndexRepository(BaseRepository[VectorIndexModel]):
                     if self.delete(index.id):
                         cleaned_count += 1
                         logger.debug(f"Removed invalid index from database: {index.id}")
-                    # Optionally remove files
-                    if remove_files and Path(index.index_path).exists():
-                        import shutil
+                    # Optionally remove files, including published versions
+                    index_path = Path(index.index_path)
+                    if remove_files and (
+                        index_path.exists() or index_path.is_symlink()
+                    ):
+                        from src.services.index_version_store import (
+                            IndexVersionStore,
+                        )
 
-                        shutil.rmtree(index.index_path, ignore_errors=True)
+                        IndexVersionStore(index_path.parent).remove(index_path)
                         logger.debug(f"Removed index files: {index.index_path}")
                 except Exception as e:
                     logger.warning(
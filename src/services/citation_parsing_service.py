@@ -7,7 +7,12 @@ Enhanced with third-party library integration for improved accuracy.
 from __future__ import annotations
 
 import logging
+import operator
+import os
 import re
+from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 # Third-party library imports (optional dependencies)
@@ -25,6 +30,281 @@ REQUESTS_AVAILABLE: bool = False
 
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# Compiled Patterns
+# ============================================================================
+# Compiled once at import: every pattern runs per candidate citation, and
+# re.search() with a pattern string pays a cache lookup on each call.
+
+_REGEX_FLAGS = re.MULTILINE | re.DOTALL
+
+CITATION_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(pattern, _REGEX_FLAGS)
+    for pattern in (
+        # Multi-author with complex punctuation: "Author, A., Author, B., ... & Author, Z. (Year)"
+        r"(?:^|\s)([A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)+(?:,\s*[A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)*)*.*?(?:&|and)\s*[A-Z][a-zA-Z]+.*?\(\d{4}[a-z]?\).*?\.)",
+        # Standard academic citation: "Author, F. (Year). Title. Journal."
+        r"(?:^|\s)([A-Z][a-zA-Z]+,\s*[A-Z]\.?.*?\(\d{4}[a-z]?\).*?\.)",
+        # Multiple authors with et al: "Author, F. et al. (Year). Title."
+        r"(?:^|\s)([A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)?\s*et\s+al\.?.*?\(\d{4}[a-z]?\).*?\.)",
+        # Full name format: "LastName, FirstName (Year)"
+        r"(?:^|\s)([A-Z][a-zA-Z]+,\s*[A-Z][a-zA-Z]+.*?\(\d{4}[a-z]?\).*?\.)",
+        # Abbreviated format: "LastName F. (Year)"
+        r"(?:^|\s)([A-Z][a-zA-Z]+\s+[A-Z]\.?.*?\(\d{4}[a-z]?\).*?\.)",
+    )
+)
+
+# Lines that are clearly not citations (matched against stripped lines)
+_SKIP_LINE_PATTERN = re.compile(
+    r"Abstract\s*:|Introduction\s*:|Conclusion\s*:|References\s*:"
+    r"|Figure\s+\d+|Table\s+\d+|Section\s+\d+|Chapter\s+\d+",
+    re.IGNORECASE,
+)
+
+_YEAR_IN_PARENS = re.compile(r"\(\d{4}[a-z]?\)")
+_FOUR_DIGITS = re.compile(r"(\d{4})")
+_LEADING_PUNCTUATION = re.compile(r"^[.,\s]+")
+_TRAILING_PUNCTUATION = re.compile(r"[.,\s]+$")
+_HAS_LETTER = re.compile(r"[A-Za-z]")
+_WHITESPACE_RUN = re.compile(r"\s+")
+_COMMA_SPACING = re.compile(r"\s*,\s*")
+_CANDIDATE_START = re.compile(r"^(?:.*?\b)?[A-Z][a-zA-Z]+")
+
+_AUTHOR_MULTI = re.compile(
+    r"^(?:.*?\b)?([A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)+)(?:,\s*[A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)*)*.*?(?:&|and)\s*[A-Z][a-zA-Z]+.*?\(\d{4}[a-z]?\)"
+)
+_AUTHOR_STANDARD = tuple(
+    re.compile(pattern)
+    for pattern in (
+        # "LastName, F." at start
+        r"^(?:.*?\b)?([A-Z][a-zA-Z]+,\s*[A-Z]\.?)(?=\s*(?:,|\.|&|et\s+al|\())",
+        # "LastName, FirstName" at start
+        r"^(?:.*?\b)?([A-Z][a-zA-Z]+,\s*[A-Z][a-zA-Z]+)(?=\s*(?:,|\.|&|et\s+al|\())",
+        # "LastName F." format
+        r"^(?:.*?\b)?([A-Z][a-zA-Z]+\s+[A-Z]\.?)(?=\s*(?:,|\.|&|et\s+al|\())",
+    )
+)
+_AUTHOR_BEFORE_YEAR = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"([A-Z][a-zA-Z]+,\s*[A-Z]\.?)(?=\s*$|\s*\.$)",  # "LastName, F."
+        r"([A-Z][a-zA-Z]+,\s*[A-Z][a-zA-Z]+)(?=\s*$|\s*\.$)",  # "LastName, FirstName"
+        r"([A-Z][a-zA-Z]+\s+[A-Z]\.?)(?=\s*$|\s*\.$)",  # "LastName F."
+        r"([A-Z][a-zA-Z]+)(?=\s*$|\s*\.$)",  # Just "LastName"
+    )
+)
+_AUTHOR_BEGINNING = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"^([A-Z][a-zA-Z]+,\s*[A-Z]\.?)",  # "LastName, F."
+        r"^([A-Z][a-zA-Z]+,\s*[A-Z][a-zA-Z]+)",  # "LastName, FirstName"
+        r"^([A-Z][a-zA-Z]+\s+[A-Z]\.?)",  # "LastName F."
+        r"^([A-Z][a-zA-Z]+)",  # Just "LastName"
+    )
+)
+
+_QUOTED_TITLE = re.compile(r'["""]([^"""]+)["""]')
+_AUTHOR_END = re.compile(r"[A-Z][a-z]+,\s*[A-Z]\.?\s*")
+_TITLE_FALLBACK = re.compile(r"[A-Z][a-z]+(?:,\s*[A-Z]\.?\s*)*\s+(.+?)(?:\.|$)")
+_STARTS_WITH_YEAR = re.compile(r"^\(\d{4}")
+_VENUE_NAME = re.compile(r"^([^,.]+)")
+
+YEAR_PATTERNS: tuple[str, ...] = (
+    r"\((\d{4}[a-z]?)\)",  # (2023) or (2023a)
+    r"(\d{4}[a-z]?)\.",  # 2023. or 2023a.
+)
+DOI_PATTERNS: tuple[str, ...] = (
+    r"https?://doi\.org/([^\s]+)",
+    r"DOI:\s*([^\s]+)",
+    r"doi:\s*([^\s]+)",
+)
+# Substring indicators per citation type, checked in order
+CITATION_TYPE_INDICATORS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (
+        "conference",
+        (
+            "proceedings",
+            "conference",
+            "workshop",
+            "symposium",
+            "icml",
+            "nips",
+            "iclr",
+            "cvpr",
+            "acl",
+            "emnlp",
+        ),
+    ),
+    (
+        "journal",
+        (
+            "journal",
+            "review",
+            "quarterly",
+            "annual",
+            "magazine",
+            "nature",
+            "science",
+            "cell",
+            "lancet",
+        ),
+    ),
+    (
+        "book",
+        (
+            "press",
+            "publisher",
+            "edition",
+            "book",
+            "handbook",
+            "cambridge",
+            "oxford",
+            "springer",
+            "wiley",
+            "mit press",
+        ),
+    ),
+    ("thesis", ("thesis", "dissertation", "phd", "master")),
+)
+_CITATION_TYPE_INDICATORS = tuple(
+    (citation_type, re.compile("|".join(map(re.escape, indicators))))
+    for citation_type, indicators in CITATION_TYPE_INDICATORS
+)
+_YEAR_PATTERNS = tuple(re.compile(pattern) for pattern in YEAR_PATTERNS)
+_DOI_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in DOI_PATTERNS)
+
+# ============================================================================
+# Near-Duplicate Detection
+# ============================================================================
+
+DUPLICATE_SIMILARITY_THRESHOLD = 0.8
+
+
+def text_similarity(text1: str, text2: str) -> float:
+    """
+    Positional character similarity of two strings.
+
+    Counts positions where both strings hold the same character and divides
+    by the length of the longer string.
+    """
+    if not text1 or not text2:
+        return 0.0
+    longer = max(len(text1), len(text2))
+    return sum(map(operator.eq, text1, text2)) / longer
+
+
+class NearDuplicateIndex:
+    """
+    Finds texts whose text_similarity() to a query exceeds a threshold.
+
+    Texts are blocked by aligned 4-character n-grams keyed on their position.
+    Two texts above a threshold of at least 0.8 disagree on fewer than a fifth
+    of the positions of the shorter one; a shorter text of 32+ characters has
+    more aligned blocks than that, so duplicates always share enough blocks to
+    pass the count filter and only those pairs get the full comparison. Short
+    texts, where the pigeonhole bound does not hold, are found by length.
+    """
+
+    BLOCK_SIZE = 4
+    MIN_BLOCKED_LENGTH = 32
+
+    def __init__(self, threshold: float = DUPLICATE_SIMILARITY_THRESHOLD) -> None:
+        if threshold < 0.8:
+            raise ValueError("Blocking is only lossless for thresholds >= 0.8")
+        self.threshold = threshold
+        self._texts: list[str] = []
+        self._short_by_length: defaultdict[int, list[str]] = defaultdict(list)
+        # One postings map per block position: block text -> text positions
+        self._blocks: list[dict[str, list[int]]] = []
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _split_blocks(self, text: str) -> list[str]:
+        size = self.BLOCK_SIZE
+        return [text[i : i + size] for i in range(0, len(text) - size + 1, size)]
+
+    def add(self, text: str) -> None:
+        """Index a text."""
+        position = len(self._texts)
+        self._texts.append(text)
+        if len(text) < self.MIN_BLOCKED_LENGTH:
+            self._short_by_length[len(text)].append(text)
+            return
+        split = self._split_blocks(text)
+        blocks = self._blocks
+        blocks.extend({} for _ in range(len(split) - len(blocks)))
+        for postings, block in zip(blocks, split, strict=False):
+            postings.setdefault(block, []).append(position)
+
+    def contains_similar(self, text: str) -> bool:
+        """Check whether any indexed text is more similar than the threshold."""
+        if not text:
+            return False
+
+        length = len(text)
+        threshold = self.threshold
+        # Similarity cannot exceed shorter/longer, which bounds the lengths
+        min_length = int(length * threshold) + 1
+        max_length = int(length / threshold) + 1
+
+        candidates: list[str] = []
+        for other_length in range(
+            min_length, min(max_length, self.MIN_BLOCKED_LENGTH - 1) + 1
+        ):
+            candidates.extend(self._short_by_length.get(other_length, ()))
+
+        if max_length >= self.MIN_BLOCKED_LENGTH:
+            if length < self.MIN_BLOCKED_LENGTH:
+                # Pigeonhole bound does not hold; fall back to a length scan
+                candidates.extend(
+                    other
+                    for other in self._texts
+                    if min_length <= len(other) <= max_length
+                    and len(other) >= self.MIN_BLOCKED_LENGTH
+                )
+            else:
+                shared: dict[int, int] = {}
+                for postings, block in zip(
+                    self._blocks, self._split_blocks(text), strict=False
+                ):
+                    for position in postings.get(block, ()):
+                        shared[position] = shared.get(position, 0) + 1
+                texts = self._texts
+                for position, count in shared.items():
+                    other = texts[position]
+                    shorter = min(length, len(other))
+                    # Blocks within the shorter text minus the most mismatches
+                    # it may have (ceil(0.2 * shorter), one spare for rounding)
+                    required = shorter // self.BLOCK_SIZE + (-shorter // 5)
+                    if count >= required:
+                        candidates.append(other)
+
+        for other in candidates:
+            other_length = len(other)
+            if min_length <= other_length <= max_length and (
+                text_similarity(text, other) > threshold
+            ):
+                return True
+        return False
+
+
+# ============================================================================
+# Parallel Parsing
+# ============================================================================
+
+_worker_service: CitationParsingService | None = None
+
+
+def _parse_document_worker(
+    text_content: str, use_third_party: bool
+) -> list[dict[str, Any]]:
+    """Process-pool entry point; reuses one service per worker process."""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = CitationParsingService()
+    return _worker_service.parse_citations_from_text(text_content, use_third_party)
+
 
 class CitationParsingService:
     """
@@ -52,16 +332,8 @@ class CitationParsingService:
             r"([A-Z][a-z]+(?:\s*et\s+al\.?))",  # Smith et al.
         ]
 
-        self.year_patterns: list[str] = [
-            r"\((\d{4}[a-z]?)\)",  # (2023) or (2023a)
-            r"(\d{4}[a-z]?)\.",  # 2023. or 2023a.
-        ]
-
-        self.doi_patterns: list[str] = [
-            r"https?://doi\.org/([^\s]+)",
-            r"DOI:\s*([^\s]+)",
-            r"doi:\s*([^\s]+)",
-        ]
+        self.year_patterns: list[str] = list(YEAR_PATTERNS)
+        self.doi_patterns: list[str] = list(DOI_PATTERNS)
 
     def parse_citations_from_text(
         self, text_content: str, use_third_party: bool = True
@@ -92,10 +364,14 @@ class CitationParsingService:
             # Always run our regex-based parser for additional coverage
             fallback_citations = self._parse_with_regex(text_content)
 
-            # Merge results, avoiding duplicates
-            citations = self._merge_and_deduplicate_citations(
-                citations, fallback_citations
-            )
+            # Merge results, avoiding duplicates (regex results are already
+            # deduplicated among themselves)
+            if citations:
+                citations = self._merge_and_deduplicate_citations(
+                    citations, fallback_citations
+                )
+            else:
+                citations = fallback_citations
 
             logger.debug(
                 f"Parsed {len(citations)} citations from text (third-party: {use_third_party})"
@@ -106,6 +382,45 @@ class CitationParsingService:
             logger.error(f"Failed to parse citations from text: {e}")
             raise
 
+    def parse_documents(
+        self,
+        texts: Sequence[str],
+        use_third_party: bool = True,
+        max_workers: int | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Parse citations from many documents, in parallel across processes.
+
+        Args:
+            texts: Text content of each document
+            use_third_party: Whether to use third-party libraries for enhanced accuracy
+            max_workers: Worker processes (defaults to the CPU count); with one
+                worker or a single document the texts are parsed in-process
+
+        Returns:
+            Parsed citations for each document, in input order
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(texts))
+
+        if max_workers <= 1:
+            return [
+                self.parse_citations_from_text(text, use_third_party) for text in texts
+            ]
+
+        logger.debug(f"Parsing {len(texts)} documents with {max_workers} workers")
+        chunksize = max(1, len(texts) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(
+                pool.map(
+                    _parse_document_worker,
+                    texts,
+                    [use_third_party] * len(texts),
+                    chunksize=chunksize,
+                )
+            )
+
     def _parse_with_refextract(self, text_content: str) -> list[dict[str, Any]]:
         """Parse citations using CERN's refextract library."""
         try:
@@ -168,28 +483,19 @@ class CitationParsingService:
         try:
             citations = []
 
-            # Enhanced citation pattern matching for academic references
-            # Focus on patterns that reliably indicate citation starts
-            citation_patterns = [
-                # Multi-author with complex punctuation: "Author, A., Author, B., ... & Author, Z. (Year)"
-                r"(?:^|\s)([A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)+(?:,\s*[A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)*)*.*?(?:&|and)\s*[A-Z][a-zA-Z]+.*?\(\d{4}[a-z]?\).*?\.)",
-                # Standard academic citation: "Author, F. (Year). Title. Journal."
-                r"(?:^|\s)([A-Z][a-zA-Z]+,\s*[A-Z]\.?.*?\(\d{4}[a-z]?\).*?\.)",
-                # Multiple authors with et al: "Author, F. et al. (Year). Title."
-                r"(?:^|\s)([A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)?\s*et\s+al\.?.*?\(\d{4}[a-z]?\).*?\.)",
-                # Full name format: "LastName, FirstName (Year)"
-                r"(?:^|\s)([A-Z][a-zA-Z]+,\s*[A-Z][a-zA-Z]+.*?\(\d{4}[a-z]?\).*?\.)",
-                # Abbreviated format: "LastName F. (Year)"
-                r"(?:^|\s)([A-Z][a-zA-Z]+\s+[A-Z]\.?.*?\(\d{4}[a-z]?\).*?\.)",
-            ]
-
             # Pre-filter text to remove obvious non-citation sentences
             filtered_text = self._prefilter_citation_text(text_content)
 
-            for pattern in citation_patterns:
-                matches = re.finditer(pattern, filtered_text, re.MULTILINE | re.DOTALL)
-                for match in matches:
+            # The patterns overlap, so most references are matched several
+            # times; a repeat can only ever be dropped as a duplicate.
+            seen_candidates: set[str] = set()
+
+            for pattern in CITATION_PATTERNS:
+                for match in pattern.finditer(filtered_text):
                     citation_text = match.group(1).strip()
+                    if citation_text in seen_candidates:
+                        continue
+                    seen_candidates.add(citation_text)
 
                     # Enhanced filtering for valid citations
                     if self._is_valid_citation_candidate(citation_text):
@@ -249,64 +555,34 @@ class CitationParsingService:
 
             # Strategy 1: Handle complex multi-author citations first
             # Pattern: "FirstAuthor, A., SecondAuthor, B., ... & LastAuthor, Z. (Year)"
-            complex_multiauthor = re.search(
-                r"^(?:.*?\b)?([A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)+)(?:,\s*[A-Z][a-zA-Z]+(?:,\s*[A-Z]\.?)*)*.*?(?:&|and)\s*[A-Z][a-zA-Z]+.*?\(\d{4}[a-z]?\)",
-                text,
-            )
+            complex_multiauthor = _AUTHOR_MULTI.search(text)
             if complex_multiauthor:
                 first_author = complex_multiauthor.group(1).strip()
                 return self._normalize_author_name(first_author)
 
             # Strategy 2: Look for standard "Author, F." patterns at the start
-            standard_patterns = [
-                # "LastName, F." at start
-                r"^(?:.*?\b)?([A-Z][a-zA-Z]+,\s*[A-Z]\.?)(?=\s*(?:,|\.|&|et\s+al|\())",
-                # "LastName, FirstName" at start
-                r"^(?:.*?\b)?([A-Z][a-zA-Z]+,\s*[A-Z][a-zA-Z]+)(?=\s*(?:,|\.|&|et\s+al|\())",
-                # "LastName F." format
-                r"^(?:.*?\b)?([A-Z][a-zA-Z]+\s+[A-Z]\.?)(?=\s*(?:,|\.|&|et\s+al|\())",
-            ]
-
-            for pattern in standard_patterns:
-                match = re.search(pattern, text)
+            for pattern in _AUTHOR_STANDARD:
+                match = pattern.search(text)
                 if match:
                     author = match.group(1).strip()
                     return self._normalize_author_name(author)
 
             # Strategy 3: Look for author before year marker
-            year_match = re.search(r"\(\d{4}[a-z]?\)", text)
+            year_match = _YEAR_IN_PARENS.search(text)
             if year_match:
                 before_year = text[: year_match.start()].strip()
 
                 # Extract the last complete author name before the year
-                author_before_year_patterns = [
-                    # "LastName, F." format
-                    r"([A-Z][a-zA-Z]+,\s*[A-Z]\.?)(?=\s*$|\s*\.$)",
-                    # "LastName, FirstName" format
-                    r"([A-Z][a-zA-Z]+,\s*[A-Z][a-zA-Z]+)(?=\s*$|\s*\.$)",
-                    # "LastName F." format
-                    r"([A-Z][a-zA-Z]+\s+[A-Z]\.?)(?=\s*$|\s*\.$)",
-                    # Just "LastName"
-                    r"([A-Z][a-zA-Z]+)(?=\s*$|\s*\.$)",
-                ]
-
-                for pattern in author_before_year_patterns:
-                    matches = re.findall(pattern, before_year)
+                for pattern in _AUTHOR_BEFORE_YEAR:
+                    matches = pattern.findall(before_year)
                     if matches:
                         # Take the first occurrence (leftmost = first author)
                         author = matches[0].strip()
                         return self._normalize_author_name(author)
 
             # Strategy 4: Extract from the very beginning, assuming citation starts with author
-            beginning_patterns = [
-                r"^([A-Z][a-zA-Z]+,\s*[A-Z]\.?)",  # "LastName, F."
-                r"^([A-Z][a-zA-Z]+,\s*[A-Z][a-zA-Z]+)",  # "LastName, FirstName"
-                r"^([A-Z][a-zA-Z]+\s+[A-Z]\.?)",  # "LastName F."
-                r"^([A-Z][a-zA-Z]+)",  # Just "LastName"
-            ]
-
-            for pattern in beginning_patterns:
-                match = re.search(pattern, text)
+            for pattern in _AUTHOR_BEGINNING:
+                match = pattern.search(text)
                 if match:
                     author = match.group(1).strip()
                     if len(author) > 2:  # Avoid single letters
@@ -330,12 +606,12 @@ class CitationParsingService:
         """
         try:
             # Look for quoted titles
-            quoted_title = re.search(r'["""]([^"""]+)["""]', citation_text)
+            quoted_title = _QUOTED_TITLE.search(citation_text)
             if quoted_title:
                 return quoted_title.group(1).strip()
 
             # Look for text between author and year
-            year_match = re.search(r"\(\d{4}[a-z]?\)", citation_text)
+            year_match = _YEAR_IN_PARENS.search(citation_text)
             if year_match:
                 before_year = citation_text[: year_match.start()]
                 # Try to find title after author name
@@ -347,22 +623,21 @@ class CitationParsingService:
                         return potential_title
 
                 # Alternative: look for title after author comma
-                author_end = re.search(r"[A-Z][a-z]+,\s*[A-Z]\.?\s*", before_year)
+                author_end = _AUTHOR_END.search(before_year)
                 if author_end:
                     after_author = before_year[author_end.end() :].strip()
                     # Remove leading punctuation
-                    after_author = re.sub(r"^[.,\s]+", "", after_author)
+                    after_author = _LEADING_PUNCTUATION.sub("", after_author)
                     if len(after_author) > 5:
                         return after_author
 
             # Fallback: look for capitalized text that could be a title
             # Look for pattern after author names
-            title_pattern = r"[A-Z][a-z]+(?:,\s*[A-Z]\.?\s*)*\s+(.+?)(?:\.|$)"
-            title_match = re.search(title_pattern, citation_text)
+            title_match = _TITLE_FALLBACK.search(citation_text)
             if title_match:
                 potential_title = title_match.group(1).strip()
-                if len(potential_title) > 5 and not re.match(
-                    r"^\(\d{4}", potential_title
+                if len(potential_title) > 5 and not _STARTS_WITH_YEAR.match(
+                    potential_title
                 ):
                     return potential_title
 
@@ -383,12 +658,12 @@ class CitationParsingService:
             Extracted year or None
         """
         try:
-            for pattern in self.year_patterns:
-                match = re.search(pattern, citation_text)
+            for pattern in _YEAR_PATTERNS:
+                match = pattern.search(citation_text)
                 if match:
                     year_str = match.group(1)
                     # Extract just the numeric part
-                    year_num = re.search(r"(\d{4})", year_str)
+                    year_num = _FOUR_DIGITS.search(year_str)
                     if year_num:
                         year = int(year_num.group(1))
                         # Validate year range
@@ -413,14 +688,14 @@ class CitationParsingService:
         """
         try:
             # Look for journal patterns after year
-            year_match = re.search(r"\(\d{4}[a-z]?\)", citation_text)
+            year_match = _YEAR_IN_PARENS.search(citation_text)
             if year_match:
                 after_year = citation_text[year_match.end() :].strip()
                 # Remove leading punctuation
-                after_year = re.sub(r"^[.,\s]+", "", after_year)
+                after_year = _LEADING_PUNCTUATION.sub("", after_year)
 
                 # Look for journal/venue name
-                venue_match = re.search(r"^([^,.]+)", after_year)
+                venue_match = _VENUE_NAME.search(after_year)
                 if venue_match:
                     venue = venue_match.group(1).strip()
                     if len(venue) > 3:
@@ -443,12 +718,14 @@ class CitationParsingService:
             Extracted DOI or None
         """
         try:
-            for pattern in self.doi_patterns:
-                match = re.search(pattern, citation_text, re.IGNORECASE)
+            for pattern in _DOI_PATTERNS:
+                match = pattern.search(citation_text)
                 if match:
                     doi = match.group(1).strip()
                     # Clean up DOI
-                    doi = re.sub(r"[.,\s]+$", "", doi)  # Remove trailing punctuation
+                    doi = _TRAILING_PUNCTUATION.sub(
+                        "", doi
+                    )  # Remove trailing punctuation
                     return doi
 
             return None
@@ -470,57 +747,9 @@ class CitationParsingService:
         try:
             text_lower = citation_text.lower()
 
-            # Conference patterns
-            conference_indicators = [
-                "proceedings",
-                "conference",
-                "workshop",
-                "symposium",
-                "icml",
-                "nips",
-                "iclr",
-                "cvpr",
-                "acl",
-                "emnlp",
-            ]
-            if any(indicator in text_lower for indicator in conference_indicators):
-                return "conference"
-
-            # Journal patterns
-            journal_indicators = [
-                "journal",
-                "review",
-                "quarterly",
-                "annual",
-                "magazine",
-                "nature",
-                "science",
-                "cell",
-                "lancet",
-            ]
-            if any(indicator in text_lower for indicator in journal_indicators):
-                return "journal"
-
-            # Book patterns
-            book_indicators = [
-                "press",
-                "publisher",
-                "edition",
-                "book",
-                "handbook",
-                "cambridge",
-                "oxford",
-                "springer",
-                "wiley",
-                "mit press",
-            ]
-            if any(indicator in text_lower for indicator in book_indicators):
-                return "book"
-
-            # Thesis patterns
-            thesis_indicators = ["thesis", "dissertation", "phd", "master"]
-            if any(indicator in text_lower for indicator in thesis_indicators):
-                return "thesis"
+            for citation_type, indicators in _CITATION_TYPE_INDICATORS:
+                if indicators.search(text_lower):
+                    return citation_type
 
             # Default to unknown
             return "unknown"
@@ -630,7 +859,7 @@ class CitationParsingService:
                     return None
 
                 # Extract numeric year
-                year_match = re.search(r"(\d{4})", str(year_str))
+                year_match = _FOUR_DIGITS.search(str(year_str))
                 if year_match:
                     return int(year_match.group(1))
             return None
@@ -673,26 +902,18 @@ class CitationParsingService:
         """Merge citations from different sources and remove duplicates."""
         try:
             all_citations = list[Any](primary_citations)  # Start with primary results
+            index = NearDuplicateIndex()
+            for existing_cite in all_citations:
+                index.add(existing_cite.get("raw_text", "").strip().lower())
 
             # Add fallback citations that don't duplicate primary ones
             for fallback_cite in fallback_citations:
-                is_duplicate = False
                 fallback_text = fallback_cite.get("raw_text", "").strip().lower()
 
-                for existing_cite in all_citations:
-                    existing_text = existing_cite.get("raw_text", "").strip().lower()
-
-                    # Simple similarity check - if 80% of text matches, consider duplicate
-                    if len(fallback_text) > 0 and len(existing_text) > 0:
-                        similarity = self._calculate_text_similarity(
-                            fallback_text, existing_text
-                        )
-                        if similarity > 0.8:
-                            is_duplicate = True
-                            break
-
-                if not is_duplicate:
+                # If 80% of text matches, consider duplicate
+                if not index.contains_similar(fallback_text):
                     all_citations.append(fallback_cite)
+                    index.add(fallback_text)
 
             return all_citations
 
@@ -703,21 +924,7 @@ class CitationParsingService:
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
         """Calculate simple text similarity between two strings."""
         try:
-            if not text1 or not text2:
-                return 0.0
-
-            # Simple character-based similarity
-            longer = text1 if len(text1) > len(text2) else text2
-            shorter = text2 if len(text1) > len(text2) else text1
-
-            if len(longer) == 0:
-                return 1.0
-
-            # Count matching characters
-            matches = sum(
-                1 for c1, c2 in zip(shorter, longer, strict=False) if c1 == c2
-            )
-            return matches / len(longer)
+            return text_similarity(text1, text2)
 
         except Exception:
             return 0.0
@@ -725,33 +932,12 @@ class CitationParsingService:
     def _prefilter_citation_text(self, text_content: str) -> str:
         """Pre-filter text to remove obvious non-citation content."""
         try:
-            lines = text_content.split("\n")
-            filtered_lines = []
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Skip lines that are clearly not citations
-                skip_patterns = [
-                    r"^\s*Abstract\s*:",
-                    r"^\s*Introduction\s*:",
-                    r"^\s*Conclusion\s*:",
-                    r"^\s*References\s*:",
-                    r"^\s*Figure\s+\d+",
-                    r"^\s*Table\s+\d+",
-                    r"^\s*Section\s+\d+",
-                    r"^\s*Chapter\s+\d+",
-                ]
-
-                should_skip = any(
-                    re.match(pattern, line, re.IGNORECASE) for pattern in skip_patterns
-                )
-                if not should_skip:
-                    filtered_lines.append(line)
-
-            return "\n".join(filtered_lines)
+            skip_line = _SKIP_LINE_PATTERN.match
+            return "\n".join(
+                line
+                for line in map(str.strip, text_content.split("\n"))
+                if line and not skip_line(line)
+            )
 
         except Exception:
             return text_content
@@ -766,11 +952,11 @@ class CitationParsingService:
                 return False
 
             # Must contain a year in parentheses
-            if not re.search(r"\(\d{4}[a-z]?\)", text):
+            if not _YEAR_IN_PARENS.search(text):
                 return False
 
             # Must start with something that looks like an author name
-            if not re.search(r"^(?:.*?\b)?[A-Z][a-zA-Z]+", text):
+            if not _CANDIDATE_START.search(text):
                 return False
 
             # Should not start with common non-citation words
@@ -829,7 +1015,7 @@ class CitationParsingService:
             if citation_data.get("authors"):
                 authors = citation_data["authors"]
                 # Authors should contain letters and basic punctuation
-                if not re.search(r"[A-Za-z]", authors):
+                if not _HAS_LETTER.search(authors):
                     return False
                 # Authors shouldn't be just common words
                 if authors.lower() in [
@@ -860,17 +1046,13 @@ class CitationParsingService:
         """Remove duplicates and filter low-quality citations."""
         try:
             filtered_citations = []
-            seen_texts = set[str]()
+            seen_texts = NearDuplicateIndex()
 
             for citation in citations:
                 raw_text = citation.get("raw_text", "").strip().lower()
 
                 # Skip if we've seen very similar text
-                is_duplicate = False
-                for seen_text in seen_texts:
-                    if self._calculate_text_similarity(raw_text, seen_text) > 0.8:
-                        is_duplicate = True
-                        break
+                is_duplicate = seen_texts.contains_similar(raw_text)
 
                 if not is_duplicate and self._validate_citation_quality(citation):
                     filtered_citations.append(citation)
@@ -905,8 +1087,8 @@ class CitationParsingService:
                         author = f"{last_name}, {initial}"
 
             # Clean up extra spaces and punctuation
-            author = re.sub(r"\s+", " ", author)
-            author = re.sub(r"\s*,\s*", ", ", author)
+            author = _WHITESPACE_RUN.sub(" ", author)
+            author = _COMMA_SPACING.sub(", ", author)
 
             return author
 
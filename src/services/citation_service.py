@@ -6,6 +6,7 @@ Implements business logic for citation management following SOLID principles.
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from typing import Any
 
 from src.database.models import CitationModel, CitationRelationModel, DocumentModel
@@ -81,13 +82,14 @@ class CitationService:
                 confidence_score=0.8,
             )
 
-            # Create the citation in the repository
-            created_citation = self.citation_repo.create(sample_citation)
+            # Upsert on (document_id, raw_text) so re-extraction updates rows
+            created_citations = self.citation_repo.bulk_upsert([sample_citation])
 
             logger.info(
-                f"Successfully extracted and created citation {created_citation.id}"
+                f"Successfully extracted and stored {len(created_citations)} "
+                f"citations for document {document.id}"
             )
-            return [created_citation]
+            return created_citations
 
         except Exception as e:
             logger.error(
@@ -156,7 +158,7 @@ class CitationService:
             raise
 
     def build_citation_network(
-        self, document_id: int, depth: int = 1
+        self, document_id: int, depth: int = 1, min_confidence: float = 0.0
     ) -> dict[str, Any]:
         """
         Build comprehensive citation network for a document with enhanced analytics.
@@ -164,6 +166,7 @@ class CitationService:
         Args:
             document_id: Document ID to start from
             depth: Network depth to traverse (1-3)
+            min_confidence: Ignore relations with a lower confidence score
 
         Returns:
             Enhanced citation network data with metrics and analysis
@@ -178,7 +181,9 @@ class CitationService:
                 raise ValueError("Depth must be between 1 and 3")
 
             # Get base network from repository
-            network = self.relation_repo.get_citation_network(document_id, depth)
+            network = self.relation_repo.get_citation_network(
+                document_id, depth, min_confidence
+            )
 
             # Enhance with network metrics
             network = self._enhance_network_with_metrics(network)
@@ -310,14 +315,16 @@ class CitationService:
 
             # Calculate node degrees (in-degree, out-degree, total degree)
             node_metrics = {}
+            in_degrees = Counter(e.get("target") for e in edges)
+            out_degrees = Counter(e.get("source") for e in edges)
 
             for node in nodes:
                 node_id = node.get("id")
                 if node_id is None:
                     continue
 
-                in_degree = len([e for e in edges if e.get("target") == node_id])
-                out_degree = len([e for e in edges if e.get("source") == node_id])
+                in_degree = in_degrees[node_id]
+                out_degree = out_degrees[node_id]
 
                 node_metrics[node_id] = {
                     "in_degree": in_degree,
@@ -582,9 +589,16 @@ class CitationService:
                 degree_centrality.items(), key=lambda x: x[1], reverse=True
             )[:5]
 
+            # PageRank over the whole library graph, restricted to this network
+            library_pagerank = self.relation_repo.get_pagerank_scores()
+            pagerank = {
+                node_id: library_pagerank.get(node_id, 0.0) for node_id in node_metrics
+            }
+
             return {
                 "centrality_calculated": True,
                 "degree_centrality": degree_centrality,
+                "pagerank": pagerank,
                 "most_central_nodes": [
                     {"node_id": node_id, "centrality": centrality}
                     for node_id, centrality in most_central
@@ -708,55 +722,14 @@ class CitationService:
                 f"Detecting citation clusters with minimum size {min_cluster_size}"
             )
 
-            # Get all citation relations
-            all_relations = self.relation_repo.get_all_relations()
-
-            # Build adjacency information
-            adjacency = {}
-            for relation in all_relations:
-                source_id = relation.source_document_id
-                target_id = relation.target_document_id
-
-                if source_id not in adjacency:
-                    adjacency[source_id] = set[str]()
-                if target_id not in adjacency:
-                    adjacency[target_id] = set[str]()
-
-                adjacency[source_id].add(target_id)
-                adjacency[target_id].add(
-                    source_id
-                )  # Treat as undirected for clustering
-
-            # Simple clustering algorithm (connected components)
-            visited = set[str]()
-            clusters: list[Any] = []
-
-            def dfs_cluster(node_id, current_cluster) -> None:
-                if node_id in visited:
-                    return
-                visited.add(node_id)
-                current_cluster.append(node_id)
-
-                for neighbor in adjacency.get(node_id, set[str]()):
-                    if neighbor not in visited:
-                        dfs_cluster(neighbor, current_cluster)
-
-            for doc_id in adjacency:
-                if doc_id not in visited:
-                    cluster: list[Any] = []
-                    dfs_cluster(doc_id, cluster)
-
-                    if len(cluster) >= min_cluster_size:
-                        clusters.append(
-                            {
-                                "cluster_id": len(clusters) + 1,
-                                "document_ids": cluster,
-                                "size": len(cluster),
-                                "internal_connections": self._count_internal_connections(
-                                    cluster, all_relations
-                                ),
-                            }
-                        )
+            # Connected components are computed on the in-memory citation graph
+            components = self.relation_repo.get_connected_components(
+                min_size=min_cluster_size
+            )
+            clusters = [
+                {"cluster_id": cluster_id, **component}
+                for cluster_id, component in enumerate(components, start=1)
+            ]
 
             logger.debug(f"Detected {len(clusters)} citation clusters")
             return clusters
@@ -764,28 +737,3 @@ class CitationService:
         except Exception as e:
             logger.error(f"Failed to detect citation clusters: {e}")
             return []
-
-    def _count_internal_connections(
-        self, cluster_docs: list[int], all_relations: list[Any]
-    ) -> int:
-        """
-        Count internal connections within a cluster.
-
-        Args:
-            cluster_docs: List of document IDs in the cluster
-            all_relations: All citation relations
-
-        Returns:
-            Number of internal connections
-        """
-        cluster_set = set[str](cluster_docs)
-        internal_count = 0
-
-        for relation in all_relations:
-            if (
-                relation.source_document_id in cluster_set
-                and relation.target_document_id in cluster_set
-            ):
-                internal_count += 1
-
-        return internal_count
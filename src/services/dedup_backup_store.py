@@ -0,0 +1,564 @@
+"""
+Deduplicating Backup Store
+Content-defined chunking backup repository for PDFs and vector indexes.
+Files are split at content-defined boundaries, chunks are stored once by
+hash, and snapshots are recorded as ordered chunk lists.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import zlib
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Chunk codec tags written as the first byte of every stored chunk
+CODEC_RAW = b"r"
+CODEC_ZLIB = b"d"
+CODEC_ZSTD = b"z"
+
+# Deterministic gear table; boundaries must be stable across processes
+_GEAR = [
+    int.from_bytes(hashlib.sha256(bytes([i])).digest()[:4], "little")
+    for i in range(256)
+]
+_HASH_BITS = 32
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+
+class DedupBackupError(Exception):
+    """Raised when a deduplicated backup or restore fails."""
+
+    pass
+
+
+class ContentDefinedChunker:
+    """
+    Gear rolling-hash content-defined chunker.
+
+    The rolling hash at byte ``i`` is ``sum(gear[b[i - k]] << k)`` over the
+    last 32 bytes, and a chunk may end wherever its high bits are all zero.
+    Because boundaries depend only on nearby content, an insertion or edit
+    only changes the chunks around it. With NumPy available the hash is
+    computed for a whole block at once; otherwise a byte loop produces the
+    same boundaries.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 16 * 1024,
+        avg_size: int = 64 * 1024,
+        max_size: int = 256 * 1024,
+        read_size: int = 8 * 1024 * 1024,
+    ) -> None:
+        """
+        Initialize chunker.
+        Args:
+            min_size: Minimum chunk size in bytes
+            avg_size: Target average chunk size in bytes
+            max_size: Maximum chunk size in bytes
+            read_size: Size of blocks read from the input stream
+        """
+        if not 0 < min_size < avg_size < max_size:
+            raise ValueError("Chunk sizes must satisfy 0 < min < avg < max")
+        self.min_size = min_size
+        self.avg_size = avg_size
+        self.max_size = max_size
+        self.read_size = read_size
+        mask_bits = max(1, (avg_size - min_size).bit_length() - 1)
+        self.boundary_mask = ((1 << mask_bits) - 1) << (_HASH_BITS - mask_bits)
+
+    def iter_chunks(self, stream: BinaryIO) -> Iterator[bytes]:
+        """
+        Split a binary stream into content-defined chunks.
+        Args:
+            stream: Readable binary stream
+        Yields:
+            Chunk payloads in stream order
+        """
+        buffer = bytearray()
+        buffer_offset = 0  # absolute stream offset of buffer[0]
+        candidates: deque[int] = deque()  # absolute chunk end offsets
+        state = self._initial_state()
+        stream_offset = 0
+
+        while block := stream.read(self.read_size):
+            state = self._find_candidates(block, stream_offset, state, candidates)
+            stream_offset += len(block)
+            buffer += block
+            while (cut := self._next_cut(buffer_offset, stream_offset, candidates)) > 0:
+                yield bytes(buffer[: cut - buffer_offset])
+                del buffer[: cut - buffer_offset]
+                buffer_offset = cut
+
+        while buffer:
+            cut = self._next_cut(buffer_offset, stream_offset, candidates, eof=True)
+            yield bytes(buffer[: cut - buffer_offset])
+            del buffer[: cut - buffer_offset]
+            buffer_offset = cut
+
+    def _next_cut(
+        self,
+        start: int,
+        end: int,
+        candidates: deque[int],
+        eof: bool = False,
+    ) -> int:
+        """Return the absolute end of the next chunk, or 0 if more data is needed."""
+        while candidates and candidates[0] - start < self.min_size:
+            candidates.popleft()
+        if candidates and candidates[0] - start <= self.max_size:
+            return candidates.popleft()
+        if end - start >= self.max_size:
+            return start + self.max_size
+        return end if eof else 0
+
+    def _initial_state(self) -> Any:
+        """Return the rolling state carried between blocks."""
+        if np is not None:
+            return np.zeros(_HASH_BITS - 1, dtype=np.uint32)
+        return 0
+
+    def _find_candidates(
+        self, block: bytes, offset: int, state: Any, candidates: deque[int]
+    ) -> Any:
+        """Append candidate chunk ends found in ``block`` and return new state."""
+        if np is not None:
+            return self._find_candidates_numpy(block, offset, state, candidates)
+
+        mask = self.boundary_mask
+        rolling = state
+        for index, byte in enumerate(block):
+            rolling = ((rolling << 1) + _GEAR[byte]) & _HASH_MASK
+            if not rolling & mask:
+                candidates.append(offset + index + 1)
+        return rolling
+
+    def _find_candidates_numpy(
+        self, block: bytes, offset: int, carry: Any, candidates: deque[int]
+    ) -> Any:
+        """Vectorized candidate search using window doubling over the gear array."""
+        window = np.concatenate(
+            (carry, _numpy_gear()[np.frombuffer(block, dtype=np.uint8)])
+        )
+        rolling = window
+        # H_2w[i] = H_w[i] + (H_w[i - w] << w); five doublings cover 32 bytes
+        width = 1
+        while width < _HASH_BITS:
+            shifted = np.zeros_like(rolling)
+            shifted[width:] = rolling[:-width] << np.uint32(width)
+            rolling = rolling + shifted
+            width *= 2
+        hashes = rolling[carry.size :]
+        ends = np.flatnonzero((hashes & np.uint32(self.boundary_mask)) == 0)
+        candidates.extend((ends + (offset + 1)).tolist())
+        return window[-(_HASH_BITS - 1) :]
+
+
+_NUMPY_GEAR: Any = None
+
+
+def _numpy_gear() -> Any:
+    """Return the gear table as a NumPy array."""
+    global _NUMPY_GEAR
+    if _NUMPY_GEAR is None:
+        _NUMPY_GEAR = np.array(_GEAR, dtype=np.uint32)
+    return _NUMPY_GEAR
+
+
+@dataclass
+class BackupFileEntry:
+    """A file recorded in a snapshot as an ordered chunk list."""
+
+    path: str
+    size: int
+    mode: int
+    mtime_ns: int
+    chunks: list[tuple[str, int]] = field(default_factory=list)
+
+
+@dataclass
+class BackupSnapshot:
+    """Snapshot manifest of a deduplicated backup run."""
+
+    snapshot_id: str
+    source: str
+    created_at: str
+    files: list[BackupFileEntry] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    stats: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert snapshot to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BackupSnapshot:
+        """Create snapshot from a dictionary."""
+        files = [
+            BackupFileEntry(
+                path=entry["path"],
+                size=entry["size"],
+                mode=entry["mode"],
+                mtime_ns=entry["mtime_ns"],
+                chunks=[(digest, length) for digest, length in entry["chunks"]],
+            )
+            for entry in data.get("files", [])
+        ]
+        return cls(
+            snapshot_id=data["snapshot_id"],
+            source=data["source"],
+            created_at=data["created_at"],
+            files=files,
+            metadata=data.get("metadata", {}),
+            stats=data.get("stats", {}),
+        )
+
+
+class DedupBackupRepository:
+    """
+    {
+        "name": "DedupBackupRepository",
+        "version": "1.0.0",
+        "description": "Content-addressed, deduplicating backup repository.",
+        "dependencies": ["numpy (optional)", "zstandard (optional)"],
+        "interface": {
+            "inputs": [{"name": "root", "type": "string"}],
+            "outputs": "Chunk-level deduplicated snapshots with streaming restore"
+        }
+    }
+    Stores each unique chunk once under ``chunks/<prefix>/<sha256>`` with a
+    one-byte codec tag (zstd when available, zlib otherwise, raw when the data
+    does not compress), and records snapshots under ``snapshots/<id>.json``.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        chunker: ContentDefinedChunker | None = None,
+        compression_level: int = 3,
+    ) -> None:
+        """
+        Initialize repository.
+        Args:
+            root: Repository root directory
+            chunker: Chunker to use (defaults to 16/64/256 KiB chunks)
+            compression_level: zstd/zlib compression level
+        """
+        self.root = Path(root)
+        self.chunks_dir = self.root / "chunks"
+        self.snapshots_dir = self.root / "snapshots"
+        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        self.chunker = chunker or ContentDefinedChunker()
+        self.compression_level = compression_level
+        self._known_chunks: set[str] = set()
+        if ZSTD_AVAILABLE:
+            self._compressor = zstandard.ZstdCompressor(level=compression_level)
+            self._decompressor = zstandard.ZstdDecompressor()
+
+    # ------------------------------------------------------------------
+    # Backup
+    # ------------------------------------------------------------------
+
+    def backup(
+        self,
+        source: str | Path,
+        snapshot_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> BackupSnapshot:
+        """
+        Back up a file or directory tree into the repository.
+        Args:
+            source: File or directory to back up
+            snapshot_id: Optional snapshot ID (generated from time if omitted)
+            metadata: Extra metadata stored with the snapshot
+        Returns:
+            The recorded snapshot, including dedup statistics
+        Raises:
+            DedupBackupError: If the source is missing or a file cannot be read
+        """
+        source_path = Path(source)
+        if not source_path.exists():
+            raise DedupBackupError(f"Backup source does not exist: {source_path}")
+
+        snapshot_id = snapshot_id or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        if self._snapshot_path(snapshot_id).exists():
+            raise DedupBackupError(f"Snapshot already exists: {snapshot_id}")
+
+        stats = {
+            "files": 0,
+            "bytes_read": 0,
+            "chunks_total": 0,
+            "chunks_new": 0,
+            "bytes_new": 0,
+            "bytes_stored": 0,
+        }
+        snapshot = BackupSnapshot(
+            snapshot_id=snapshot_id,
+            source=str(source_path),
+            created_at=datetime.now().isoformat(),
+            metadata=metadata or {},
+            stats=stats,
+        )
+
+        if source_path.is_file():
+            files = [(source_path, source_path.name)]
+        else:
+            files = [
+                (path, path.relative_to(source_path).as_posix())
+                for path in sorted(source_path.rglob("*"))
+                if path.is_file()
+            ]
+
+        for file_path, relative_path in files:
+            try:
+                snapshot.files.append(
+                    self._backup_file(file_path, relative_path, stats)
+                )
+            except OSError as e:
+                raise DedupBackupError(f"Failed to back up {file_path}: {e}") from e
+
+        self._write_snapshot(snapshot)
+        logger.info(
+            f"Deduplicated backup {snapshot_id}: {stats['files']} files, "
+            f"{stats['bytes_read']} bytes read, {stats['chunks_new']}/"
+            f"{stats['chunks_total']} new chunks, {stats['bytes_stored']} bytes stored"
+        )
+        return snapshot
+
+    def _backup_file(
+        self, file_path: Path, relative_path: str, stats: dict[str, Any]
+    ) -> BackupFileEntry:
+        """Chunk a single file into the store and return its manifest entry."""
+        stat_info = file_path.stat()
+        entry = BackupFileEntry(
+            path=relative_path,
+            size=stat_info.st_size,
+            mode=stat_info.st_mode & 0o777,
+            mtime_ns=stat_info.st_mtime_ns,
+        )
+        with open(file_path, "rb") as f:
+            for chunk in self.chunker.iter_chunks(f):
+                digest = hashlib.sha256(chunk).hexdigest()
+                entry.chunks.append((digest, len(chunk)))
+                stats["chunks_total"] += 1
+                stats["bytes_read"] += len(chunk)
+                stored = self._store_chunk(digest, chunk)
+                if stored:
+                    stats["chunks_new"] += 1
+                    stats["bytes_new"] += len(chunk)
+                    stats["bytes_stored"] += stored
+        stats["files"] += 1
+        return entry
+
+    def _store_chunk(self, digest: str, chunk: bytes) -> int:
+        """Store a chunk if unseen; return bytes written (0 when deduplicated)."""
+        if digest in self._known_chunks:
+            return 0
+        chunk_path = self._chunk_path(digest)
+        if chunk_path.exists():
+            self._known_chunks.add(digest)
+            return 0
+
+        payload = self._compress(chunk)
+        chunk_path.parent.mkdir(exist_ok=True)
+        temp_path = chunk_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(payload)
+        os.replace(temp_path, chunk_path)
+        self._known_chunks.add(digest)
+        return len(payload)
+
+    def _compress(self, chunk: bytes) -> bytes:
+        """Compress a chunk, falling back to raw storage if it does not shrink."""
+        if ZSTD_AVAILABLE:
+            codec, compressed = CODEC_ZSTD, self._compressor.compress(chunk)
+        else:
+            codec, compressed = CODEC_ZLIB, zlib.compress(chunk, self.compression_level)
+        if len(compressed) >= len(chunk):
+            return CODEC_RAW + chunk
+        return codec + compressed
+
+    # ------------------------------------------------------------------
+    # Restore
+    # ------------------------------------------------------------------
+
+    def iter_file(self, snapshot_id: str, path: str) -> Iterator[bytes]:
+        """
+        Stream the verified contents of one file from a snapshot.
+        Args:
+            snapshot_id: Snapshot to read from
+            path: Relative path of the file within the snapshot
+        Yields:
+            Decompressed chunk payloads in file order
+        Raises:
+            DedupBackupError: If the file is not in the snapshot or a chunk is corrupt
+        """
+        snapshot = self.load_snapshot(snapshot_id)
+        for entry in snapshot.files:
+            if entry.path == path:
+                yield from self._iter_entry(entry)
+                return
+        raise DedupBackupError(f"File {path} not found in snapshot {snapshot_id}")
+
+    def restore(self, snapshot_id: str, destination: str | Path) -> Path:
+        """
+        Restore a snapshot into a directory, streaming chunk by chunk.
+        Args:
+            snapshot_id: Snapshot to restore
+            destination: Target directory (created if missing)
+        Returns:
+            The destination directory
+        Raises:
+            DedupBackupError: If a chunk is missing or fails verification
+        """
+        snapshot = self.load_snapshot(snapshot_id)
+        destination_path = Path(destination)
+        destination_path.mkdir(parents=True, exist_ok=True)
+        root = destination_path.resolve()
+
+        for entry in snapshot.files:
+            target = (destination_path / entry.path).resolve()
+            if not target.is_relative_to(root):
+                raise DedupBackupError(f"Unsafe path in snapshot: {entry.path}")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, "wb") as f:
+                for payload in self._iter_entry(entry):
+                    f.write(payload)
+            os.chmod(target, entry.mode)
+            os.utime(target, ns=(entry.mtime_ns, entry.mtime_ns))
+
+        logger.info(f"Restored snapshot {snapshot_id} to {destination_path}")
+        return destination_path
+
+    def _iter_entry(self, entry: BackupFileEntry) -> Iterator[bytes]:
+        """Yield verified chunk payloads for a manifest entry."""
+        for digest, length in entry.chunks:
+            payload = self._read_chunk(digest)
+            if len(payload) != length or hashlib.sha256(payload).hexdigest() != digest:
+                raise DedupBackupError(f"Chunk verification failed: {digest}")
+            yield payload
+
+    def _read_chunk(self, digest: str) -> bytes:
+        """Read and decompress a stored chunk."""
+        try:
+            data = self._chunk_path(digest).read_bytes()
+        except FileNotFoundError as e:
+            raise DedupBackupError(f"Missing chunk: {digest}") from e
+
+        codec, body = data[:1], data[1:]
+        if codec == CODEC_RAW:
+            return body
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(body)
+        if codec == CODEC_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise DedupBackupError(
+                    "zstandard is required to read zstd-compressed chunks"
+                )
+            return self._decompressor.decompress(body)
+        raise DedupBackupError(f"Unknown chunk codec {codec!r} for {digest}")
+
+    # ------------------------------------------------------------------
+    # Snapshot management
+    # ------------------------------------------------------------------
+
+    def list_snapshots(self) -> list[str]:
+        """List snapshot IDs, oldest first."""
+        return sorted(path.stem for path in self.snapshots_dir.glob("*.json"))
+
+    def load_snapshot(self, snapshot_id: str) -> BackupSnapshot:
+        """Load a snapshot manifest."""
+        try:
+            with open(self._snapshot_path(snapshot_id)) as f:
+                return BackupSnapshot.from_dict(json.load(f))
+        except FileNotFoundError as e:
+            raise DedupBackupError(f"Snapshot not found: {snapshot_id}") from e
+
+    def snapshot_mtime(self, snapshot_id: str) -> float:
+        """Get the modification time of a snapshot manifest."""
+        return self._snapshot_path(snapshot_id).stat().st_mtime
+
+    def delete_snapshot(self, snapshot_id: str) -> bool:
+        """Delete a snapshot manifest; chunks are reclaimed by ``collect_garbage``."""
+        snapshot_path = self._snapshot_path(snapshot_id)
+        if not snapshot_path.exists():
+            return False
+        snapshot_path.unlink()
+        return True
+
+    def collect_garbage(self) -> dict[str, int]:
+        """
+        Remove chunks no longer referenced by any snapshot.
+        Returns:
+            Dictionary with removed chunk count and bytes freed
+        """
+        referenced: set[str] = set()
+        for snapshot_id in self.list_snapshots():
+            for entry in self.load_snapshot(snapshot_id).files:
+                referenced.update(digest for digest, _ in entry.chunks)
+
+        results = {"chunks_removed": 0, "bytes_freed": 0}
+        for chunk_path in self.chunks_dir.glob("*/*"):
+            if chunk_path.name in referenced:
+                continue
+            results["bytes_freed"] += chunk_path.stat().st_size
+            chunk_path.unlink()
+            self._known_chunks.discard(chunk_path.name)
+            results["chunks_removed"] += 1
+
+        logger.info(
+            f"Backup store GC removed {results['chunks_removed']} chunks, "
+            f"{results['bytes_freed']} bytes"
+        )
+        return results
+
+    def get_storage_stats(self) -> dict[str, int]:
+        """Get chunk and snapshot counts plus on-disk size."""
+        chunk_files = list(self.chunks_dir.glob("*/*"))
+        return {
+            "snapshots": len(self.list_snapshots()),
+            "chunks": len(chunk_files),
+            "stored_bytes": sum(path.stat().st_size for path in chunk_files),
+        }
+
+    def _write_snapshot(self, snapshot: BackupSnapshot) -> None:
+        """Write a snapshot manifest atomically."""
+        snapshot_path = self._snapshot_path(snapshot.snapshot_id)
+        temp_path = snapshot_path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(snapshot.to_dict(), f, separators=(",", ":"))
+        os.replace(temp_path, snapshot_path)
+
+    def _snapshot_path(self, snapshot_id: str) -> Path:
+        """Get the manifest path for a snapshot ID."""
+        if not snapshot_id or Path(snapshot_id).name != snapshot_id:
+            raise DedupBackupError(f"Invalid snapshot ID: {snapshot_id!r}")
+        return self.snapshots_dir / f"{snapshot_id}.json"
+
+    def _chunk_path(self, digest: str) -> Path:
+        """Get the storage path for a chunk digest."""
+        return self.chunks_dir / digest[:2] / digest
@@ -10,7 +10,7 @@ import logging
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.database.connection import DatabaseConnection
 from src.database.models import DocumentModel
@@ -23,6 +23,11 @@ from src.exceptions import (
 from src.interfaces.repository_interfaces import IDocumentRepository
 from src.interfaces.service_interfaces import IContentHashService
 from src.repositories.vector_repository import VectorIndexRepository
+from src.services.file_status_resolver import get_file_status_resolver
+from src.services.index_version_store import IndexVersionStore
+
+if TYPE_CHECKING:
+    from src.repositories.document_similarity_index import DocumentSimilarityIndex
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +77,7 @@ class DocumentLibraryService:
         # TODO: Refactor to inject VectorIndexRepository in v2.2
         self.db: DatabaseConnection = document_repository.db
         self.vector_repo: VectorIndexRepository = VectorIndexRepository(self.db)
+        self._similarity_index: DocumentSimilarityIndex | None = None
 
         # Set up managed documents directory
         if documents_dir:
@@ -80,6 +86,17 @@ class DocumentLibraryService:
             self.documents_dir: Path = Path.home() / ".ai_pdf_scholar" / "documents"
         self.documents_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def similarity_index(self) -> DocumentSimilarityIndex:
+        """Near-duplicate index, loaded on first use (requires NumPy)."""
+        if self._similarity_index is None:
+            from src.repositories.document_similarity_index import (
+                get_document_similarity_index,
+            )
+
+            self._similarity_index = get_document_similarity_index(self.db)
+        return self._similarity_index
+
     def _create_managed_file_path(
         self, file_hash: str, original_filename: str, force_unique: bool = False
     ) -> Path:
@@ -115,6 +132,7 @@ class DocumentLibraryService:
         try:
             logger.debug(f"Copying file from {source_path} to {managed_path}")
             shutil.copy2(source_path, managed_path)
+            get_file_status_resolver().invalidate(managed_path)
             logger.debug(f"File copied successfully to {managed_path}")
         except Exception as e:
             raise DocumentImportError(
@@ -128,8 +146,9 @@ class DocumentLibraryService:
 
         try:
             index_path = Path(vector_index.index_path)
-            if index_path.exists():
-                shutil.rmtree(index_path, ignore_errors=True)
+            if index_path.exists() or index_path.is_symlink():
+                # Removes the version directories behind a published symlink
+                IndexVersionStore(index_path.parent).remove(index_path)
                 logger.debug("Removed vector index files: %s", index_path)
         except Exception as exc:
             logger.warning("Could not remove vector index files: %s", exc)
@@ -144,6 +163,7 @@ class DocumentLibraryService:
             file_path = Path(document.file_path)
             if file_path.exists():
                 file_path.unlink()
+                get_file_status_resolver().invalidate(file_path)
                 logger.debug("Removed document file: %s", file_path)
         except Exception as exc:
             logger.warning(
@@ -243,6 +263,31 @@ class DocumentLibraryService:
         except Exception as e:
             logger.warning(f"Could not extract additional metadata: {e}")
 
+    def _flag_near_duplicates(self, document: DocumentModel) -> None:
+        """Record library documents whose titles nearly match a new import."""
+        try:
+            matches = self.similarity_index.find_similar(self.db, title=document.title)
+            if matches and document.metadata is not None:
+                document.metadata["near_duplicate_ids"] = [
+                    document_id for document_id, _ in matches
+                ]
+                logger.info(
+                    f"Import '{document.title}' resembles {len(matches)} "
+                    f"existing documents"
+                )
+        except Exception as e:
+            logger.warning(f"Could not check for near-duplicate documents: {e}")
+
+    def _index_similarity(self, document: DocumentModel) -> None:
+        """Add a saved document to the near-duplicate index."""
+        try:
+            if document.id is not None:
+                self.similarity_index.index_document(
+                    self.db, document.id, document.title
+                )
+        except Exception as e:
+            logger.warning(f"Could not index document {document.id} for dedup: {e}")
+
     def import_document(
         self,
         file_path: str,
@@ -297,7 +342,9 @@ class DocumentLibraryService:
             self._enrich_document_metadata(
                 document, file_path, managed_file_path, content_hash
             )
+            self._flag_near_duplicates(document)
             saved_document = self.document_repo.create(document)
+            self._index_similarity(saved_document)
 
             logger.info(
                 f"Document imported successfully: {saved_document.id} - "
@@ -410,6 +457,7 @@ class DocumentLibraryService:
                 deleted = self.document_repo.delete(document_id)
                 if deleted:
                     self._remove_document_file(document)
+                    self.similarity_index.remove_document(self.db, document_id)
                     logger.info("Document %s deleted successfully", document_id)
                 return deleted
         except Exception as e:
@@ -453,9 +501,7 @@ class DocumentLibraryService:
 
             # 3. Similar titles (lower priority)
             if include_title_similarity:
-                title_duplicates = self.document_repo.find_similar_documents_by_title(
-                    title_similarity_threshold
-                )
+                title_duplicates = self._find_similar_titles(title_similarity_threshold)
                 for criteria, docs in title_duplicates:
                     # Only include if not already found
                     if not self._already_in_duplicates(docs, duplicates):
@@ -470,6 +516,92 @@ class DocumentLibraryService:
             logger.error(f"Failed to find duplicate documents: {e}")
             raise
 
+    def _find_similar_titles(
+        self, threshold: float
+    ) -> list[tuple[str, list[DocumentModel]]]:
+        """
+        Group documents by title similarity using the LSH index.
+
+        Thresholds below what the banding serves reliably fall back to the
+        repository's pairwise comparison.
+        Args:
+            threshold: Minimum similarity score (0.0 to 1.0)
+        Returns:
+            List of tuples (criteria, list_of_documents)
+        """
+        if threshold < self.similarity_index.min_threshold:
+            return self.document_repo.find_similar_documents_by_title(threshold)
+
+        groups = self.similarity_index.similar_title_groups(self.db, threshold)
+        grouped_ids = [document_id for group in groups for document_id in group]
+        documents = {}
+        for start in range(0, len(grouped_ids), 500):
+            for document in self.document_repo.get_by_ids(
+                grouped_ids[start : start + 500]
+            ):
+                documents[document.id] = document
+
+        criteria = f"Similar titles (>{threshold * 100}% match)"
+        return [
+            (criteria, [documents[i] for i in group if i in documents])
+            for group in groups
+            if sum(i in documents for i in group) > 1
+        ]
+
+    def find_similar_documents(
+        self,
+        document_id: int,
+        threshold: float = 0.8,
+        limit: int = 20,
+    ) -> list[tuple[DocumentModel, float]]:
+        """
+        Find near-duplicates of one document by title and indexed content.
+
+        Args:
+            document_id: Document to match
+            threshold: Minimum similarity score (0.0 to 1.0)
+            limit: Maximum number of matches
+        Returns:
+            List of (document, similarity) sorted by descending similarity
+        """
+        try:
+            document = self.document_repo.find_by_id(document_id)
+            if not document:
+                return []
+            matches = self.similarity_index.find_similar(
+                self.db,
+                title=document.title,
+                threshold=threshold,
+                exclude_id=document_id,
+                content_of=document_id,
+            )[:limit]
+            documents = {
+                doc.id: doc
+                for doc in self.document_repo.get_by_ids([i for i, _ in matches])
+            }
+            return [(documents[i], score) for i, score in matches if i in documents]
+        except Exception as e:
+            logger.error(f"Failed to find documents similar to {document_id}: {e}")
+            raise
+
+    def index_document_content(self, document_id: int, text: str) -> None:
+        """
+        Add a document's extracted text to near-duplicate detection.
+
+        Args:
+            document_id: Document primary key
+            text: Extracted document text
+        """
+        try:
+            document = self.document_repo.find_by_id(document_id)
+            if document:
+                self.similarity_index.index_document(
+                    self.db, document_id, document.title, text=text
+                )
+        except Exception as e:
+            logger.error(f"Failed to index content of document {document_id}: {e}")
+            raise
+
     def _already_in_duplicates(
         self,
         docs: list[DocumentModel],
@@ -746,6 +878,7 @@ class DocumentLibraryService:
                 if file_path.is_file() and file_path.name not in db_files:
                     try:
                         file_path.unlink()
+                        get_file_status_resolver().invalidate(file_path)
                         count += 1
                         logger.debug(f"Removed orphaned file: {file_path}")
                     except Exception as e:
@@ -5,13 +5,30 @@ Generates lightweight previews/thumbnails for managed documents.
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
 
 from src.database.models import DocumentModel
 from src.interfaces.repository_interfaces import IDocumentRepository
+from src.services.preview_render_pool import (
+    PageOutOfRangeError,
+    PreviewRenderPool,
+    RenderResult,
+)
+from src.services.thumbnail_store import (
+    CONTENT_TYPES,
+    ThumbnailRecord,
+    ThumbnailStore,
+    build_sprite,
+    content_etag,
+    encode_image,
+    resolve_format,
+)
 
 # Lazy import PyMuPDF to avoid test-time import errors
 # The fitz module is only imported when actually rendering PDFs
@@ -20,6 +37,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Sprite cells fit an A4 portrait page at the thumbnail width
+SPRITE_CELL_ASPECT = 1.414
+
 
 class PreviewError(RuntimeError):
     """Base preview service error."""
@@ -48,6 +68,13 @@ class PreviewSettings:
     thumbnail_width: int
     max_page_number: int
     cache_ttl_seconds: int
+    render_workers: int = 2
+    open_documents_per_worker: int = 8
+    prerender_first_pages: int = 3
+    prerender_ahead: int = 2
+    thumbnail_format: str = "webp"
+    thumbnail_quality: str = "standard"
+    max_sprite_documents: int = 500
 
 
 class PreviewContent(NamedTuple):
@@ -57,6 +84,20 @@ class PreviewContent(NamedTuple):
     height: int
     page: int
     from_cache: bool
+    etag: str | None = None
+
+
+class ThumbnailSprite(NamedTuple):
+    """Thumbnails of several documents packed row-major into one image."""
+
+    content: bytes
+    content_type: str
+    etag: str
+    columns: int
+    cell_width: int
+    cell_height: int
+    document_ids: list[int]
+    missing_ids: list[int]
 
 
 class DocumentPreviewService:
@@ -66,10 +107,24 @@ class DocumentPreviewService:
         self,
         document_repository: IDocumentRepository,
         settings: PreviewSettings,
+        render_pool: PreviewRenderPool | None = None,
+        thumbnail_store: ThumbnailStore | None = None,
     ) -> None:
         self._repo = document_repository
         self.settings = settings
         self.settings.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.render_pool = render_pool or PreviewRenderPool(
+            workers=settings.render_workers,
+            max_open_documents=settings.open_documents_per_worker,
+        )
+        self._page_counts: dict[int, int] = {}
+        self._page_counts_lock = threading.Lock()
+        self.thumbnails = thumbnail_store or ThumbnailStore(
+            settings.cache_dir / "thumbnails"
+        )
+        self._thumbnail_format = resolve_format(settings.thumbnail_format)
+        self._sprites: OrderedDict[str, bytes] = OrderedDict()
+        self._sprites_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public API
@@ -88,6 +143,7 @@ class DocumentPreviewService:
         cached = self._read_cache(cache_path)
         if cached is not None:
             cached_width, cached_height = self._read_dimensions(cache_path)
+            self._schedule_prerender(document, normalized_page, normalized_width)
             return PreviewContent(
                 cached, "image/png", cached_width, cached_height, normalized_page, True
             )
@@ -106,18 +162,113 @@ class DocumentPreviewService:
         )
         self._write_cache(cache_path, content)
         self._write_dimensions(cache_path, width_px, height_px)
+        self._schedule_prerender(document, normalized_page, normalized_width)
         return PreviewContent(
             content, "image/png", width_px, height_px, normalized_page, False
         )
 
     def get_thumbnail(self, document_id: int) -> PreviewContent:
-        """Return cached first-page thumbnail."""
-        return self.get_page_preview(
-            document_id=document_id,
-            page=1,
-            width=self.settings.thumbnail_width,
+        """Return the first-page thumbnail from the thumbnail store."""
+        self._ensure_enabled()
+        document = self._get_document(document_id)
+        stored = self.thumbnails.get(document.id)
+        if stored is not None and stored[0].source_key == self._thumbnail_key(document):
+            record, content = stored
+            return PreviewContent(
+                content,
+                record.content_type,
+                record.width,
+                record.height,
+                1,
+                True,
+                record.etag,
+            )
+
+        content, width_px, height_px = self._render_page(
+            document, 1, self.settings.thumbnail_width
+        )
+        record, content = self._store_thumbnail(document, content, width_px, height_px)
+        return PreviewContent(
+            content,
+            record.content_type,
+            width_px,
+            height_px,
+            1,
+            False,
+            record.etag,
+        )
+
+    def get_thumbnail_sprite(
+        self, document_ids: list[int], columns: int = 10
+    ) -> ThumbnailSprite:
+        """
+        Return thumbnails for several documents as one sprite sheet.
+
+        Cells are ``thumbnail_width`` wide and laid out row-major in the
+        order of ``document_ids``; documents without a thumbnail leave a
+        blank cell and are listed in ``missing_ids``.
+
+        Args:
+            document_ids: Documents to include, in display order
+            columns: Cells per sprite row
+        Returns:
+            Sprite sheet with its layout and a strong ETag
+        Raises:
+            PreviewError: If too many documents are requested
+        """
+        self._ensure_enabled()
+        if not document_ids or len(document_ids) > self.settings.max_sprite_documents:
+            raise PreviewError(
+                f"Sprites cover 1 to {self.settings.max_sprite_documents} documents"
+            )
+        columns = max(1, min(columns, len(document_ids)))
+        cell_width = self.settings.thumbnail_width
+        cell_height = round(cell_width * SPRITE_CELL_ASPECT)
+        records = self._ensure_thumbnails(document_ids)
+        missing = [doc_id for doc_id in document_ids if doc_id not in records]
+
+        etag = content_etag(
+            f"{columns}:{cell_width}x{cell_height}:{self._thumbnail_format}",
+            *(records[i].etag if i in records else "-" for i in document_ids),
+        )
+        with self._sprites_lock:
+            content = self._sprites.get(etag)
+            if content is not None:
+                self._sprites.move_to_end(etag)
+        if content is None:
+            tiles = []
+            for doc_id in document_ids:
+                stored = self.thumbnails.get(doc_id) if doc_id in records else None
+                tiles.append(stored[1] if stored else None)
+            content = build_sprite(
+                tiles,
+                columns,
+                cell_width,
+                cell_height,
+                self._thumbnail_format,
+                self.settings.thumbnail_quality,
+            )
+            with self._sprites_lock:
+                self._sprites[etag] = content
+                while len(self._sprites) > 16:
+                    self._sprites.popitem(last=False)
+
+        return ThumbnailSprite(
+            content,
+            CONTENT_TYPES[self._thumbnail_format],
+            etag,
+            columns,
+            cell_width,
+            cell_height,
+            list(document_ids),
+            missing,
         )
 
+    def close(self) -> None:
+        """Stop background renderers and release the thumbnail store."""
+        self.render_pool.shutdown()
+        self.thumbnails.close()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -148,12 +299,83 @@ class DocumentPreviewService:
         document = getter(document_id)
         if not document:
             raise PreviewNotFoundError(f"Document {document_id} not found")
+        return self._check_document(document)
+
+    def _check_document(self, document: DocumentModel) -> DocumentModel:
         if not document.file_path:
             raise PreviewNotFoundError("Document file path missing")
         if document.file_type and document.file_type.lower() not in {".pdf"}:
             raise PreviewUnsupportedError("Only PDF previews are supported")
         return document
 
+    def _thumbnail_key(self, document: DocumentModel) -> str:
+        # Content-addressed, so stored thumbnails need no TTL or file stat
+        return ":".join(
+            (
+                document.file_hash,
+                str(self.settings.thumbnail_width),
+                self._thumbnail_format,
+                self.settings.thumbnail_quality,
+            )
+        )
+
+    def _store_thumbnail(
+        self, document: DocumentModel, png: bytes, width: int, height: int
+    ) -> tuple[ThumbnailRecord, bytes]:
+        content = encode_image(
+            png, self._thumbnail_format, self.settings.thumbnail_quality
+        )
+        record = self.thumbnails.put(
+            document.id,
+            content,
+            width,
+            height,
+            self._thumbnail_format,
+            self._thumbnail_key(document),
+        )
+        return record, content
+
+    def _ensure_thumbnails(self, document_ids: list[int]) -> dict[int, ThumbnailRecord]:
+        """Return current thumbnail records, rendering missing ones together."""
+        getter = getattr(self._repo, "get_by_ids", None)
+        if getter:
+            documents = getter(list(dict.fromkeys(document_ids)))
+        else:
+            documents = [self._repo.get_by_id(doc_id) for doc_id in document_ids]
+
+        records: dict[int, ThumbnailRecord] = {}
+        pending: dict[int, tuple[DocumentModel, Future[RenderResult]]] = {}
+        for document in documents:
+            if document is None:
+                continue
+            try:
+                self._check_document(document)
+            except PreviewError:
+                continue
+            record = self.thumbnails.record(document.id)
+            if record is not None and record.source_key == self._thumbnail_key(
+                document
+            ):
+                records[document.id] = record
+            elif document.id not in pending:
+                pending[document.id] = (
+                    document,
+                    self.render_pool.submit(
+                        str(document.file_path), 1, self.settings.thumbnail_width
+                    ),
+                )
+
+        for document_id, (document, future) in pending.items():
+            try:
+                result = future.result()
+            except Exception as exc:
+                logger.debug("Thumbnail for document %s failed: %s", document_id, exc)
+                continue
+            records[document_id], _ = self._store_thumbnail(
+                document, result.content, result.width, result.height
+            )
+        return records
+
     def _cache_path(self, document_id: int, page: int, width: int) -> Path:
         doc_dir = self.settings.cache_dir / str(document_id)
         doc_dir.mkdir(parents=True, exist_ok=True)
@@ -181,7 +403,7 @@ class DocumentPreviewService:
         # Lazy import fitz (PyMuPDF) only when actually rendering
         # This prevents import errors in test environments where PyMuPDF may not be available
         try:
-            import fitz  # PyMuPDF
+            import fitz  # noqa: F401 - PyMuPDF, used by the render pool
         except ImportError as exc:
             raise PreviewError(
                 "PyMuPDF (fitz) is not installed. Install it with: pip install PyMuPDF"
@@ -192,22 +414,68 @@ class DocumentPreviewService:
             raise PreviewNotFoundError("Document file is not available on disk")
 
         try:
-            with fitz.open(file_path) as pdf_doc:
-                if page > pdf_doc.page_count:
-                    raise PreviewNotFoundError("Requested page exceeds document length")
-                pdf_page = pdf_doc.load_page(page - 1)
-                original_width = pdf_page.rect.width or 1
-                scale = width / original_width
-                matrix = fitz.Matrix(scale, scale)
-                pixmap = pdf_page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB)
-                return pixmap.tobytes("png"), pixmap.width, pixmap.height
-        except PreviewNotFoundError:
-            raise
+            result = self.render_pool.render(str(file_path), page, width)
+        except PageOutOfRangeError as exc:
+            raise PreviewNotFoundError(
+                "Requested page exceeds document length"
+            ) from exc
+        except FileNotFoundError as exc:
+            raise PreviewNotFoundError(
+                "Document file is not available on disk"
+            ) from exc
         except Exception as exc:
             logger.error(
                 "Failed to render preview for %s page %s: %s", document.id, page, exc
             )
             raise PreviewError("Failed to render preview") from exc
+        with self._page_counts_lock:
+            self._page_counts[document.id] = result.page_count
+        return result.content, result.width, result.height
+
+    def _prerender_pages(self, document_id: int, page: int) -> list[int]:
+        """Pages to render ahead of a reader who just opened ``page``."""
+        with self._page_counts_lock:
+            page_count = self._page_counts.get(document_id)
+        if page_count is None:
+            return []
+        last = min(page_count, self.settings.max_page_number)
+        ahead = self.settings.prerender_ahead
+        # Most likely next first: forward, one page back, then the opening pages
+        candidates = [page + offset for offset in range(1, ahead + 1)]
+        if ahead:
+            candidates.append(page - 1)
+        candidates.extend(range(1, self.settings.prerender_first_pages + 1))
+        pages: list[int] = []
+        for candidate in candidates:
+            if 1 <= candidate <= last and candidate != page and candidate not in pages:
+                pages.append(candidate)
+        return pages
+
+    def _schedule_prerender(
+        self, document: DocumentModel, page: int, width: int
+    ) -> None:
+        file_path = str(document.file_path)
+        # Queued newest-first, so submit the least likely page first
+        for candidate in reversed(self._prerender_pages(document.id, page)):
+            cache_path = self._cache_path(document.id, candidate, width)
+            if cache_path.exists():
+                continue
+            self.render_pool.prefetch(
+                file_path,
+                candidate,
+                width,
+                lambda future, cache_path=cache_path: self._store_prerender(
+                    cache_path, future
+                ),
+            )
+
+    def _store_prerender(self, cache_path: Path, future: Future[RenderResult]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            logger.debug("Pre-render for %s did not complete", cache_path)
+            return
+        result = future.result()
+        self._write_cache(cache_path, result.content)
+        self._write_dimensions(cache_path, result.width, result.height)
 
     def _write_cache(self, cache_path: Path, data: bytes) -> None:
         try:
@@ -11,7 +11,7 @@ import logging
 import os
 import shutil
 import tempfile
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -39,6 +39,7 @@ from src.services.error_recovery import (
     with_circuit_breaker,
     with_retry,
 )
+from src.services.index_version_store import IndexVersionStore
 
 
 # Define base RAG exceptions
@@ -168,6 +169,10 @@ class EnhancedRAGService:
         # Vector storage configuration
         self.vector_storage_dir: Path = Path(vector_storage_dir)
         self.vector_storage_dir.mkdir(exist_ok=True)
+        # Index paths may be symlinks to published versions
+        self.index_versions: IndexVersionStore = IndexVersionStore(
+            self.vector_storage_dir
+        )
         # Current state
         self.current_document_id: int | None = None
         self.current_vector_index: VectorIndexModel | None = None
@@ -367,20 +372,10 @@ class EnhancedRAGService:
             if self.test_mode:
                 return f"Test mode response for query: {query_text}"
 
-            from llama_index.core import PromptTemplate
-
-            # Default query engine arguments
-            query_engine_args = {}
-
-            # Use prompt manager if available
-            if self.prompt_manager:
-                prompt_data = self.prompt_manager.get_prompt("default_qa")
-                if prompt_data and "template" in prompt_data:
-                    qa_template = PromptTemplate(prompt_data["template"])
-                    query_engine_args["text_qa_template"] = qa_template
-
             # Create query engine
-            query_engine = self.current_index.as_query_engine(**query_engine_args)
+            query_engine = self.current_index.as_query_engine(
+                **self._query_engine_args()
+            )
 
             # Execute query
             response = query_engine.query(query_text)
@@ -389,6 +384,76 @@ class EnhancedRAGService:
             logger.error(f"Query execution failed: {e}")
             raise RAGQueryError(f"Failed to execute query: {e}") from e
 
+    def stream_query(self, query_text: str) -> Iterator[str]:
+        """
+        Query the current vector index, yielding answer tokens as the LLM
+        produces them.
+        Retrieval runs before the first token; the answer is then synthesized
+        with LlamaIndex streaming synthesis instead of being generated in full.
+        Closing the iterator early stops consuming the LLM stream.
+        Args:
+            query_text: User query string
+        Returns:
+            Iterator over answer text deltas
+        Raises:
+            RAGQueryError: If no index is loaded or query fails
+        """
+        if not self.current_index:
+            raise RAGQueryError("No vector index loaded. Build or load an index first.")
+        try:
+            if self.test_mode:
+                tokens = f"Test mode response for query: {query_text}".split(" ")
+                return iter([tokens[0], *(f" {token}" for token in tokens[1:])])
+
+            query_engine = self.current_index.as_query_engine(
+                streaming=True, **self._query_engine_args()
+            )
+            response = query_engine.query(query_text)
+        except Exception as e:
+            logger.error(f"Query execution failed: {e}")
+            raise RAGQueryError(f"Failed to execute query: {e}") from e
+        return self._iter_response_tokens(response)
+
+    def stream_query_document(self, query: str, document_id: int) -> Iterator[str]:
+        """
+        Stream the answer to a query against a specific document.
+        Args:
+            query: User query
+            document_id: Document ID to query
+        Returns:
+            Iterator over answer text deltas
+        Raises:
+            RAGQueryError: If the index cannot be loaded or the query fails
+        """
+        logger.info(f"Streaming query for document {document_id}: {query[:100]}...")
+        if self.current_document_id != document_id or not self.current_index:
+            try:
+                self.load_index_for_document(document_id)
+            except (VectorIndexNotFoundError, RAGIndexError) as e:
+                raise RAGQueryError(f"Failed to load index for query: {e}") from e
+        return self.stream_query(query)
+
+    def _query_engine_args(self) -> dict[str, Any]:
+        """Query engine arguments, using the managed QA prompt if available."""
+        query_engine_args: dict[str, Any] = {}
+        if self.prompt_manager:
+            prompt_data = self.prompt_manager.get_prompt("default_qa")
+            if prompt_data and "template" in prompt_data:
+                from llama_index.core import PromptTemplate
+
+                qa_template = PromptTemplate(prompt_data["template"])
+                query_engine_args["text_qa_template"] = qa_template
+        return query_engine_args
+
+    @staticmethod
+    def _iter_response_tokens(response: Any) -> Iterator[str]:
+        """Yield deltas from a streaming response, wrapping LLM failures."""
+        try:
+            yield from response.response_gen
+        except Exception as e:
+            logger.error(f"Streaming query failed: {e}")
+            raise RAGQueryError(f"Failed to stream query response: {e}") from e
+
     def get_cache_info(self) -> dict[str, Any]:
         """
         Get information about the current cache and index status.
@@ -645,8 +710,8 @@ class EnhancedRAGService:
             retryable_exceptions=self.file_retry_config.retryable_exceptions,
         )
         def prepare_directory() -> None:
-            if vector_index_path.exists():
-                shutil.rmtree(vector_index_path, ignore_errors=False)
+            if vector_index_path.exists() or vector_index_path.is_symlink():
+                self.index_versions.remove(vector_index_path)
             vector_index_path.mkdir(parents=True, exist_ok=True)
 
         prepare_directory()
@@ -717,8 +782,8 @@ class EnhancedRAGService:
     def _cleanup_vector_path(self, vector_path: Path) -> None:
         """Clean up vector index path."""
         try:
-            if vector_path and vector_path.exists():
-                shutil.rmtree(vector_path, ignore_errors=True)
+            if vector_path and (vector_path.exists() or vector_path.is_symlink()):
+                self.index_versions.remove(vector_path)
                 logger.debug(f"Cleaned up vector path: {vector_path}")
         except Exception as e:
             logger.warning(f"Failed to cleanup vector path {vector_path}: {e}")
@@ -1278,7 +1343,7 @@ class EnhancedRAGService:
                             db_index = self.vector_repo.find_by_document_id(doc_id)
                             if not db_index or db_index.index_path != str(vector_dir):
                                 # This is an orphaned filesystem directory
-                                shutil.rmtree(vector_dir, ignore_errors=True)
+                                self.index_versions.remove(vector_dir)
                                 fs_orphan_count += 1
                                 logger.info(
                                     f"Removed orphaned vector directory: {vector_dir}"
@@ -1288,6 +1353,11 @@ class EnhancedRAGService:
                             logger.warning(
                                 f"Found directory with invalid name format: {vector_dir}"
                             )
+                        except OSError as e:
+                            logger.warning(
+                                f"Failed to remove orphaned vector directory "
+                                f"{vector_dir}: {e}"
+                            )
 
                 orphaned_count += fs_orphan_count
 
@@ -1477,8 +1547,8 @@ class EnhancedRAGService:
         """Clean up index files at the given path."""
         try:
             path = Path(index_path)
-            if path.exists():
-                shutil.rmtree(path, ignore_errors=True)
+            if path.exists() or path.is_symlink():
+                self.index_versions.remove(path)
                 logger.debug(f"Cleaned up index files at {index_path}")
         except Exception as e:
             logger.warning(f"Could not cleanup index files at {index_path}: {e}")
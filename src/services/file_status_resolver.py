@@ -0,0 +1,180 @@
+"""
+File Status Resolver
+Answers "does this document file exist?" for whole pages of documents with
+one directory scan per parent directory instead of one stat() per file.
+Directory listings are cached and keyed on the directory's mtime, so repeat
+listings cost a single stat() per directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _DirectoryListing:
+    """Entry names of one directory as of a given mtime."""
+
+    mtime_ns: int
+    scanned_at_ns: int
+    names: frozenset[str]
+    symlinks: frozenset[str]
+
+    def is_fresh(self, mtime_ns: int) -> bool:
+        # A change landing in the same mtime tick as the scan would not move
+        # the mtime, so listings taken right after a change are never trusted.
+        return (
+            mtime_ns == self.mtime_ns
+            and self.scanned_at_ns - mtime_ns > FileStatusResolver.RACY_WINDOW_NS
+        )
+
+
+class FileStatusResolver:
+    """
+    {
+        "name": "FileStatusResolver",
+        "version": "1.0.0",
+        "description": "Batched, mtime-cached file existence checks.",
+        "dependencies": [],
+        "interface": {
+            "inputs": ["paths: Iterable[str | None]"],
+            "outputs": "Mapping of path to existence"
+        }
+    }
+    Resolves file existence for many paths at once. Paths are grouped by
+    parent directory; each directory is stat()ed once and only re-listed
+    with os.scandir() when its mtime changed or it was invalidated.
+    """
+
+    # Filesystems with coarse timestamps (FAT, some network mounts) only move
+    # the mtime every 2 seconds.
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, max_directories: int = 1024) -> None:
+        """
+        Initialize the resolver.
+
+        Args:
+            max_directories: Number of directory listings kept (LRU)
+        """
+        self.max_directories = max_directories
+        self._listings: OrderedDict[str, _DirectoryListing] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, paths: Iterable[str | None]) -> dict[str, bool]:
+        """
+        Check which of the given files exist.
+
+        Args:
+            paths: File paths; empty values are skipped
+
+        Returns:
+            Mapping of each given path to whether it exists
+        """
+        by_directory: dict[str, list[tuple[str, str]]] = defaultdict(list)
+        for path in paths:
+            if path:
+                directory, name = os.path.split(os.path.abspath(path))
+                by_directory[directory].append((path, os.path.normcase(name)))
+
+        status: dict[str, bool] = {}
+        for directory, entries in by_directory.items():
+            listing = self._get_listing(directory)
+            for path, name in entries:
+                if listing is None or name not in listing.names:
+                    status[path] = False
+                elif name in listing.symlinks:
+                    # Dangling links are listed but do not exist
+                    status[path] = os.path.exists(path)
+                else:
+                    status[path] = True
+        return status
+
+    async def resolve_async(self, paths: Iterable[str | None]) -> dict[str, bool]:
+        """Resolve file existence in a worker thread, off the event loop."""
+        return await asyncio.to_thread(self.resolve, list(paths))
+
+    def exists(self, path: str | None) -> bool:
+        """
+        Check a single path through the directory cache.
+
+        A cache miss scans the whole parent directory, so callers that only
+        need one path should use os.path.exists() instead.
+        """
+        return bool(path) and self.resolve([path])[path]
+
+    def invalidate(self, path: str | os.PathLike[str] | None = None) -> None:
+        """
+        Drop cached listings after files were added or removed.
+
+        Args:
+            path: File whose directory changed, or None to drop everything
+        """
+        with self._lock:
+            if path is None:
+                self._listings.clear()
+            else:
+                directory = os.path.dirname(os.path.abspath(path))
+                self._listings.pop(directory, None)
+
+    def _get_listing(self, directory: str) -> _DirectoryListing | None:
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._listings.pop(directory, None)
+            return None
+
+        with self._lock:
+            listing = self._listings.get(directory)
+            if listing is not None and listing.is_fresh(mtime_ns):
+                self._listings.move_to_end(directory)
+                return listing
+
+        listing = self._scan(directory, mtime_ns)
+        if listing is None:
+            return None
+        with self._lock:
+            self._listings[directory] = listing
+            self._listings.move_to_end(directory)
+            while len(self._listings) > self.max_directories:
+                self._listings.popitem(last=False)
+        return listing
+
+    @staticmethod
+    def _scan(directory: str, mtime_ns: int) -> _DirectoryListing | None:
+        scanned_at_ns = time.time_ns()
+        names, symlinks = set(), set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = os.path.normcase(entry.name)
+                    names.add(name)
+                    if entry.is_symlink():
+                        symlinks.add(name)
+        except OSError as e:
+            logger.debug(f"Could not scan {directory}: {e}")
+            return None
+        return _DirectoryListing(
+            mtime_ns, scanned_at_ns, frozenset(names), frozenset(symlinks)
+        )
+
+
+_file_status_resolver: FileStatusResolver | None = None
+
+
+def get_file_status_resolver() -> FileStatusResolver:
+    """Get the process-wide file status resolver."""
+    global _file_status_resolver
+    if _file_status_resolver is None:
+        _file_status_resolver = FileStatusResolver()
+    return _file_status_resolver
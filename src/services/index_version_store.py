@@ -0,0 +1,342 @@
+"""
+Index Version Store
+Atomic publication of vector index directories. An index is built in a
+staging directory, fsynced, renamed into a numbered version directory and
+published by atomically replacing a symlink at the index path, so readers
+see either the old index or the new one and never a half-written mix.
+Published versions are immutable; the previous one is kept for rollback and
+older ones are garbage-collected in the background.
+
+Layout next to each published index path::
+
+    doc_1_ab12cd34 -> .versions/doc_1_ab12cd34/v000003
+    .versions/doc_1_ab12cd34/v000002/   (previous, rollback target)
+    .versions/doc_1_ab12cd34/v000003/   (current)
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_DIR = ".versions"
+STAGING_DIR = ".staging"
+VERSION_PREFIX = "v"
+
+
+class IndexVersionError(Exception):
+    """Raised when an index version cannot be published or restored."""
+
+    pass
+
+
+def fsync_tree(path: Path) -> None:
+    """Flush every file and directory under path (inclusive) to disk."""
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            fd = os.open(os.path.join(dirpath, filename), os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        fsync_directory(Path(dirpath))
+
+
+def fsync_directory(path: Path) -> None:
+    """Flush a directory entry table so renames and links inside it persist."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class IndexVersionStore:
+    """
+    {
+        "name": "IndexVersionStore",
+        "version": "1.0.0",
+        "description": "Versioned, atomically published index directories.",
+        "dependencies": [],
+        "interface": {
+            "inputs": ["root: Path", "keep_versions: int"],
+            "outputs": "Staging, publish, rollback and version cleanup"
+        }
+    }
+    Publishes index directories by rename instead of copy. Staging
+    directories live under ``root`` so the rename into place stays on one
+    filesystem; versions live next to the index path they back.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        keep_versions: int = 2,
+        background_gc: bool = True,
+        stale_staging_seconds: float = 3600.0,
+    ) -> None:
+        """
+        Initialize version store.
+        Args:
+            root: Storage directory holding published indexes
+            keep_versions: Versions kept per index, current one included
+            background_gc: Collect old versions on a background thread after
+                each publish (synchronously when False)
+            stale_staging_seconds: Age after which an abandoned staging
+                directory is removed by collect_garbage()
+        """
+        if keep_versions < 1:
+            raise ValueError("keep_versions must be at least 1")
+        self.root = Path(root)
+        self.keep_versions = keep_versions
+        self.background_gc = background_gc
+        self.stale_staging_seconds = stale_staging_seconds
+        self.staging_dir = self.root / STAGING_DIR
+        # Serializes pointer changes with the version selection in GC
+        self._lock = threading.Lock()
+
+    def create_staging(self, prefix: str = "index_") -> Path:
+        """
+        Create an empty staging directory to build an index into.
+        Args:
+            prefix: Directory name prefix
+        Returns:
+            Path to the new staging directory
+        """
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix=prefix, dir=self.staging_dir))
+
+    def publish(
+        self, staging_path: Path, index_path: Path, keep_existing: bool = True
+    ) -> Path:
+        """
+        Publish a staged index as the new current version of index_path.
+
+        The staged files are fsynced and the directory is renamed into the
+        index's version directory (copied only if it is on another
+        filesystem); then the index path symlink is replaced in one rename.
+        An index path that is still a plain directory from before versioning
+        is adopted as the previous version (or discarded when keep_existing
+        is False); that one-time conversion briefly leaves the path absent.
+        Args:
+            staging_path: Directory holding the complete index
+            index_path: Published index path readers open
+            keep_existing: Keep a plain directory at index_path for rollback
+        Returns:
+            Path to the new version directory
+        Raises:
+            IndexVersionError: If the index cannot be published
+        """
+        replaced: Path | None = None
+        try:
+            fsync_tree(staging_path)
+            versions_dir = self.versions_dir(index_path)
+            with self._lock:
+                versions_dir.mkdir(parents=True, exist_ok=True)
+                if index_path.is_dir() and not index_path.is_symlink():
+                    if keep_existing:
+                        legacy = versions_dir / self._next_version_name(versions_dir)
+                        os.rename(index_path, legacy)
+                    else:
+                        replaced = self._set_aside(index_path)
+                version = versions_dir / self._next_version_name(versions_dir)
+                self._move_directory(staging_path, version)
+                fsync_directory(versions_dir)
+                self._point(index_path, version)
+        except IndexVersionError:
+            raise
+        except OSError as e:
+            raise IndexVersionError(
+                f"Failed to publish {staging_path} as {index_path}: {e}"
+            ) from e
+        if replaced is not None:
+            shutil.rmtree(replaced, ignore_errors=True)
+        logger.info(f"Published index version {version.name} at {index_path}")
+        self._schedule_gc(index_path)
+        return version
+
+    def rollback(self, index_path: Path) -> Path:
+        """
+        Point index_path back at the version published before the current one.
+        Args:
+            index_path: Published index path
+        Returns:
+            Path to the version now current
+        Raises:
+            IndexVersionError: If there is no earlier version
+        """
+        with self._lock:
+            current = self.current_version(index_path)
+            if current is None:
+                raise IndexVersionError(f"Index is not versioned: {index_path}")
+            earlier = [
+                version
+                for version in self.list_versions(index_path)
+                if version.name < current.name
+            ]
+            if not earlier:
+                raise IndexVersionError(f"No earlier version of {index_path}")
+            self._point(index_path, earlier[-1])
+        logger.info(f"Rolled back {index_path} to version {earlier[-1].name}")
+        return earlier[-1]
+
+    def versions_dir(self, index_path: Path) -> Path:
+        """Directory holding the versions of an index path."""
+        return index_path.parent / VERSIONS_DIR / index_path.name
+
+    def list_versions(self, index_path: Path) -> list[Path]:
+        """Version directories of an index path, oldest first."""
+        versions_dir = self.versions_dir(index_path)
+        if not versions_dir.is_dir():
+            return []
+        return sorted(
+            path
+            for path in versions_dir.iterdir()
+            if path.name.startswith(VERSION_PREFIX) and path.is_dir()
+        )
+
+    def current_version(self, index_path: Path) -> Path | None:
+        """Version directory the index path points at, if it is versioned."""
+        if not index_path.is_symlink():
+            return None
+        return index_path.parent / os.readlink(index_path)
+
+    def is_published_version(self, path: Path) -> bool:
+        """Whether path is (or links to) an immutable published version."""
+        resolved = path.resolve()
+        in_versions_dir = resolved.parent.parent.name == VERSIONS_DIR
+        return in_versions_dir and resolved.name.startswith(VERSION_PREFIX)
+
+    def remove(self, index_path: Path) -> None:
+        """Remove an index path together with all of its versions."""
+        with self._lock:
+            if index_path.is_symlink():
+                index_path.unlink()
+            elif index_path.is_dir():
+                shutil.rmtree(index_path)
+            versions_dir = self.versions_dir(index_path)
+            if versions_dir.exists():
+                shutil.rmtree(versions_dir)
+
+    def collect_garbage(self, index_path: Path | None = None) -> int:
+        """
+        Remove versions that are neither current nor among the newest kept.
+
+        With no index path, every index under the root is collected; versions
+        whose index path no longer exists and abandoned staging directories
+        are removed as well.
+        Args:
+            index_path: Published index path to collect, or None for all
+        Returns:
+            Number of directories removed
+        """
+        doomed: list[Path] = []
+        with self._lock:
+            if index_path is not None:
+                doomed += self._unreferenced_versions(index_path)
+            else:
+                for versions_dir in self._all_versions_dirs():
+                    target = versions_dir.parent.parent / versions_dir.name
+                    if target.is_symlink() or target.exists():
+                        doomed += self._unreferenced_versions(target)
+                    else:
+                        doomed.append(versions_dir)
+                doomed += self._stale_staging()
+            # Renamed aside under the lock so a rollback cannot pick them
+            trash = [self._set_aside(path) for path in doomed]
+        for path in trash:
+            shutil.rmtree(path, ignore_errors=True)
+        if trash:
+            logger.debug(f"Collected {len(trash)} old index directories")
+        return len(trash)
+
+    def _unreferenced_versions(self, index_path: Path) -> list[Path]:
+        versions = self.list_versions(index_path)
+        keep = set(versions[-self.keep_versions :])
+        current = self.current_version(index_path)
+        if current is not None:
+            keep.add(current)
+        return [version for version in versions if version not in keep]
+
+    def _all_versions_dirs(self) -> list[Path]:
+        root_versions = self.root / VERSIONS_DIR
+        if not root_versions.is_dir():
+            return []
+        return [
+            path
+            for path in root_versions.iterdir()
+            if path.is_dir() and not path.name.startswith(".")
+        ]
+
+    def _stale_staging(self) -> list[Path]:
+        if not self.staging_dir.is_dir():
+            return []
+        cutoff = time.time() - self.stale_staging_seconds
+        return [
+            path
+            for path in self.staging_dir.iterdir()
+            if path.is_dir() and path.stat().st_mtime < cutoff
+        ]
+
+    def _set_aside(self, path: Path) -> Path:
+        trash = path.with_name(f".gc-{path.name}-{uuid.uuid4().hex[:8]}")
+        os.rename(path, trash)
+        return trash
+
+    def _schedule_gc(self, index_path: Path) -> None:
+        if not self.background_gc:
+            self._collect_quietly(index_path)
+            return
+        threading.Thread(
+            target=self._collect_quietly,
+            args=(index_path,),
+            name="index-version-gc",
+            daemon=True,
+        ).start()
+
+    def _collect_quietly(self, index_path: Path) -> None:
+        try:
+            self.collect_garbage(index_path)
+        except Exception as e:
+            logger.warning(f"Index version cleanup failed for {index_path}: {e}")
+
+    def _next_version_name(self, versions_dir: Path) -> str:
+        numbers = [
+            int(path.name[len(VERSION_PREFIX) :])
+            for path in versions_dir.iterdir()
+            if path.name.startswith(VERSION_PREFIX)
+            and path.name[len(VERSION_PREFIX) :].isdigit()
+        ]
+        return f"{VERSION_PREFIX}{max(numbers, default=0) + 1:06d}"
+
+    def _move_directory(self, source: Path, destination: Path) -> None:
+        try:
+            os.rename(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Staged on another filesystem: copy next to the target, then rename
+            partial = destination.with_name(f".partial-{destination.name}")
+            shutil.copytree(source, partial)
+            fsync_tree(partial)
+            os.rename(partial, destination)
+            shutil.rmtree(source, ignore_errors=True)
+
+    def _point(self, index_path: Path, version: Path) -> None:
+        link = index_path.with_name(f".{index_path.name}.{uuid.uuid4().hex[:8]}")
+        os.symlink(os.path.relpath(version, index_path.parent), link)
+        try:
+            os.replace(link, index_path)
+        except OSError:
+            link.unlink()
+            raise
+        fsync_directory(index_path.parent)
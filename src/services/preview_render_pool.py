@@ -0,0 +1,361 @@
+"""
+Preview Render Pool
+Bounded pool of PDF page renderers. Each worker process keeps an LRU of open
+PyMuPDF documents, so scrolling through a document parses it once instead of
+once per page. Requests for the same document are routed to the same worker
+while it keeps up, identical in-flight renders share one job, and
+speculative pre-renders only run on otherwise idle workers.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any
+
+RenderKey = tuple[str, int, int]
+PrefetchCallback = Callable[["Future[RenderResult]"], None]
+
+logger = logging.getLogger(__name__)
+
+
+class PageOutOfRangeError(LookupError):
+    """Raised by a renderer when the requested page does not exist."""
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """One rendered page."""
+
+    content: bytes
+    width: int
+    height: int
+    page_count: int
+
+
+# ----------------------------------------------------------------------
+# Renderer (runs inside worker processes, or in-process without workers)
+# ----------------------------------------------------------------------
+
+
+class PageRenderer:
+    """Renders PNG pages while keeping recently used documents open."""
+
+    def __init__(self, max_open_documents: int = 8) -> None:
+        """
+        Initialize the renderer.
+
+        Args:
+            max_open_documents: Open document handles to keep; 0 reopens the
+                file for every page
+        """
+        self.max_open_documents = max_open_documents
+        self._documents: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def render(self, file_path: str, page: int, width: int) -> RenderResult:
+        """
+        Render one page scaled to a target width.
+
+        Args:
+            file_path: PDF path
+            page: One-based page number
+            width: Target width in pixels
+        Returns:
+            Rendered page with the document's page count
+        Raises:
+            PageOutOfRangeError: If the page does not exist
+            FileNotFoundError: If the file is missing
+        """
+        import fitz  # PyMuPDF, imported lazily like the preview service
+
+        with self._lock:
+            document = self._open(fitz, file_path)
+            try:
+                if page > document.page_count:
+                    raise PageOutOfRangeError(
+                        f"Page {page} exceeds document length {document.page_count}"
+                    )
+                pdf_page = document.load_page(page - 1)
+                scale = width / (pdf_page.rect.width or 1)
+                pixmap = pdf_page.get_pixmap(
+                    matrix=fitz.Matrix(scale, scale), colorspace=fitz.csRGB
+                )
+                return RenderResult(
+                    pixmap.tobytes("png"),
+                    pixmap.width,
+                    pixmap.height,
+                    document.page_count,
+                )
+            finally:
+                if not self.max_open_documents:
+                    document.close()
+
+    def _open(self, fitz: Any, file_path: str) -> Any:
+        # Keyed by mtime and size so a replaced file is reopened
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        document = self._documents.get(key)
+        if document is not None:
+            self._documents.move_to_end(key)
+            return document
+
+        document = fitz.open(file_path)
+        self.opened += 1
+        if self.max_open_documents:
+            for stale in [k for k in self._documents if k[0] == file_path]:
+                self._documents.pop(stale).close()
+            self._documents[key] = document
+            while len(self._documents) > self.max_open_documents:
+                _, evicted = self._documents.popitem(last=False)
+                evicted.close()
+        return document
+
+
+_worker_renderer: PageRenderer | None = None
+
+
+def _init_worker(max_open_documents: int) -> None:
+    global _worker_renderer
+    _worker_renderer = PageRenderer(max_open_documents)
+
+
+def _ping() -> None:
+    """No-op job used to start a worker process."""
+
+
+def _render_in_worker(file_path: str, page: int, width: int) -> RenderResult:
+    assert _worker_renderer is not None, "worker not initialized"
+    return _worker_renderer.render(file_path, page, width)
+
+
+# ----------------------------------------------------------------------
+# Pool
+# ----------------------------------------------------------------------
+
+
+class PreviewRenderPool:
+    """
+    {
+        "name": "PreviewRenderPool",
+        "version": "1.0.0",
+        "description": "Process pool of PDF page renderers with cached document handles.",
+        "dependencies": ["PyMuPDF"],
+        "interface": {
+            "inputs": ["file_path: str", "page: int", "width: int"],
+            "outputs": "Future[RenderResult]"
+        }
+    }
+    Dispatches page renders to single-process workers.
+
+    A document is pinned to one worker (by path hash) so its open handle is
+    reused; when that worker is backed up the job goes to the least busy
+    worker instead, which opens its own handle. Pre-renders wait in a small
+    newest-first queue and are only handed to idle workers. With zero
+    workers pages are rendered in the calling thread by a shared
+    PageRenderer and pre-renders are dropped.
+
+    A worker process that dies (e.g. PyMuPDF crashing on a malformed PDF)
+    fails the jobs it had queued; its slot gets a fresh process on the next
+    job instead of staying broken.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_open_documents: int = 8,
+        max_backlog_per_worker: int = 2,
+        max_queued_prefetches: int = 32,
+    ) -> None:
+        """
+        Initialize the pool; worker processes start on first use.
+
+        Args:
+            workers: Renderer processes (0 renders in-process)
+            max_open_documents: Open documents kept per renderer
+            max_backlog_per_worker: Jobs queued on a document's home worker
+                before it spills over to another worker
+            max_queued_prefetches: Pre-renders waiting for an idle worker;
+                the oldest are dropped first
+        """
+        self.workers = workers
+        self.max_open_documents = max_open_documents
+        self.max_backlog_per_worker = max_backlog_per_worker
+        self.max_queued_prefetches = max_queued_prefetches
+        # Reentrant: a done callback runs inline if its future already finished
+        self._lock = threading.RLock()
+        self._executors: list[ProcessPoolExecutor | None] = [None] * workers
+        self._pending = [0] * workers
+        self._inflight: dict[RenderKey, Future[RenderResult]] = {}
+        self._prefetches: OrderedDict[RenderKey, PrefetchCallback] = OrderedDict()
+        self._local_renderer = PageRenderer(max_open_documents)
+        self.stats = {"renders": 0, "deduplicated": 0, "prefetched": 0, "dropped": 0}
+
+    def submit(self, file_path: str, page: int, width: int) -> Future[RenderResult]:
+        """
+        Queue a render, sharing any identical render already in flight.
+
+        Args:
+            file_path: PDF path
+            page: One-based page number
+            width: Target width in pixels
+        Returns:
+            Future for the rendered page
+        """
+        key = (file_path, page, width)
+        with self._lock:
+            existing = self._inflight.get(key)
+            if existing is not None:
+                self.stats["deduplicated"] += 1
+                return existing
+            self._prefetches.pop(key, None)
+            self.stats["renders"] += 1
+            if self.workers:
+                return self._dispatch(key, self._pick_worker(file_path))
+            future: Future[RenderResult] = Future()
+            self._inflight[key] = future
+
+        # In-process: render now; concurrent duplicates wait on the future
+        try:
+            future.set_result(self._local_renderer.render(file_path, page, width))
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return future
+
+    def render(self, file_path: str, page: int, width: int) -> RenderResult:
+        """Render a page and wait for the result."""
+        return self.submit(file_path, page, width).result()
+
+    def prefetch(
+        self,
+        file_path: str,
+        page: int,
+        width: int,
+        callback: PrefetchCallback,
+    ) -> None:
+        """
+        Render a page ahead of demand when a worker is idle.
+
+        Args:
+            file_path: PDF path
+            page: One-based page number
+            width: Target width in pixels
+            callback: Called with the finished future (e.g. to cache it)
+        """
+        if not self.workers:
+            return
+        key = (file_path, page, width)
+        with self._lock:
+            if key in self._inflight:
+                return
+            self._prefetches[key] = callback
+            self._prefetches.move_to_end(key, last=False)
+            while len(self._prefetches) > self.max_queued_prefetches:
+                self._prefetches.popitem()
+                self.stats["dropped"] += 1
+            self._start_prefetches()
+
+    def _start_prefetches(self) -> None:
+        """Hand queued pre-renders to idle workers (lock held)."""
+        while self._prefetches:
+            idle = [w for w in range(self.workers) if self._pending[w] == 0]
+            if not idle:
+                return
+            key, callback = self._prefetches.popitem(last=False)
+            home = hash(key[0]) % self.workers
+            worker = home if home in idle else idle[0]
+            self.stats["prefetched"] += 1
+            self._dispatch(key, worker).add_done_callback(callback)
+
+    def _dispatch(self, key: RenderKey, worker: int) -> Future[RenderResult]:
+        """Submit a render to a worker (lock held)."""
+        executor = self._executor(worker)
+        try:
+            future = executor.submit(_render_in_worker, *key)
+        except BrokenProcessPool:
+            # The process died before its done callbacks dropped it
+            self._discard_executor(worker, executor)
+            executor = self._executor(worker)
+            future = executor.submit(_render_in_worker, *key)
+        self._pending[worker] += 1
+        self._inflight[key] = future
+        future.add_done_callback(
+            lambda done, worker=worker, key=key, executor=executor: self._finished(
+                worker, key, executor, done
+            )
+        )
+        return future
+
+    def _pick_worker(self, file_path: str) -> int:
+        home = hash(file_path) % self.workers
+        if self._pending[home] < self.max_backlog_per_worker:
+            return home
+        return min(range(self.workers), key=lambda w: self._pending[w])
+
+    def _executor(self, worker: int) -> ProcessPoolExecutor:
+        executor = self._executors[worker]
+        if executor is None:
+            # Spawned workers do not inherit the server's threads or handles
+            executor = self._executors[worker] = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.max_open_documents,),
+            )
+        return executor
+
+    def _discard_executor(self, worker: int, executor: ProcessPoolExecutor) -> None:
+        """Drop a broken executor so the slot starts a new process (lock held)."""
+        if self._executors[worker] is executor:
+            logger.warning("Preview render worker %s died; restarting it", worker)
+            # A broken executor has already terminated and cleans up itself
+            self._executors[worker] = None
+
+    def _finished(
+        self,
+        worker: int,
+        key: RenderKey,
+        executor: ProcessPoolExecutor,
+        future: Future[RenderResult],
+    ) -> None:
+        with self._lock:
+            self._pending[worker] -= 1
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if not future.cancelled() and isinstance(
+                future.exception(), BrokenProcessPool
+            ):
+                self._discard_executor(worker, executor)
+                return
+            if self._executors[worker] is not None:
+                self._start_prefetches()
+
+    def warm_up(self) -> None:
+        """Start all worker processes ahead of the first request."""
+        with self._lock:
+            futures = [
+                self._executor(worker).submit(_ping) for worker in range(self.workers)
+            ]
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Stop worker processes and close in-process handles."""
+        with self._lock:
+            executors, self._executors = self._executors, [None] * self.workers
+            self._prefetches.clear()
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        self._local_renderer = PageRenderer(self.max_open_documents)
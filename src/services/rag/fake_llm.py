@@ -0,0 +1,118 @@
+"""
+Fake Streaming LLM
+
+Deterministic stand-in for an LLM that streams its answer. The answer text is
+fixed and emitted word by word with configurable delays, so tests and
+benchmarks can measure time-to-first-token against total generation time
+without a model provider. ``as_llama_index_llm()`` wraps it as a LlamaIndex
+``CustomLLM`` for use with real streaming response synthesis
+(``index.as_query_engine(llm=..., streaming=True)``).
+"""
+
+import functools
+import re
+import time
+from collections.abc import Iterator
+from typing import Any
+
+DEFAULT_FAKE_RESPONSE = (
+    "The document describes a retrieval augmented generation pipeline that "
+    "answers questions from indexed PDF content."
+)
+
+
+class FakeStreamingLLM:
+    """
+    {
+        "name": "FakeStreamingLLM",
+        "version": "1.0.0",
+        "description": "Deterministic word-by-word streaming LLM for tests.",
+        "dependencies": [],
+        "interface": {
+            "inputs": [
+                {"name": "response", "type": "string"},
+                {"name": "first_token_delay", "type": "float"},
+                {"name": "token_delay", "type": "float"}
+            ],
+            "outputs": "The same response for every prompt, streamed per word"
+        }
+    }
+    Ignores the prompt and always answers with ``response``. Waits
+    ``first_token_delay`` seconds before the first token (prompt processing)
+    and ``token_delay`` seconds before each following token (decoding).
+    """
+
+    def __init__(
+        self,
+        response: str = DEFAULT_FAKE_RESPONSE,
+        first_token_delay: float = 0.0,
+        token_delay: float = 0.0,
+    ) -> None:
+        self.response = response
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.tokens_generated = 0
+
+    def tokens(self) -> list[str]:
+        """Split the response into word tokens, each keeping its leading space."""
+        return re.findall(r"\s*\S+", self.response)
+
+    def stream(self, prompt: str = "") -> Iterator[str]:
+        """Yield the response token by token, sleeping like a real decoder."""
+        for index, token in enumerate(self.tokens()):
+            delay = self.first_token_delay if index == 0 else self.token_delay
+            if delay:
+                time.sleep(delay)
+            self.tokens_generated += 1
+            yield token
+
+    def complete(self, prompt: str = "") -> str:
+        """Generate the whole response before returning it."""
+        return "".join(self.stream(prompt))
+
+    def as_llama_index_llm(self) -> Any:
+        """Wrap this fake as a LlamaIndex LLM (requires llama_index.core)."""
+        return _llama_index_adapter()(fake=self)
+
+
+@functools.cache
+def _llama_index_adapter() -> type:
+    """Build the CustomLLM adapter class on first use."""
+    from llama_index.core.base.llms.types import (
+        CompletionResponse,
+        CompletionResponseGen,
+        LLMMetadata,
+    )
+    from llama_index.core.llms import CustomLLM
+    from llama_index.core.llms.callbacks import llm_completion_callback
+
+    class FakeStreamingLlamaIndexLLM(CustomLLM):
+        fake: Any
+
+        @classmethod
+        def class_name(cls) -> str:
+            return "FakeStreamingLLM"
+
+        @property
+        def metadata(self) -> LLMMetadata:
+            return LLMMetadata(model_name="fake-streaming")
+
+        @llm_completion_callback()
+        def complete(
+            self, prompt: str, formatted: bool = False, **kwargs: Any
+        ) -> CompletionResponse:
+            return CompletionResponse(text=self.fake.complete(prompt))
+
+        @llm_completion_callback()
+        def stream_complete(
+            self, prompt: str, formatted: bool = False, **kwargs: Any
+        ) -> CompletionResponseGen:
+            def gen() -> CompletionResponseGen:
+                text = ""
+                for token in self.fake.stream(prompt):
+                    text += token
+                    yield CompletionResponse(text=text, delta=token)
+
+            return gen()
+
+    return FakeStreamingLlamaIndexLLM
@@ -2,8 +2,9 @@
 RAG File Manager Service
 
 Handles all file system operations for RAG indexes including:
-- File verification and integrity checking
+- File verification and integrity checking (manifest-based)
 - Index file copying and management
+- Atomic index publication with versioned rollback
 - Cleanup operations
 - Path management and directory structure
 
@@ -14,11 +15,29 @@ interface for other RAG services to interact with the filesystem.
 import json
 import logging
 import shutil
+import threading
 from pathlib import Path
 from typing import Any
 
+from src.services.index_version_store import IndexVersionError, IndexVersionStore
+
+from .index_manifest import (
+    IndexManifestError,
+    check_manifest,
+    deep_verify,
+    read_manifest,
+    write_manifest,
+)
+
 logger = logging.getLogger(__name__)
 
+# Required LlamaIndex files
+REQUIRED_INDEX_FILES = [
+    "default__vector_store.json",
+    "graph_store.json",
+    "index_store.json",
+]
+
 
 class RAGFileManagerError(Exception):
     """Base exception for RAG file manager errors."""
@@ -33,6 +52,7 @@ class RAGFileManager:
     Responsibilities:
     - Index file verification and validation
     - File copying and directory management
+    - Staging, atomic promotion and rollback of index versions
     - Cleanup operations and orphan removal
     - Path resolution and directory structure
     """
@@ -46,12 +66,18 @@ class RAGFileManager:
         """
         self.vector_storage_dir = Path(vector_storage_dir)
         self.vector_storage_dir.mkdir(exist_ok=True)
+        self.versions = IndexVersionStore(self.vector_storage_dir)
         logger.info(f"RAG File Manager initialized with storage: {vector_storage_dir}")
 
     def verify_index_files(self, index_path: str) -> bool:
         """
         Verify that all required index files exist and are valid.
 
+        Indexes with a manifest are checked by comparing file sizes with it,
+        without reading the stores; use deep_verify_index() to recompute
+        digests. Indexes built before manifests are validated by parsing
+        their JSON files (see verify_index_structure()).
+
         Args:
             index_path: Path to vector index directory
 
@@ -66,14 +92,35 @@ class RAGFileManager:
                 )
                 return False
 
-            # Required LlamaIndex files
-            required_files = [
-                "default__vector_store.json",
-                "graph_store.json",
-                "index_store.json",
-            ]
+            manifest = read_manifest(path)
+            if manifest is not None:
+                problems = check_manifest(path, manifest, REQUIRED_INDEX_FILES)
+                for problem in problems:
+                    logger.debug(f"Index manifest check failed: {problem}")
+                return not problems
+
+            return self.verify_index_structure(index_path)
+
+        except Exception as e:
+            logger.error(f"Index file verification failed: {e}")
+            return False
+
+    def verify_index_structure(self, index_path: str) -> bool:
+        """
+        Verify that the required index files exist and parse as JSON.
+
+        Ignores any manifest, so a freshly built index can be checked before
+        its manifest is written.
+
+        Args:
+            index_path: Path to vector index directory
 
-            for file_name in required_files:
+        Returns:
+            True if all required files exist, are non-empty and parse
+        """
+        try:
+            path = Path(index_path)
+            for file_name in REQUIRED_INDEX_FILES:
                 file_path = path / file_name
                 if not file_path.exists():
                     logger.debug(f"Missing required file: {file_name}")
@@ -102,6 +149,87 @@ class RAGFileManager:
             logger.error(f"Index file verification failed: {e}")
             return False
 
+    def write_index_manifest(
+        self, index_path: Path, build_params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Record sizes, digests, chunk count and build parameters of an index.
+
+        Called on the finished build before it is published, so the manifest
+        is part of the immutable index version.
+
+        Args:
+            index_path: Directory holding the built index
+            build_params: Parameters the index was built with
+
+        Returns:
+            Written manifest
+
+        Raises:
+            RAGFileManagerError: If the manifest cannot be written
+        """
+        try:
+            return write_manifest(Path(index_path), build_params)
+        except IndexManifestError as e:
+            logger.error(str(e))
+            raise RAGFileManagerError(str(e)) from e
+
+    def deep_verify_index(
+        self, index_path: str, max_bytes_per_second: float | None = None
+    ) -> bool:
+        """
+        Verify an index by recomputing the digests recorded in its manifest.
+
+        Args:
+            index_path: Path to vector index directory
+            max_bytes_per_second: Read rate cap, unlimited when None
+
+        Returns:
+            True if every file matches its manifest digest; indexes without
+            a manifest fall back to verify_index_files()
+        """
+        path = Path(index_path)
+        manifest = read_manifest(path)
+        if manifest is None:
+            return self.verify_index_files(index_path)
+        problems = deep_verify(path, manifest, max_bytes_per_second)
+        for problem in problems:
+            logger.warning(f"Deep verification of {index_path} failed: {problem}")
+        return not problems
+
+    def start_deep_verification(
+        self,
+        index_paths: list[str],
+        max_bytes_per_second: float | None = 32 * 1024 * 1024,
+    ) -> tuple[threading.Thread, dict[str, bool]]:
+        """
+        Deep-verify indexes on a background thread at a throttled read rate.
+
+        Args:
+            index_paths: Index directories to verify
+            max_bytes_per_second: Read rate cap (default 32 MB/s)
+
+        Returns:
+            Tuple of (thread, results by index path filled in as it runs)
+        """
+        results: dict[str, bool] = {}
+
+        def verify_all() -> None:
+            for index_path in index_paths:
+                try:
+                    results[index_path] = self.deep_verify_index(
+                        index_path, max_bytes_per_second
+                    )
+                except Exception as e:
+                    logger.warning(f"Deep verification of {index_path} failed: {e}")
+                    results[index_path] = False
+
+        thread = threading.Thread(
+            target=verify_all, name="index-deep-verify", daemon=True
+        )
+        thread.start()
+        return thread, results
+
     def copy_index_files(self, source_path: Path, dest_path: Path) -> None:
         """
         Copy index files from source to destination directory.
@@ -140,6 +268,63 @@ class RAGFileManager:
             logger.error(error_msg)
             raise RAGFileManagerError(error_msg) from e
 
+    def create_staging_directory(self, document_id: int) -> Path:
+        """
+        Create a staging directory to build an index in.
+
+        Staging lives inside the vector storage directory, so promoting the
+        finished index is a rename on the same filesystem rather than a copy.
+
+        Args:
+            document_id: Document the index is built for
+
+        Returns:
+            Path to the empty staging directory
+        """
+        return self.versions.create_staging(prefix=f"doc_{document_id}_")
+
+    def promote_index(self, staging_path: Path, index_path: Path) -> Path:
+        """
+        Atomically publish a staged index at its final path.
+
+        The staged files are fsynced and become a new version; index_path is
+        switched to it in a single rename, so readers never see a partial
+        index. The previous version is kept for rollback_index().
+
+        Args:
+            staging_path: Directory holding the built index
+            index_path: Final index path (as stored in the database)
+
+        Returns:
+            Path to the published version directory
+
+        Raises:
+            RAGFileManagerError: If promotion fails
+        """
+        try:
+            return self.versions.publish(staging_path, index_path)
+        except IndexVersionError as e:
+            logger.error(str(e))
+            raise RAGFileManagerError(str(e)) from e
+
+    def rollback_index(self, index_path: Path) -> Path:
+        """
+        Switch an index back to its previously published version.
+
+        Args:
+            index_path: Final index path
+
+        Returns:
+            Path to the version now being served
+
+        Raises:
+            RAGFileManagerError: If there is no earlier version
+        """
+        try:
+            return self.versions.rollback(index_path)
+        except IndexVersionError as e:
+            raise RAGFileManagerError(str(e)) from e
+
     def prepare_index_directory(
         self, index_path: Path, overwrite: bool = False
     ) -> None:
@@ -154,9 +339,9 @@ class RAGFileManager:
             RAGFileManagerError: If directory preparation fails
         """
         try:
-            if index_path.exists():
+            if index_path.exists() or index_path.is_symlink():
                 if overwrite:
-                    shutil.rmtree(index_path, ignore_errors=False)
+                    self.versions.remove(index_path)
                     logger.debug(f"Removed existing index directory: {index_path}")
                 else:
                     raise RAGFileManagerError(
@@ -183,8 +368,8 @@ class RAGFileManager:
         """
         try:
             path = Path(index_path)
-            if path.exists():
-                shutil.rmtree(path, ignore_errors=True)
+            if path.exists() or path.is_symlink():
+                self.versions.remove(path)
                 logger.debug(f"Index files cleaned up: {index_path}")
                 return True
             else:
@@ -210,7 +395,12 @@ class RAGFileManager:
         try:
             index_dir = Path(index_path)
 
-            # Try metadata.json first (if it exists)
+            # Manifest written at build time
+            manifest = read_manifest(index_dir)
+            if manifest is not None:
+                return int(manifest.get("chunk_count", 0))
+
+            # Try metadata.json (if it exists)
             metadata_path = index_dir / "metadata.json"
             if metadata_path.exists():
                 with open(metadata_path) as f:
@@ -298,7 +488,7 @@ class RAGFileManager:
 
         for orphaned_dir in orphaned_dirs:
             try:
-                shutil.rmtree(orphaned_dir, ignore_errors=False)
+                self.versions.remove(orphaned_dir)
                 logger.info(f"Removed orphaned index directory: {orphaned_dir}")
                 cleaned_count += 1
 
@@ -307,6 +497,12 @@ class RAGFileManager:
                     f"Failed to remove orphaned directory {orphaned_dir}: {e}"
                 )
 
+        # Also sweep superseded versions and abandoned staging directories
+        try:
+            self.versions.collect_garbage()
+        except Exception as e:
+            logger.warning(f"Failed to collect old index versions: {e}")
+
         return cleaned_count
 
     def get_storage_statistics(self) -> dict[str, Any]:
@@ -327,8 +523,11 @@ class RAGFileManager:
             if self.vector_storage_dir.exists():
                 stats["directory_exists"] = True
 
+                # Version and staging directories are hidden behind dot names
                 index_dirs = [
-                    d for d in self.vector_storage_dir.iterdir() if d.is_dir()
+                    d
+                    for d in self.vector_storage_dir.iterdir()
+                    if d.is_dir() and not d.name.startswith(".")
                 ]
                 stats["total_indexes"] = len(index_dirs)
 
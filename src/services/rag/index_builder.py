@@ -13,7 +13,6 @@ and provides a clean interface for index creation operations.
 
 import logging
 import os
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -61,6 +60,9 @@ class RAGIndexBuilder:
     - Error recovery and cleanup
     """
 
+    LLM_MODEL = "gemini-1.5-flash"
+    EMBED_MODEL = "models/embedding-001"
+
     def __init__(
         self, api_key: str, file_manager: RAGFileManager, test_mode: bool = False
     ) -> None:
@@ -111,11 +113,9 @@ class RAGIndexBuilder:
             from llama_index.llms.google_genai import GoogleGenAI
 
             # Configure LLM and embeddings
-            Settings.llm = GoogleGenAI(
-                model_name="gemini-1.5-flash", api_key=self.api_key
-            )
+            Settings.llm = GoogleGenAI(model_name=self.LLM_MODEL, api_key=self.api_key)
             Settings.embed_model = GoogleGenAIEmbedding(
-                model_name="models/embedding-001", api_key=self.api_key
+                model_name=self.EMBED_MODEL, api_key=self.api_key
             )
 
             logger.info("LlamaIndex initialized with Google Gemini")
@@ -248,7 +248,6 @@ class RAGIndexBuilder:
             "error": None,
         }
 
-        temp_dir_path: Path | None = None
         final_index_path: Path | None = None
 
         try:
@@ -279,34 +278,42 @@ class RAGIndexBuilder:
                 )
 
             with self.cleanup_manager.cleanup_scope(f"index_build_{document.id}"):
-                # Create temporary directory for index building
-                temp_dir = tempfile.mkdtemp(prefix=f"rag_index_{document.id}_")
-                temp_dir_path = Path(temp_dir)
-                self.cleanup_manager.add_cleanup_path(temp_dir_path)
+                # Stage on the storage filesystem so promotion is a rename
+                staging_path = self.file_manager.create_staging_directory(document.id)
+                self.cleanup_manager.add_cleanup_path(staging_path)
 
-                logger.debug(f"Building index in temporary directory: {temp_dir_path}")
+                logger.debug(f"Building index in staging directory: {staging_path}")
 
-                # Build index in temporary directory
+                # Build index in staging directory
                 build_success = self.build_index_from_pdf(
-                    document.file_path, str(temp_dir_path)
+                    document.file_path, str(staging_path)
                 )
                 if not build_success:
                     raise IndexCreationError("Index building returned failure status")
 
-                # Prepare final index directory
-                self.file_manager.prepare_index_directory(
-                    final_index_path, overwrite=overwrite
-                )
-
-                # Copy index files to final location
-                self.file_manager.copy_index_files(temp_dir_path, final_index_path)
-
-                # Verify final index
-                if not self.file_manager.verify_index_files(str(final_index_path)):
+                # Parse the stores before publishing (and before the manifest
+                # vouches for them); a failed build never replaces the index
+                # readers are using
+                if not self.file_manager.verify_index_structure(str(staging_path)):
                     raise IndexCreationError("Final index verification failed")
 
+                # Record sizes, digests and chunk count for cheap verification
+                self.file_manager.write_index_manifest(
+                    staging_path,
+                    build_params={
+                        "document_id": document.id,
+                        "content_hash": content_hash,
+                        "llm_model": self.LLM_MODEL,
+                        "embed_model": self.EMBED_MODEL,
+                        "test_mode": self.test_mode,
+                    },
+                )
+
                 # Get chunk count for metadata
-                chunk_count = self.file_manager.get_chunk_count(str(final_index_path))
+                chunk_count = self.file_manager.get_chunk_count(str(staging_path))
+
+                # Atomically switch the final path to the new version
+                self.file_manager.promote_index(staging_path, final_index_path)
 
                 # Update build result
                 build_result.update(
@@ -326,11 +333,6 @@ class RAGIndexBuilder:
         except Exception as e:
             build_result["error"] = str(e)
             logger.error(f"Index building failed for document {document.id}: {e}")
-
-            # Emergency cleanup
-            if final_index_path and final_index_path.exists():
-                self.file_manager.cleanup_index_files(str(final_index_path))
-
             raise RAGIndexBuilderError(f"Index building failed: {e}") from e
 
         finally:
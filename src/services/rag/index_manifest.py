@@ -0,0 +1,244 @@
+"""
+RAG Index Manifest
+
+Small JSON manifest written next to a persisted vector index at build time:
+per-file sizes and digests, chunk count, embedding dimension and the build
+parameters. Routine verification compares the manifest with a stat() of
+each file instead of parsing the stores; digests are only recomputed by
+deep verification, which can be throttled to a fixed read rate.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+    XXHASH_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "index_manifest.json"
+MANIFEST_VERSION = 1
+VECTOR_STORE_FILE = "default__vector_store.json"
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+class IndexManifestError(Exception):
+    """Raised when an index manifest cannot be written or read."""
+
+    pass
+
+
+def _new_digest(algorithm: str) -> Any:
+    """Create a hasher for a manifest digest algorithm."""
+    if algorithm == "xxh3_128":
+        if not XXHASH_AVAILABLE:
+            raise IndexManifestError("xxhash is required to verify this manifest")
+        return xxhash.xxh3_128()
+    return hashlib.new(algorithm)
+
+
+def default_algorithm() -> str:
+    """Fastest digest available: xxh3_128 with xxhash installed, else sha256."""
+    return "xxh3_128" if XXHASH_AVAILABLE else "sha256"
+
+
+def file_digest(
+    path: Path, algorithm: str, max_bytes_per_second: float | None = None
+) -> str:
+    """
+    Digest a file, optionally reading no faster than a given rate.
+
+    Args:
+        path: File to digest
+        algorithm: Digest algorithm name (xxh3_128 or a hashlib name)
+        max_bytes_per_second: Read rate cap, unlimited when None
+
+    Returns:
+        Hex digest
+    """
+    digest = _new_digest(algorithm)
+    start = time.monotonic()
+    read = 0
+    with open(path, "rb") as f:
+        while block := f.read(READ_BLOCK_SIZE):
+            digest.update(block)
+            read += len(block)
+            if max_bytes_per_second:
+                ahead = read / max_bytes_per_second - (time.monotonic() - start)
+                if ahead > 0:
+                    time.sleep(ahead)
+    return digest.hexdigest()
+
+
+def _vector_store_shape(index_dir: Path) -> tuple[int, int | None]:
+    """Chunk count and embedding dimension, parsed once at build time."""
+    vector_store_path = index_dir / VECTOR_STORE_FILE
+    if not vector_store_path.exists():
+        return 0, None
+    with open(vector_store_path) as f:
+        embeddings = json.load(f).get("embedding_dict", {})
+    first = next(iter(embeddings.values()), None)
+    return len(embeddings), len(first) if first is not None else None
+
+
+def build_manifest(
+    index_dir: Path,
+    build_params: dict[str, Any] | None = None,
+    algorithm: str | None = None,
+) -> dict[str, Any]:
+    """
+    Describe the files of an index directory.
+
+    Args:
+        index_dir: Directory holding the persisted index
+        build_params: Parameters the index was built with
+        algorithm: Digest algorithm (default_algorithm() when omitted)
+
+    Returns:
+        Manifest dictionary
+    """
+    algorithm = algorithm or default_algorithm()
+    files = {}
+    for path in sorted(index_dir.rglob("*")):
+        if path.is_file() and path.name != MANIFEST_FILE:
+            files[path.relative_to(index_dir).as_posix()] = {
+                "size": path.stat().st_size,
+                "digest": file_digest(path, algorithm),
+            }
+    chunk_count, embedding_dimension = _vector_store_shape(index_dir)
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "digest_algorithm": algorithm,
+        "chunk_count": chunk_count,
+        "embedding_dimension": embedding_dimension,
+        "build_params": build_params or {},
+        "files": files,
+    }
+
+
+def write_manifest(
+    index_dir: Path, build_params: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Build the manifest of an index directory and save it inside it.
+
+    Args:
+        index_dir: Directory holding the persisted index
+        build_params: Parameters the index was built with
+
+    Returns:
+        Written manifest
+
+    Raises:
+        IndexManifestError: If the manifest cannot be written
+    """
+    try:
+        manifest = build_manifest(index_dir, build_params)
+        temp_path = index_dir / f".{MANIFEST_FILE}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, index_dir / MANIFEST_FILE)
+        return manifest
+    except (OSError, ValueError) as e:
+        raise IndexManifestError(
+            f"Failed to write manifest for {index_dir}: {e}"
+        ) from e
+
+
+def read_manifest(index_dir: Path) -> dict[str, Any] | None:
+    """
+    Load the manifest of an index directory.
+
+    Args:
+        index_dir: Directory holding the persisted index
+
+    Returns:
+        Manifest dictionary, or None if the index has none (built before
+        manifests) or it is unreadable
+    """
+    manifest_path = index_dir / MANIFEST_FILE
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Unreadable index manifest {manifest_path}: {e}")
+        return None
+    if manifest.get("manifest_version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def check_manifest(
+    index_dir: Path, manifest: dict[str, Any], required_files: list[str]
+) -> list[str]:
+    """
+    Compare an index directory with its manifest using stat() only.
+
+    Args:
+        index_dir: Directory holding the persisted index
+        manifest: Manifest read from the directory
+        required_files: Files every index must have
+
+    Returns:
+        Problems found; empty if the directory matches the manifest
+    """
+    files = manifest.get("files", {})
+    problems = [
+        f"Required file not in manifest: {name}"
+        for name in required_files
+        if name not in files
+    ]
+    for name, entry in files.items():
+        try:
+            size = (index_dir / name).stat().st_size
+        except OSError:
+            problems.append(f"Missing file: {name}")
+            continue
+        if size != entry["size"]:
+            problems.append(f"Size mismatch for {name}: {size} != {entry['size']}")
+    return problems
+
+
+def deep_verify(
+    index_dir: Path,
+    manifest: dict[str, Any],
+    max_bytes_per_second: float | None = None,
+) -> list[str]:
+    """
+    Recompute every file digest and compare it with the manifest.
+
+    Args:
+        index_dir: Directory holding the persisted index
+        manifest: Manifest read from the directory
+        max_bytes_per_second: Read rate cap, unlimited when None
+
+    Returns:
+        Problems found; empty if every digest matches
+    """
+    problems = check_manifest(index_dir, manifest, [])
+    if problems:
+        return problems
+    algorithm = manifest["digest_algorithm"]
+    for name, entry in manifest["files"].items():
+        try:
+            digest = file_digest(index_dir / name, algorithm, max_bytes_per_second)
+        except (OSError, IndexManifestError) as e:
+            problems.append(f"Could not digest {name}: {e}")
+            continue
+        if digest != entry["digest"]:
+            problems.append(f"Digest mismatch for {name}")
+    return problems
@@ -0,0 +1,512 @@
+"""
+Thumbnail Store
+Packs document thumbnails into a single append-only blob file with an
+in-memory offset index, so a grid of thumbnails is served from one open
+file without a per-thumbnail stat/open/read and without sidecar files.
+Several processes (server workers) can share one store directory: writes
+are serialized with a file lock and each process follows the others'
+changes through the index file.
+Thumbnails are re-encoded to WebP or JPEG at a quality tier when Pillow is
+available and can be composed into sprite sheets.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+try:
+    from PIL import Image, features
+
+    PIL_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+    features = None
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Encoder quality per tier; PNG ignores it
+QUALITY_TIERS = {"low": 50, "standard": 72, "high": 88}
+CONTENT_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+
+
+@dataclass(frozen=True)
+class ThumbnailRecord:
+    """Location and metadata of one stored thumbnail."""
+
+    document_id: int
+    offset: int
+    length: int
+    width: int
+    height: int
+    format: str
+    source_key: str
+    etag: str
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[self.format]
+
+
+def resolve_format(preferred: str) -> str:
+    """Return the best available encoding, falling back WebP -> JPEG -> PNG."""
+    if not PIL_AVAILABLE:
+        return "png"
+    if preferred == "webp" and not features.check("webp"):
+        preferred = "jpeg"
+    if preferred == "jpeg" and not features.check("jpg"):
+        preferred = "png"
+    return preferred
+
+
+def encode_image(png_bytes: bytes, image_format: str, quality: str) -> bytes:
+    """
+    Re-encode a rendered PNG.
+
+    Args:
+        png_bytes: Rendered page image
+        image_format: webp, jpeg or png (see resolve_format)
+        quality: Quality tier name from QUALITY_TIERS
+    Returns:
+        Encoded image bytes
+    """
+    if image_format == "png":
+        return png_bytes
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        return _save(image.convert("RGB"), image_format, quality)
+
+
+def build_sprite(
+    tiles: list[bytes | None],
+    columns: int,
+    cell_width: int,
+    cell_height: int,
+    image_format: str,
+    quality: str,
+) -> bytes:
+    """
+    Compose tiles into a row-major sprite sheet of fixed-size cells.
+
+    Each tile is scaled to fit its cell and centred; missing tiles leave a
+    blank cell so positions stay predictable from the request order.
+
+    Args:
+        tiles: Encoded images, or None for an empty cell
+        columns: Cells per row
+        cell_width: Cell width in pixels
+        cell_height: Cell height in pixels
+        image_format: Sprite encoding (webp, jpeg or png)
+        quality: Quality tier name from QUALITY_TIERS
+    Returns:
+        Encoded sprite sheet
+    Raises:
+        RuntimeError: If Pillow is not installed
+    """
+    if not PIL_AVAILABLE:
+        raise RuntimeError("Pillow is required to build thumbnail sprites")
+    rows = max(1, -(-len(tiles) // columns))
+    sheet = Image.new("RGB", (columns * cell_width, rows * cell_height), "white")
+    for index, tile in enumerate(tiles):
+        if tile is None:
+            continue
+        with Image.open(io.BytesIO(tile)) as image:
+            image.thumbnail((cell_width, cell_height))
+            row, column = divmod(index, columns)
+            sheet.paste(
+                image.convert("RGB"),
+                (
+                    column * cell_width + (cell_width - image.width) // 2,
+                    row * cell_height + (cell_height - image.height) // 2,
+                ),
+            )
+    # Sprites are large and composed on request: favour encoder speed
+    return _save(sheet, image_format, quality, fast=True)
+
+
+def _save(image: Image.Image, image_format: str, quality: str, fast=False) -> bytes:
+    buffer = io.BytesIO()
+    if image_format == "png":
+        image.save(buffer, "PNG", optimize=not fast)
+    elif image_format == "webp":
+        image.save(
+            buffer,
+            "WEBP",
+            quality=QUALITY_TIERS.get(quality, 72),
+            method=2 if fast else 4,
+        )
+    else:
+        image.save(buffer, "JPEG", quality=QUALITY_TIERS.get(quality, 72))
+    return buffer.getvalue()
+
+
+def content_etag(*parts: bytes | str) -> str:
+    """Strong ETag (quoted) over the given parts."""
+    digest = hashlib.blake2b(digest_size=12)
+    for part in parts:
+        digest.update(part.encode() if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+class ThumbnailStore:
+    """
+    {
+        "name": "ThumbnailStore",
+        "version": "1.0.0",
+        "description": "Append-only packed thumbnail storage with an offset index.",
+        "dependencies": [],
+        "interface": {
+            "inputs": ["document_id: int", "content: bytes"],
+            "outputs": "tuple[ThumbnailRecord, bytes]"
+        }
+    }
+    Stores every thumbnail in ``thumbnails.<generation>.pack`` and appends a
+    JSON line per change to the matching ``.idx`` file. The index is held in
+    memory, so a lookup is a dict access and a read is a single ``pread`` on
+    a file descriptor held open by the store. Replaced and removed
+    thumbnails leave dead bytes that ``compact`` drops by writing the next
+    generation.
+
+    Writers hold an exclusive ``flock`` on ``thumbnails.lock`` and readers a
+    shared one. Under the lock each store first reads the index lines other
+    processes appended since its last access; a compaction leaves a marker
+    line in the old index that makes the others reload the new generation.
+    Every store keeps a shared lock on the pack it reads, and an old
+    generation is only deleted once no store holds it.
+    """
+
+    def __init__(self, root: Path, compact_ratio: float = 0.5) -> None:
+        """
+        Open or create a store.
+
+        Args:
+            root: Directory holding the pack and index files
+            compact_ratio: Dead-byte share of the pack that triggers
+                compaction on write
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compact_ratio = compact_ratio
+        self._lock = threading.RLock()
+        self._lock_fd: int | None = None
+        self._lock_depth = 0
+        self._records: dict[int, ThumbnailRecord] = {}
+        self._generation = 0
+        # Bytes of the index file already applied; None until loaded
+        self._index_pos: int | None = None
+        self._pack_size = 0
+        self._dead_bytes = 0
+        self._fd: int | None = None
+        with self._locked(exclusive=False):
+            pass
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, document_id: int) -> tuple[ThumbnailRecord, bytes] | None:
+        """Return a stored thumbnail and its record, if present."""
+        with self._locked(exclusive=False):
+            record = self._records.get(document_id)
+            if record is None:
+                return None
+            return record, os.pread(self._reader(), record.length, record.offset)
+
+    def record(self, document_id: int) -> ThumbnailRecord | None:
+        """Return a thumbnail's record without reading its bytes."""
+        with self._locked(exclusive=False):
+            return self._records.get(document_id)
+
+    def put(
+        self,
+        document_id: int,
+        content: bytes,
+        width: int,
+        height: int,
+        image_format: str,
+        source_key: str,
+    ) -> ThumbnailRecord:
+        """
+        Store or replace a document's thumbnail.
+
+        Args:
+            document_id: Document the thumbnail belongs to
+            content: Encoded image bytes
+            width: Image width in pixels
+            height: Image height in pixels
+            image_format: Encoding of content (webp, jpeg or png)
+            source_key: Identifies what the thumbnail was rendered from;
+                callers compare it to decide whether to re-render
+        Returns:
+            The stored record
+        """
+        with self._locked(exclusive=True):
+            fd = os.open(
+                self._pack_path(self._generation),
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o644,
+            )
+            try:
+                # The real end of the pack, which other processes also append to
+                offset = os.fstat(fd).st_size
+                view = memoryview(content)
+                while view:
+                    view = view[os.write(fd, view) :]
+            finally:
+                os.close(fd)
+            record = ThumbnailRecord(
+                document_id=document_id,
+                offset=offset,
+                length=len(content),
+                width=width,
+                height=height,
+                format=image_format,
+                source_key=source_key,
+                etag=content_etag(content),
+            )
+            self._append_index(asdict(record))
+            # Bytes between the known end and offset are a torn crash tail
+            self._dead_bytes += offset - self._pack_size
+            self._pack_size = offset + len(content)
+            previous = self._records.get(document_id)
+            if previous is not None:
+                self._dead_bytes += previous.length
+            self._records[document_id] = record
+            self._maybe_compact()
+            return record
+
+    def remove(self, document_id: int) -> bool:
+        """Drop a document's thumbnail; returns False if none was stored."""
+        with self._locked(exclusive=True):
+            record = self._records.pop(document_id, None)
+            if record is None:
+                return False
+            self._append_index({"document_id": document_id, "deleted": True})
+            self._dead_bytes += record.length
+            self._maybe_compact()
+            return True
+
+    def compact(self) -> None:
+        """Rewrite live thumbnails into the next generation's files."""
+        with self._locked(exclusive=True):
+            previous = self._generation
+            generation = previous + 1
+            records: dict[int, ThumbnailRecord] = {}
+            offset = 0
+            with open(self._pack_path(generation), "wb") as pack:
+                for record in sorted(self._records.values(), key=lambda r: r.offset):
+                    pack.write(os.pread(self._reader(), record.length, record.offset))
+                    records[record.document_id] = ThumbnailRecord(
+                        **{**asdict(record), "offset": offset}
+                    )
+                    offset += record.length
+            # The index is written last: a generation without one is ignored
+            index_tmp = self._index_path(generation).with_suffix(".tmp")
+            index_tmp.write_text(
+                "".join(json.dumps(asdict(r)) + "\n" for r in records.values())
+            )
+            index_tmp.replace(self._index_path(generation))
+            # Tells other processes reading the old index to reload
+            self._append_index({"compacted_to": generation})
+
+            self._close_reader()
+            self._generation = generation
+            self._records = records
+            self._index_pos = self._index_path(generation).stat().st_size
+            self._pack_size = offset
+            self._dead_bytes = 0
+            self._remove_unused_generations()
+            logger.info(
+                "Compacted thumbnail store to %s thumbnails (%s bytes)",
+                len(records),
+                offset,
+            )
+
+    def close(self) -> None:
+        """Release the read descriptor and the lock file."""
+        with self._lock:
+            self._close_reader()
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "thumbnails": len(self._records),
+            "pack_bytes": self._pack_size,
+            "dead_bytes": self._dead_bytes,
+            "generation": self._generation,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _pack_path(self, generation: int) -> Path:
+        return self.root / f"thumbnails.{generation}.pack"
+
+    def _index_path(self, generation: int) -> Path:
+        return self.root / f"thumbnails.{generation}.idx"
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold the thread lock and the cross-process file lock, then sync."""
+        with self._lock:
+            if self._lock_depth:
+                # Re-entered from a writer (e.g. put -> compact)
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            if fcntl is not None:
+                if self._lock_fd is None:
+                    self._lock_fd = os.open(
+                        self.root / "thumbnails.lock", os.O_RDWR | os.O_CREAT, 0o644
+                    )
+                fcntl.flock(
+                    self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+                )
+            self._lock_depth = 1
+            try:
+                self._sync()
+                yield
+            finally:
+                self._lock_depth = 0
+                if fcntl is not None:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _sync(self) -> None:
+        """Apply index changes made since the last access, by any process."""
+        if self._index_pos is not None:
+            try:
+                size = self._index_path(self._generation).stat().st_size
+            except FileNotFoundError:
+                size = None  # Generation replaced and removed
+            if size is not None and size <= self._index_pos:
+                return
+            if size is not None and self._read_index(self._index_pos):
+                self._refresh_sizes()
+                return
+        self._load()
+
+    def _load(self) -> None:
+        self._close_reader()
+        self._records = {}
+        generations = sorted(
+            int(path.name.split(".")[1]) for path in self.root.glob("thumbnails.*.idx")
+        )
+        if not generations:
+            self._pack_path(0).touch()
+            self._index_path(0).touch()
+            generations = [0]
+        self._generation = generations[-1]
+        self._read_index(0)
+        self._refresh_sizes()
+        self._remove_unused_generations()
+
+    def _read_index(self, start: int) -> bool:
+        """
+        Apply complete index lines from byte start onwards.
+
+        Returns False when the index ends in a compaction marker, meaning the
+        store has to reload the next generation.
+        """
+        with open(self._index_path(self._generation), "rb") as index:
+            index.seek(start)
+            data = index.read()
+        # A line without its newline is a write torn by a crash
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if "compacted_to" in entry:
+                return False
+            self._records.pop(entry["document_id"], None)
+            if not entry.get("deleted"):
+                record = ThumbnailRecord(**entry)
+                self._records[record.document_id] = record
+        self._index_pos = start + end
+        return True
+
+    def _refresh_sizes(self) -> None:
+        pack_path = self._pack_path(self._generation)
+        pack_size = pack_path.stat().st_size if pack_path.exists() else 0
+        # Records past the end of the pack were torn by a crash
+        self._records = {
+            document_id: record
+            for document_id, record in self._records.items()
+            if record.offset + record.length <= pack_size
+        }
+        live = sum(record.length for record in self._records.values())
+        self._pack_size = pack_size
+        self._dead_bytes = pack_size - live
+
+    def _append_index(self, entry: dict) -> None:
+        fd = os.open(
+            self._index_path(self._generation), os.O_WRONLY | os.O_APPEND, 0o644
+        )
+        try:
+            # Drop a torn line left by a crash instead of appending after it
+            if os.fstat(fd).st_size > self._index_pos:
+                os.ftruncate(fd, self._index_pos)
+            os.write(fd, json.dumps(entry).encode() + b"\n")
+            self._index_pos = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+
+    def _reader(self) -> int:
+        if self._fd is None:
+            self._fd = os.open(self._pack_path(self._generation), os.O_RDONLY)
+            if fcntl is not None:
+                # Keeps compaction in other processes from deleting this pack
+                fcntl.flock(self._fd, fcntl.LOCK_SH)
+        return self._fd
+
+    def _close_reader(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _remove_unused_generations(self) -> None:
+        """Delete older generations that no store is reading any more."""
+        for path in self.root.glob("thumbnails.*.pack"):
+            generation = int(path.name.split(".")[1])
+            if generation >= self._generation:
+                continue
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                if fcntl is not None:
+                    try:
+                        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        continue  # Still read by another store
+                self._pack_path(generation).unlink(missing_ok=True)
+                self._index_path(generation).unlink(missing_ok=True)
+            finally:
+                os.close(fd)
+
+    def _maybe_compact(self) -> None:
+        if self._pack_size and self._dead_bytes > self._pack_size * self.compact_ratio:
+            self.compact()
@@ -2,12 +2,14 @@
 Vector Index Persistence Manager
 This module provides comprehensive vector index persistence management,
 including index lifecycle, integrity verification, and optimization.
+Index files are published as immutable versions (see IndexVersionStore).
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +18,8 @@ from typing import Any
 from src.database.connection import DatabaseConnection
 from src.database.models import VectorIndexModel
 from src.repositories.vector_repository import VectorIndexRepository
+from src.services.dedup_backup_store import BackupSnapshot, DedupBackupRepository
+from src.services.index_version_store import IndexVersionStore
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +77,12 @@ class VectorIndexManager:
         self.temp_dir: Path = self.storage_base_dir / "temp"
         for directory in [self.active_dir, self.backup_dir, self.temp_dir]:
             directory.mkdir(exist_ok=True)
+        # Chunk-deduplicated backups live outside backup_dir so they are not
+        # counted or swept as plain directory backups
+        self.backup_store_dir: Path = self.storage_base_dir / "backup_store"
+        self._backup_store: DedupBackupRepository | None = None
+        # Versions and staging sit under active_dir behind dot names
+        self.versions: IndexVersionStore = IndexVersionStore(self.active_dir)
         logger.info(
             f"Vector index manager initialized with storage: {storage_base_dir}"
         )
@@ -168,15 +178,24 @@ class VectorIndexManager:
                 raise VectorIndexManagerError(
                     f"Missing required files: {missing_files}"
                 )
-            # Ensure destination directory exists
-            dest_path.mkdir(exist_ok=True)
-            # Copy all files from source to destination
-            for item in source_path.iterdir():
-                if item.is_file():
-                    shutil.copy2(item, dest_path / item.name)
-                elif item.is_dir():
-                    shutil.copytree(item, dest_path / item.name, dirs_exist_ok=True)
-            # Verify integrity after copy
+            # Move (rename where possible) into staging, carry over the
+            # storage metadata and publish atomically as a new version
+            staging_path = self.versions.create_staging(
+                prefix=f"doc_{vector_index.document_id}_"
+            )
+            try:
+                for item in source_path.iterdir():
+                    shutil.move(str(item), staging_path / item.name)
+                metadata_path = dest_path / "index_metadata.json"
+                if (
+                    metadata_path.exists()
+                    and not (staging_path / "index_metadata.json").exists()
+                ):
+                    shutil.copy2(metadata_path, staging_path / metadata_path.name)
+                self.versions.publish(staging_path, dest_path, keep_existing=False)
+            finally:
+                shutil.rmtree(staging_path, ignore_errors=True)
+            # Verify integrity after publishing
             if not self.verify_index_integrity(vector_index.id):
                 raise VectorIndexManagerError(
                     "Index integrity verification failed after move"
@@ -291,6 +310,9 @@ class VectorIndexManager:
     def backup_index(self, vector_index_id: int) -> str:
         """
         Create a backup of a vector index.
+        Published versions are never modified in place, so their files are
+        hard-linked into the backup instead of copied; other indexes (or a
+        backup on another filesystem) fall back to copying.
         Args:
             vector_index_id: Vector index ID to backup
         Returns:
@@ -313,8 +335,13 @@ class VectorIndexManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"backup_doc_{vector_index.document_id}_{timestamp}"
             backup_path = self.backup_dir / backup_name
-            # Copy index to backup
-            shutil.copytree(source_path, backup_path)
+            # Link (or copy) index files into the backup
+            copy_function = (
+                _link_or_copy
+                if self.versions.is_published_version(source_path)
+                else shutil.copy2
+            )
+            shutil.copytree(source_path, backup_path, copy_function=copy_function)
             # Create backup metadata
             backup_metadata = {
                 "original_index_id": vector_index_id,
@@ -331,6 +358,73 @@ class VectorIndexManager:
             logger.error(f"Failed to backup index {vector_index_id}: {e}")
             raise VectorIndexManagerError(f"Index backup failed: {e}") from e
 
+    @property
+    def backup_store(self) -> DedupBackupRepository:
+        """Deduplicating backup repository, created on first use."""
+        if self._backup_store is None:
+            self._backup_store = DedupBackupRepository(self.backup_store_dir)
+        return self._backup_store
+
+    def backup_index_deduplicated(self, vector_index_id: int) -> BackupSnapshot:
+        """
+        Create a chunk-deduplicated backup of a vector index.
+        Only chunks not already present in the backup store are written, so
+        re-running after a small index rebuild stores just the changed data.
+        Args:
+            vector_index_id: Vector index ID to backup
+        Returns:
+            Recorded snapshot with dedup statistics
+        Raises:
+            VectorIndexManagerError: If backup fails
+        """
+        try:
+            vector_index = self.vector_repo.find_by_id(vector_index_id)
+            if not vector_index:
+                raise VectorIndexManagerError(
+                    f"Vector index not found: {vector_index_id}"
+                )
+            source_path = Path(vector_index.index_path)
+            if not source_path.exists():
+                raise VectorIndexManagerError(
+                    f"Index path does not exist: {source_path}"
+                )
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            snapshot = self.backup_store.backup(
+                source_path,
+                snapshot_id=f"backup_doc_{vector_index.document_id}_{timestamp}",
+                metadata={
+                    "original_index_id": vector_index_id,
+                    "document_id": vector_index.document_id,
+                    "original_path": str(source_path),
+                    "index_hash": vector_index.index_hash,
+                },
+            )
+            logger.info(
+                f"Deduplicated index backup created: {snapshot.snapshot_id} "
+                f"({snapshot.stats['bytes_stored']} bytes stored)"
+            )
+            return snapshot
+        except Exception as e:
+            logger.error(f"Failed to backup index {vector_index_id}: {e}")
+            raise VectorIndexManagerError(f"Index backup failed: {e}") from e
+
+    def restore_index_backup(self, snapshot_id: str, destination: Path) -> Path:
+        """
+        Restore a deduplicated index backup into a directory.
+        Args:
+            snapshot_id: Snapshot ID returned by backup_index_deduplicated
+            destination: Directory to restore into
+        Returns:
+            Path to the restored index directory
+        Raises:
+            VectorIndexManagerError: If restore fails
+        """
+        try:
+            return self.backup_store.restore(snapshot_id, destination)
+        except Exception as e:
+            logger.error(f"Failed to restore index backup {snapshot_id}: {e}")
+            raise VectorIndexManagerError(f"Index restore failed: {e}") from e
+
     def optimize_storage(self) -> dict[str, int]:
         """
         Optimize vector index storage by removing duplicates and cleaning up.
@@ -380,8 +474,7 @@ class VectorIndexManager:
             }
             # Count active indexes
             if self.active_dir.exists():
-                active_indexes = list(self.active_dir.iterdir())
-                stats["active_indexes"] = len([d for d in active_indexes if d.is_dir()])
+                stats["active_indexes"] = len(self._index_dirs())
             # Count backups
             if self.backup_dir.exists():
                 backup_dirs = list(self.backup_dir.iterdir())
@@ -389,13 +482,12 @@ class VectorIndexManager:
             # Calculate total size
             total_size = 0
             index_sizes = []
-            for index_dir in self.active_dir.iterdir():
-                if index_dir.is_dir():
-                    size = sum(
-                        f.stat().st_size for f in index_dir.rglob("*") if f.is_file()
-                    )
-                    total_size += size
-                    index_sizes.append(size)
+            for index_dir in self._index_dirs():
+                size = sum(
+                    f.stat().st_size for f in index_dir.rglob("*") if f.is_file()
+                )
+                total_size += size
+                index_sizes.append(size)
             stats["total_size_mb"] = round(total_size / (1024 * 1024), 2)
             stats["total_indexes"] = len(index_sizes)
             if index_sizes:
@@ -417,6 +509,14 @@ class VectorIndexManager:
             return {"error": str(e)}
 
     # Private helper methods
+    def _index_dirs(self) -> list[Path]:
+        """Published index paths in active storage (skips version internals)."""
+        return [
+            path
+            for path in self.active_dir.iterdir()
+            if path.is_dir() and not path.name.startswith(".")
+        ]
+
     def _extract_chunk_count(self, index_path: Path) -> int:
         """Extract chunk count from index files."""
         try:
@@ -444,11 +544,13 @@ class VectorIndexManager:
             # Get all index IDs from database
             db_paths = {idx.index_path for idx in self.vector_repo.find_all()}
             # Check each directory in active storage
-            for index_dir in self.active_dir.iterdir():
-                if index_dir.is_dir() and str(index_dir) not in db_paths:
+            for index_dir in self._index_dirs():
+                if str(index_dir) not in db_paths:
                     logger.info(f"Removing orphaned storage directory: {index_dir}")
-                    shutil.rmtree(index_dir, ignore_errors=True)
+                    self.versions.remove(index_dir)
                     removed_count += 1
+            # Superseded versions and abandoned staging directories
+            self.versions.collect_garbage()
             return removed_count
         except Exception as e:
             logger.error(f"Failed to remove orphaned storage: {e}")
@@ -474,8 +576,8 @@ class VectorIndexManager:
                         )
                     # Remove storage
                     index_path = Path(vector_index.index_path)
-                    if index_path.exists():
-                        shutil.rmtree(index_path, ignore_errors=True)
+                    if index_path.exists() or index_path.is_symlink():
+                        self.versions.remove(index_path)
                     # Remove database record
                     self.vector_repo.delete(vector_index.id)
                     removed_count += 1
@@ -507,5 +609,25 @@ class VectorIndexManager:
                     if backup_dir.is_dir() and backup_dir.stat().st_mtime < cutoff_time:
                         logger.info(f"Removing old backup: {backup_dir}")
                         shutil.rmtree(backup_dir, ignore_errors=True)
+            if self.backup_store_dir.exists():
+                store = self.backup_store
+                expired = [
+                    snapshot_id
+                    for snapshot_id in store.list_snapshots()
+                    if store.snapshot_mtime(snapshot_id) < cutoff_time
+                ]
+                for snapshot_id in expired:
+                    logger.info(f"Removing old deduplicated backup: {snapshot_id}")
+                    store.delete_snapshot(snapshot_id)
+                if expired:
+                    store.collect_garbage()
         except Exception as e:
             logger.warning(f"Could not cleanup old backups: {e}")
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    """Hard-link a file, copying it when linking is not possible."""
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
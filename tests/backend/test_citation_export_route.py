@@ -0,0 +1,176 @@
+"""
+Tests for streaming citation export.
+
+Tests cover:
+- Every matching citation is exported across batch boundaries
+- Each format produces a well-formed document
+- Gzip encoding is applied only when the client accepts it with q > 0
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from backend.api.routes import citations
+from src.repositories.citation_repository import CitationRepository
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class SimpleDB:
+    def __init__(self, connection: sqlite3.Connection):
+        self.conn = connection
+        self.queries = 0
+
+    def fetch_one(self, query, params=()):
+        return self.conn.execute(query, params).fetchone()
+
+    def fetch_all(self, query, params=()):
+        self.queries += 1
+        return self.conn.execute(query, params).fetchall()
+
+
+class StubDocumentRepository:
+    def get_by_id(self, document_id):
+        return SimpleNamespace(id=document_id) if document_id <= 3 else None
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> CitationRepository:
+    conn = sqlite3.connect(tmp_path / "citations.db", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE citations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER NOT NULL,
+            raw_text TEXT NOT NULL,
+            authors TEXT,
+            title TEXT,
+            publication_year INTEGER,
+            journal_or_venue TEXT,
+            doi TEXT,
+            page_range TEXT,
+            citation_type TEXT,
+            confidence_score REAL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+    conn.executemany(
+        "INSERT INTO citations (document_id, raw_text, authors, title, "
+        "publication_year, journal_or_venue, citation_type, confidence_score) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                1 + i % 3,
+                f"Raw citation {i}",
+                "Smith, J." if i % 2 else "Doe, A.",
+                f"Paper, part {i}",
+                2000 + i % 10,
+                "Journal of Tests",
+                "journal",
+                0.9,
+            )
+            for i in range(25)
+        ],
+    )
+    conn.commit()
+    return CitationRepository(SimpleDB(conn))
+
+
+@pytest.fixture
+def client(repo, monkeypatch):
+    monkeypatch.setattr(citations, "EXPORT_BATCH_SIZE", 10)
+    app = FastAPI()
+    app.include_router(citations.router, prefix="/api/citations")
+    app.dependency_overrides[citations.get_citation_repository] = lambda: repo
+    app.dependency_overrides[citations.get_document_repository] = (
+        lambda: StubDocumentRepository()
+    )
+    return TestClient(app)
+
+
+def _export(client, format, headers=None, **params):
+    return client.post(
+        f"/api/citations/export/{format}",
+        params=params,
+        headers=headers or {"Accept-Encoding": "identity"},
+    )
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+
+def test_json_export_streams_all_citations_in_batches(client, repo):
+    response = _export(client, "json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "attachment" in response.headers["content-disposition"]
+    assert [c["id"] for c in json.loads(response.text)] == list(range(1, 26))
+    assert repo.db.queries == 3  # 10 + 10 + 5 rows
+
+
+def test_csv_bibtex_and_endnote_exports(client):
+    rows = list(csv.DictReader(io.StringIO(_export(client, "csv").text)))
+    assert len(rows) == 25
+    assert rows[0]["title"] == "Paper, part 0"
+
+    bibtex = _export(client, "bibtex", document_id=2).text
+    assert bibtex.count("@article{") == 8
+    assert "journal={Journal of Tests}" in bibtex
+
+    endnote = _export(client, "endnote", author="Smith", year_from=2005).text
+    records = [r for r in endnote.split("\n\n") if r.strip()]
+    assert len(records) == 6
+    assert all("%A Smith, J." in r for r in records)
+
+
+def test_empty_export_is_well_formed(client):
+    assert json.loads(_export(client, "json", year_from=2100).text) == []
+    assert _export(client, "csv", year_from=2100).text.startswith("id,document_id")
+
+
+def test_gzip_export_when_accepted(client):
+    response = client.post(
+        "/api/citations/export/csv", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.count("\n") == 26  # Decoded by the client
+    chunks = citations.gzip_chunks(["id\n", "", "1\n"])
+    assert gzip.decompress(b"".join(chunks)) == b"id\n1\n"
+
+
+def test_gzip_refused_by_q_value(client):
+    response = client.post(
+        "/api/citations/export/csv", headers={"Accept-Encoding": "gzip;q=0, br"}
+    )
+
+    assert "content-encoding" not in response.headers
+    assert response.text.count("\n") == 26
+    assert citations.accepts_gzip("br;q=1.0, gzip; q=0.5")
+    assert citations.accepts_gzip("*")
+    assert not citations.accepts_gzip("*;q=0")
+    assert not citations.accepts_gzip("gzip;q=0, *")
+    assert not citations.accepts_gzip("identity")
+
+
+def test_invalid_format_and_missing_document(client):
+    assert _export(client, "xml").status_code == status.HTTP_400_BAD_REQUEST
+    assert _export(client, "json", document_id=99).status_code == (
+        status.HTTP_404_NOT_FOUND
+    )
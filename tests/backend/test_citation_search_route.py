@@ -0,0 +1,162 @@
+"""
+Tests for keyset-paginated citation search.
+
+Tests cover:
+- Walking every page with cursors returns each citation exactly once
+- Filters are applied in SQL and combine with the cursor
+- Cursors are rejected when malformed or reused with other filters
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from backend.api.routes import citations
+from src.repositories.citation_repository import CitationRepository
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class SimpleDB:
+    def __init__(self, connection: sqlite3.Connection):
+        self.conn = connection
+
+    def fetch_one(self, query, params=()):
+        return self.conn.execute(query, params).fetchone()
+
+    def fetch_all(self, query, params=()):
+        return self.conn.execute(query, params).fetchall()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> CitationRepository:
+    conn = sqlite3.connect(tmp_path / "citations.db", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE citations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER NOT NULL,
+            raw_text TEXT NOT NULL,
+            authors TEXT,
+            title TEXT,
+            publication_year INTEGER,
+            journal_or_venue TEXT,
+            doi TEXT,
+            page_range TEXT,
+            citation_type TEXT,
+            confidence_score REAL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+    conn.execute(
+        "CREATE INDEX idx_citations_keyset "
+        "ON citations(COALESCE(publication_year, 0), id)"
+    )
+    rows = [
+        (
+            1 + i % 3,
+            f"Raw citation {i}",
+            "Smith, J." if i % 2 else "Doe, A.",
+            f"Paper {i}",
+            None if i % 10 == 0 else 2000 + i % 7,
+            "journal" if i % 4 else "conference",
+            (i % 5) / 4,
+        )
+        for i in range(120)
+    ]
+    conn.executemany(
+        "INSERT INTO citations (document_id, raw_text, authors, title, "
+        "publication_year, citation_type, confidence_score) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    return CitationRepository(SimpleDB(conn))
+
+
+@pytest.fixture
+def client(repo):
+    app = FastAPI()
+    app.include_router(citations.router, prefix="/api/citations")
+    app.dependency_overrides[citations.get_citation_repository] = lambda: repo
+    return TestClient(app)
+
+
+def _walk(client, **params):
+    ids, cursor, pages = [], None, 0
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = client.get("/api/citations/search", params=query)
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        ids.extend(item["id"] for item in body["data"])
+        pages += 1
+        cursor = body["meta"]["next_cursor"]
+        assert body["meta"]["has_next"] is (cursor is not None)
+        if not cursor:
+            return ids, pages
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+
+def test_cursor_walk_returns_every_citation_once(client):
+    ids, pages = _walk(client, limit=25)
+
+    assert sorted(ids) == list(range(1, 121))
+    assert pages == 5
+
+
+def test_results_follow_year_then_id_order(repo):
+    citations, _ = repo.search_page(limit=200)
+    keys = [(c.publication_year or 0, c.id) for c in citations]
+
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_filters_combine_with_cursor(client, repo):
+    ids, _ = _walk(
+        client,
+        limit=7,
+        author="Smith",
+        year_from=2002,
+        year_to=2005,
+        citation_type="journal",
+        document_id=2,
+        min_confidence=0.5,
+    )
+
+    expected = {
+        row["id"]
+        for row in repo.db.fetch_all(
+            "SELECT id FROM citations WHERE authors LIKE '%Smith%' "
+            "AND publication_year BETWEEN 2002 AND 2005 "
+            "AND citation_type = 'journal' AND document_id = 2 "
+            "AND confidence_score >= 0.5"
+        )
+    }
+    assert expected
+    assert sorted(ids) == sorted(expected)
+
+
+def test_invalid_or_mismatched_cursor_is_rejected(client):
+    first = client.get("/api/citations/search", params={"limit": 10}).json()
+    cursor = first["meta"]["next_cursor"]
+
+    mismatched = client.get(
+        "/api/citations/search", params={"limit": 10, "cursor": cursor, "doi": "x"}
+    )
+    garbage = client.get("/api/citations/search", params={"cursor": "not-a-cursor"})
+
+    assert mismatched.status_code == status.HTTP_400_BAD_REQUEST
+    assert garbage.status_code == status.HTTP_400_BAD_REQUEST
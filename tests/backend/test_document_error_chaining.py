@@ -2,6 +2,7 @@ import pytest
 from fastapi import HTTPException, status
 
 from backend.api.routes.documents import get_document, list_documents
+from src.repositories.async_repository import AsyncDocumentRepository
 
 
 class _FailingListRepo:
@@ -11,6 +12,9 @@ class _FailingListRepo:
     def get_all(self, *args, **kwargs):
         raise self._error
 
+    def get_page(self, *args, **kwargs):
+        raise self._error
+
     def count(self):
         return 0
 
@@ -34,7 +38,8 @@ async def test_list_documents_chains_value_error():
             per_page=5,
             sort_by="created_at",
             sort_order="desc",
-            doc_repo=repo,
+            cursor=None,
+            doc_repo=AsyncDocumentRepository(repo),
         )
 
     assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
@@ -46,7 +51,7 @@ async def test_get_document_chains_internal_errors():
     repo = _FailingGetRepo(RuntimeError("db down"))
 
     with pytest.raises(HTTPException) as exc:
-        await get_document(document_id=123, doc_repo=repo)
+        await get_document(document_id=123, doc_repo=AsyncDocumentRepository(repo))
 
     assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert isinstance(exc.value.__cause__, RuntimeError)
@@ -6,6 +6,7 @@ from fastapi import HTTPException
 
 from backend.api.routes import documents
 from src.database.models import DocumentModel
+from src.repositories.async_repository import AsyncDocumentRepository
 from src.services.document_preview_service import (
     PreviewContent,
     PreviewDisabledError,
@@ -25,9 +26,26 @@ class _StubDocRepo:
         ]
         return filtered[offset : offset + limit], len(filtered)
 
+    def search_page(
+        self, query: str, *, after=None, offset: int = 0, limit: int, columns=None
+    ):
+        documents, total = self.search(query, limit + 1, offset)
+        next_key = (documents[limit - 1].title, 0) if len(documents) > limit else None
+        return documents[:limit], next_key
+
+    def count_search(self, query: str) -> int:
+        return self.search(query, 0, 0)[1]
+
     def get_all(self, limit: int, offset: int, sort_by: str, sort_order: str):
         return self._documents[offset : offset + limit]
 
+    def get_page(
+        self, *, sort_by, sort_order, after=None, offset=0, limit, columns=None
+    ):
+        documents = self.get_all(limit + 1, offset, sort_by, sort_order)
+        next_key = (documents[limit - 1].id, 0) if len(documents) > limit else None
+        return documents[:limit], next_key
+
     def count(self) -> int:
         return len(self._documents)
 
@@ -74,7 +92,8 @@ async def test_list_documents_returns_paginated_response():
         per_page=2,
         sort_by="created_at",
         sort_order="desc",
-        doc_repo=repo,
+        cursor=None,
+        doc_repo=AsyncDocumentRepository(repo),
     )
 
     assert response.success is True
@@ -96,7 +115,8 @@ async def test_list_documents_handles_value_error_from_repo():
             per_page=10,
             sort_by="invalid",
             sort_order="asc",
-            doc_repo=repo,
+            cursor=None,
+            doc_repo=AsyncDocumentRepository(repo),
         )
 
     assert exc.value.status_code == 400
@@ -112,7 +132,8 @@ async def test_list_documents_handles_generic_exception():
             per_page=10,
             sort_by="created_at",
             sort_order="desc",
-            doc_repo=repo,
+            cursor=None,
+            doc_repo=AsyncDocumentRepository(repo),
         )
 
     assert exc.value.status_code == 500
@@ -124,7 +145,9 @@ async def test_get_document_envelope_handles_missing_file_path():
     docs[0].file_path = None
     repo = _StubDocRepo(docs)
 
-    response = await documents.get_document(document_id=1, doc_repo=repo)
+    response = await documents.get_document(
+        document_id=1, doc_repo=AsyncDocumentRepository(repo)
+    )
 
     assert response.success is True
     assert response.data.id == 1
@@ -136,7 +159,9 @@ async def test_get_document_returns_404_when_missing():
     repo = _StubDocRepo(_sample_documents())
 
     with pytest.raises(HTTPException) as exc:
-        await documents.get_document(document_id=999, doc_repo=repo)
+        await documents.get_document(
+            document_id=999, doc_repo=AsyncDocumentRepository(repo)
+        )
 
     assert exc.value.status_code == 404
 
@@ -146,7 +171,9 @@ async def test_get_document_raises_500_on_repo_error():
     repo = _FailingDocRepo(RuntimeError("db down"))
 
     with pytest.raises(HTTPException) as exc:
-        await documents.get_document(document_id=1, doc_repo=repo)
+        await documents.get_document(
+            document_id=1, doc_repo=AsyncDocumentRepository(repo)
+        )
 
     assert exc.value.status_code == 500
 
@@ -189,6 +216,25 @@ async def test_preview_endpoint_returns_image_response():
     assert "Cache-Control" in response.headers
 
 
+@pytest.mark.asyncio
+async def test_thumbnail_endpoint_honours_if_none_match():
+    service = _StubPreviewService()
+    service.get_thumbnail = lambda document_id: PreviewContent(
+        b"thumb", "image/webp", 256, 362, 1, True, '"abc"'
+    )
+
+    fresh = await documents.get_document_thumbnail(
+        document_id=1, v="hash", if_none_match=None, preview_service=service
+    )
+    cached = await documents.get_document_thumbnail(
+        document_id=1, v="hash", if_none_match='W/"abc"', preview_service=service
+    )
+
+    assert fresh.status_code == 200 and fresh.headers["ETag"] == '"abc"'
+    assert "immutable" in fresh.headers["Cache-Control"]
+    assert cached.status_code == 304 and cached.body == b""
+
+
 @pytest.mark.asyncio
 async def test_preview_endpoint_handles_disabled_service():
     service = _DisabledPreviewService()
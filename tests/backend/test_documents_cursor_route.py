@@ -0,0 +1,128 @@
+"""
+Tests for cursor pagination on the document list endpoint.
+
+Tests cover:
+- Following next_cursor visits every document once, in sort order
+- Search results paginate with cursors and report cached totals
+- Malformed or mismatched cursors are rejected
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_document_repository
+from backend.api.routes import documents
+from src.repositories.document_repository import DocumentRepository
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class SimpleDB:
+    def __init__(self, connection: sqlite3.Connection):
+        self.conn = connection
+
+    def fetch_one(self, query, params=()):
+        return self.conn.execute(query, params).fetchone()
+
+    def fetch_all(self, query, params=()):
+        return self.conn.execute(query, params).fetchall()
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> TestClient:
+    conn = sqlite3.connect(tmp_path / "documents.db", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE documents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            file_path TEXT,
+            file_hash TEXT UNIQUE NOT NULL,
+            content_hash TEXT,
+            file_size INTEGER NOT NULL,
+            file_type TEXT,
+            page_count INTEGER,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            last_accessed DATETIME,
+            metadata TEXT DEFAULT '{}',
+            tags TEXT
+        )
+        """)
+    conn.executemany(
+        "INSERT INTO documents (title, file_path, file_hash, file_size, created_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            (
+                f"{'Thesis' if i % 4 == 0 else 'Paper'} {i}",
+                str(tmp_path / f"doc{i}.pdf"),
+                f"hash-{i}",
+                100 + i % 5,
+                f"2024-01-{1 + i % 10:02d}T00:00:00",
+            )
+            for i in range(45)
+        ],
+    )
+    conn.commit()
+
+    app = FastAPI()
+    app.include_router(documents.router, prefix="/api/documents")
+    repo = DocumentRepository(SimpleDB(conn))
+    app.dependency_overrides[get_document_repository] = lambda: repo
+    return TestClient(app)
+
+
+def _walk(client, **params):
+    ids, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = client.get("/api/documents", params=query)
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        ids.extend(item["id"] for item in body["data"])
+        cursor = body["meta"]["next_cursor"]
+        assert body["meta"]["has_next"] is (cursor is not None)
+        if not cursor:
+            return ids, body["meta"]
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+
+def test_cursor_walk_lists_every_document_in_order(client):
+    ids, meta = _walk(client, per_page=10, sort_by="file_size", sort_order="asc")
+
+    assert sorted(ids) == list(range(1, 46))
+    assert ids == sorted(ids, key=lambda i: ((i - 1) % 5, i))
+    assert meta["total"] == 45
+    assert meta["has_prev"] is True
+
+
+def test_search_walk_and_total(client):
+    ids, meta = _walk(client, per_page=4, query="thesis")
+
+    assert sorted(ids) == [i for i in range(1, 46) if (i - 1) % 4 == 0]
+    assert meta["total"] == 12
+
+
+def test_invalid_or_mismatched_cursor_is_rejected(client):
+    first = client.get("/api/documents", params={"per_page": 5}).json()
+    cursor = first["meta"]["next_cursor"]
+
+    mismatched = client.get(
+        "/api/documents", params={"cursor": cursor, "sort_by": "title"}
+    )
+    garbage = client.get("/api/documents", params={"cursor": "bm90LWEtY3Vyc29y"})
+
+    assert mismatched.status_code == status.HTTP_400_BAD_REQUEST
+    assert garbage.status_code == status.HTTP_400_BAD_REQUEST
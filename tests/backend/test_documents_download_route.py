@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
 import pytest
-from fastapi import HTTPException
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
 
+from backend.api.dependencies import get_document_repository
 from backend.api.routes import documents
+from backend.api.utils.ranged_file_response import (
+    ZEROCOPY_EXTENSION,
+    RangedFileResponse,
+)
 from src.database.models import DocumentModel
+from src.repositories.async_repository import AsyncDocumentRepository
 
 
 class _SingleDocRepo:
@@ -39,7 +48,7 @@ async def test_download_document_serves_file(tmp_path: Path):
 
     response = await documents.download_document(
         document_id=1,
-        doc_repo=_SingleDocRepo(doc),
+        doc_repo=AsyncDocumentRepository(_SingleDocRepo(doc)),
         documents_dir=docs_dir,
     )
 
@@ -55,7 +64,7 @@ async def test_download_document_404_when_doc_missing(tmp_path: Path):
     with pytest.raises(HTTPException) as exc:
         await documents.download_document(
             document_id=1,
-            doc_repo=_SingleDocRepo(None),
+            doc_repo=AsyncDocumentRepository(_SingleDocRepo(None)),
             documents_dir=docs_dir,
         )
 
@@ -78,7 +87,7 @@ async def test_download_document_404_when_file_path_missing(tmp_path: Path):
     with pytest.raises(HTTPException) as exc:
         await documents.download_document(
             document_id=1,
-            doc_repo=_SingleDocRepo(doc),
+            doc_repo=AsyncDocumentRepository(_SingleDocRepo(doc)),
             documents_dir=docs_dir,
         )
 
@@ -103,7 +112,7 @@ async def test_download_document_404_when_file_absent(tmp_path: Path):
     with pytest.raises(HTTPException) as exc:
         await documents.download_document(
             document_id=1,
-            doc_repo=_SingleDocRepo(doc),
+            doc_repo=AsyncDocumentRepository(_SingleDocRepo(doc)),
             documents_dir=docs_dir,
         )
 
@@ -129,8 +138,156 @@ async def test_download_document_blocks_path_traversal(tmp_path: Path):
     with pytest.raises(HTTPException) as exc:
         await documents.download_document(
             document_id=1,
-            doc_repo=_SingleDocRepo(doc),
+            doc_repo=AsyncDocumentRepository(_SingleDocRepo(doc)),
             documents_dir=docs_dir,
         )
 
     assert exc.value.status_code == 403
+
+
+# ============================================================================
+# Range and conditional requests
+# ============================================================================
+
+PDF_BYTES = bytes(range(256)) * 4096  # 1 MiB, every offset distinguishable
+
+
+@pytest.fixture
+def range_client(tmp_path: Path) -> TestClient:
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    file_path = docs_dir / "large.pdf"
+    file_path.write_bytes(PDF_BYTES)
+    doc = DocumentModel(
+        id=1,
+        title="Large",
+        file_path=str(file_path),
+        file_hash="abc123",
+        file_size=len(PDF_BYTES),
+        file_type=".pdf",
+    )
+    app = FastAPI()
+    app.include_router(documents.router, prefix="/api/documents")
+    app.dependency_overrides[get_document_repository] = lambda: _SingleDocRepo(doc)
+    app.dependency_overrides[documents.get_documents_dir] = lambda: docs_dir
+    return TestClient(app)
+
+
+def test_full_download_has_hash_etag(range_client: TestClient):
+    response = range_client.get("/api/documents/1/download")
+
+    assert response.status_code == 200
+    assert response.content == PDF_BYTES
+    assert response.headers["etag"] == '"abc123"'
+    assert response.headers["accept-ranges"] == "bytes"
+
+    cached = range_client.get(
+        "/api/documents/1/download", headers={"If-None-Match": '"abc123"'}
+    )
+    assert cached.status_code == 304 and cached.content == b""
+
+
+def test_rewritten_file_drops_hash_etag(range_client: TestClient, tmp_path: Path):
+    # Same size, so only the modification time shows the file changed
+    rewritten = PDF_BYTES[::-1]
+    file_path = tmp_path / "docs" / "large.pdf"
+    file_path.write_bytes(rewritten)
+    later = time.time() + 60
+    os.utime(file_path, (later, later))
+
+    response = range_client.get("/api/documents/1/download")
+    stale = range_client.get(
+        "/api/documents/1/download", headers={"If-None-Match": '"abc123"'}
+    )
+    resumed = range_client.get(
+        "/api/documents/1/download",
+        headers={"Range": "bytes=0-99", "If-Range": '"abc123"'},
+    )
+
+    assert response.content == rewritten
+    assert response.headers["etag"] != '"abc123"'
+    assert stale.status_code == 200 and stale.content == rewritten
+    assert resumed.status_code == 200 and resumed.content == rewritten
+
+
+def test_single_range_and_suffix_range(range_client: TestClient):
+    response = range_client.get(
+        "/api/documents/1/download", headers={"Range": "bytes=1000-300000"}
+    )
+    suffix = range_client.get(
+        "/api/documents/1/download", headers={"Range": "bytes=-100"}
+    )
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 1000-300000/{len(PDF_BYTES)}"
+    assert response.content == PDF_BYTES[1000:300001]
+    assert suffix.content == PDF_BYTES[-100:]
+
+
+def test_multiple_ranges_are_multipart(range_client: TestClient):
+    response = range_client.get(
+        "/api/documents/1/download", headers={"Range": "bytes=0-9, 500000-500019"}
+    )
+
+    assert response.status_code == 206
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=")[1]
+    parts = [
+        part.split(b"\r\n\r\n", 1)[1].removesuffix(b"\r\n")
+        for part in response.content.split(f"--{boundary}".encode())[1:-1]
+    ]
+    assert parts == [PDF_BYTES[0:10], PDF_BYTES[500000:500020]]
+    assert int(response.headers["content-length"]) == len(response.content)
+
+
+def test_if_range_mismatch_sends_whole_file(range_client: TestClient):
+    stale = range_client.get(
+        "/api/documents/1/download",
+        headers={"Range": "bytes=0-99", "If-Range": '"old-hash"'},
+    )
+    weak = range_client.get(
+        "/api/documents/1/download",
+        headers={"Range": "bytes=0-99", "If-Range": 'W/"abc123"'},
+    )
+    current = range_client.get(
+        "/api/documents/1/download",
+        headers={"Range": "bytes=0-99", "If-Range": '"abc123"'},
+    )
+
+    assert stale.status_code == 200 and len(stale.content) == len(PDF_BYTES)
+    assert weak.status_code == 200
+    assert current.status_code == 206 and current.content == PDF_BYTES[:100]
+
+
+def test_unsatisfiable_range(range_client: TestClient):
+    response = range_client.get(
+        "/api/documents/1/download", headers={"Range": f"bytes={len(PDF_BYTES)}-"}
+    )
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"*/{len(PDF_BYTES)}"
+
+
+@pytest.mark.asyncio
+async def test_zero_copy_extension_receives_descriptor(tmp_path: Path):
+    file_path = tmp_path / "doc.pdf"
+    file_path.write_bytes(PDF_BYTES)
+    messages = []
+
+    async def send(message):
+        if message["type"] == ZEROCOPY_EXTENSION:
+            message = {**message, "data": os.pread(message["file"], 16, 100)}
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"range", b"bytes=100-115")],
+        "extensions": {ZEROCOPY_EXTENSION: {}},
+    }
+    await RangedFileResponse(file_path, etag='"x"')(scope, None, send)
+
+    assert messages[0]["status"] == 206
+    assert (messages[1]["offset"], messages[1]["count"]) == (100, 16)
+    assert messages[1]["data"] == PDF_BYTES[100:116]
@@ -25,6 +25,7 @@ import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
+from backend.api.dependencies import get_document_repository
 from backend.api.routes import documents
 from src.database.models import DocumentModel
 
@@ -61,8 +62,11 @@ def mock_doc_repo():
     repo = Mock()
     repo.get_by_id = Mock(return_value=None)
     repo.get_all = Mock(return_value=[])
+    repo.get_page = Mock(return_value=([], None))
     repo.count = Mock(return_value=0)
     repo.search = Mock(return_value=([], 0))
+    repo.search_page = Mock(return_value=([], None))
+    repo.count_search = Mock(return_value=0)
     return repo
 
 
@@ -174,7 +178,7 @@ def test_list_documents_page_limit_maximum(client, app, mock_doc_repo):
     mock_doc_repo.get_all.return_value = []
     mock_doc_repo.count.return_value = 0
 
-    app.dependency_overrides[documents.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
 
     # Execute - page=1000 is the maximum allowed
     response = client.get("/api/documents?page=1000&per_page=10")
@@ -200,7 +204,7 @@ def test_list_documents_per_page_minimum(client, app, mock_doc_repo):
     mock_doc_repo.get_all.return_value = []
     mock_doc_repo.count.return_value = 0
 
-    app.dependency_overrides[documents.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
 
     # Execute - per_page=1 is minimum
     response = client.get("/api/documents?page=1&per_page=1")
@@ -235,7 +239,7 @@ def test_list_documents_empty_results(client, app, mock_doc_repo):
     mock_doc_repo.get_all.return_value = []
     mock_doc_repo.count.return_value = 0
 
-    app.dependency_overrides[documents.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
 
     # Execute
     response = client.get("/api/documents?page=1&per_page=20")
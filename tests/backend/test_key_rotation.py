@@ -0,0 +1,149 @@
+import base64
+import json
+import time
+
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
+from sqlalchemy import Column, Integer, MetaData, Table, Text, create_engine, select
+from sqlalchemy.orm import Session
+
+from backend.services.key_rotation import (
+    KeyCache,
+    ReEncryptionJob,
+    rewrap_data_keys,
+)
+
+
+def test_key_cache_is_bounded_lru():
+    cache = KeyCache(max_size=2, ttl_seconds=60)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a") == b"1"
+
+    cache.put("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert len(cache) == 2
+    assert cache.missing(["a", "b", "c", "b"]) == ["b"]
+
+
+def test_key_cache_entries_expire():
+    cache = KeyCache(ttl_seconds=0.05)
+    cache.put_many({"a": b"1", "b": b"2"})
+    assert cache.get("a") == b"1"
+
+    time.sleep(0.1)
+
+    assert cache.get("a") is None
+    assert cache.missing(["b"]) == ["b"]
+    assert cache.get_stats()["hits"] == 1
+
+
+@pytest.fixture
+def key_table():
+    engine = create_engine("sqlite://")
+    table = Table(
+        "encryption_keys",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("encrypted_key", Text, nullable=False),
+    )
+    table.metadata.create_all(engine)
+    return engine, table
+
+
+def test_rewrap_data_keys_in_one_transaction(key_table):
+    engine, table = key_table
+    old_master, new_master = Fernet.generate_key(), Fernet.generate_key()
+    data_keys = [f"key-{i}".encode() for i in range(25)]
+    wrapped = [Fernet(old_master).encrypt(key) for key in data_keys]
+    with Session(engine) as session:
+        session.execute(
+            table.insert(),
+            [{"encrypted_key": base64.b64encode(token).decode()} for token in wrapped],
+        )
+        session.commit()
+
+        assert rewrap_data_keys(session, table, old_master, new_master, 10) == 25
+        session.rollback()
+        stored = session.execute(select(table.c.encrypted_key)).scalars().all()
+        assert stored == [base64.b64encode(token).decode() for token in wrapped]
+
+        rewrap_data_keys(session, table, old_master, new_master, 10)
+        session.commit()
+
+    with Session(engine) as session:
+        rewrapped = (
+            session.execute(select(table.c.encrypted_key).order_by(table.c.id))
+            .scalars()
+            .all()
+        )
+    unwrapped = [Fernet(new_master).decrypt(base64.b64decode(v)) for v in rewrapped]
+    assert unwrapped == data_keys
+    with pytest.raises(InvalidToken):
+        Fernet(old_master).decrypt(base64.b64decode(rewrapped[0]))
+
+
+def _list_job(items, processed, checkpoint_path, **kwargs):
+    def fetch_batch(cursor, limit):
+        start = 0 if cursor is None else cursor + 1
+        return [(i, items[i]) for i in range(start, min(start + limit, len(items)))]
+
+    return ReEncryptionJob(fetch_batch, processed.extend, checkpoint_path, **kwargs)
+
+
+def test_reencryption_job_checkpoints_and_resumes(tmp_path):
+    items = list(range(10))
+    processed = []
+    checkpoint = tmp_path / "job.json"
+    job = _list_job(items, processed, checkpoint, batch_size=3)
+
+    def stop_after_first_batch(batch):
+        processed.extend(batch)
+        job.stop()
+
+    job.process_batch = stop_after_first_batch
+    state = job.run()
+    assert state["cursor"] == 2 and not state["completed"]
+    assert json.loads(checkpoint.read_text())["processed"] == 3
+
+    resumed = _list_job(items, processed, checkpoint, batch_size=3)
+    state = resumed.run()
+
+    assert processed == items
+    assert state["completed"] and state["processed"] == 10
+    assert resumed.run()["processed"] == 10
+
+
+def test_reencryption_checkpoint_is_keyed_by_target(tmp_path):
+    items = list(range(4))
+    checkpoint = tmp_path / "job.json"
+    first = []
+    assert _list_job(items, first, checkpoint, target="rotation-1").run()["completed"]
+
+    # A later rotation must not reuse the completed checkpoint
+    second = []
+    state = _list_job(items, second, checkpoint, target="rotation-2").run()
+
+    assert first == second == items
+    assert state["completed"] and state["processed"] == 4
+    assert json.loads(checkpoint.read_text())["target"] == "rotation-2"
+
+
+def test_reencryption_job_is_throttled(tmp_path):
+    processed = []
+    job = _list_job(
+        list(range(6)),
+        processed,
+        tmp_path / "job.json",
+        batch_size=2,
+        max_items_per_second=20,
+    )
+
+    start = time.monotonic()
+    thread = job.start()
+    thread.join(timeout=5)
+
+    assert processed == list(range(6))
+    assert time.monotonic() - start >= 0.25
@@ -0,0 +1,79 @@
+import base64
+
+import pytest
+from cryptography.fernet import Fernet
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# The service imports backend.services.secrets_manager, absent from some builds
+encryption_service = pytest.importorskip("backend.services.encryption_service")
+
+
+class _Secrets:
+    def __init__(self):
+        self.values = {}
+
+    def get_secret(self, key, version=None):
+        return self.values.get(key)
+
+    def set_secret(self, key, value, *args, **kwargs):
+        self.values[key] = value
+        return True
+
+    def delete_secret(self, key):
+        return self.values.pop(key, None) is not None
+
+
+@pytest.fixture
+def service():
+    engine = create_engine("sqlite://")
+    encryption_service.Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield encryption_service.EncryptionService(session, secrets_manager=_Secrets())
+
+
+def _store_data_key(service, key_id, data_key):
+    wrapped = Fernet(service._master_key).encrypt(data_key)
+    service.db.add(
+        encryption_service.EncryptionKey(
+            key_id=key_id,
+            key_type="field",
+            algorithm="AES-256-GCM",
+            encrypted_key=base64.b64encode(wrapped).decode(),
+        )
+    )
+    service.db.commit()
+
+
+def test_rotation_drops_previous_master_key_after_commit(service):
+    _store_data_key(service, "field-1", b"data-key")
+    old_master = service._master_key
+
+    assert service.rotate_master_key()["rewrapped"] == 1
+
+    secrets = service.secrets_manager.values
+    assert "encryption/master_key_previous" not in secrets
+    assert service._previous_master_key is None
+    new_master = base64.b64decode(secrets["encryption/master_key"])
+    assert new_master == service._master_key != old_master
+    stored = service.db.query(encryption_service.EncryptionKey).one()
+    assert Fernet(new_master).decrypt(base64.b64decode(stored.encrypted_key)) == (
+        b"data-key"
+    )
+
+
+def test_failed_rotation_restores_master_keys(service, monkeypatch):
+    _store_data_key(service, "field-1", b"data-key")
+    old_master = service._master_key
+
+    def fail_commit():
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(service.db, "commit", fail_commit)
+    with pytest.raises(RuntimeError):
+        service.rotate_master_key()
+
+    secrets = service.secrets_manager.values
+    assert base64.b64decode(secrets["encryption/master_key"]) == old_master
+    assert "encryption/master_key_previous" not in secrets
+    assert service._master_key == old_master
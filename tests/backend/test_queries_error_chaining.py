@@ -2,6 +2,7 @@ import pytest
 from fastapi import HTTPException, status
 
 from backend.api.routes import queries as queries_module
+from src.repositories.async_repository import AsyncDocumentRepository
 
 
 @pytest.fixture(autouse=True)
@@ -33,7 +34,7 @@ async def test_query_document_chains_exception():
         await queries_module.query_document(
             document_id=1,
             request=queries_module.QueryRequest(query="hello", mode="semantic"),
-            doc_repo=repo,
+            doc_repo=AsyncDocumentRepository(repo),
         )
 
     assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -49,7 +50,7 @@ async def test_query_multiple_documents_chains_exception():
             request=queries_module.MultiDocumentQueryRequest(
                 query="hello", document_ids=[1], synthesis_mode="summarize"
             ),
-            doc_repo=repo,
+            doc_repo=AsyncDocumentRepository(repo),
         )
 
     assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
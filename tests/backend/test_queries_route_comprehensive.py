@@ -3,6 +3,7 @@ Comprehensive tests for Queries API Routes.
 
 Tests cover:
 - Single document query execution (success, cache hits, errors)
+- Streaming single document queries as Server-Sent Events
 - Multi-document query execution
 - Cache management (clear, stats)
 - Error handling (404, 500, 501)
@@ -14,12 +15,14 @@ Target Coverage: backend/api/routes/queries.py (15% → 75%)
 
 from __future__ import annotations
 
+import json
 from unittest.mock import Mock
 
 import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
+from backend.api.dependencies import get_document_repository
 from backend.api.routes import queries
 from src.database.models import DocumentModel
 
@@ -96,7 +99,7 @@ def test_query_document_success(
     mock_doc_repo.get_by_id.return_value = sample_document
 
     # Override dependencies
-    app.dependency_overrides[queries.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
     app.dependency_overrides[queries.get_rag_cache_manager] = lambda: mock_cache_manager
 
     # Execute
@@ -126,7 +129,7 @@ def test_query_document_cache_hit(
     mock_doc_repo.get_by_id.return_value = sample_document
     mock_cache_manager.get_cached_query.return_value = "Cached response text"
 
-    app.dependency_overrides[queries.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
     app.dependency_overrides[queries.get_rag_cache_manager] = lambda: mock_cache_manager
 
     # Execute
@@ -152,7 +155,7 @@ def test_query_document_not_found(client, app, mock_doc_repo, mock_cache_manager
     # Setup mocks
     mock_doc_repo.get_by_id.return_value = None
 
-    app.dependency_overrides[queries.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
     app.dependency_overrides[queries.get_rag_cache_manager] = lambda: mock_cache_manager
 
     # Execute
@@ -206,6 +209,75 @@ def test_query_document_rag_disabled(client, app, monkeypatch):
     assert "not available" in response.json()["detail"]
 
 
+# ============================================================================
+# Streaming Query Tests
+# ============================================================================
+
+
+def _sse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line[6:])))
+    return events
+
+
+def test_query_document_streams_tokens_as_sse(
+    client, app, mock_doc_repo, mock_cache_manager, sample_document
+):
+    """Test streaming query sends token events, then done, and caches."""
+    mock_doc_repo.get_by_id.return_value = sample_document
+    rag_service = Mock()
+    rag_service.stream_query_document.return_value = iter(["The", " answer", "."])
+
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[queries.get_rag_cache_manager] = lambda: mock_cache_manager
+    app.dependency_overrides[queries.require_rag_service] = lambda: rag_service
+
+    response = client.post(
+        "/api/queries/document/1", json={"query": "What?", "streaming": True}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    events = _sse_events(response.text)
+    assert events[:3] == [
+        ("token", {"text": "The"}),
+        ("token", {"text": " answer"}),
+        ("token", {"text": "."}),
+    ]
+    assert events[3][0] == "done"
+    assert events[3][1]["response"] == "The answer."
+    assert events[3][1]["cached"] is False
+    rag_service.stream_query_document.assert_called_once_with(
+        query="What?", document_id=1
+    )
+    mock_cache_manager.cache_query_result.assert_called_once()
+
+
+def test_query_document_streaming_index_missing(
+    client, app, mock_doc_repo, mock_cache_manager, sample_document
+):
+    """Test failures before the first token still map to HTTP status codes."""
+    from src.services.enhanced_rag_service import VectorIndexNotFoundError
+
+    mock_doc_repo.get_by_id.return_value = sample_document
+    rag_service = Mock()
+    rag_service.stream_query_document.side_effect = VectorIndexNotFoundError("none")
+
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[queries.get_rag_cache_manager] = lambda: mock_cache_manager
+    app.dependency_overrides[queries.require_rag_service] = lambda: rag_service
+
+    response = client.post(
+        "/api/queries/document/1", json={"query": "What?", "streaming": True}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    mock_cache_manager.cache_query_result.assert_not_called()
+
+
 # ============================================================================
 # Multi-Document Query Tests
 # ============================================================================
@@ -225,7 +297,7 @@ def test_multi_document_query_success(client, app, mock_doc_repo, sample_documen
     )
     mock_doc_repo.get_by_ids.return_value = [doc1, doc2]
 
-    app.dependency_overrides[queries.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
 
     # Execute
     response = client.post(
@@ -254,7 +326,7 @@ def test_multi_document_query_missing_documents(
     # Setup: Only return one document when two requested
     mock_doc_repo.get_by_ids.return_value = [sample_document]
 
-    app.dependency_overrides[queries.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
 
     # Execute
     response = client.post(
@@ -327,7 +399,7 @@ def test_query_response_hateoas_links(
     """Test HATEOAS links in query response."""
     mock_doc_repo.get_by_id.return_value = sample_document
 
-    app.dependency_overrides[queries.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
     app.dependency_overrides[queries.get_rag_cache_manager] = lambda: mock_cache_manager
 
     response = client.post("/api/queries/document/1", json={"query": "test"})
@@ -347,7 +419,7 @@ def test_query_response_processing_time(
     """Test processing time is included in response."""
     mock_doc_repo.get_by_id.return_value = sample_document
 
-    app.dependency_overrides[queries.get_document_repository] = lambda: mock_doc_repo
+    app.dependency_overrides[get_document_repository] = lambda: mock_doc_repo
     app.dependency_overrides[queries.get_rag_cache_manager] = lambda: mock_cache_manager
 
     response = client.post("/api/queries/document/1", json={"query": "test"})
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from backend.api.models.requests import IndexBuildRequest, QueryRequest
 from backend.api.routes import indexes, queries
 from src.database.models import DocumentModel
+from src.repositories.async_repository import AsyncDocumentRepository
 
 
 class _StubDocRepo:
@@ -55,7 +56,7 @@ async def test_query_document_returns_501_when_flag_disabled(monkeypatch):
         await queries.query_document(
             document_id=1,
             request=request,
-            doc_repo=_StubDocRepo(None),
+            doc_repo=AsyncDocumentRepository(_StubDocRepo(None)),
             cache_manager=_StubCacheManager(),
         )
 
@@ -76,7 +77,7 @@ async def test_query_document_succeeds_when_flag_enabled(monkeypatch, tmp_path):
     response = await queries.query_document(
         document_id=1,
         request=request,
-        doc_repo=_StubDocRepo(document),
+        doc_repo=AsyncDocumentRepository(_StubDocRepo(document)),
         cache_manager=_StubCacheManager(),
     )
 
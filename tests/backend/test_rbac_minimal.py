@@ -51,3 +51,74 @@ def test_require_role_decorator_allows_admin():
     finally:
         loop.close()
     assert result == "ok"
+
+
+class _StubPermission(types.SimpleNamespace):
+    pass
+
+
+def _role(id, name, perms, parent=None):
+    return types.SimpleNamespace(
+        id=id,
+        name=name,
+        permissions=[
+            _StubPermission(resource=p.split(":")[0], action=p.split(":")[1])
+            for p in perms
+        ],
+        parent_role=parent,
+    )
+
+
+def _fresh_service(monkeypatch):
+    model = rbac.CompiledPermissionModel()
+    monkeypatch.setattr(rbac, "_permission_model", model)
+    return rbac.RBACService(_StubSession()), model
+
+
+def test_inherited_and_wildcard_permissions(monkeypatch):
+    service, model = _fresh_service(monkeypatch)
+    base = _role(10, "reader", ["document:read"])
+    editor = _role(11, "editor", ["library:*"], parent=base)
+    model.compile_roles([base, editor])
+
+    user = _StubUser(id=7, roles=[editor], permissions=[])
+    assert service.check_permission(user, "document", "read").allowed
+    assert service.check_permission(user, "library", "update").allowed
+    assert not service.check_permission(user, "document", "delete").allowed
+    assert service.check_permission(user, "document", "read").cached
+    assert set(service.get_user_permissions(user)) == {"document:read", "library:*"}
+
+
+def test_enum_resource_and_action_match_stored_names(monkeypatch):
+    service, model = _fresh_service(monkeypatch)
+    user = _StubUser(id=3, roles=[_role(1, "ops", ["user:update"])], permissions=[])
+
+    assert service.check_permission(
+        user, rbac.ResourceTypes.USER, rbac.Actions.UPDATE
+    ).allowed
+
+
+def test_role_change_invalidates_user_masks(monkeypatch):
+    service, model = _fresh_service(monkeypatch)
+    role = _role(20, "viewer", [])
+    user = _StubUser(id=8, roles=[role], permissions=[])
+    assert not service.check_permission(user, "rag", "execute").allowed
+
+    role.permissions.append(_StubPermission(resource="rag", action="execute"))
+    model.invalidate()
+    result = service.check_permission(user, "rag", "execute")
+    assert result.allowed and not result.cached
+
+    # Changing a user's role set is picked up without explicit invalidation
+    user.roles = []
+    assert not service.check_permission(user, "rag", "execute").allowed
+
+
+def test_cyclic_role_hierarchy_terminates(monkeypatch):
+    _, model = _fresh_service(monkeypatch)
+    first = _role(30, "a", ["document:read"])
+    second = _role(31, "b", ["document:update"], parent=first)
+    first.parent_role = second
+
+    mask = model.role_mask(second)
+    assert model.permission_names(mask) == {"document:read", "document:update"}
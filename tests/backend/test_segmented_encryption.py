@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from backend.services.segmented_encryption import (
+    SEGMENTS_PER_TASK,
+    SegmentAuthenticationError,
+    SegmentedFileCipher,
+    SegmentHeader,
+    is_segmented_file,
+)
+
+SEGMENT_SIZE = 1024
+
+
+@pytest.fixture
+def cipher() -> SegmentedFileCipher:
+    return SegmentedFileCipher(os.urandom(32), max_workers=4)
+
+
+def _encrypt(cipher, tmp_path: Path, size: int) -> tuple[bytes, Path]:
+    plaintext = os.urandom(size)
+    source = tmp_path / "plain.bin"
+    source.write_bytes(plaintext)
+    target = tmp_path / "plain.bin.enc"
+    cipher.encrypt_file(source, target, "key-1", segment_size=SEGMENT_SIZE)
+    return plaintext, target
+
+
+@pytest.mark.parametrize(
+    "size", [0, 1, SEGMENT_SIZE, SEGMENT_SIZE * SEGMENTS_PER_TASK * 3 + 17]
+)
+def test_round_trip(cipher, tmp_path, size):
+    plaintext, encrypted = _encrypt(cipher, tmp_path, size)
+
+    header = SegmentHeader.read_from(encrypted)
+    assert is_segmented_file(encrypted)
+    assert header.key_id == "key-1"
+    assert encrypted.stat().st_size == header.encrypted_size
+
+    output = tmp_path / "out.bin"
+    cipher.decrypt_file(encrypted, output)
+    assert output.read_bytes() == plaintext
+
+
+def test_range_reads_match_plaintext(cipher, tmp_path):
+    plaintext, encrypted = _encrypt(cipher, tmp_path, SEGMENT_SIZE * 200 + 5)
+
+    for offset, length in [
+        (0, 10),
+        (SEGMENT_SIZE - 3, 6),
+        (5000, SEGMENT_SIZE * 150),
+        (len(plaintext) - 4, 100),
+        (len(plaintext) + 10, 5),
+    ]:
+        expected = plaintext[offset : offset + length]
+        assert cipher.read_range(encrypted, offset, length) == expected
+        assert b"".join(cipher.iter_range(encrypted, offset, length)) == expected
+
+
+def test_tampered_segment_fails_and_removes_output(cipher, tmp_path):
+    plaintext, encrypted = _encrypt(cipher, tmp_path, SEGMENT_SIZE * 10)
+    header = SegmentHeader.read_from(encrypted)
+    with open(encrypted, "r+b") as f:
+        f.seek(header.segment_offset(3) + 10)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 1]))
+
+    output = tmp_path / "out.bin"
+    with pytest.raises(SegmentAuthenticationError, match="Segment 3"):
+        cipher.decrypt_file(encrypted, output)
+    assert not output.exists()
+
+    # Untouched segments remain readable
+    assert cipher.read_range(encrypted, 0, SEGMENT_SIZE) == plaintext[:SEGMENT_SIZE]
+    with pytest.raises(SegmentAuthenticationError):
+        cipher.read_range(encrypted, SEGMENT_SIZE * 3, 1)
+
+
+def test_truncation_and_wrong_key_are_detected(cipher, tmp_path):
+    _, encrypted = _encrypt(cipher, tmp_path, SEGMENT_SIZE * 4)
+
+    with pytest.raises(SegmentAuthenticationError):
+        SegmentedFileCipher(os.urandom(32)).read_range(encrypted, 0, 10)
+
+    header = SegmentHeader.read_from(encrypted)
+    with open(encrypted, "r+b") as f:
+        f.truncate(header.segment_offset(3))
+    with pytest.raises(SegmentAuthenticationError, match="truncated"):
+        cipher.read_range(encrypted, 0, 10)
@@ -0,0 +1,171 @@
+"""
+Tests for WebSocketManager outbound queues.
+
+Tests cover:
+- A stalled client does not delay delivery to the rest of a room
+- Broadcasts are serialized once and share the same payload
+- Progress updates for a task coalesce under the default policy
+- DROP_OLDEST and DISCONNECT overflow policies
+- Room membership is cleaned up on disconnect
+- A send that exceeds the timeout disconnects the client
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from backend.api.websocket_manager import (
+    OverflowPolicy,
+    RAGProgressType,
+    SendQueueConfig,
+    WebSocketManager,
+)
+
+
+class _FakeWebSocket:
+    """Records sent text; a stalled socket blocks until released."""
+
+    def __init__(self, stalled: bool = False):
+        self.sent: list[str] = []
+        self.closed_with: int | None = None
+        self._release = asyncio.Event()
+        if not stalled:
+            self._release.set()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        await self._release.wait()
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+    def release(self) -> None:
+        self._release.set()
+
+    def messages(self) -> list[dict]:
+        return [json.loads(text) for text in self.sent]
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _connect(manager, client_id, stalled=False) -> _FakeWebSocket:
+    websocket = _FakeWebSocket(stalled)
+    await manager.connect(websocket, client_id)
+    return websocket
+
+
+@pytest.mark.asyncio
+async def test_stalled_client_does_not_block_room():
+    manager = WebSocketManager()
+    stalled = await _connect(manager, "slow", stalled=True)
+    fast = await _connect(manager, "fast")
+    for client_id in ("slow", "fast"):
+        await manager.join_room(client_id, "upload_1")
+
+    await manager.send_json_to_room({"type": "note", "n": 1}, "upload_1")
+    await manager.broadcast_json({"type": "document_update", "document_id": 3})
+    await _settle()
+
+    assert [m["type"] for m in fast.messages()] == [
+        "connected",
+        "note",
+        "document_update",
+    ]
+    assert stalled.sent == []
+
+    stalled.release()
+    await _settle()
+    assert stalled.sent[1:] == fast.sent[1:]
+    assert stalled.sent[2] is fast.sent[2]  # Serialized once
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_progress_updates_coalesce_per_task():
+    manager = WebSocketManager()
+    websocket = await _connect(manager, "c", stalled=True)
+
+    for percentage in (10.0, 20.0, 30.0):
+        await manager.send_rag_progress_update(
+            "c", "task-a", RAGProgressType.QUERYING, percentage, "working"
+        )
+    await manager.send_rag_progress_update(
+        "c", "task-b", RAGProgressType.QUERYING, 50.0, "working"
+    )
+    await manager.send_rag_response_chunk("c", "task-a", "text", 0)
+
+    websocket.release()
+    await _settle()
+
+    progress = [
+        (m["task_id"], m["percentage"])
+        for m in websocket.messages()
+        if m["type"] == "rag_progress_update"
+    ]
+    assert progress == [("task-a", 30.0), ("task-b", 50.0)]
+    assert websocket.messages()[-1]["type"] == "rag_response_chunk"
+    assert manager.get_stats()["send_queues"]["coalesced_messages"] == 2
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy_keeps_newest_messages():
+    manager = WebSocketManager(
+        SendQueueConfig(max_queue_size=3, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    )
+    websocket = await _connect(manager, "c", stalled=True)
+    await _settle()  # Writer picks up the welcome message and blocks on it
+
+    for n in range(6):
+        await manager.send_personal_json({"type": "note", "n": n}, "c")
+    websocket.release()
+    await _settle()
+
+    assert [m.get("n") for m in websocket.messages()] == [None, 3, 4, 5]
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_closes_slow_client_and_leaves_rooms():
+    manager = WebSocketManager(
+        SendQueueConfig(max_queue_size=2, overflow_policy=OverflowPolicy.DISCONNECT)
+    )
+    slow = await _connect(manager, "slow", stalled=True)
+    fast = await _connect(manager, "fast")
+    await manager.join_room("slow", "room")
+    await manager.join_room("fast", "room")
+    await _settle()
+
+    for n in range(3):
+        await manager.send_json_to_room({"type": "note", "n": n}, "room")
+        await _settle()  # The fast client drains between messages
+
+    assert "slow" not in manager.active_connections
+    assert slow.closed_with == 1013
+    assert manager.get_room_members("room") == ["fast"]
+    assert [m.get("n") for m in fast.messages()] == [None, 0, 1, 2]
+    assert manager.get_stats()["send_queues"]["overflow_disconnects"] == 1
+
+    manager.disconnect("fast")
+    assert manager.rooms == {}
+    await manager.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_disconnects_stuck_client():
+    manager = WebSocketManager(SendQueueConfig(send_timeout_seconds=0.05))
+    await _connect(manager, "stuck", stalled=True)
+
+    await asyncio.sleep(0.2)
+
+    assert "stuck" not in manager.active_connections
+    await manager.cleanup()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.database.connection import (
+    DatabaseConnection,
+    DatabaseConnectionError,
+    statement_keyword,
+)
+
+pytestmark = pytest.mark.database
+
+
+@pytest.fixture
+def db(tmp_path: Path):
+    connection = DatabaseConnection(str(tmp_path / "split.db"), reader_pool_size=4)
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield connection
+    connection.close_all_connections()
+
+
+def _count(db: DatabaseConnection) -> int:
+    return db.fetch_one("SELECT COUNT(*) AS n FROM items")["n"]
+
+
+def test_statement_keyword_skips_comments() -> None:
+    assert statement_keyword("  -- note\n/* x */ SELECT 1") == "select"
+    assert statement_keyword("WITH t AS (SELECT 1) SELECT * FROM t") == "with"
+    assert statement_keyword("insert into items values (1)") == "insert"
+    assert statement_keyword("") == ""
+
+
+def test_memory_database_keeps_single_pool() -> None:
+    db = DatabaseConnection(":memory:")
+    try:
+        assert not db.split_enabled
+        db.execute("CREATE TABLE t (v INTEGER)")
+        db.execute("INSERT INTO t VALUES (1)")
+        assert db.fetch_one("SELECT v FROM t")["v"] == 1
+    finally:
+        db.close_all_connections()
+
+
+def test_writes_go_through_writer_and_reads_through_pool(db) -> None:
+    cursor = db.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+
+    assert cursor.lastrowid == 1
+    assert db.get_last_insert_id() == 1
+    assert db.get_last_change_count() == 1
+    assert _count(db) == 1
+
+    stats = db.get_pool_stats()
+    assert stats["writer"]["statements"] == 2  # CREATE TABLE + INSERT
+    assert stats["read_pool"]["acquired"] >= 1
+
+
+def test_reader_connections_are_query_only(db) -> None:
+    with db._read_pool.connection() as conn:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO items (name) VALUES ('x')")
+
+
+def test_transaction_pins_thread_to_writer(db) -> None:
+    with db.transaction():
+        db.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+        # Uncommitted rows are visible inside the transaction only
+        assert _count(db) == 1
+        assert db.get_last_insert_id() == 1
+
+    with pytest.raises(Exception, match="boom"):
+        with db.transaction():
+            db.execute("INSERT INTO items (name) VALUES (?)", ("b",))
+            raise ValueError("boom")
+
+    assert _count(db) == 1
+
+
+def test_failing_statement_does_not_fail_its_group(db) -> None:
+    errors: list[BaseException] = []
+    barrier = threading.Barrier(16)
+
+    def write(i: int) -> None:
+        barrier.wait()
+        table = "missing" if i == 0 else "items"
+        try:
+            db.execute(f"INSERT INTO {table} (name) VALUES (?)", (str(i),))  # noqa: S608
+        except DatabaseConnectionError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 1
+    assert _count(db) == 15
+
+
+def test_execute_many_runs_atomically(db) -> None:
+    db.execute("CREATE UNIQUE INDEX idx_items_name ON items(name)")
+
+    with pytest.raises(DatabaseConnectionError):
+        db.execute_many("INSERT INTO items (name) VALUES (?)", [("a",), ("b",), ("a",)])
+    assert _count(db) == 0
+
+    db.execute_many("INSERT INTO items (name) VALUES (?)", [("a",), ("b",)])
+    assert _count(db) == 2
+
+
+def test_temp_tables_stay_on_thread_connection(db) -> None:
+    db.execute("CREATE TEMP TABLE scratch (v INTEGER)")
+    db.execute("INSERT INTO scratch VALUES (1)")
+
+    assert db.fetch_one("SELECT v FROM scratch")["v"] == 1
+    assert db._pinned_to_thread_connection()
+
+
+def test_dropping_last_temp_table_unpins_thread(db) -> None:
+    db.execute("CREATE TEMP TABLE scratch (v INTEGER)")
+    db.execute("CREATE TEMPORARY TABLE other (v INTEGER)")
+    db.execute("DROP TABLE temp.scratch")
+    assert db._pinned_to_thread_connection()
+
+    db.execute("DROP TABLE other")
+    assert not db._pinned_to_thread_connection()
+
+    db.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+    assert db.get_pool_stats()["writer"]["statements"] == 2  # CREATE + INSERT
+
+
+def test_close_all_connections_restarts_split(db) -> None:
+    db.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+    db.close_all_connections()
+
+    db.execute("INSERT INTO items (name) VALUES (?)", ("b",))
+    assert _count(db) == 2
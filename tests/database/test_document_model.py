@@ -42,12 +42,12 @@ def test_document_model_from_file_missing(tmp_path: Path) -> None:
         DocumentModel.from_file(str(tmp_path / "missing.pdf"), file_hash="hash")
 
 
-def test_document_model_from_database_row_parses_timestamps() -> None:
+def test_document_model_from_database_row_parses_timestamps(tmp_path: Path) -> None:
     now = datetime.utcnow()
     row = {
         "id": 1,
         "title": "FromDB",
-        "file_path": "/tmp/doc.pdf",
+        "file_path": str(tmp_path / "doc.pdf"),
         "file_hash": "hash789",
         "file_size": 10,
         "file_type": ".pdf",
@@ -79,6 +79,35 @@ def test_document_model_to_database_dict_serializes_metadata(tmp_path: Path) ->
     assert isinstance(payload["created_at"], str)
 
 
+def test_document_model_metadata_decoded_lazily() -> None:
+    text = json.dumps({"key": "value"})
+    model = DocumentModel.from_database_row(
+        {
+            "id": 1,
+            "title": "Lazy",
+            "file_path": None,
+            "file_hash": "hash",
+            "file_size": 1,
+            "metadata": text,
+        }
+    )
+    # Round-trips the column text without decoding it
+    assert model.to_database_dict()["metadata"] is text
+    assert model.metadata == {"key": "value"}
+    model.metadata["other"] = 1
+    assert json.loads(model.to_database_dict()["metadata"]) == {
+        "key": "value",
+        "other": 1,
+    }
+
+
+def test_document_model_metadata_missing_from_projection() -> None:
+    model = DocumentModel.from_database_row(
+        {"id": 1, "title": "Summary", "file_hash": "hash", "file_size": 1}
+    )
+    assert model.metadata == {}
+
+
 def test_document_model_update_access_and_display(tmp_path: Path) -> None:
     model = DocumentModel(
         title="",
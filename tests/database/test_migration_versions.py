@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+
+from src.database import migrations
+from src.database.connection import DatabaseConnection
+from src.database.modular_migrator import ModularDatabaseMigrator
+
+VERSIONS_DIR = Path(migrations.__file__).parent / "versions"
+
+
+def _latest_migration_file() -> int:
+    return max(
+        int(match.group(1))
+        for path in VERSIONS_DIR.glob("*.py")
+        if (match := re.match(r"(\d{3})_", path.name))
+    )
+
+
+def test_current_version_covers_every_migration_file():
+    latest = _latest_migration_file()
+    assert latest == migrations.CURRENT_VERSION
+    assert ModularDatabaseMigrator.CURRENT_VERSION == migrations.CURRENT_VERSION
+
+
+@pytest.fixture
+def connection(tmp_path: Path):
+    connection = DatabaseConnection(str(tmp_path / "fresh.db"))
+    yield connection
+    connection.close_all_connections()
+
+
+def test_startup_migration_creates_keyset_and_natural_key_indexes(connection):
+    migrator = ModularDatabaseMigrator(connection)
+
+    assert migrator.create_tables_if_not_exist()
+
+    indexes = {
+        row["name"]
+        for row in connection.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+    }
+    assert migrator.get_current_version() == migrations.CURRENT_VERSION
+    assert {
+        "idx_citations_keyset",
+        "idx_citations_document_keyset",
+        "idx_citations_type_keyset",
+        "idx_citations_natural_key",
+        "idx_citation_relations_natural_key",
+    } <= indexes
@@ -0,0 +1,151 @@
+"""
+Tests for the async repository layer and the database executor.
+
+Tests cover:
+- Repository calls run on database threads, never on the event loop
+- The loop keeps serving other work while a slow query runs
+- Async transactions commit, roll back and see their own writes
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.database.connection import DatabaseConnection, TransactionError
+from src.database.executor import DatabaseExecutor
+from src.repositories.async_repository import (
+    AsyncBaseRepository,
+    AsyncDocumentRepository,
+)
+from src.repositories.base_repository import BaseRepository
+
+pytestmark = pytest.mark.repositories
+
+
+class NoteRepository(BaseRepository[dict[str, Any]]):
+    def get_table_name(self) -> str:
+        return "notes"
+
+    def to_model(self, row: dict[str, Any]) -> dict[str, Any]:
+        return row
+
+    def to_database_dict(self, model: dict[str, Any]) -> dict[str, Any]:
+        return dict(model)
+
+
+class SlowDocumentRepository:
+    def __init__(self) -> None:
+        self.threads: list[str] = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def get_by_id(self, entity_id: int) -> None:
+        self.threads.append(threading.current_thread().name)
+        self.entered.set()
+        # Blocks until the test lets it finish, like a long-running query
+        self.release.wait(timeout=5)
+        return None
+
+    def count(self) -> int:
+        self.threads.append(threading.current_thread().name)
+        return 0
+
+
+@pytest.fixture
+def executor():
+    executor = DatabaseExecutor(max_workers=4)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def notes(tmp_path: Path, executor: DatabaseExecutor):
+    db = DatabaseConnection(str(tmp_path / "notes.db"), reader_pool_size=2)
+    db.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)")
+    yield AsyncBaseRepository(NoteRepository(db), executor)
+    db.close_all_connections()
+
+
+@pytest.mark.asyncio
+async def test_calls_run_on_database_threads(executor):
+    repo = SlowDocumentRepository()
+    async_repo = AsyncDocumentRepository(repo, executor)
+
+    assert await async_repo.count() == 0
+    assert repo.threads[0].startswith("db")
+    assert repo.threads[0] != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_slow_query_does_not_block_the_loop(executor):
+    repo = SlowDocumentRepository()
+    async_repo = AsyncDocumentRepository(repo, executor)
+    slow = asyncio.create_task(async_repo.get_by_id(1))
+    assert await asyncio.to_thread(repo.entered.wait, 5)
+
+    # With the query blocked on its thread, the loop still runs callbacks
+    loop = asyncio.get_running_loop()
+    served = loop.create_future()
+    loop.call_soon(served.set_result, True)
+    try:
+        assert await asyncio.wait_for(served, timeout=5)
+        assert not slow.done()
+    finally:
+        repo.release.set()
+    assert await slow is None
+
+
+@pytest.mark.asyncio
+async def test_crud_round_trip(notes):
+    created = await notes.create({"body": "first"})
+
+    assert await notes.find_by_id(created["id"]) == created
+    assert await notes.count() == 1
+    assert await notes.exists(created["id"])
+    assert await notes.delete(created["id"])
+    assert await notes.find_all() == []
+
+
+@pytest.mark.asyncio
+async def test_transaction_commits_and_sees_its_own_writes(notes):
+    async with notes.transaction():
+        created = await notes.create({"body": "inside"})
+        assert await notes.count() == 1
+        async with notes.transaction("nested"):
+            await notes.update({"id": created["id"], "body": "edited"})
+
+    assert (await notes.find_by_id(created["id"]))["body"] == "edited"
+
+
+@pytest.mark.asyncio
+async def test_transaction_rolls_back_on_error(notes):
+    with pytest.raises(TransactionError):
+        async with notes.transaction():
+            await notes.create({"body": "discarded"})
+            raise ValueError("abort")
+
+    assert await notes.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_other_tasks_do_not_join_a_transaction(notes):
+    started = asyncio.Event()
+
+    async def count_after_start() -> int:
+        await started.wait()
+        return await notes.count()
+
+    # Created before the transaction, like a concurrent request
+    other = asyncio.create_task(count_after_start())
+    async with notes.transaction():
+        await notes.create({"body": "pending"})
+        started.set()
+        assert await other == 0
+
+    assert await notes.count() == 1
@@ -7,7 +7,7 @@ from typing import Any
 
 import pytest
 
-from src.repositories.base_repository import BaseRepository
+from src.repositories.base_repository import BaseRepository, build_statement
 
 pytestmark = pytest.mark.repositories
 
@@ -105,3 +105,23 @@ def test_update(repo: DummyRepository) -> None:
 def test_delete(repo: DummyRepository) -> None:
     assert repo.delete(2) is True
     assert repo.delete(999) is False
+
+
+def test_statements_are_cached_per_shape(repo: DummyRepository) -> None:
+    build_statement.cache_clear()
+    repo.find_by_id(1)
+    repo.find_by_id(2)
+    repo.find_all(columns=["id", "name"])
+    repo.find_all(columns=("id", "name"))
+
+    info = build_statement.cache_info()
+    assert info.misses == 2
+    assert info.hits == 2
+
+
+def test_projection_selects_only_requested_columns(repo: DummyRepository) -> None:
+    assert repo.find_by_field("name", "beta", columns=["id", "name"]) == [
+        DummyModel(id=2, name="beta")
+    ]
+    with pytest.raises(ValueError):
+        repo.find_all(columns=["name; DROP TABLE dummy"])
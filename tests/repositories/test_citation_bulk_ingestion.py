@@ -0,0 +1,232 @@
+"""
+Tests for bulk citation and relation ingestion.
+
+Tests cover:
+- Bulk upserts assign IDs and match rows inserted one at a time
+- Re-ingesting the same natural keys updates rows instead of duplicating them
+- Extracting citations from the same document twice succeeds
+- Relation upserts keep the in-memory citation graph in sync
+- Migration 011 merges existing duplicates before adding the unique indexes
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from src.database.connection import DatabaseConnection
+from src.database.models import CitationModel, CitationRelationModel, DocumentModel
+from src.repositories.citation_graph import CitationGraph
+from src.repositories.citation_relation_repository import CitationRelationRepository
+from src.repositories.citation_repository import CitationRepository
+from src.services.citation_service import CitationService
+
+pytestmark = pytest.mark.repositories
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2]
+    / "src/database/migrations/versions/011_add_citation_natural_keys.py"
+)
+
+
+def _load_migration_class():
+    spec = importlib.util.spec_from_file_location("natural_keys", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.AddCitationNaturalKeysMigration
+
+
+@pytest.fixture(scope="module")
+def connection(tmp_path_factory):
+    # Shared across tests: closing a connection pool waits on its monitor threads
+    connection = DatabaseConnection(
+        str(tmp_path_factory.mktemp("citations") / "citations.db")
+    )
+    yield connection
+    connection.close_all_connections()
+
+
+@pytest.fixture
+def db(connection: DatabaseConnection):
+    for table in ("documents", "citations", "citation_relations"):
+        connection.execute(f"DROP TABLE IF EXISTS {table}")
+    connection.execute(
+        "CREATE TABLE documents (id INTEGER PRIMARY KEY, title TEXT, created_at TEXT)"
+    )
+    connection.execute("""
+        CREATE TABLE citations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER NOT NULL,
+            raw_text TEXT NOT NULL,
+            authors TEXT,
+            title TEXT,
+            publication_year INTEGER,
+            journal_or_venue TEXT,
+            doi TEXT,
+            page_range TEXT,
+            citation_type TEXT,
+            confidence_score REAL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+    connection.execute("""
+        CREATE TABLE citation_relations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_document_id INTEGER NOT NULL,
+            source_citation_id INTEGER NOT NULL,
+            target_document_id INTEGER,
+            target_citation_id INTEGER,
+            relation_type TEXT NOT NULL DEFAULT 'cites',
+            confidence_score REAL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+    connection.execute_many(
+        "INSERT INTO documents (id, title) VALUES (?, ?)",
+        [(i, f"Doc {i}") for i in range(1, 6)],
+    )
+    return connection
+
+
+@pytest.fixture
+def migrated_db(db):
+    _load_migration_class()(db).up()
+    return db
+
+
+@pytest.fixture
+def graph(monkeypatch) -> CitationGraph:
+    # Never reconcile, so only in-place updates reach the graph
+    graph = CitationGraph(reconcile_interval=3600.0)
+    monkeypatch.setattr(
+        "src.repositories.citation_relation_repository.get_citation_graph",
+        lambda _db: graph,
+    )
+    return graph
+
+
+def _citation(document_id: int, i: int, **fields) -> CitationModel:
+    return CitationModel(
+        document_id=document_id,
+        raw_text=f"Author {i}. Paper {i}. 2020.",
+        title=fields.pop("title", f"Paper {i}"),
+        publication_year=2020,
+        confidence_score=fields.pop("confidence_score", 0.8),
+        **fields,
+    )
+
+
+def test_bulk_upsert_assigns_ids_and_stores_rows(migrated_db):
+    repo = CitationRepository(migrated_db)
+    citations = [_citation(1 + i % 3, i) for i in range(1200)]
+
+    stored = repo.bulk_upsert(citations)
+
+    assert stored is not citations and stored == citations
+    assert len({c.id for c in stored}) == 1200
+    for citation in (stored[0], stored[599], stored[-1]):
+        row = repo.get_by_id(citation.id)
+        assert (row.document_id, row.raw_text, row.title) == (
+            citation.document_id,
+            citation.raw_text,
+            citation.title,
+        )
+    assert repo.bulk_upsert([]) == []
+
+
+def test_bulk_upsert_updates_existing_natural_keys(migrated_db):
+    repo = CitationRepository(migrated_db)
+    original = repo.bulk_upsert([_citation(1, i) for i in range(3)])
+
+    updated = repo.bulk_upsert(
+        [
+            _citation(1, 0, title="Revised", confidence_score=0.95),
+            _citation(1, 0, title="Revised twice"),
+            _citation(2, 0),
+        ]
+    )
+
+    count = migrated_db.fetch_one("SELECT COUNT(*) AS n FROM citations")["n"]
+    assert count == 4
+    assert updated[0].id == updated[1].id == original[0].id
+    assert updated[2].id not in {c.id for c in original}
+    assert repo.get_by_id(original[0].id).title == "Revised twice"
+
+
+def test_extracting_a_document_twice_reuses_rows(migrated_db):
+    service = CitationService(
+        CitationRepository(migrated_db), CitationRelationRepository(migrated_db)
+    )
+    document = DocumentModel(
+        id=1, title="Doc 1", file_path=None, file_hash="hash", file_size=0
+    )
+
+    first = service.extract_citations_from_document(document)
+    second = service.extract_citations_from_document(document)
+
+    count = migrated_db.fetch_one("SELECT COUNT(*) AS n FROM citations")["n"]
+    assert count == len(first) == 1
+    assert [c.id for c in second] == [c.id for c in first]
+
+
+def test_relation_bulk_upsert_dedupes_and_updates_graph(migrated_db, graph):
+    citations = CitationRepository(migrated_db).bulk_upsert(
+        [_citation(1, i) for i in range(3)]
+    )
+    repo = CitationRelationRepository(migrated_db)
+    graph.load(migrated_db)
+
+    def relation(citation, target, confidence=0.5):
+        return CitationRelationModel(
+            source_document_id=1,
+            source_citation_id=citation.id,
+            target_document_id=target,
+            confidence_score=confidence,
+        )
+
+    first = repo.bulk_upsert(
+        [
+            relation(citations[0], 2),
+            relation(citations[1], 3),
+            relation(citations[2], None),
+        ]
+    )
+    again = repo.bulk_upsert([relation(citations[0], 2, confidence=0.9)])
+
+    count = migrated_db.fetch_one("SELECT COUNT(*) AS n FROM citation_relations")["n"]
+    assert count == 3
+    assert again[0].id == first[0].id
+    row = migrated_db.fetch_one(
+        "SELECT confidence_score FROM citation_relations WHERE id = ?", (first[0].id,)
+    )
+    assert row["confidence_score"] == 0.9
+    assert graph.edge_count == 2
+
+    network = repo.get_citation_network(1, depth=1, min_confidence=0.8)
+    assert {n["id"] for n in network["nodes"]} == {1, 2}
+
+
+def test_migration_merges_duplicates_before_indexing(db):
+    db.execute_many(
+        "INSERT INTO citations (document_id, raw_text) VALUES (?, ?)",
+        [(1, "Same"), (1, "Same"), (2, "Same")],
+    )
+    db.execute_many(
+        "INSERT INTO citation_relations "
+        "(source_document_id, source_citation_id, target_document_id) "
+        "VALUES (?, ?, ?)",
+        [(1, 1, 2), (1, 2, 2), (1, 2, 3)],
+    )
+
+    _load_migration_class()(db).up()
+
+    citations = db.fetch_all("SELECT id FROM citations ORDER BY id")
+    relations = db.fetch_all(
+        "SELECT source_citation_id, target_document_id FROM citation_relations "
+        "ORDER BY id"
+    )
+    assert [row["id"] for row in citations] == [1, 3]
+    assert [tuple(row) for row in relations] == [(1, 2), (1, 3)]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.database.models import CitationRelationModel
+from src.repositories.citation_graph import CitationGraph
+from src.repositories.citation_relation_repository import CitationRelationRepository
+
+pytestmark = pytest.mark.repositories
+
+
+class SimpleDB:
+    def __init__(self, connection: sqlite3.Connection):
+        self.conn = connection
+
+    def fetch_one(self, query, params=()):
+        return self.conn.execute(query, params).fetchone()
+
+    def fetch_all(self, query, params=()):
+        return self.conn.execute(query, params).fetchall()
+
+    def execute(self, query, params=()):
+        cur = self.conn.execute(query, params)
+        self.conn.commit()
+        self._changes = cur.rowcount
+        return cur
+
+    def get_last_change_count(self):
+        return self._changes
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> SimpleDB:
+    conn = sqlite3.connect(tmp_path / "db.sqlite")
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE documents (
+            id INTEGER PRIMARY KEY, title TEXT, created_at TEXT
+        );
+        CREATE TABLE citation_relations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_document_id INTEGER NOT NULL,
+            source_citation_id INTEGER NOT NULL,
+            target_document_id INTEGER,
+            target_citation_id INTEGER,
+            relation_type TEXT NOT NULL DEFAULT 'cites',
+            confidence_score REAL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+        """)
+    conn.executemany(
+        "INSERT INTO documents (id, title, created_at) VALUES (?, ?, '2024-01-01')",
+        [(i, f"Doc {i}") for i in range(1, 10)],
+    )
+    conn.commit()
+    return SimpleDB(conn)
+
+
+@pytest.fixture
+def repo(db, monkeypatch) -> CitationRelationRepository:
+    graph = CitationGraph(reconcile_interval=0.0)
+    monkeypatch.setattr(
+        "src.repositories.citation_relation_repository.get_citation_graph",
+        lambda _db: graph,
+    )
+    return CitationRelationRepository(db)
+
+
+def _relate(repo, source, target, confidence=0.9):
+    return repo.create(
+        CitationRelationModel(
+            source_document_id=source,
+            source_citation_id=1,
+            target_document_id=target,
+            confidence_score=confidence,
+        )
+    )
+
+
+def test_network_follows_both_directions_up_to_depth(repo):
+    # 1 -> 2 -> 3 -> 4, and 5 -> 2
+    for source, target in [(1, 2), (2, 3), (3, 4), (5, 2)]:
+        _relate(repo, source, target)
+
+    network = repo.get_citation_network(2, depth=1)
+    assert {n["id"] for n in network["nodes"]} == {1, 2, 3, 5}
+    assert {(e["source"], e["target"]) for e in network["edges"]} == {
+        (1, 2),
+        (2, 3),
+        (5, 2),
+    }
+    assert next(n for n in network["nodes"] if n["id"] == 2)["title"] == "Doc 2"
+
+    network = repo.get_citation_network(1, depth=3)
+    assert {n["id"] for n in network["nodes"]} == {1, 2, 3, 4, 5}
+    assert network["depth_reached"] == 3
+    distances = {n["id"]: n["distance"] for n in network["nodes"]}
+    assert distances == {1: 0, 2: 1, 3: 2, 5: 2, 4: 3}
+
+
+def test_network_respects_min_confidence_and_unknown_document(repo):
+    _relate(repo, 1, 2, confidence=0.9)
+    _relate(repo, 1, 3, confidence=0.2)
+
+    network = repo.get_citation_network(1, depth=1, min_confidence=0.5)
+    assert {n["id"] for n in network["nodes"]} == {1, 2}
+
+    isolated = repo.get_citation_network(9, depth=2)
+    assert [n["id"] for n in isolated["nodes"]] == [9]
+    assert isolated["edges"] == []
+
+
+def test_graph_tracks_creates_deletes_and_out_of_band_changes(repo, db):
+    first = _relate(repo, 1, 2)
+    repo.get_citation_network(1)  # Load graph
+    _relate(repo, 2, 3)
+    assert {n["id"] for n in repo.get_citation_network(1, depth=2)["nodes"]} == {
+        1,
+        2,
+        3,
+    }
+
+    assert repo.delete(first.id)
+    assert {n["id"] for n in repo.get_citation_network(1, depth=2)["nodes"]} == {1}
+
+    # Cascaded/bulk deletes bypass the repository and are reconciled
+    db.execute("DELETE FROM citation_relations")
+    assert repo.get_citation_network(2)["edges"] == []
+
+
+def test_connected_components_and_pagerank(repo):
+    for source, target in [(1, 2), (2, 3), (3, 1), (4, 5), (6, 7)]:
+        _relate(repo, source, target)
+    _relate(repo, 8, None)  # Unresolved target is not a graph edge
+
+    components = repo.get_connected_components(min_size=2)
+    assert [sorted(c["document_ids"]) for c in components] == [
+        [1, 2, 3],
+        [4, 5],
+        [6, 7],
+    ]
+    assert components[0]["internal_connections"] == 3
+
+    scores = repo.get_pagerank_scores()
+    assert sum(scores.values()) == pytest.approx(1.0)
+    assert scores[5] > scores[4]
+    assert scores[1] == pytest.approx(scores[2])
+
+
+def test_components_survive_compaction_with_many_edges():
+    graph = CitationGraph()
+    graph._loaded = True
+    for i in range(1, 5001):
+        graph.add_relation(i, i, i + 1)
+    for i in range(1, 2000):
+        graph.remove_relation(i)
+
+    components = graph.connected_components()
+    assert len(components) == 1
+    assert components[0]["size"] == 3002
+    assert graph.edge_count == 3001
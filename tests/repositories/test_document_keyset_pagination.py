@@ -0,0 +1,166 @@
+"""
+Tests for keyset-paginated document listing and cached counts.
+
+Tests cover:
+- Cursor walks over every sort key and direction match a full ORDER BY
+- Title search pages and cached search totals
+- Trigger-maintained counts follow inserts, deletes and retitles
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.repositories.document_repository import SORT_KEYS, DocumentRepository
+
+pytestmark = pytest.mark.repositories
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2]
+    / "src/database/migrations/versions/012_add_document_keyset_indexes.py"
+)
+
+
+class SimpleDB:
+    def __init__(self, connection: sqlite3.Connection):
+        self.conn = connection
+        self.queries: list[str] = []
+
+    def fetch_one(self, query, params=()):
+        self.queries.append(query)
+        return self.conn.execute(query, params).fetchone()
+
+    def fetch_all(self, query, params=()):
+        self.queries.append(query)
+        return self.conn.execute(query, params).fetchall()
+
+    def execute(self, query, params=None):
+        cur = self.conn.execute(query, params or ())
+        self.conn.commit()
+        return cur
+
+
+def _migrate(db: SimpleDB) -> None:
+    spec = importlib.util.spec_from_file_location("document_keyset", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.AddDocumentKeysetIndexesMigration(db).up()
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> SimpleDB:
+    conn = sqlite3.connect(tmp_path / "db.sqlite")
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE documents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            file_path TEXT,
+            file_hash TEXT UNIQUE NOT NULL,
+            content_hash TEXT,
+            file_size INTEGER NOT NULL,
+            file_type TEXT,
+            page_count INTEGER,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            last_accessed DATETIME,
+            metadata TEXT DEFAULT '{}',
+            tags TEXT
+        )
+        """)
+    conn.executemany(
+        "INSERT INTO documents (title, file_hash, file_size, created_at, "
+        "updated_at, last_accessed) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                f"Paper {i % 13}",
+                f"hash-{i}",
+                1000 * (i % 7),
+                f"2024-01-{1 + i % 20:02d}T10:00:00",
+                f"2024-02-{1 + i % 9:02d}T10:00:00",
+                None if i % 3 else f"2024-03-{1 + i % 5:02d}T10:00:00",
+            )
+            for i in range(90)
+        ],
+    )
+    conn.commit()
+    database = SimpleDB(conn)
+    _migrate(database)
+    return database
+
+
+def _walk(fetch, limit):
+    ids, after, pages = [], None, 0
+    while True:
+        documents, after = fetch(after=after, limit=limit)
+        ids.extend(doc.id for doc in documents)
+        pages += 1
+        if after is None:
+            return ids, pages
+
+
+@pytest.mark.parametrize("sort_by", sorted(SORT_KEYS))
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+def test_cursor_walk_matches_full_ordering(db, sort_by, sort_order):
+    repo = DocumentRepository(db)
+    direction = sort_order.upper()
+    expected = [
+        row["id"]
+        for row in db.fetch_all(
+            f"SELECT id FROM documents ORDER BY {SORT_KEYS[sort_by]} {direction}, "
+            f"id {direction}"
+        )
+    ]
+
+    ids, pages = _walk(
+        lambda **kw: repo.get_page(sort_by=sort_by, sort_order=sort_order, **kw), 8
+    )
+
+    assert ids == expected
+    assert pages == 12
+    assert [d.id for d in repo.get_all(8, 16, sort_by, sort_order)] == ids[16:24]
+
+
+def test_search_pages_and_cached_total(db):
+    repo = DocumentRepository(db)
+
+    ids, _ = _walk(lambda **kw: repo.search_page("paper 1", **kw), 5)
+    expected = [
+        row["id"]
+        for row in db.fetch_all(
+            "SELECT id FROM documents WHERE title LIKE '%paper 1%' ORDER BY title, id"
+        )
+    ]
+    assert ids == expected
+    assert repo.search("paper 1", limit=5)[1] == len(expected)
+
+    db.queries.clear()
+    assert repo.count_search("paper 1") == len(expected)
+    assert not any("COUNT(*)" in query for query in db.queries)
+
+    db.execute("UPDATE documents SET title = 'Paper 1 revised' WHERE id = 1")
+    assert repo.count_search("paper 1") == len(expected) + 1
+
+
+def test_counts_follow_inserts_deletes_and_fall_back(db):
+    repo = DocumentRepository(db)
+    assert repo.count() == 90
+
+    db.execute(
+        "INSERT INTO documents (title, file_hash, file_size) VALUES ('New', 'h', 1)"
+    )
+    db.execute("DELETE FROM documents WHERE id IN (1, 2, 3)")
+    db.queries.clear()
+
+    assert repo.count() == 88
+    assert db.queries == [
+        "SELECT document_count, generation FROM document_stats WHERE id = 1"
+    ]
+
+    db.execute("DROP TABLE document_stats")
+    assert repo.count() == 88
+    assert repo.count_search("New") == 1
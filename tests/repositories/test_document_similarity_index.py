@@ -0,0 +1,216 @@
+"""
+Tests for the MinHash/LSH document similarity index.
+
+Tests cover:
+- Title groups match the exhaustive pairwise comparison
+- Signatures are persisted once and reused across loads
+- Out-of-band inserts, retitles and deletes are picked up by sync
+- Content signatures find near-identical extracted text
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.repositories.document_repository import DocumentRepository
+from src.repositories.document_similarity_index import (
+    DocumentSimilarityIndex,
+    MinHasher,
+)
+from src.services.document_library_service import DocumentLibraryService
+
+pytestmark = pytest.mark.repositories
+
+MIGRATIONS = Path(__file__).parents[2] / "src/database/migrations/versions"
+
+
+class SimpleDB:
+    def __init__(self, connection: sqlite3.Connection):
+        self.conn = connection
+        self.writes = 0
+
+    def fetch_one(self, query, params=()):
+        return self.conn.execute(query, params).fetchone()
+
+    def fetch_all(self, query, params=()):
+        return self.conn.execute(query, params).fetchall()
+
+    def execute(self, query, params=None):
+        cur = self.conn.execute(query, params or ())
+        self.conn.commit()
+        return cur
+
+    def execute_many(self, query, params_list):
+        self.writes += len(params_list)
+        cur = self.conn.executemany(query, params_list)
+        self.conn.commit()
+        return cur
+
+
+def _migrate(db: SimpleDB, filename: str, class_name: str) -> None:
+    spec = importlib.util.spec_from_file_location(class_name, MIGRATIONS / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    getattr(module, class_name)(db).up()
+
+
+WORDS = [
+    "graph",
+    "neural",
+    "network",
+    "learning",
+    "protein",
+    "folding",
+    "quantum",
+    "error",
+    "correction",
+    "climate",
+    "model",
+    "ensemble",
+    "survey",
+    "robust",
+    "sparse",
+    "attention",
+    "transformer",
+    "retrieval",
+    "causal",
+    "inference",
+]
+
+
+def _titles(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(count):
+        if titles and rng.random() < 0.3:
+            words = rng.choice(titles).split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            titles.append(" ".join(words))
+        else:
+            titles.append(" ".join(rng.sample(WORDS, rng.randint(4, 8))))
+    return titles
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> SimpleDB:
+    conn = sqlite3.connect(tmp_path / "db.sqlite")
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE documents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            file_path TEXT,
+            file_hash TEXT UNIQUE NOT NULL,
+            content_hash TEXT,
+            file_size INTEGER NOT NULL DEFAULT 0,
+            file_type TEXT,
+            page_count INTEGER,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            last_accessed DATETIME,
+            metadata TEXT DEFAULT '{}',
+            tags TEXT
+        )
+        """)
+    conn.executemany(
+        "INSERT INTO documents (title, file_hash, file_size) VALUES (?, ?, ?)",
+        [(title, f"hash-{i}", i) for i, title in enumerate(_titles(400))],
+    )
+    conn.commit()
+    database = SimpleDB(conn)
+    _migrate(
+        database,
+        "012_add_document_keyset_indexes.py",
+        "AddDocumentKeysetIndexesMigration",
+    )
+    _migrate(
+        database, "013_add_document_signatures.py", "AddDocumentSignaturesMigration"
+    )
+    return database
+
+
+def test_title_groups_match_pairwise_comparison(db):
+    expected = [
+        [doc.id for doc in docs]
+        for _, docs in DocumentRepository(db).find_similar_documents_by_title(0.8)
+    ]
+
+    groups = DocumentSimilarityIndex().similar_title_groups(db, 0.8)
+
+    assert expected and groups == expected
+
+
+def test_library_duplicates_use_index_and_flag_imports(db, tmp_path):
+    repo = DocumentRepository(db)
+    service = DocumentLibraryService(repo, hash_service=None, documents_dir=tmp_path)
+    service._similarity_index = DocumentSimilarityIndex()
+    expected = repo.find_similar_documents_by_title(0.8)
+
+    duplicates = service.find_duplicate_documents(include_content_hash=False)
+
+    title_groups = [docs for criteria, docs in duplicates if "titles" in criteria]
+    assert [[d.id for d in docs] for docs in title_groups] == [
+        [d.id for d in docs] for _, docs in expected
+    ]
+    document = repo.find_by_id(expected[0][1][0].id)
+    document.id, document.file_hash, document.metadata = None, "copy", {}
+    service._flag_near_duplicates(document)
+    assert expected[0][1][0].id in document.metadata["near_duplicate_ids"]
+
+
+def test_signatures_are_persisted_and_reused(db):
+    DocumentSimilarityIndex().ensure_loaded(db)
+    assert db.writes == 400
+    stored = db.fetch_one("SELECT COUNT(*) AS n FROM document_signatures")["n"]
+    assert stored == 400
+
+    db.execute("UPDATE documents SET title = 'quantum error correction' WHERE id = 5")
+    reloaded = DocumentSimilarityIndex()
+    reloaded.ensure_loaded(db)
+
+    assert db.writes == 401  # Only the retitled document is signed again
+    assert reloaded.find_similar(db, title="Quantum error  correction")[0] == (5, 1.0)
+
+
+def test_sync_applies_out_of_band_changes(db):
+    index = DocumentSimilarityIndex(reconcile_interval=0)
+    index.ensure_loaded(db)
+    title = "sparse attention for causal retrieval transformer"
+
+    db.execute("INSERT INTO documents (title, file_hash) VALUES (?, 'new')", (title,))
+    new_id = db.fetch_one("SELECT MAX(id) AS id FROM documents")["id"]
+    assert (new_id, 1.0) in index.find_similar(db, title=title)
+
+    db.execute("DELETE FROM documents WHERE id = ?", (new_id,))
+    assert new_id not in dict(index.find_similar(db, title=title))
+
+
+def test_content_signatures_match_near_identical_text(db):
+    rng = random.Random(3)
+    text = " ".join(rng.choice(WORDS) for _ in range(3000))
+    edited = text.replace("graph", "graphs", 5)
+    index = DocumentSimilarityIndex()
+    index.index_document(db, 1, "first", text=text)
+    index.index_document(db, 2, "second", text=" ".join(rng.sample(WORDS, 20) * 50))
+
+    matches = DocumentSimilarityIndex().find_similar(db, text=edited, threshold=0.8)
+
+    assert [document_id for document_id, _ in matches] == [1]
+    assert index.find_similar(db, content_of=1, exclude_id=1, threshold=0.8) == []
+
+
+def test_recall_curve_and_signature_estimate():
+    index = DocumentSimilarityIndex()
+    hasher = MinHasher()
+    first = hasher.signature({f"w{i}" for i in range(100)})
+    second = hasher.signature({f"w{i}" for i in range(20, 120)})
+
+    assert index.recall_at(0.8) > 0.999
+    assert 0.4 < index.min_threshold < 0.6
+    assert abs((first == second).mean() - 80 / 120) < 0.1
+    assert hasher.signature(set()) is None
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scripts import log_analyzer as la
+
+
+def _write_log(path: Path, count: int = 600) -> None:
+    rng = random.Random(7)
+    now = datetime.now()
+    lines = []
+    for i in range(count):
+        timestamp = now - timedelta(minutes=count - i)
+        level = "ERROR" if i % 25 == 0 else "INFO"
+        message = "Request handled"
+        if i % 25 == 0:
+            message = "Database connection failed: timeout"
+        elif i % 40 == 0:
+            message = "Document uploaded successfully"
+        elif i % 30 == 0:
+            message = "authentication failed for user"
+        lines.append(
+            json.dumps(
+                {
+                    "timestamp": timestamp.isoformat(),
+                    "level": level,
+                    "message": message,
+                    "ip": f"10.0.0.{i % 3}",
+                    "endpoint": f"/api/items/{i % 4}",
+                    "response_time": rng.uniform(10, 400),
+                    "status_code": 500 if i % 50 == 0 else 200,
+                }
+            )
+        )
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    path = tmp_path / "app.log"
+    _write_log(path)
+    return path
+
+
+def test_tdigest_quantiles_close_to_exact_and_mergeable() -> None:
+    rng = random.Random(1)
+    values = [rng.expovariate(1 / 100) for _ in range(20_000)]
+    left, right = la.TDigest(), la.TDigest()
+    for value in values[:10_000]:
+        left.add(value)
+    for value in values[10_000:]:
+        right.add(value)
+    left.merge(right)
+
+    assert left.count == len(values)
+    assert len(left.centroids) < 500
+    for q in (0.5, 0.95, 0.99):
+        exact = float(np.percentile(values, q * 100))
+        assert left.quantile(q) == pytest.approx(exact, rel=0.03)
+
+
+def test_running_stats_merge_matches_single_pass() -> None:
+    values = [float(v) for v in range(1, 101)]
+    whole, left, right = la.RunningStats(), la.RunningStats(), la.RunningStats()
+    for value in values:
+        whole.add(value)
+    for value in values[:37]:
+        left.add(value)
+    for value in values[37:]:
+        right.add(value)
+    left.merge(right)
+
+    assert left.count == whole.count
+    assert left.mean == pytest.approx(whole.mean)
+    assert left.stdev == pytest.approx(whole.stdev)
+    assert (left.min, left.max) == (1.0, 100.0)
+
+
+def test_reservoir_sample_is_bounded() -> None:
+    sample = la.ReservoirSample(capacity=10, seed=3)
+    other = la.ReservoirSample(capacity=10, seed=4)
+    for i in range(1000):
+        sample.add(i)
+        other.add(-i)
+    sample.merge(other)
+
+    assert len(sample.items) == 10
+    assert sample.seen == 2000
+
+
+def test_byte_ranges_cover_every_line_exactly_once(log_file: Path) -> None:
+    start_time, end_time = la.resolve_time_window("24h")
+    ranges = la.split_log_file(log_file, chunk_size=1000)
+    assert len(ranges) > 10
+
+    total = sum(
+        la.analyze_log_range(
+            str(log_file), start, end, start_time, end_time
+        ).total_entries
+        for start, end in ranges
+    )
+    assert total == 600
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_streaming_matches_batch_analysis(
+    log_file: Path, tmp_path: Path, workers: int
+) -> None:
+    engine = la.LogAnalysisEngine(cache_dir=tmp_path / "cache")
+    batch = engine.analyze_logs([log_file], timeframe="24h")
+    streaming = engine.analyze_logs_streaming(
+        [log_file], timeframe="24h", workers=workers, chunk_size=4096
+    )
+
+    assert streaming["metadata"]["mode"] == "streaming"
+    assert (
+        streaming["metadata"]["total_log_entries"]
+        == batch["metadata"]["total_log_entries"]
+    )
+
+    def pattern_counts(result):
+        return {(p.pattern_id, p.frequency) for p in result["error_patterns"]}
+
+    assert pattern_counts(streaming) == pattern_counts(batch)
+    assert {(m.metric_name, m.metric_value) for m in streaming["business_metrics"]} == {
+        (m.metric_name, m.metric_value) for m in batch["business_metrics"]
+    }
+    assert {
+        (e.source_ip, e.event_type, e.frequency) for e in streaming["security_events"]
+    } == {(e.source_ip, e.event_type, e.frequency) for e in batch["security_events"]}
+
+    batch_bottlenecks = {b.endpoint: b for b in batch["performance_bottlenecks"]}
+    for bottleneck in streaming["performance_bottlenecks"]:
+        expected = batch_bottlenecks[bottleneck.endpoint]
+        assert bottleneck.request_count == expected.request_count
+        assert bottleneck.avg_response_time == pytest.approx(expected.avg_response_time)
+        assert bottleneck.error_rate == pytest.approx(expected.error_rate)
+        assert bottleneck.percentile_95 == pytest.approx(
+            expected.percentile_95, rel=0.05
+        )
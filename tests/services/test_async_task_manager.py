@@ -0,0 +1,158 @@
+"""
+Tests for AsyncTaskManager lane scheduling.
+
+Tests cover:
+- Each category lane respects its own concurrency limit
+- A saturated lane does not hold back other categories
+- Priority order within a lane and cancelling queued tasks
+- CPU-bound callables run in the process pool lane
+- Memory pressure holds dispatch and re-checks on a timer
+"""
+
+from __future__ import annotations
+
+import asyncio
+import operator
+import os
+
+import pytest
+
+from backend.services.async_task_manager import (
+    AsyncTaskManager,
+    TaskCategory,
+    TaskPriority,
+)
+
+
+async def _wait_until(predicate, timeout: float = 10.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+def _manager(**kwargs) -> AsyncTaskManager:
+    return AsyncTaskManager(
+        max_queue_size=1000, enable_memory_monitoring=False, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_lane_limits_and_isolation():
+    manager = _manager(lane_limits={TaskCategory.INDEX_BUILD: 2})
+    await manager.start()
+    release = asyncio.Event()
+    started: list[str] = []
+
+    async def blocked(name: str) -> None:
+        started.append(name)
+        await release.wait()
+
+    async def quick() -> str:
+        return "done"
+
+    for index in range(6):
+        await manager.submit_task(
+            blocked, TaskCategory.INDEX_BUILD, TaskPriority.NORMAL, None, None, index
+        )
+    query_id = await manager.submit_task(quick, TaskCategory.RAG_QUERY)
+    await _wait_until(lambda: query_id in manager.completed_tasks)
+
+    assert manager.completed_tasks[query_id].result == "done"
+    assert started == [0, 1]
+    assert manager.get_stats()["lanes"]["index_build"] == {
+        "running": 2,
+        "queued": 4,
+        "limit": 2,
+    }
+
+    release.set()
+    await _wait_until(lambda: len(started) == 6 and not manager.active_tasks)
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_priority_order_and_queued_cancel():
+    manager = _manager(max_concurrent_tasks=1)
+    order: list[str] = []
+
+    async def record(name: str) -> None:
+        order.append(name)
+
+    async def submit(name: str, priority: TaskPriority) -> str:
+        return await manager.submit_task(
+            record, TaskCategory.RAG_QUERY, priority, None, None, name
+        )
+
+    # Queued before start, so nothing runs until every task is in the lane
+    await submit("low", TaskPriority.LOW)
+    first = await submit("normal-1", TaskPriority.NORMAL)
+    await submit("normal-2", TaskPriority.NORMAL)
+    cancelled = await submit("urgent-cancelled", TaskPriority.URGENT)
+    await submit("high", TaskPriority.HIGH)
+
+    assert (await manager.get_task_status(first))["status"] == "queued"
+    assert await manager.cancel_task(cancelled) is True
+
+    await manager.start()
+    await _wait_until(lambda: len(manager.completed_tasks) == 5)
+
+    assert order == ["high", "normal-1", "normal-2", "low"]
+    assert (await manager.get_task_status(cancelled))["status"] == "failed"
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_cpu_task_runs_in_worker_process():
+    manager = _manager(cpu_workers=1)
+    await manager.start()
+
+    product_id = await manager.submit_cpu_task(operator.mul, 6, 7)
+    pid_id = await manager.submit_cpu_task(os.getpid)
+    await _wait_until(
+        lambda: {product_id, pid_id} <= manager.completed_tasks.keys(), timeout=60
+    )
+
+    assert manager.completed_tasks[product_id].result == 42
+    assert manager.completed_tasks[pid_id].result != os.getpid()
+    assert manager.completed_tasks[pid_id].category == TaskCategory.DOCUMENT_PROCESSING
+    await manager.stop()
+
+
+class _PressureMonitor:
+    check_interval_seconds = 0.02
+
+    def __init__(self) -> None:
+        self.limited = True
+        self.checks = 0
+
+    def should_limit_tasks(self) -> bool:
+        self.checks += 1
+        return self.limited
+
+    def is_memory_critical(self) -> bool:
+        return False
+
+    def get_memory_stats(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_memory_pressure_defers_dispatch_without_polling():
+    manager = _manager()
+    monitor = _PressureMonitor()
+    manager.memory_monitor = monitor
+    await manager.start()
+
+    async def quick() -> None:
+        return None
+
+    task_id = await manager.submit_task(quick)
+    await asyncio.sleep(0.1)
+
+    assert task_id in manager.queued_tasks
+    assert monitor.checks < 15  # One re-check per interval, not a busy loop
+
+    monitor.limited = False
+    await _wait_until(lambda: task_id in manager.completed_tasks)
+    await manager.stop()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.services.citation_parsing_service import (
+    CitationParsingService,
+    NearDuplicateIndex,
+    text_similarity,
+)
+
+pytestmark = pytest.mark.services
+
+BIBLIOGRAPHY = """Abstract: We study citation graphs.
+Table 1 summarises the corpus.
+References:
+Smith, J., Chen, A. & Garcia, M. (2019). Graph neural networks at scale. Journal of Machine Learning Research, 20(1), 1-30.
+Kumar, R. et al. (2021). Attention is all you cite. Proceedings of the Conference on Neural Information Processing.
+Novak, P., Silva, T., and Lee, K. (2015). Sparse retrieval. Cambridge University Press.
+Okafor, B. (2008). Language models. PhD thesis. https://doi.org/10.1234/abcd.5678.
+"""
+
+
+def test_parses_structured_fields_and_drops_near_duplicates():
+    citations = CitationParsingService().parse_citations_from_text(
+        BIBLIOGRAPHY, use_third_party=False
+    )
+    raw_texts = [c["raw_text"] for c in citations]
+
+    assert "Smith, J., Chen, A. & Garcia, M. (2019)." in raw_texts
+    kumar = next(c for c in citations if c["raw_text"].startswith("Kumar"))
+    assert kumar["publication_year"] == 2021
+    assert kumar["citation_type"] == "conference"
+    scores = [c["confidence_score"] for c in citations]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_deduplication_keeps_first_of_near_identical_citations():
+    service = CitationParsingService()
+    texts = [
+        "Novak, P., Silva, T., and Lee, K. (2015). Sparse retrieval.",
+        "Novak, P., Silva, T., and Lea, K. (2015). Sparse retrieval.",
+        "Okafor, B. (2008). Language models for citation parsing.",
+    ]
+    citations = [service._parse_single_citation(text) for text in texts]
+
+    kept = service._deduplicate_and_filter_citations(citations)
+    merged = service._merge_and_deduplicate_citations(citations[2:], citations)
+
+    assert sorted(c["raw_text"] for c in kept) == [texts[0], texts[2]]
+    assert [c["raw_text"] for c in merged] == [texts[2], texts[0]]
+
+
+def test_extractors_use_compiled_patterns():
+    service = CitationParsingService()
+    text = "Okafor, B. (2008). Language models. PhD thesis. doi: 10.1234/abcd.5678."
+
+    assert service.extract_doi(text) == "10.1234/abcd.5678"
+    assert service.extract_year(text) == 2008
+    assert service.classify_citation_type(text) == "thesis"
+    assert service._prefilter_citation_text("  Figure 2 shows\n\nkept line ") == (
+        "kept line"
+    )
+
+
+def test_near_duplicate_index_matches_pairwise_scan():
+    rng = random.Random(7)
+
+    def mutate(text: str) -> str:
+        chars = list(text)
+        for _ in range(rng.randint(0, len(chars) // 4)):
+            chars[rng.randrange(len(chars))] = rng.choice("ab ,.")
+        return "".join(chars[: rng.randint(len(chars) * 3 // 4, len(chars))])
+
+    for _ in range(50):
+        base = [
+            "".join(rng.choice("abcdef ,.") for _ in range(rng.randint(5, 150)))
+            for _ in range(15)
+        ]
+        texts = base + [mutate(text) for text in base]
+        rng.shuffle(texts)
+
+        index, kept = NearDuplicateIndex(), []
+        for text in texts:
+            expected = any(text_similarity(text, other) > 0.8 for other in kept)
+            assert index.contains_similar(text) is expected
+            if not expected:
+                index.add(text)
+                kept.append(text)
+
+
+def test_parse_documents_in_process_pool_matches_serial():
+    service = CitationParsingService()
+    texts = [BIBLIOGRAPHY, BIBLIOGRAPHY.replace("2019", "2020"), ""]
+
+    serial = service.parse_documents(texts, use_third_party=False, max_workers=1)
+    pooled = service.parse_documents(texts, use_third_party=False, max_workers=2)
+
+    assert pooled == serial
+    assert serial[0] and serial[2] == []
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+import src.services.dedup_backup_store as store_module
+from src.services.dedup_backup_store import (
+    ContentDefinedChunker,
+    DedupBackupError,
+    DedupBackupRepository,
+)
+
+
+def _small_chunker() -> ContentDefinedChunker:
+    return ContentDefinedChunker(
+        min_size=1024, avg_size=4096, max_size=16384, read_size=10_000
+    )
+
+
+def test_chunker_respects_bounds_and_reassembles():
+    data = os.urandom(200_000)
+    chunks = list(_small_chunker().iter_chunks(io.BytesIO(data)))
+
+    assert b"".join(chunks) == data
+    assert all(len(c) <= 16384 for c in chunks)
+    assert all(len(c) >= 1024 for c in chunks[:-1])
+
+
+def test_chunker_python_fallback_matches_numpy(monkeypatch):
+    if store_module.np is None:
+        pytest.skip("numpy not installed")
+    data = os.urandom(120_000)
+    vectorized = list(_small_chunker().iter_chunks(io.BytesIO(data)))
+
+    monkeypatch.setattr(store_module, "np", None)
+    fallback = list(_small_chunker().iter_chunks(io.BytesIO(data)))
+
+    assert vectorized == fallback
+
+
+def test_chunk_boundaries_survive_insertions():
+    data = os.urandom(200_000)
+    edited = data[:5000] + b"inserted bytes" + data[5000:]
+    chunker = _small_chunker()
+
+    original = set(chunker.iter_chunks(io.BytesIO(data)))
+    shifted = set(chunker.iter_chunks(io.BytesIO(edited)))
+
+    assert len(original & shifted) >= len(original) - 3
+
+
+def test_incremental_backup_stores_only_changed_chunks(tmp_path: Path):
+    source = tmp_path / "index"
+    source.mkdir()
+    (source / "default__vector_store.json").write_bytes(os.urandom(100_000))
+    (source / "nested").mkdir()
+    (source / "nested" / "docstore.json").write_bytes(os.urandom(50_000))
+    repo = DedupBackupRepository(tmp_path / "repo", chunker=_small_chunker())
+
+    first = repo.backup(source, snapshot_id="s1")
+    assert first.stats["chunks_new"] == first.stats["chunks_total"]
+
+    second = repo.backup(source, snapshot_id="s2")
+    assert second.stats["chunks_new"] == 0
+    assert second.stats["bytes_stored"] == 0
+
+    with open(source / "nested" / "docstore.json", "ab") as f:
+        f.write(b"appended metadata")
+    third = repo.backup(source, snapshot_id="s3")
+    assert 0 < third.stats["chunks_new"] <= 2
+
+    restored = repo.restore("s3", tmp_path / "restored")
+    for name in ["default__vector_store.json", "nested/docstore.json"]:
+        assert (restored / name).read_bytes() == (source / name).read_bytes()
+    streamed = b"".join(repo.iter_file("s1", "default__vector_store.json"))
+    assert streamed == (source / "default__vector_store.json").read_bytes()
+
+
+def test_corrupt_chunk_is_detected_on_restore(tmp_path: Path):
+    source = tmp_path / "file.pdf"
+    source.write_bytes(os.urandom(20_000))
+    repo = DedupBackupRepository(tmp_path / "repo", chunker=_small_chunker())
+    snapshot = repo.backup(source, snapshot_id="s1")
+
+    digest = snapshot.files[0].chunks[0][0]
+    (tmp_path / "repo" / "chunks" / digest[:2] / digest).write_bytes(b"rgarbage")
+
+    with pytest.raises(DedupBackupError):
+        repo.restore("s1", tmp_path / "out")
+
+
+def test_garbage_collection_keeps_referenced_chunks(tmp_path: Path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.bin").write_bytes(os.urandom(30_000))
+    repo = DedupBackupRepository(tmp_path / "repo", chunker=_small_chunker())
+    repo.backup(source, snapshot_id="old")
+    (source / "a.bin").write_bytes(os.urandom(30_000))
+    repo.backup(source, snapshot_id="new")
+
+    repo.delete_snapshot("old")
+    result = repo.collect_garbage()
+
+    assert result["chunks_removed"] > 0
+    repo.restore("new", tmp_path / "out")
+    assert (tmp_path / "out" / "a.bin").read_bytes() == (source / "a.bin").read_bytes()
+
+
+def test_invalid_snapshot_id_rejected(tmp_path: Path):
+    repo = DedupBackupRepository(tmp_path / "repo")
+    with pytest.raises(DedupBackupError):
+        repo.load_snapshot("../escape")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -12,6 +14,7 @@ from src.exceptions import (
     DuplicateDocumentError,
 )
 from src.services.document_library_service import DocumentLibraryService
+from src.services.index_version_store import IndexVersionStore
 
 
 class _StubRepo:
@@ -32,6 +35,12 @@ class _StubRepo:
         self.documents[document.id] = document
         return document
 
+    def find_by_id(self, document_id: int):
+        return self.documents.get(document_id)
+
+    def delete(self, document_id: int) -> bool:
+        return self.documents.pop(document_id, None) is not None
+
 
 class _StubHashService:
     def __init__(self, is_valid: bool = True):
@@ -121,3 +130,33 @@ def test_duplicate_detection_raises(tmp_pdf: Path, service: DocumentLibraryServi
             managed_file_path=tmp_pdf,
             title=None,
         )
+
+
+def test_delete_document_removes_published_index_versions(
+    tmp_path: Path, service: DocumentLibraryService
+):
+    storage = tmp_path / "vector_indexes"
+    store = IndexVersionStore(storage, background_gc=False)
+    index_path = storage / "doc_1_abcd1234"
+    for _ in range(2):
+        staging = store.create_staging()
+        (staging / "default__vector_store.json").write_text("{}")
+        store.publish(staging, index_path)
+    assert index_path.is_symlink() and len(store.list_versions(index_path)) == 2
+
+    deleted_indexes = []
+    service.db.transaction = nullcontext
+    service.vector_repo = SimpleNamespace(
+        find_by_document_id=lambda _id: SimpleNamespace(index_path=str(index_path)),
+        delete_by_document_id=deleted_indexes.append,
+    )
+    service._similarity_index = SimpleNamespace(remove_document=lambda db, _id: None)
+    service.document_repo.documents[1] = DocumentModel(
+        id=1, title="Indexed", file_path=None, file_hash="hash", file_size=0
+    )
+
+    assert service.delete_document(1)
+
+    assert not index_path.is_symlink() and not index_path.exists()
+    assert not store.versions_dir(index_path).exists()
+    assert deleted_indexes == [1]
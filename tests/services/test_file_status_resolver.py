@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.services import file_status_resolver as resolver_module
+from src.services.file_status_resolver import FileStatusResolver
+
+pytestmark = pytest.mark.services
+
+
+@pytest.fixture
+def scans(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        calls.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(resolver_module.os, "scandir", counting_scandir)
+    return calls
+
+
+def _age(directory: Path, seconds: int = 60) -> None:
+    """Move a directory's mtime out of the racy window."""
+    past = time.time() - seconds
+    os.utime(directory, (past, past))
+
+
+def test_resolves_a_page_with_one_scan_per_directory(tmp_path, scans):
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    paths = []
+    for directory in (first, second):
+        for i in range(50):
+            path = directory / f"doc{i}.pdf"
+            if i % 2 == 0:
+                path.write_bytes(b"%PDF")
+            paths.append(str(path))
+    (first / "dangling.pdf").symlink_to(tmp_path / "missing.pdf")
+
+    status = FileStatusResolver().resolve(
+        paths + [None, "", str(first / "dangling.pdf"), str(tmp_path / "x/y.pdf")]
+    )
+
+    assert sorted(scans) == sorted([str(first), str(second)])
+    assert {p for p in paths if status[p]} == {p for p in paths if Path(p).exists()}
+    assert status[str(first / "dangling.pdf")] is False
+    assert status[str(tmp_path / "x/y.pdf")] is False
+    assert None not in status and "" not in status
+
+
+def test_listing_is_reused_until_directory_mtime_changes(tmp_path, scans):
+    existing = tmp_path / "existing.pdf"
+    existing.write_bytes(b"%PDF")
+    added = tmp_path / "added.pdf"
+    _age(tmp_path)
+    resolver = FileStatusResolver()
+
+    assert resolver.resolve([str(existing), str(added)]) == {
+        str(existing): True,
+        str(added): False,
+    }
+    assert resolver.exists(str(existing))
+    assert len(scans) == 1
+
+    added.write_bytes(b"%PDF")  # Bumps the directory mtime
+
+    assert resolver.exists(str(added))
+    assert len(scans) == 2
+
+
+def test_invalidate_drops_stale_listing(tmp_path, scans):
+    target = tmp_path / "doc.pdf"
+    _age(tmp_path)
+    mtime = tmp_path.stat().st_mtime_ns
+    resolver = FileStatusResolver()
+    assert not resolver.exists(str(target))
+
+    # Simulate a change the directory mtime does not reveal
+    target.write_bytes(b"%PDF")
+    os.utime(tmp_path, ns=(mtime, mtime))
+    assert not resolver.exists(str(target))
+
+    resolver.invalidate(target)
+    assert resolver.exists(str(target))
+    assert len(scans) == 2
+
+
+def test_resolve_async_and_lru_bound(tmp_path):
+    directories = []
+    for i in range(3):
+        directory = tmp_path / f"d{i}"
+        directory.mkdir()
+        (directory / "doc.pdf").write_bytes(b"%PDF")
+        directories.append(directory)
+    resolver = FileStatusResolver(max_directories=2)
+
+    status = asyncio.run(
+        resolver.resolve_async(str(d / "doc.pdf") for d in directories)
+    )
+
+    assert all(status.values()) and len(status) == 3
+    assert list(resolver._listings) == [str(d) for d in directories[1:]]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from backend.services.incremental_backup_service import (
+    ChangeType,
+    FileSystemTracker,
+)
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    source = tmp_path / "data"
+    (source / "nested").mkdir(parents=True)
+    (source / "a.txt").write_text("alpha")
+    (source / "nested" / "b.txt").write_text("beta")
+    return source
+
+
+@pytest.mark.asyncio
+async def test_unchanged_files_reuse_checksums(source_dir):
+    tracker = FileSystemTracker(str(source_dir))
+    first = await tracker.create_snapshot("s1")
+    assert first.metadata["files_hashed"] == 2
+
+    (source_dir / "a.txt").write_text("alpha, edited")
+    second = await tracker.create_snapshot("s2")
+
+    assert second.metadata["files_hashed"] == 1
+    assert second.checksum_map["nested/b.txt"] == first.checksum_map["nested/b.txt"]
+    assert second.checksum_map["a.txt"] == hashlib.sha256(b"alpha, edited").hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_rename_is_reported_as_move(source_dir):
+    tracker = FileSystemTracker(str(source_dir))
+    await tracker.create_snapshot("s1")
+
+    os.rename(source_dir / "nested" / "b.txt", source_dir / "b-moved.txt")
+    (source_dir / "c.txt").write_text("gamma")
+    changes = {change.path: change for change in await tracker.detect_changes()}
+
+    assert set(changes) == {"b-moved.txt", "c.txt"}
+    assert changes["b-moved.txt"].change_type == ChangeType.MOVED
+    assert changes["b-moved.txt"].metadata["previous_path"] == "nested/b.txt"
+    assert changes["c.txt"].change_type == ChangeType.CREATED
+
+
+@pytest.mark.asyncio
+async def test_manifest_round_trip(source_dir):
+    tracker = FileSystemTracker(str(source_dir))
+    snapshot = await tracker.create_snapshot("s1")
+
+    reloaded = FileSystemTracker(str(source_dir))
+    await reloaded._load_snapshot()
+
+    assert tracker.snapshot_file.exists()
+    loaded = reloaded.last_snapshot
+    assert loaded.snapshot_id == "s1"
+    assert loaded.checksum_map == snapshot.checksum_map
+    assert loaded.stat_map == snapshot.stat_map
+    assert await reloaded.detect_changes() == []
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_snapshot_is_loaded_without_spurious_changes(source_dir):
+    large = source_dir / "large.bin"
+    large.write_bytes(b"\0" * FileSystemTracker.FULL_HASH_MAX_SIZE)
+    stat_info = large.stat()
+    tracker = FileSystemTracker(str(source_dir))
+    # Format written before stat-first tracking: float mtime for large files
+    tracker.legacy_snapshot_file.write_text(
+        json.dumps(
+            {
+                "snapshot_id": "legacy",
+                "source_id": str(source_dir),
+                "backup_level": "full",
+                "created_at": "2024-01-01T00:00:00",
+                "files_tracked": 3,
+                "total_size": stat_info.st_size + 9,
+                "checksum_map": {
+                    "a.txt": hashlib.sha256(b"alpha").hexdigest(),
+                    "nested/b.txt": hashlib.sha256(b"beta").hexdigest(),
+                    "large.bin": hashlib.sha256(
+                        f"{stat_info.st_mtime}:{stat_info.st_size}".encode()
+                    ).hexdigest()[:16],
+                },
+            }
+        )
+    )
+
+    assert await tracker.detect_changes() == []
+
+    await tracker.create_snapshot("s1")
+    reloaded = FileSystemTracker(str(source_dir))
+    assert await reloaded.detect_changes() == []
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.services.index_version_store import (
+    IndexVersionError,
+    IndexVersionStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> IndexVersionStore:
+    return IndexVersionStore(tmp_path, background_gc=False)
+
+
+def _stage(store: IndexVersionStore, content: str) -> Path:
+    staging = store.create_staging()
+    (staging / "default__vector_store.json").write_text(content)
+    return staging
+
+
+def test_publish_renames_staging_and_points_index_at_it(
+    store: IndexVersionStore, tmp_path: Path
+):
+    index_path = tmp_path / "doc_1_abcd"
+    staging = _stage(store, '{"v": 1}')
+    inode = (staging / "default__vector_store.json").stat().st_ino
+
+    version = store.publish(staging, index_path)
+
+    assert not staging.exists()
+    assert index_path.is_symlink()
+    assert store.current_version(index_path) == version
+    published = index_path / "default__vector_store.json"
+    assert published.read_text() == '{"v": 1}'
+    assert published.stat().st_ino == inode  # Renamed, not copied
+
+
+def test_rollback_restores_previous_version(store: IndexVersionStore, tmp_path: Path):
+    index_path = tmp_path / "doc_1_abcd"
+    first = store.publish(_stage(store, '{"v": 1}'), index_path)
+    store.publish(_stage(store, '{"v": 2}'), index_path)
+
+    assert store.rollback(index_path) == first
+    assert (index_path / "default__vector_store.json").read_text() == '{"v": 1}'
+    with pytest.raises(IndexVersionError):
+        store.rollback(index_path)
+
+
+def test_old_versions_are_collected(store: IndexVersionStore, tmp_path: Path):
+    index_path = tmp_path / "doc_1_abcd"
+    for n in range(4):
+        store.publish(_stage(store, f'{{"v": {n}}}'), index_path)
+
+    versions = store.list_versions(index_path)
+    assert [v.name for v in versions] == ["v000003", "v000004"]
+    assert store.current_version(index_path) == versions[-1]
+
+
+def test_plain_directory_is_adopted_as_previous_version(
+    store: IndexVersionStore, tmp_path: Path
+):
+    index_path = tmp_path / "doc_1_abcd"
+    index_path.mkdir()
+    (index_path / "default__vector_store.json").write_text('{"legacy": true}')
+
+    store.publish(_stage(store, '{"v": 1}'), index_path)
+    store.rollback(index_path)
+
+    assert (index_path / "default__vector_store.json").read_text() == (
+        '{"legacy": true}'
+    )
+
+
+def test_readers_never_see_a_partial_index(store: IndexVersionStore, tmp_path: Path):
+    index_path = tmp_path / "doc_1_abcd"
+    store.publish(_stage(store, "0" * 100_000), index_path)
+    stop = threading.Event()
+    seen: set[int] = set()
+
+    def read() -> None:
+        while not stop.is_set():
+            seen.add(len((index_path / "default__vector_store.json").read_text()))
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for _ in range(20):
+        store.publish(_stage(store, "1" * 100_000), index_path)
+    stop.set()
+    reader.join()
+
+    assert seen == {100_000}
+
+
+def test_remove_and_sweep_orphans(store: IndexVersionStore, tmp_path: Path):
+    kept = tmp_path / "doc_1_abcd"
+    dropped = tmp_path / "doc_2_abcd"
+    store.publish(_stage(store, "{}"), kept)
+    store.publish(_stage(store, "{}"), dropped)
+    os.unlink(dropped)  # Pointer removed out of band
+    store.create_staging()
+    store.stale_staging_seconds = -1
+
+    assert store.collect_garbage() == 2
+    assert store.list_versions(dropped) == []
+    assert store.list_versions(kept)
+
+    store.remove(kept)
+    assert not kept.exists() and not kept.is_symlink()
+    assert store.list_versions(kept) == []
@@ -0,0 +1,236 @@
+"""
+Tests for the preview render pool.
+
+Tests cover:
+- Open documents are reused across pages and reopened when the file changes
+- Concurrent identical renders share one job
+- Missing pages surface as PreviewNotFoundError
+- Worker processes pre-render neighbouring pages into the preview cache
+- A worker process that dies is replaced on the next render
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import types
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from src.database.models import DocumentModel
+from src.services.document_preview_service import (
+    DocumentPreviewService,
+    PreviewNotFoundError,
+    PreviewSettings,
+)
+from src.services.preview_render_pool import (
+    PageOutOfRangeError,
+    PageRenderer,
+    PreviewRenderPool,
+)
+
+
+class _FakePixmap:
+    def __init__(self, width: int, page: int):
+        self.width = width
+        self.height = width * 2
+        self._page = page
+
+    def tobytes(self, _format: str) -> bytes:
+        return f"page-{self._page}-w{self.width}".encode()
+
+
+class _FakePage:
+    rect = types.SimpleNamespace(width=100)
+
+    def __init__(self, number: int, delay: float):
+        self._number = number
+        self._delay = delay
+
+    def get_pixmap(self, matrix, colorspace):  # pylint: disable=unused-argument
+        time.sleep(self._delay)
+        return _FakePixmap(int(100 * matrix.scale), self._number + 1)
+
+
+class _FakeDocument:
+    def __init__(self, page_count: int, delay: float):
+        self.page_count = page_count
+        self.closed = False
+        self._delay = delay
+
+    def load_page(self, index: int) -> _FakePage:
+        return _FakePage(index, self._delay)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_fitz(monkeypatch):
+    """In-process PyMuPDF stand-in recording every open."""
+    module = types.SimpleNamespace(opened=[], delay=0.0, csRGB="rgb")
+
+    def _open(path):
+        module.opened.append(path)
+        return _FakeDocument(page_count=10, delay=module.delay)
+
+    module.open = _open
+    module.Matrix = lambda scale, _: types.SimpleNamespace(scale=scale)
+    monkeypatch.setitem(sys.modules, "fitz", module)
+    return module
+
+
+def _write_pdf(path: Path, pages: int) -> None:
+    """Write a minimal PDF with blank pages."""
+    kids = " ".join(f"{3 + i} 0 R" for i in range(pages))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>",
+    ]
+    objects += ["<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 300] >>"] * pages
+    body, offsets = b"%PDF-1.4\n", []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode()
+    xref = f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    xref += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    trailer = f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+    path.write_bytes(
+        body + (xref + trailer + f"startxref\n{len(body)}\n%%EOF").encode()
+    )
+
+
+def _service(tmp_path: Path, pdf_path: Path, pool: PreviewRenderPool):
+    document = DocumentModel(
+        id=1,
+        title="Test",
+        file_path=str(pdf_path),
+        file_hash="hash",
+        file_size=100,
+        file_type=".pdf",
+        _from_database=True,
+    )
+    repo = types.SimpleNamespace(get_by_id=lambda _: document)
+    settings = PreviewSettings(
+        enabled=True,
+        cache_dir=tmp_path / "previews",
+        max_width=800,
+        min_width=100,
+        thumbnail_width=256,
+        max_page_number=50,
+        cache_ttl_seconds=60,
+        prerender_first_pages=2,
+        prerender_ahead=2,
+    )
+    return DocumentPreviewService(repo, settings, render_pool=pool)
+
+
+def test_renderer_reuses_open_documents(fake_fitz, tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF")
+    renderer = PageRenderer(max_open_documents=2)
+
+    results = [renderer.render(str(pdf_path), page, 200) for page in range(1, 6)]
+
+    assert [r.content for r in results][:2] == [b"page-1-w200", b"page-2-w200"]
+    assert results[0].page_count == 10
+    assert fake_fitz.opened == [str(pdf_path)]
+
+    pdf_path.write_bytes(b"%PDF-changed")
+    renderer.render(str(pdf_path), 1, 200)
+    assert len(fake_fitz.opened) == 2
+    with pytest.raises(PageOutOfRangeError):
+        renderer.render(str(pdf_path), 11, 200)
+
+
+def test_concurrent_identical_renders_share_one_job(fake_fitz, tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF")
+    fake_fitz.delay = 0.2
+    pool = PreviewRenderPool(workers=0)
+    results = []
+
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(pool.render(str(pdf_path), 3, 200))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {r.content for r in results} == {b"page-3-w200"} and len(results) == 4
+    assert pool.stats["renders"] == 1
+    assert pool.stats["deduplicated"] == 3
+
+
+def test_missing_page_raises_not_found(fake_fitz, tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF")
+    service = _service(tmp_path, pdf_path, PreviewRenderPool(workers=0))
+
+    assert service.get_page_preview(1, page=10, width=200).content == b"page-10-w200"
+    with pytest.raises(PreviewNotFoundError):
+        service.get_page_preview(1, page=11, width=200)
+
+
+def test_workers_prerender_neighbouring_pages(tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    _write_pdf(pdf_path, pages=8)
+    pool = PreviewRenderPool(workers=1)
+    service = _service(tmp_path, pdf_path, pool)
+    try:
+        preview = service.get_page_preview(1, page=5, width=200)
+        assert (preview.width, preview.height) == (200, 300)
+
+        cache_dir = tmp_path / "previews" / "1"
+        expected = {f"page-{p}-w200.png" for p in (1, 2, 4, 5, 6, 7)}
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if expected <= {path.name for path in cache_dir.glob("*.png")}:
+                break
+            time.sleep(0.05)
+
+        assert {path.name for path in cache_dir.glob("*.png")} == expected
+        assert pool.stats["prefetched"] == 5
+        assert service.get_page_preview(1, page=6, width=200).from_cache is True
+    finally:
+        service.close()
+
+
+def test_crashed_worker_is_replaced(tmp_path):
+    pdf_path = tmp_path / "doc.pdf"
+    _write_pdf(pdf_path, pages=2)
+    pool = PreviewRenderPool(workers=1)
+    try:
+        pool.warm_up()
+        crashed = pool._executors[0]
+        with pytest.raises(BrokenProcessPool):
+            crashed.submit(os._exit, 1).result(timeout=30)
+
+        # The slot still holds the broken executor: submit must replace it
+        assert pool._executors[0] is crashed
+        result = pool.render(str(pdf_path), 1, 200)
+        assert (result.width, result.height) == (200, 300)
+        assert pool._executors[0] is not crashed
+        assert pool._pending == [0]
+
+        # A job that was queued when its worker died fails and frees the slot
+        replacement = pool._executors[0]
+        replacement.submit(os._exit, 1)
+        with pytest.raises(BrokenProcessPool):
+            pool.submit(str(pdf_path), 2, 200).result(timeout=30)
+        deadline = time.monotonic() + 30
+        while pool._executors[0] is replacement and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pool._executors[0] is None
+        assert pool._pending == [0]
+        assert pool.render(str(pdf_path), 2, 200).width == 200
+    finally:
+        pool.shutdown()
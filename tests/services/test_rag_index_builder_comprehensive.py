@@ -14,6 +14,7 @@ Target Coverage: src/services/rag/index_builder.py (0% → 65%)
 
 from __future__ import annotations
 
+import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -37,8 +38,12 @@ def mock_file_manager():
     manager = Mock()
     manager.is_accessible.return_value = True
     manager.verify_index_files.return_value = True
+    manager.verify_index_structure.return_value = True
     manager.get_chunk_count.return_value = 10
     manager.get_storage_statistics.return_value = {"total_indexes": 5}
+    manager.create_staging_directory.side_effect = lambda document_id: Path(
+        tempfile.mkdtemp(prefix=f"doc_{document_id}_")
+    )
     return manager
 
 
@@ -224,13 +229,17 @@ def test_build_index_for_document_success(
     index_builder_test_mode.file_manager.generate_index_path = Mock(
         return_value=index_path
     )
-    index_builder_test_mode.file_manager.prepare_index_directory = Mock()
-    index_builder_test_mode.file_manager.copy_index_files = Mock()
-
     # Execute
     result = index_builder_test_mode.build_index_for_document(sample_document)
 
-    # Verify
+    # Verify the staged build was promoted to the final path
+    file_manager = index_builder_test_mode.file_manager
+    staging_path = file_manager.promote_index.call_args.args[0]
+    file_manager.promote_index.assert_called_once_with(staging_path, index_path)
+    file_manager.verify_index_structure.assert_called_once_with(str(staging_path))
+    # The stores are parsed before the manifest is written
+    calls = [name for name, _, _ in file_manager.mock_calls]
+    assert calls.index("verify_index_structure") < calls.index("write_index_manifest")
     assert result["success"] is True
     assert result["document_id"] == 1
     assert result["index_path"] == str(index_path)
@@ -250,18 +259,14 @@ def test_build_index_for_document_with_overwrite(
     index_builder_test_mode.file_manager.generate_index_path = Mock(
         return_value=index_path
     )
-    index_builder_test_mode.file_manager.prepare_index_directory = Mock()
-    index_builder_test_mode.file_manager.copy_index_files = Mock()
-
     # Execute with overwrite
     result = index_builder_test_mode.build_index_for_document(
         sample_document, overwrite=True
     )
 
-    # Verify prepare was called with overwrite=True
-    index_builder_test_mode.file_manager.prepare_index_directory.assert_called_once_with(
-        index_path, overwrite=True
-    )
+    # Verify the new version is promoted over the existing index
+    promote = index_builder_test_mode.file_manager.promote_index
+    assert promote.call_args.args[1] == index_path
     assert result["success"] is True
 
 
@@ -309,15 +314,17 @@ def test_build_index_for_document_verification_failure(
     index_builder_test_mode.file_manager.generate_index_path = Mock(
         return_value=index_path
     )
-    index_builder_test_mode.file_manager.prepare_index_directory = Mock()
-    index_builder_test_mode.file_manager.copy_index_files = Mock()
 
     # Mock verification failure
-    index_builder_test_mode.file_manager.verify_index_files.return_value = False
+    index_builder_test_mode.file_manager.verify_index_structure.return_value = False
 
     with pytest.raises(RAGIndexBuilderError, match="verification failed"):
         index_builder_test_mode.build_index_for_document(sample_document)
 
+    # A failed build is never published
+    index_builder_test_mode.file_manager.write_index_manifest.assert_not_called()
+    index_builder_test_mode.file_manager.promote_index.assert_not_called()
+
 
 # ============================================================================
 # Statistics & Info Methods
@@ -347,26 +354,27 @@ def test_get_build_statistics(index_builder_test_mode):
 def test_build_index_for_document_cleans_up_on_error(
     index_builder_test_mode, sample_document, tmp_path
 ):
-    """Test cleanup occurs when build fails."""
+    """Test a failed promotion removes staging and leaves the live index alone."""
     index_path = tmp_path / "final_index"
     index_path.mkdir()
 
     index_builder_test_mode.file_manager.generate_index_path = Mock(
         return_value=index_path
     )
-    index_builder_test_mode.file_manager.prepare_index_directory = Mock()
 
-    # Mock copy to raise exception
-    index_builder_test_mode.file_manager.copy_index_files = Mock(
-        side_effect=Exception("Copy failed")
+    # Mock promotion to raise exception
+    index_builder_test_mode.file_manager.promote_index = Mock(
+        side_effect=Exception("Promotion failed")
     )
-    index_builder_test_mode.file_manager.cleanup_index_files = Mock()
 
     # Execute and expect failure
     with pytest.raises(RAGIndexBuilderError):
-        index_builder_test_mode.build_index_for_document(sample_document)
+        index_builder_test_mode.build_index_for_document(
+            sample_document, overwrite=True
+        )
 
-    # Verify cleanup was called
-    index_builder_test_mode.file_manager.cleanup_index_files.assert_called_once_with(
-        str(index_path)
-    )
+    # Staging was cleaned up; the published index was not touched
+    staging_path = index_builder_test_mode.file_manager.promote_index.call_args.args[0]
+    assert not staging_path.exists()
+    assert index_path.exists()
+    index_builder_test_mode.file_manager.cleanup_index_files.assert_not_called()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from src.database.models import DocumentModel
+from src.services.rag.file_manager import RAGFileManager
+from src.services.rag.index_builder import RAGIndexBuilder, RAGIndexBuilderError
+from src.services.rag.index_manifest import (
+    MANIFEST_FILE,
+    file_digest,
+    read_manifest,
+)
+
+
+@pytest.fixture
+def file_manager(tmp_path: Path) -> RAGFileManager:
+    return RAGFileManager(str(tmp_path / "vector_indexes"))
+
+
+@pytest.fixture
+def index_dir(tmp_path: Path) -> Path:
+    path = tmp_path / "index"
+    path.mkdir()
+    vector_store = {"embedding_dict": {"a": [0.1, 0.2, 0.3], "b": [0.4, 0.5, 0.6]}}
+    (path / "default__vector_store.json").write_text(json.dumps(vector_store))
+    (path / "graph_store.json").write_text('{"graph_dict": {}}')
+    (path / "index_store.json").write_text('{"index_store/data": {}}')
+    return path
+
+
+def test_manifest_records_files_and_shape(file_manager, index_dir):
+    manifest = file_manager.write_index_manifest(index_dir, {"embed_model": "m"})
+
+    assert read_manifest(index_dir) == manifest
+    assert manifest["chunk_count"] == 2
+    assert manifest["embedding_dimension"] == 3
+    assert manifest["build_params"] == {"embed_model": "m"}
+    assert MANIFEST_FILE not in manifest["files"]
+    entry = manifest["files"]["graph_store.json"]
+    assert entry["size"] == (index_dir / "graph_store.json").stat().st_size
+    assert entry["digest"] == file_digest(
+        index_dir / "graph_store.json", manifest["digest_algorithm"]
+    )
+
+
+def test_verification_uses_manifest_without_parsing(file_manager, index_dir):
+    file_manager.write_index_manifest(index_dir)
+    vector_store = index_dir / "default__vector_store.json"
+    # Same size, no longer JSON: only the digest can tell
+    vector_store.write_text("x" * vector_store.stat().st_size)
+
+    assert file_manager.verify_index_files(str(index_dir))
+    assert file_manager.get_chunk_count(str(index_dir)) == 2
+    assert not file_manager.deep_verify_index(str(index_dir))
+
+    vector_store.write_text("{}")
+    assert not file_manager.verify_index_files(str(index_dir))
+
+
+def test_index_without_manifest_is_parsed(file_manager, index_dir):
+    assert file_manager.verify_index_files(str(index_dir))
+    assert file_manager.deep_verify_index(str(index_dir))
+
+    (index_dir / "graph_store.json").write_text("{not json")
+    assert not file_manager.verify_index_files(str(index_dir))
+
+
+def test_background_deep_verification_is_throttled(file_manager, index_dir):
+    file_manager.write_index_manifest(index_dir)
+    total = sum(
+        path.stat().st_size
+        for path in index_dir.iterdir()
+        if path.name != MANIFEST_FILE
+    )
+
+    start = time.monotonic()
+    thread, results = file_manager.start_deep_verification(
+        [str(index_dir)], max_bytes_per_second=total / 0.3
+    )
+    thread.join(timeout=10)
+
+    assert results == {str(index_dir): True}
+    assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.parametrize("corrupt", [False, True])
+def test_corrupt_build_is_not_published(file_manager, index_dir, tmp_path, corrupt):
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    document = DocumentModel(
+        id=1, title="Doc", file_path=str(pdf), file_hash="hash", file_size=8
+    )
+    builder = RAGIndexBuilder("key", file_manager, test_mode=True)
+
+    def build_index_from_pdf(pdf_path: str, temp_dir: str) -> bool:
+        for path in index_dir.iterdir():
+            (Path(temp_dir) / path.name).write_bytes(path.read_bytes())
+        if corrupt:
+            (Path(temp_dir) / "index_store.json").write_text('{"truncated": ')
+        return True
+
+    builder.build_index_from_pdf = build_index_from_pdf
+    final_path = file_manager.generate_index_path(document.id, "hash")
+    file_manager.generate_index_path = lambda *_: final_path
+
+    if corrupt:
+        with pytest.raises(RAGIndexBuilderError, match="verification failed"):
+            builder.build_index_for_document(document)
+        assert not final_path.exists() and not final_path.is_symlink()
+    else:
+        builder.build_index_for_document(document)
+        assert read_manifest(final_path) is not None
+        assert file_manager.verify_index_files(str(final_path))
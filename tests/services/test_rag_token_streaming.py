@@ -0,0 +1,176 @@
+"""
+Tests for token-streaming RAG answers.
+
+Tests cover:
+- EnhancedRAGService.stream_query uses streaming synthesis, so the first
+  token arrives long before generation finishes
+- stream_tokens stops the producer when the cancellation token is set or
+  the consumer goes away
+- MemoryOptimizedRAGProcessor forwards tokens to the WebSocket client as
+  they are generated
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import aclosing
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from backend.services.memory_efficient_rag import MemoryOptimizedRAGProcessor
+from backend.services.rag_token_stream import stream_tokens
+from src.services.enhanced_rag_service import EnhancedRAGService
+from src.services.rag.fake_llm import FakeStreamingLLM
+
+TOKEN_DELAY = 0.02
+
+
+class _StreamingIndex:
+    """Index whose query engines synthesize with the fake LLM, mirroring
+    LlamaIndex: streaming=True returns a response with a token generator."""
+
+    def __init__(self, llm: FakeStreamingLLM):
+        self.llm = llm
+        self.engine_kwargs: list[dict] = []
+
+    def as_query_engine(self, streaming: bool = False, **kwargs):
+        self.engine_kwargs.append({"streaming": streaming, **kwargs})
+
+        def query(query_text: str):
+            if streaming:
+                return SimpleNamespace(response_gen=self.llm.stream(query_text))
+            return self.llm.complete(query_text)
+
+        return SimpleNamespace(query=query)
+
+
+@pytest.fixture
+def fake_llm() -> FakeStreamingLLM:
+    return FakeStreamingLLM(first_token_delay=TOKEN_DELAY, token_delay=TOKEN_DELAY)
+
+
+@pytest.fixture
+def rag_service(monkeypatch, tmp_path, fake_llm) -> EnhancedRAGService:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        EnhancedRAGService, "_initialize_llama_index", lambda self: None
+    )
+    service = EnhancedRAGService(
+        api_key="test-key",
+        db_connection=Mock(),
+        vector_storage_dir=str(tmp_path / "vector_store"),
+    )
+    service.current_index = _StreamingIndex(fake_llm)
+    return service
+
+
+class _ClosingTokens:
+    """Wraps a token iterator and signals when the producer closed it."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        try:
+            yield from self.tokens
+        finally:
+            self.closed.set()
+
+
+class _GatedTokens:
+    """Wraps a token iterator and holds generation after the first token
+    until ``release`` is set."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.release = threading.Event()
+
+    def __iter__(self):
+        tokens = iter(self.tokens)
+        yield next(tokens)
+        if not self.release.wait(5):
+            raise TimeoutError("first token was not delivered")
+        yield from tokens
+
+
+@pytest.mark.asyncio
+async def test_first_token_arrives_before_generation_finishes(rag_service, fake_llm):
+    producer = _GatedTokens(rag_service.stream_query("What?"))
+    parts = []
+    async for token in stream_tokens(lambda: producer):
+        if not parts:
+            # Generation is blocked after one token, so it cannot have finished
+            assert fake_llm.tokens_generated == 1
+            producer.release.set()
+        parts.append(token)
+
+    assert "".join(parts) == fake_llm.response
+    assert len(parts) == len(fake_llm.tokens())
+    assert rag_service.current_index.engine_kwargs == [{"streaming": True}]
+
+
+@pytest.mark.asyncio
+async def test_cancellation_token_stops_generation(rag_service, fake_llm):
+    cancellation_token = asyncio.Event()
+    producer = _ClosingTokens(rag_service.stream_query("What?"))
+    received = []
+
+    async for token in stream_tokens(lambda: producer, cancellation_token):
+        received.append(token)
+        if len(received) == 2:
+            cancellation_token.set()
+
+    assert await asyncio.to_thread(producer.closed.wait, 5)
+    assert len(received) == 2
+    assert fake_llm.tokens_generated < len(fake_llm.tokens())
+
+
+@pytest.mark.asyncio
+async def test_consumer_going_away_stops_generation(rag_service, fake_llm):
+    producer = _ClosingTokens(rag_service.stream_query("What?"))
+
+    async with aclosing(stream_tokens(lambda: producer)) as tokens:
+        async for _ in tokens:
+            break
+
+    assert await asyncio.to_thread(producer.closed.wait, 5)
+    assert fake_llm.tokens_generated < len(fake_llm.tokens())
+
+
+@pytest.mark.asyncio
+async def test_processor_forwards_tokens_as_generated(rag_service, fake_llm):
+    events: list[tuple[str, float]] = []
+    ws_manager = Mock()
+
+    async def record_chunk(client_id, task_id, chunk, chunk_index, total=None):
+        events.append((chunk, time.perf_counter()))
+
+    ws_manager.send_rag_response_chunk = record_chunk
+    ws_manager.send_rag_progress_update = Mock(side_effect=_async_noop)
+    ws_manager.send_memory_warning = Mock(side_effect=_async_noop)
+
+    controller = Mock()
+    controller.get_index_status.return_value = {"can_query": True}
+    controller.stream_query_document.side_effect = (
+        lambda document_id, query: rag_service.stream_query(query)
+    )
+
+    processor = MemoryOptimizedRAGProcessor(ws_manager, memory_limit_mb=1e9)
+    result = await processor.process_with_memory_management(
+        "What?", 1, "task-1", asyncio.Event(), "client-1", controller
+    )
+    finished_at = time.perf_counter()
+
+    assert result == fake_llm.response
+    assert "".join(chunk for chunk, _ in events) == fake_llm.response
+    # Chunks were spread over generation, not sent in a burst at the end
+    assert finished_at - events[0][1] > (len(events) - 2) * TOKEN_DELAY
+
+
+async def _async_noop(*args, **kwargs) -> None:
+    return None
@@ -0,0 +1,265 @@
+"""
+Tests for the packed thumbnail store and thumbnail sprites.
+
+Tests cover:
+- Thumbnails survive reopening and compaction drops replaced bytes
+- A torn index or pack tail after a crash is ignored on load
+- Stores in several processes share one directory safely
+- The preview service stores WebP thumbnails keyed by file hash
+- Sprites lay out thumbnails in request order with blank missing cells
+- The sprite route renders off the event loop and honours If-None-Match
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import types
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.routes import documents as document_routes
+from src.database.models import DocumentModel
+from src.services.document_preview_service import (
+    DocumentPreviewService,
+    PreviewSettings,
+)
+from src.services.preview_render_pool import RenderResult
+from src.services.thumbnail_store import ThumbnailStore
+
+Image = pytest.importorskip("PIL.Image")
+
+COLORS = ["red", "green", "blue"]
+
+
+def _png(color: str, size: tuple[int, int] = (128, 180)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class _ColorPool:
+    """Render pool stand-in that renders each document as a flat colour."""
+
+    def __init__(self, colors: dict[str, str]):
+        self.colors = colors
+        self.renders = 0
+
+    def submit(self, file_path: str, page: int, width: int) -> Future:
+        self.renders += 1
+        future: Future = Future()
+        future.set_result(RenderResult(_png(self.colors[file_path]), 128, 180, 1))
+        return future
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _service(tmp_path: Path, documents: list[DocumentModel]):
+    by_id = {document.id: document for document in documents}
+    repo = types.SimpleNamespace(
+        get_by_id=by_id.get,
+        get_by_ids=lambda ids: [by_id[i] for i in ids if i in by_id],
+    )
+    pool = _ColorPool({d.file_path: c for d, c in zip(documents, COLORS, strict=True)})
+    settings = PreviewSettings(
+        enabled=True,
+        cache_dir=tmp_path / "previews",
+        max_width=800,
+        min_width=100,
+        thumbnail_width=128,
+        max_page_number=50,
+        cache_ttl_seconds=60,
+    )
+    service = DocumentPreviewService(repo, settings, render_pool=pool)
+    service._render_page = lambda document, page, width: (
+        pool.submit(document.file_path, page, width).result().content,
+        128,
+        180,
+    )
+    return service, pool
+
+
+@pytest.fixture
+def documents(tmp_path: Path) -> list[DocumentModel]:
+    docs = []
+    for index in range(3):
+        path = tmp_path / f"doc{index}.pdf"
+        path.write_bytes(b"%PDF")
+        docs.append(
+            DocumentModel(
+                id=index + 1,
+                title=f"Doc {index}",
+                file_path=str(path),
+                file_hash=f"hash-{index}",
+                file_size=4,
+                file_type=".pdf",
+                _from_database=True,
+            )
+        )
+    return docs
+
+
+def test_store_reopens_and_compacts(tmp_path):
+    store = ThumbnailStore(tmp_path, compact_ratio=0.5)
+    store.put(1, b"a" * 100, 10, 10, "webp", "k1")
+    store.put(2, b"b" * 100, 10, 10, "webp", "k2")
+    store.put(1, b"c" * 100, 10, 10, "webp", "k1b")
+    assert store.stats["dead_bytes"] == 100
+    store.close()
+
+    reopened = ThumbnailStore(tmp_path, compact_ratio=0.5)
+    assert reopened.get(1)[1] == b"c" * 100
+    assert reopened.get(1)[0].source_key == "k1b"
+
+    reopened.remove(2)  # 200 of 300 bytes dead: compacts to generation 1
+    assert reopened.stats == {
+        "thumbnails": 1,
+        "pack_bytes": 100,
+        "dead_bytes": 0,
+        "generation": 1,
+    }
+    assert reopened.get(1)[1] == b"c" * 100 and reopened.get(2) is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "thumbnails.1.idx",
+        "thumbnails.1.pack",
+        "thumbnails.lock",
+    ]
+
+
+def test_stores_sharing_a_directory_see_each_others_writes(tmp_path):
+    # Two instances stand in for two server worker processes
+    first = ThumbnailStore(tmp_path, compact_ratio=0.5)
+    second = ThumbnailStore(tmp_path, compact_ratio=0.5)
+    first.put(1, b"a" * 100, 10, 10, "webp", "k1")
+    second.put(2, b"b" * 100, 10, 10, "webp", "k2")
+    first.put(3, b"c" * 100, 10, 10, "webp", "k3")
+
+    for store in (first, second):
+        assert [store.get(i)[1] for i in (1, 2, 3)] == [
+            b"a" * 100,
+            b"b" * 100,
+            b"c" * 100,
+        ]
+    assert second.record(3).offset == 200
+
+    # Compaction in one store while the other still reads the old pack
+    first.remove(1)
+    first.remove(2)
+    assert first.stats["generation"] == 1
+    assert (tmp_path / "thumbnails.0.pack").exists()
+    assert second.get(3)[1] == b"c" * 100 and second.get(1) is None
+    assert second.stats["generation"] == 1
+
+    second.put(4, b"d" * 100, 10, 10, "webp", "k4")
+    assert first.get(4)[1] == b"d" * 100
+    assert first.get(3)[1] == b"c" * 100
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "thumbnails.1.idx",
+        "thumbnails.1.pack",
+        "thumbnails.lock",
+    ]
+
+
+def test_store_ignores_torn_tail(tmp_path):
+    store = ThumbnailStore(tmp_path)
+    store.put(1, b"a" * 50, 10, 10, "png", "k1")
+    record = store.put(2, b"b" * 50, 10, 10, "png", "k2")
+    store.close()
+    pack = tmp_path / "thumbnails.0.pack"
+    pack.write_bytes(pack.read_bytes()[: record.offset + 10])
+    with open(tmp_path / "thumbnails.0.idx", "a") as index:
+        index.write('{"document_id": 3, "off')
+
+    reopened = ThumbnailStore(tmp_path)
+
+    assert reopened.get(1)[1] == b"a" * 50
+    assert reopened.get(2) is None and reopened.get(3) is None
+
+
+def test_service_thumbnails_are_webp_and_keyed_by_hash(tmp_path, documents):
+    service, pool = _service(tmp_path, documents)
+
+    first = service.get_thumbnail(1)
+    again = service.get_thumbnail(1)
+
+    assert first.content_type == "image/webp" and first.from_cache is False
+    assert again.from_cache is True and again.etag == first.etag
+    assert len(first.content) < len(_png("red"))
+    assert pool.renders == 1
+
+    documents[0].file_hash = "replaced"
+    assert service.get_thumbnail(1).from_cache is False
+    assert pool.renders == 2
+
+
+def test_sprite_layout_and_etag(tmp_path, documents):
+    service, pool = _service(tmp_path, documents)
+
+    sprite = service.get_thumbnail_sprite([3, 99, 1], columns=2)
+    repeat = service.get_thumbnail_sprite([3, 99, 1], columns=2)
+
+    assert pool.renders == 2  # Only the two existing documents render
+    assert repeat.etag == sprite.etag
+    assert sprite.missing_ids == [99]
+    with Image.open(io.BytesIO(sprite.content)) as image:
+        assert image.size == (2 * sprite.cell_width, 2 * sprite.cell_height)
+        centre_y = sprite.cell_height // 2
+        assert _is_close(image.getpixel((sprite.cell_width // 2, centre_y)), "blue")
+        blank = image.getpixel((sprite.cell_width * 3 // 2, centre_y))
+        assert _is_close(blank, "white")
+        assert _is_close(
+            image.getpixel((sprite.cell_width // 2, sprite.cell_height * 3 // 2)),
+            "red",
+        )
+    assert service.get_thumbnail_sprite([1, 3], columns=2).etag != sprite.etag
+
+
+def test_sprite_route(tmp_path, documents):
+    service, _pool = _service(tmp_path, documents)
+    on_event_loop = []
+
+    def get_thumbnail_sprite(document_ids, columns):
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(True)
+        except RuntimeError:
+            on_event_loop.append(False)
+        return type(service).get_thumbnail_sprite(service, document_ids, columns)
+
+    service.get_thumbnail_sprite = get_thumbnail_sprite
+    app = FastAPI()
+    app.include_router(document_routes.router, prefix="/api/documents")
+    app.dependency_overrides[document_routes.get_document_preview_service] = (
+        lambda: service
+    )
+    client = TestClient(app)
+
+    response = client.get("/api/documents/thumbnails/sprite?ids=3,99,1&columns=2")
+    cached = client.get(
+        "/api/documents/thumbnails/sprite?ids=3,99,1&columns=2",
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    invalid = client.get("/api/documents/thumbnails/sprite?ids=1,x")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert response.headers["x-sprite-columns"] == "2"
+    assert response.headers["x-sprite-missing"] == "99"
+    with Image.open(io.BytesIO(response.content)) as image:
+        assert image.size == (
+            2 * int(response.headers["x-sprite-cell-width"]),
+            2 * int(response.headers["x-sprite-cell-height"]),
+        )
+    assert cached.status_code == 304 and cached.content == b""
+    assert invalid.status_code == 400
+    assert on_event_loop == [False, False]
+
+
+def _is_close(pixel: tuple[int, int, int], color: str) -> bool:
+    expected = Image.new("RGB", (1, 1), color).getpixel((0, 0))
+    return all(abs(a - b) < 40 for a, b in zip(pixel, expected, strict=True))
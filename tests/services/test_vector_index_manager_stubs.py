@@ -75,3 +75,23 @@ def test_verify_index_integrity_success(manager: VectorIndexManager, tmp_path: P
     manager.vector_repo.by_id = model  # type: ignore[attr-defined]
     result = manager.verify_index_integrity(vector_index_id=1)
     assert "errors" in result
+
+
+def test_backup_index_deduplicated_round_trip(
+    manager: VectorIndexManager, tmp_path: Path
+):
+    idx_dir = tmp_path / "idx_dedup"
+    idx_dir.mkdir()
+    (idx_dir / "default__vector_store.json").write_text('{"embedding": [1, 2]}')
+    manager.vector_repo.by_id = VectorIndexModel(  # type: ignore[attr-defined]
+        document_id=4, index_path=str(idx_dir), index_hash="hash"
+    )
+
+    first = manager.backup_index_deduplicated(vector_index_id=1)
+    second = manager.backup_index_deduplicated(vector_index_id=1)
+    assert second.stats["chunks_new"] == 0
+
+    restored = manager.restore_index_backup(first.snapshot_id, tmp_path / "restored")
+    assert (restored / "default__vector_store.json").read_text() == (
+        '{"embedding": [1, 2]}'
+    )